@@ -13,10 +13,18 @@ Usage:
 """
 
 import re
-from typing import List, Tuple, Dict, Set
+import sys
+from pathlib import Path
+from typing import List, Optional, Tuple, Dict, Set
 from dataclasses import dataclass
 from difflib import SequenceMatcher
 
+try:
+    from rrwrite_fuzzy_match import FuzzyIndex
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_fuzzy_match import FuzzyIndex
+
 
 @dataclass
 class CitationLink:
@@ -121,7 +129,8 @@ class CitationMatcher:
     def find_best_match(
         self,
         citation: str,
-        candidates: Dict[str, str]
+        candidates: Dict[str, str],
+        index: Optional[FuzzyIndex] = None
     ) -> Tuple[str, float]:
         """
         Find best matching citation from candidates
@@ -129,21 +138,20 @@ class CitationMatcher:
         Args:
             citation: Citation text to match
             candidates: Dict mapping citation text to Paperpile URL
+            index: FuzzyIndex of the candidate texts, in dict order (built
+                if not given; pass one when matching many citations)
 
         Returns:
             (best_match_url, similarity_score) or (None, 0.0)
         """
-        best_match = None
-        best_score = 0.0
-
-        for candidate_text, url in candidates.items():
-            score = self.similarity(citation, candidate_text)
-
-            if score > best_score:
-                best_score = score
-                best_match = url
+        urls = list(candidates.values())
+        if index is None:
+            index = FuzzyIndex(list(candidates), normalize=self.normalize_citation)
 
-        return best_match, best_score
+        best_idx, best_score = index.best_match(citation)
+        if best_idx is None:
+            return None, 0.0
+        return urls[best_idx], best_score
 
     def match_citations(
         self,
@@ -177,6 +185,7 @@ class CitationMatcher:
         for link in old_links:
             normalized = self.normalize_citation(link.text)
             citation_to_url[normalized] = link.url
+        candidate_index = FuzzyIndex(list(citation_to_url), normalize=self.normalize_citation)
 
         # Match new citations to old URLs using fuzzy matching
         matched_links = []
@@ -200,7 +209,7 @@ class CitationMatcher:
                 match_stats['exact'] += 1
             else:
                 # Try fuzzy match
-                best_url, score = self.find_best_match(cite_text, citation_to_url)
+                best_url, score = self.find_best_match(cite_text, citation_to_url, candidate_index)
 
                 if best_url and score >= self.similarity_threshold:
                     # Fuzzy match found
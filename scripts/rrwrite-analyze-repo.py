@@ -12,6 +12,11 @@ Usage:
 Examples:
     python rrwrite-analyze-repo.py https://github.com/user/research-repo
     python rrwrite-analyze-repo.py /path/to/local/repo --output analysis.md
+
+Repeated analyses are incremental: GitHub URLs are kept as a mirror under
+$RRWRITE_CACHE_DIR/mirrors and updated with `git fetch`, directories whose git
+tree is unchanged are reused from $RRWRITE_CACHE_DIR/repo_analysis, and only
+data tables whose inputs changed are rewritten. Use --no-cache to disable.
 """
 
 import argparse
@@ -25,6 +30,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from rrwrite_analysis_cache import AnalysisCache, mirror_repo
+from rrwrite_repo_index import RepoIndex, SKIP_DIRS
 from rrwrite_table_generator import TableGenerator
 
 
@@ -38,23 +45,26 @@ class RepoAnalyzer:
     CONFIG_PATTERNS = ['requirements.txt', 'environment.yml', 'setup.py', 'pyproject.toml', 'Pipfile', 'package.json']
     DOC_PATTERNS = ['README.md', 'README.txt', 'README.rst', 'README', 'DOCUMENTATION.md', 'NOTES.md']
 
-    # Directories to skip
-    SKIP_DIRS = {'.git', '__pycache__', '.ipynb_checkpoints', 'node_modules', '.venv', 'venv',
-                 'env', '.env', 'dist', 'build', '.pytest_cache', '.mypy_cache', '.tox'}
-
-    def __init__(self, repo_input: str, max_depth: int = 5):
+    def __init__(self, repo_input: str, max_depth: int = 5, use_cache: bool = True,
+                 cache_dir: Optional[Path] = None):
         """
         Initialize analyzer.
 
         Args:
             repo_input: GitHub URL or local path
             max_depth: Maximum directory depth to scan
+            use_cache: Reuse mirrors and unchanged directories from earlier runs
+            cache_dir: Cache root (default: $RRWRITE_CACHE_DIR)
         """
         self.repo_input = repo_input
         self.max_depth = max_depth
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
         self.temp_dir: Optional[Path] = None
         self.repo_path: Optional[Path] = None
         self.repo_name: str = ""
+        self._index: Optional[RepoIndex] = None
+        self._tree_key: Optional[str] = None
 
     def __enter__(self):
         """Context manager entry."""
@@ -71,7 +81,12 @@ class RepoAnalyzer:
 
     def clone_repo(self, url: str) -> Path:
         """
-        Clone GitHub repository to temporary directory.
+        Clone GitHub repository.
+
+        With caching enabled the repository is fetched into a persistent mirror
+        (see rrwrite_analysis_cache.mirror_repo); otherwise, or if mirroring
+        fails, it is shallow-cloned into a temporary directory that is removed
+        on exit.
 
         Args:
             url: GitHub repository URL
@@ -79,6 +94,15 @@ class RepoAnalyzer:
         Returns:
             Path to cloned repository
         """
+        if self.use_cache:
+            try:
+                return mirror_repo(url, self.cache_dir)
+            except subprocess.CalledProcessError as e:
+                # Fall back to an uncached temporary clone
+                print(f"Warning: mirroring failed ({(e.stderr or '').strip()}), "
+                      f"cloning without cache", file=sys.stderr)
+                self.use_cache = False
+
         self.temp_dir = Path(tempfile.mkdtemp(prefix='rrwrite_'))
 
         try:
@@ -115,6 +139,22 @@ class RepoAnalyzer:
 
         return repo_path, repo_name
 
+    @property
+    def index(self) -> RepoIndex:
+        """File index of the repository, built with a single walk on first use."""
+        if self._index is None or self._index.root != self.repo_path:
+            if self.use_cache:
+                cache = AnalysisCache(self.repo_path, self.cache_dir)
+                self._index = RepoIndex(self.repo_path, skip_dirs=SKIP_DIRS, reuse=cache.lookup)
+                cache.save(self._index.snapshots())
+                self._tree_key = cache.tree_key
+                if cache.hits:
+                    print(f"Reused {cache.hits} unchanged directories "
+                          f"({cache.misses} rescanned)", file=sys.stderr)
+            else:
+                self._index = RepoIndex(self.repo_path, skip_dirs=SKIP_DIRS)
+        return self._index
+
     def scan_directory_tree(self, max_lines: int = 100) -> str:
         """
         Generate directory tree structure.
@@ -131,13 +171,8 @@ class RepoAnalyzer:
             if depth > self.max_depth or len(lines) >= max_lines:
                 return
 
-            try:
-                items = sorted(path.iterdir(), key=lambda p: (not p.is_dir(), p.name))
-            except PermissionError:
-                return
-
-            # Filter out skip directories
-            items = [item for item in items if item.name not in self.SKIP_DIRS]
+            # Skip directories are already pruned from the index
+            items = sorted(self.index.children(path), key=lambda e: (not e.is_dir, e.name))
 
             for i, item in enumerate(items):
                 if len(lines) >= max_lines:
@@ -147,9 +182,9 @@ class RepoAnalyzer:
                 current_prefix = "└── " if is_last else "├── "
                 lines.append(f"{prefix}{current_prefix}{item.name}")
 
-                if item.is_dir():
+                if item.is_dir:
                     extension = "    " if is_last else "│   "
-                    walk_tree(item, prefix + extension, depth + 1)
+                    walk_tree(item.path, prefix + extension, depth + 1)
 
         lines.append(self.repo_name + "/")
         walk_tree(self.repo_path)
@@ -169,13 +204,7 @@ class RepoAnalyzer:
         Returns:
             List of matching file paths
         """
-        files = []
-        for pattern in patterns:
-            files.extend(self.repo_path.rglob(pattern))
-
-        # Filter out files in skip directories
-        files = [f for f in files if not any(skip in f.parts for skip in self.SKIP_DIRS)]
-        return sorted(files)
+        return self.index.find(patterns)
 
     def format_file_list(self, files: List[Path], max_files: int = 20) -> str:
         """
@@ -194,7 +223,8 @@ class RepoAnalyzer:
         lines = []
         for i, f in enumerate(files[:max_files]):
             rel_path = f.relative_to(self.repo_path)
-            size = f.stat().st_size
+            entry = self.index.stat(f)
+            size = entry.size if entry else f.stat().st_size
             size_str = self._format_size(size)
             lines.append(f"- `{rel_path}` ({size_str})")
 
@@ -268,8 +298,8 @@ class RepoAnalyzer:
                 pass
 
         # Extract from directory names
-        for path in self.repo_path.rglob('*'):
-            if path.is_dir() and path.name not in self.SKIP_DIRS:
+        for path in self.index.dirs:
+            if path.name not in SKIP_DIRS:
                 name = path.name.lower().replace('_', ' ').replace('-', ' ')
                 if any(kw in name for kw in ['analysis', 'model', 'data', 'result', 'figure']):
                     topics.add(path.name.replace('_', ' ').title())
@@ -370,9 +400,7 @@ class RepoAnalyzer:
         notes = []
 
         # Count total files
-        all_files = list(self.repo_path.rglob('*'))
-        all_files = [f for f in all_files if f.is_file() and not any(skip in f.parts for skip in self.SKIP_DIRS)]
-        notes.append(f"- Total files analyzed: {len(all_files)}")
+        notes.append(f"- Total files analyzed: {len(self.index)}")
 
         # Check for tests
         test_files = self.find_files_by_pattern(['test_*.py', '*_test.py', 'test*.py'])
@@ -417,7 +445,9 @@ class RepoAnalyzer:
             table_paths = TableGenerator.generate_repo_tables(
                 repo_path=self.repo_path,
                 categorized_files=categorized_files,
-                output_dir=output_dir
+                output_dir=output_dir,
+                repo_index=self.index,
+                tree_key=self._tree_key
             )
 
             print(f"Generated {len(table_paths)} data tables", file=sys.stderr)
@@ -484,6 +514,11 @@ def main():
         type=int,
         default=5
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-clone and rescan from scratch instead of reusing earlier analyses'
+    )
 
     args = parser.parse_args()
 
@@ -500,7 +535,7 @@ def main():
         return 1
 
     try:
-        with RepoAnalyzer(args.repo, max_depth=args.max_depth) as analyzer:
+        with RepoAnalyzer(args.repo, max_depth=args.max_depth, use_cache=not args.no_cache) as analyzer:
             # Store output file path for table generation
             if args.output:
                 analyzer._output_file = args.output
@@ -11,13 +11,17 @@ Europe PMC provides access to life sciences literature including:
 
 Usage:
     python scripts/rrwrite-api-europepmc.py "query" --max-results 20
+
+    # Stream up to 10k articles as NDJSON; rerun the same command to resume
+    python scripts/rrwrite-api-europepmc.py "query" --harvest --max-results 10000 \\
+        --output europepmc.ndjson
 """
 
 import argparse
 import json
 import sys
-import time
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
+from pathlib import Path
 from urllib.parse import quote
 
 try:
@@ -28,6 +32,14 @@ except ImportError:
     print("Error: requests not installed. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    from rrwrite_http_cache import get_session
+    from rrwrite_harvest import harvest_ndjson
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import get_session
+    from rrwrite_harvest import harvest_ndjson
+
 
 class EuropePMCClient:
     """Client for Europe PMC API"""
@@ -36,7 +48,7 @@ class EuropePMCClient:
 
     def __init__(self):
         """Initialize Europe PMC client"""
-        self.session = requests.Session()
+        self.session = get_session()
         self.session.headers.update({
             'User-Agent': 'RRWriteLiteratureSearch/1.0'
         })
@@ -55,62 +67,71 @@ class EuropePMCClient:
         """
         papers = []
         page_size = min(max_results, 1000)  # Europe PMC max
-        cursor_mark = '*'
 
+        try:
+            for page, _ in self.iter_pages(query, year_min=year_min, page_size=page_size):
+                papers.extend(page[:max_results - len(papers)])
+                if len(papers) >= max_results:
+                    break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"Europe PMC API error: {e}", file=sys.stderr)
+
+        return papers
+
+    def iter_pages(
+        self,
+        query: str,
+        cursor: str = '*',
+        year_min: int = None,
+        page_size: int = 1000,
+        result_type: str = 'core'
+    ) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+        """
+        Page through search results with cursorMark pagination.
+
+        Args:
+            query: Search query
+            cursor: Start cursorMark ('*' for the first page, or a saved cursor)
+            year_min: Minimum publication year filter
+            page_size: Results per page (max 1000)
+            result_type: 'core' (with abstracts) or 'lite' (metadata only)
+
+        Yields:
+            (papers, next_cursor) per page; next_cursor is None on the last page
+
+        Raises:
+            requests.exceptions.RequestException, ValueError: If a page request
+                fails (pages already yielded are complete)
+        """
         # Add year filter to query
         search_query = query
         if year_min:
             search_query = f"({query}) AND (FIRST_PDATE:[{year_min} TO 2100])"
 
-        while len(papers) < max_results:
+        while cursor:
             params = {
                 'query': search_query,
                 'format': 'json',
+                'resultType': result_type,
                 'pageSize': page_size,
-                'cursorMark': cursor_mark,
+                'cursorMark': cursor,
                 'sort': 'CITED desc'  # Sort by citations
             }
 
-            try:
-                response = self.session.get(
-                    f"{self.BASE_URL}/search",
-                    params=params,
-                    timeout=30
-                )
-
-                if response.status_code == 429:
-                    print("Rate limited, waiting 10 seconds...", file=sys.stderr)
-                    time.sleep(10)
-                    continue
-
-                response.raise_for_status()
-                data = response.json()
-
-                results = data.get('resultList', {}).get('result', [])
-                if not results:
-                    break
-
-                for article in results:
-                    if len(papers) >= max_results:
-                        break
+            # Session enforces the shared Europe PMC rate limit and retries 429s
+            response = self.session.get(f"{self.BASE_URL}/search", params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
 
-                    paper = self._parse_article(article)
-                    if paper:
-                        papers.append(paper)
+            results = data.get('resultList', {}).get('result', [])
+            if not results:
+                return
 
-                # Check for next cursor
-                next_cursor = data.get('nextCursorMark')
-                if not next_cursor or next_cursor == cursor_mark:
-                    break
-
-                cursor_mark = next_cursor
-                time.sleep(0.34)  # ~3 req/sec
-
-            except requests.exceptions.RequestException as e:
-                print(f"Europe PMC API error: {e}", file=sys.stderr)
-                break
-
-        return papers
+            next_cursor = data.get('nextCursorMark')
+            if next_cursor == cursor:
+                next_cursor = None
+            cursor = next_cursor
+            yield [self._parse_article(article) for article in results], cursor
 
     def _parse_article(self, article: Dict) -> Dict:
         """Parse Europe PMC article into standardized format"""
@@ -178,7 +199,11 @@ def main():
     parser.add_argument('query', help='Search query')
     parser.add_argument('--max-results', type=int, default=20, help='Maximum results (default: 20)')
     parser.add_argument('--year-min', type=int, help='Minimum publication year')
-    parser.add_argument('--output', help='Output JSON file (default: stdout)')
+    parser.add_argument('--output', type=Path, help='Output JSON file (default: stdout)')
+    parser.add_argument('--harvest', action='store_true',
+                        help='Stream NDJSON page by page with cursorMark pagination (resumable with --output)')
+    parser.add_argument('--no-abstracts', action='store_true',
+                        help='Harvest with resultType=lite (no abstracts, smaller responses)')
 
     args = parser.parse_args()
 
@@ -186,6 +211,27 @@ def main():
     print(f"Searching Europe PMC: '{args.query}'", file=sys.stderr)
 
     client = EuropePMCClient()
+
+    if args.harvest:
+        try:
+            count = harvest_ndjson(
+                lambda cursor: client.iter_pages(
+                    args.query, cursor=cursor, year_min=args.year_min,
+                    result_type='lite' if args.no_abstracts else 'core'
+                ),
+                source='europepmc',
+                query=args.query,
+                max_results=args.max_results,
+                output=args.output
+            )
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # The cursor state file is kept, so rerunning resumes the harvest
+            print(f"Harvest failed: {e}", file=sys.stderr)
+            if args.output:
+                print("Rerun the same command to resume", file=sys.stderr)
+            return 1
+        print(f"Harvested {count} papers", file=sys.stderr)
+        return 0
     papers = client.search(
         query=args.query,
         max_results=args.max_results,
@@ -10,13 +10,17 @@ OpenAlex is a free, open catalog of scholarly papers, authors, institutions, and
 
 Usage:
     python scripts/rrwrite-api-openalex.py "query" --max-results 20
+
+    # Stream up to 10k works as NDJSON; rerun the same command to resume
+    python scripts/rrwrite-api-openalex.py "query" --harvest --max-results 10000 \\
+        --output openalex.ndjson
 """
 
 import argparse
 import json
 import sys
-import time
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
+from pathlib import Path
 from urllib.parse import quote
 
 try:
@@ -27,6 +31,21 @@ except ImportError:
     print("Error: requests not installed. Install with: pip install requests")
     sys.exit(1)
 
+try:
+    from rrwrite_http_cache import get_session
+    from rrwrite_harvest import harvest_ndjson
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import get_session
+    from rrwrite_harvest import harvest_ndjson
+
+
+# Fields needed by _parse_work (keeps harvest responses small)
+SELECT_FIELDS = [
+    'id', 'doi', 'title', 'publication_year', 'authorships',
+    'primary_location', 'cited_by_count', 'abstract_inverted_index'
+]
+
 
 class OpenAlexClient:
     """Client for OpenAlex API"""
@@ -41,7 +60,7 @@ class OpenAlexClient:
             email: Contact email for polite pool (faster rate limits)
         """
         self.email = email
-        self.session = requests.Session()
+        self.session = get_session()
         self.session.headers.update({
             'User-Agent': f'RRWriteLiteratureSearch/1.0 (mailto:{email})'
         })
@@ -60,79 +79,78 @@ class OpenAlexClient:
         """
         papers = []
         per_page = min(max_results, 200)  # OpenAlex max per page
-        page = 1
-
-        # Build filter parameters
-        filters = []
-        if year_min:
-            filters.append(f"publication_year:>{year_min}")
-
-        filter_str = ",".join(filters) if filters else None
 
-        while len(papers) < max_results:
-            params = {
-                'search': query,
-                'per-page': per_page,
-                'page': page,
-                'mailto': self.email  # Polite pool
-            }
-
-            if filter_str:
-                params['filter'] = filter_str
-
-            # Sort by citation count (relevance)
-            params['sort'] = 'cited_by_count:desc'
+        try:
+            for page, _ in self.iter_pages(query, year_min=year_min, per_page=per_page):
+                papers.extend(page[:max_results - len(papers)])
+                if len(papers) >= max_results:
+                    break
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"OpenAlex API error: {e}", file=sys.stderr)
 
-            try:
-                response = self.session.get(
-                    f"{self.BASE_URL}/works",
-                    params=params,
-                    timeout=30
-                )
+        return papers
 
-                if response.status_code == 429:
-                    # Rate limited
-                    print("Rate limited, waiting 60 seconds...", file=sys.stderr)
-                    time.sleep(60)
-                    continue
+    def iter_pages(
+        self,
+        query: str,
+        cursor: str = '*',
+        year_min: int = None,
+        per_page: int = 200,
+        abstracts: bool = True
+    ) -> Iterator[Tuple[List[Dict], Optional[str]]]:
+        """
+        Page through search results with cursor pagination.
 
-                response.raise_for_status()
-                data = response.json()
+        Only the fields _parse_work needs are requested (select=).
 
-                results = data.get('results', [])
-                if not results:
-                    break
+        Args:
+            query: Search query
+            cursor: Start cursor ('*' for the first page, or a saved cursor)
+            year_min: Minimum publication year filter
+            per_page: Results per page (max 200)
+            abstracts: Request abstract_inverted_index
 
-                for work in results:
-                    if len(papers) >= max_results:
-                        break
+        Yields:
+            (papers, next_cursor) per page; next_cursor is None on the last page
 
-                    paper = self._parse_work(work)
-                    if paper:
-                        papers.append(paper)
+        Raises:
+            requests.exceptions.RequestException, ValueError: If a page request
+                fails (pages already yielded are complete)
+        """
+        fields = SELECT_FIELDS if abstracts else [f for f in SELECT_FIELDS if f != 'abstract_inverted_index']
 
-                # Check if more pages available
-                meta = data.get('meta', {})
-                if not meta.get('next_cursor'):
-                    break
+        while cursor:
+            params = {
+                'search': query,
+                'per-page': per_page,
+                'cursor': cursor,
+                'select': ','.join(fields),
+                'sort': 'cited_by_count:desc',  # Sort by citation count (relevance)
+                'mailto': self.email  # Polite pool
+            }
+            if year_min:
+                params['filter'] = f"publication_year:>{year_min}"
 
-                page += 1
-                time.sleep(0.1)  # Be polite
+            # Session enforces the shared OpenAlex rate limit and retries 429s
+            response = self.session.get(f"{self.BASE_URL}/works", params=params, timeout=30)
+            response.raise_for_status()
+            data = response.json()
 
-            except requests.exceptions.RequestException as e:
-                print(f"OpenAlex API error: {e}", file=sys.stderr)
-                break
+            results = data.get('results', [])
+            if not results:
+                return
 
-        return papers
+            cursor = data.get('meta', {}).get('next_cursor')
+            yield [self._parse_work(work) for work in results], cursor
 
     def _parse_work(self, work: Dict) -> Dict:
         """Parse OpenAlex work into standardized paper format"""
 
         # Extract DOI
-        doi = work.get('doi', '').replace('https://doi.org/', '')
+        doi = (work.get('doi') or '').replace('https://doi.org/', '')
 
         # Extract authors
-        authorships = work.get('authorships', [])
+        authorships = work.get('authorships') or []
         authors = ', '.join([
             a.get('author', {}).get('display_name', 'Unknown')
             for a in authorships[:3]  # First 3 authors
@@ -151,15 +169,15 @@ class OpenAlexClient:
         title = work.get('title', '')
 
         # Extract journal/venue
-        primary_location = work.get('primary_location', {})
-        source = primary_location.get('source', {})
+        primary_location = work.get('primary_location') or {}
+        source = primary_location.get('source') or {}
         journal = source.get('display_name', '')
 
         # Citation count
         cited_by_count = work.get('cited_by_count', 0)
 
         # OpenAlex ID
-        openalex_id = work.get('id', '').replace('https://openalex.org/', '')
+        openalex_id = (work.get('id') or '').replace('https://openalex.org/', '')
 
         return {
             'title': title,
@@ -212,7 +230,11 @@ def main():
     parser.add_argument('--max-results', type=int, default=20, help='Maximum results (default: 20)')
     parser.add_argument('--year-min', type=int, help='Minimum publication year')
     parser.add_argument('--email', default='research@example.org', help='Contact email for polite pool')
-    parser.add_argument('--output', help='Output JSON file (default: stdout)')
+    parser.add_argument('--output', type=Path, help='Output JSON file (default: stdout)')
+    parser.add_argument('--harvest', action='store_true',
+                        help='Stream NDJSON page by page with cursor pagination (resumable with --output)')
+    parser.add_argument('--no-abstracts', action='store_true',
+                        help='Harvest without abstracts (smaller responses)')
 
     args = parser.parse_args()
 
@@ -220,6 +242,26 @@ def main():
     print(f"Searching OpenAlex: '{args.query}'", file=sys.stderr)
 
     client = OpenAlexClient(email=args.email)
+
+    if args.harvest:
+        try:
+            count = harvest_ndjson(
+                lambda cursor: client.iter_pages(
+                    args.query, cursor=cursor, year_min=args.year_min, abstracts=not args.no_abstracts
+                ),
+                source='openalex',
+                query=args.query,
+                max_results=args.max_results,
+                output=args.output
+            )
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # The cursor state file is kept, so rerunning resumes the harvest
+            print(f"Harvest failed: {e}", file=sys.stderr)
+            if args.output:
+                print("Rerun the same command to resume", file=sys.stderr)
+            return 1
+        print(f"Harvested {count} papers", file=sys.stderr)
+        return 0
     papers = client.search(
         query=args.query,
         max_results=args.max_results,
@@ -4,24 +4,46 @@ PubMed E-utilities API integration for biomedical literature search.
 
 Free API with no authentication required (rate limited to 3 requests/second).
 Returns: PMID, DOI, title, authors, journal, year, abstract
+
+Retrieval uses the history server (usehistory=y / WebEnv): results are fetched
+with POSTed efetch requests in chunks of ~200 records, parsed incrementally
+and yielded as a stream, so memory stays flat for thousands of PMIDs.
 """
 
 import argparse
 import json
 import sys
-import time
-from typing import List, Dict, Any
+import io
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Iterator, Optional
 from pathlib import Path
 import xml.etree.ElementTree as ET
 
-import requests
+try:
+    from rrwrite_http_cache import get_session
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import get_session
+
+
+ESEARCH_MAX_IDS = 10000  # E-utilities retmax limit
+EFETCH_CHUNK_SIZE = 200
+
+
+@dataclass
+class HistoryResult:
+    """An esearch result set stored on the E-utilities history server."""
+    query: str
+    webenv: Optional[str] = None
+    query_key: Optional[str] = None
+    count: int = 0
+    ids: List[str] = field(default_factory=list)
 
 
 class PubMedAPI:
     """PubMed E-utilities API client."""
 
     BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/"
-    RATE_LIMIT_DELAY = 0.34  # ~3 requests/second
 
     def __init__(self, email: str = None):
         """
@@ -31,14 +53,15 @@ class PubMedAPI:
             email: Optional email for API usage tracking (recommended by NCBI)
         """
         self.email = email
-        self.last_request_time = 0
+        # Shared session: HTTP cache + cross-process NCBI rate limit (3 req/s)
+        self.session = get_session()
 
-    def _rate_limit(self):
-        """Enforce rate limiting (3 requests/second)."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.RATE_LIMIT_DELAY:
-            time.sleep(self.RATE_LIMIT_DELAY - elapsed)
-        self.last_request_time = time.time()
+    def _params(self, **params) -> Dict[str, Any]:
+        """Common E-utilities parameters."""
+        params["db"] = "pubmed"
+        if self.email:
+            params["email"] = self.email
+        return params
 
     def search(self, query: str, max_results: int = 20) -> List[str]:
         """
@@ -51,66 +74,243 @@ class PubMedAPI:
         Returns:
             List of PMIDs
         """
-        self._rate_limit()
+        return self.search_history(query, max_results).ids
+
+    def search_history(
+        self,
+        query: str,
+        max_results: int = 20,
+        webenv: Optional[str] = None
+    ) -> "HistoryResult":
+        """
+        Search PubMed and post the result set to the E-utilities history server.
 
-        url = f"{self.BASE_URL}esearch.fcgi"
-        params = {
-            "db": "pubmed",
-            "term": query,
-            "retmax": max_results,
-            "retmode": "json",
-            "sort": "relevance"
-        }
+        Passing the WebEnv of an earlier search adds this query to the same
+        session, so several queries can be fetched from one history.
 
-        if self.email:
-            params["email"] = self.email
+        Args:
+            query: Search query (PubMed syntax)
+            max_results: Maximum results to keep
+            webenv: Existing history session to join
+
+        Returns:
+            HistoryResult (empty on failure)
+        """
+        url = f"{self.BASE_URL}esearch.fcgi"
+        # PubMed serves at most ESEARCH_MAX_IDS records per query, through
+        # esearch and the history server alike
+        limit = min(max_results, ESEARCH_MAX_IDS)
+        params = self._params(
+            term=query,
+            retmax=limit,
+            retmode="json",
+            sort="relevance",
+            usehistory="y"
+        )
+        if webenv:
+            params["WebEnv"] = webenv
 
         try:
-            response = requests.get(url, params=params, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             response.raise_for_status()
-            data = response.json()
-
-            pmids = data.get("esearchresult", {}).get("idlist", [])
-            return pmids
+            result = response.json().get("esearchresult", {})
+
+            ids = result.get("idlist", [])
+            total = int(result.get("count", 0))
+            if total > limit and max_results > ESEARCH_MAX_IDS:
+                print(f"Warning: '{query}' matched {total} records; PubMed returns at most "
+                      f"{ESEARCH_MAX_IDS} per query, narrow the query to retrieve the rest",
+                      file=sys.stderr)
+            return HistoryResult(
+                query=query,
+                webenv=result.get("webenv"),
+                query_key=result.get("querykey"),
+                count=min(total, limit),
+                ids=ids
+            )
 
         except Exception as e:
             print(f"Error: PubMed search failed: {e}", file=sys.stderr)
-            return []
+            return HistoryResult(query=query)
 
-    def fetch_summaries(self, pmids: List[str]) -> List[Dict[str, Any]]:
+    def iter_history(
+        self,
+        history: "HistoryResult",
+        chunk_size: int = EFETCH_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Fetch article summaries for PMIDs.
+        Stream full records for a history result set in chunks.
+
+        Each chunk is one POST to efetch (retstart/retmax over the WebEnv),
+        parsed incrementally. If the history session has expired, falls back
+        to fetching the PMIDs returned by esearch, resuming after the last
+        record already yielded.
 
         Args:
-            pmids: List of PMIDs
+            history: Result of search_history()
+            chunk_size: Records per efetch request
 
-        Returns:
-            List of article dictionaries
+        Yields:
+            Article dictionaries (see _parse_article)
+        """
+        if not history.count:
+            return
+
+        if not (history.webenv and history.query_key):
+            yield from self.iter_records(history.ids, chunk_size)
+            return
+
+        position = {pmid: i for i, pmid in enumerate(history.ids)}
+        resume = 0  # Index into history.ids after the last yielded record
+        for start in range(0, history.count, chunk_size):
+            data = self._params(
+                WebEnv=history.webenv,
+                query_key=history.query_key,
+                retstart=start,
+                retmax=min(chunk_size, history.count - start),
+                retmode="xml"
+            )
+            resume = max(resume, start)
+            try:
+                for article in self._efetch(data):
+                    resume = max(resume, position.get(article["pmid"], resume - 1) + 1)
+                    yield article
+            except Exception as e:
+                print(f"Warning: history fetch failed ({e}), fetching by PMID", file=sys.stderr)
+                yield from self.iter_records(history.ids[resume:], chunk_size)
+                return
+
+    def iter_records(
+        self,
+        pmids: List[str],
+        chunk_size: int = EFETCH_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
         """
-        if not pmids:
-            return []
+        Stream full records for explicit PMIDs, one POSTed efetch per chunk.
 
-        self._rate_limit()
+        Args:
+            pmids: List of PMIDs
+            chunk_size: Records per efetch request
 
-        url = f"{self.BASE_URL}esummary.fcgi"
-        params = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "json"
+        Yields:
+            Article dictionaries (see _parse_article)
+        """
+        for start in range(0, len(pmids), chunk_size):
+            chunk = pmids[start:start + chunk_size]
+            try:
+                yield from self._efetch(self._params(id=",".join(chunk), retmode="xml"))
+            except Exception as e:
+                print(f"Error: Failed to fetch records: {e}", file=sys.stderr)
+
+    def _efetch(self, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """POST one efetch request and parse PubmedArticle elements incrementally."""
+        response = self.session.post(f"{self.BASE_URL}efetch.fcgi", data=data, timeout=60)
+        response.raise_for_status()
+
+        # iterparse + clear() keeps only the current article in memory
+        for _, elem in ET.iterparse(io.BytesIO(response.content), events=("end",)):
+            if elem.tag == "PubmedArticle":
+                article = self._parse_article(elem)
+                elem.clear()
+                if article:
+                    yield article
+            elif elem.tag == "ERROR":
+                raise RuntimeError(elem.text or "efetch error")
+
+    def _parse_article(self, elem: ET.Element) -> Optional[Dict[str, Any]]:
+        """Parse a PubmedArticle element into the standard paper dictionary."""
+        pmid = elem.findtext("MedlineCitation/PMID")
+        if not pmid:
+            return None
+
+        article = elem.find("MedlineCitation/Article")
+        if article is None:
+            return None
+
+        title_elem = article.find("ArticleTitle")
+        title = "".join(title_elem.itertext()).strip() if title_elem is not None else ""
+
+        # Structured abstracts have several labelled AbstractText sections
+        parts = []
+        for section in article.findall("Abstract/AbstractText"):
+            text = "".join(section.itertext()).strip()
+            if not text:
+                continue
+            label = section.get("Label")
+            parts.append(f"{label}: {text}" if label else text)
+
+        authors = []
+        for author in article.findall("AuthorList/Author"):
+            name = author.findtext("CollectiveName")
+            if not name:
+                last = author.findtext("LastName", "")
+                initials = author.findtext("Initials", "")
+                name = f"{last} {initials}".strip()
+            if name:
+                authors.append({"name": name})
+
+        pub_date_elem = article.find("Journal/JournalIssue/PubDate")
+        pub_date = ""
+        if pub_date_elem is not None:
+            pub_date = pub_date_elem.findtext("MedlineDate") or " ".join(
+                part for part in (
+                    pub_date_elem.findtext("Year"),
+                    pub_date_elem.findtext("Month"),
+                    pub_date_elem.findtext("Day")
+                ) if part
+            )
+
+        doi = ""
+        for article_id in elem.findall("PubmedData/ArticleIdList/ArticleId"):
+            if article_id.get("IdType") == "doi" and article_id.text:
+                doi = article_id.text.strip()
+                break
+        if not doi:
+            for eloc in article.findall("ELocationID"):
+                if eloc.get("EIdType") == "doi" and eloc.text:
+                    doi = eloc.text.strip()
+                    break
+
+        return {
+            "pmid": pmid,
+            "title": title,
+            "authors": self._format_authors(authors),
+            "journal": article.findtext("Journal/Title", ""),
+            "pub_date": pub_date,
+            "year": self._extract_year(pub_date),
+            "doi": doi,
+            "source": "PubMed",
+            "url": f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+            "abstract": "\n".join(parts)
         }
 
-        if self.email:
-            params["email"] = self.email
+    def fetch_summaries(self, pmids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch article summaries for PMIDs.
 
-        try:
-            response = requests.get(url, params=params, timeout=15)
-            response.raise_for_status()
-            data = response.json()
+        Args:
+            pmids: List of PMIDs
 
-            articles = []
-            for pmid in pmids:
-                if pmid in data.get("result", {}):
-                    article = data["result"][pmid]
+        Returns:
+            List of article dictionaries
+        """
+        articles = []
+
+        for start in range(0, len(pmids), EFETCH_CHUNK_SIZE):
+            chunk = pmids[start:start + EFETCH_CHUNK_SIZE]
+            data = self._params(id=",".join(chunk), retmode="json")
+
+            try:
+                response = self.session.post(f"{self.BASE_URL}esummary.fcgi", data=data, timeout=15)
+                response.raise_for_status()
+                result = response.json().get("result", {})
+            except Exception as e:
+                print(f"Error: Failed to fetch summaries: {e}", file=sys.stderr)
+                continue
+
+            for pmid in chunk:
+                if pmid in result:
+                    article = result[pmid]
                     articles.append({
                         "pmid": pmid,
                         "title": article.get("title", ""),
@@ -124,15 +324,11 @@ class PubMedAPI:
                         "abstract": ""  # Filled by fetch_abstracts
                     })
 
-            return articles
-
-        except Exception as e:
-            print(f"Error: Failed to fetch summaries: {e}", file=sys.stderr)
-            return []
+        return articles
 
     def fetch_abstracts(self, pmids: List[str]) -> Dict[str, str]:
         """
-        Fetch abstracts for PMIDs via efetch (XML).
+        Fetch abstracts for PMIDs via chunked efetch (XML).
 
         Args:
             pmids: List of PMIDs
@@ -140,44 +336,12 @@ class PubMedAPI:
         Returns:
             Dictionary mapping PMID -> abstract text
         """
-        if not pmids:
-            return {}
-
-        self._rate_limit()
-
-        url = f"{self.BASE_URL}efetch.fcgi"
-        params = {
-            "db": "pubmed",
-            "id": ",".join(pmids),
-            "retmode": "xml"
+        return {
+            article["pmid"]: article["abstract"]
+            for article in self.iter_records(pmids)
+            if article["abstract"]
         }
 
-        if self.email:
-            params["email"] = self.email
-
-        try:
-            response = requests.get(url, params=params, timeout=20)
-            response.raise_for_status()
-
-            # Parse XML
-            root = ET.fromstring(response.content)
-            abstracts = {}
-
-            for article in root.findall(".//PubmedArticle"):
-                pmid_elem = article.find(".//PMID")
-                abstract_elem = article.find(".//AbstractText")
-
-                if pmid_elem is not None and abstract_elem is not None:
-                    pmid = pmid_elem.text
-                    abstract = abstract_elem.text or ""
-                    abstracts[pmid] = abstract
-
-            return abstracts
-
-        except Exception as e:
-            print(f"Error: Failed to fetch abstracts: {e}", file=sys.stderr)
-            return {}
-
     def _format_authors(self, authors_data: List) -> str:
         """Format author list as string."""
         if not authors_data:
@@ -223,6 +387,51 @@ class PubMedAPI:
         return ""
 
 
+def iter_pubmed(
+    queries: List[str],
+    max_results: int = 20,
+    email: str = None,
+    chunk_size: int = EFETCH_CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream PubMed records for one or more queries from a single history session.
+
+    All queries join the same WebEnv; records are fetched in chunks and
+    yielded as they are parsed. A PMID matched by several queries is yielded
+    once, tagged with the first query that found it.
+
+    Args:
+        queries: Search queries
+        max_results: Maximum results per query
+        email: Optional email for API tracking
+        chunk_size: Records per efetch request
+
+    Yields:
+        Paper dictionaries with PMID, DOI, title, authors, abstract, query
+    """
+    api = PubMedAPI(email=email)
+    webenv = None
+    histories = []
+
+    # Step 1: Search all queries into one history session
+    for query in queries:
+        print(f"Searching PubMed: '{query}'", file=sys.stderr)
+        history = api.search_history(query, max_results, webenv=webenv)
+        webenv = history.webenv or webenv
+        print(f"Found {history.count} PMIDs", file=sys.stderr)
+        histories.append(history)
+
+    # Step 2: Stream full records (summary fields + complete abstracts)
+    seen = set()
+    for history in histories:
+        for article in api.iter_history(history, chunk_size):
+            if article["pmid"] in seen:
+                continue
+            seen.add(article["pmid"])
+            article["query"] = history.query
+            yield article
+
+
 def search_pubmed(
     query: str,
     max_results: int = 20,
@@ -239,29 +448,10 @@ def search_pubmed(
     Returns:
         List of paper dictionaries with PMID, DOI, title, authors, abstract
     """
-    api = PubMedAPI(email=email)
-
-    # Step 1: Search for PMIDs
-    print(f"Searching PubMed: '{query}'", file=sys.stderr)
-    pmids = api.search(query, max_results)
+    articles = list(iter_pubmed([query], max_results, email))
 
-    if not pmids:
+    if not articles:
         print("No results found", file=sys.stderr)
-        return []
-
-    print(f"Found {len(pmids)} PMIDs", file=sys.stderr)
-
-    # Step 2: Fetch article summaries
-    articles = api.fetch_summaries(pmids)
-
-    # Step 3: Fetch abstracts
-    print(f"Fetching abstracts for {len(pmids)} articles", file=sys.stderr)
-    abstracts = api.fetch_abstracts(pmids)
-
-    # Add abstracts to articles
-    for article in articles:
-        pmid = article["pmid"]
-        article["abstract"] = abstracts.get(pmid, "")
 
     return articles
 
@@ -271,7 +461,7 @@ def main():
     parser = argparse.ArgumentParser(
         description="Search PubMed E-utilities API for biomedical papers"
     )
-    parser.add_argument("query", help="Search query (PubMed syntax)")
+    parser.add_argument("query", nargs="+", help="Search query (PubMed syntax); several queries share one history session")
     parser.add_argument(
         "--max-results",
         type=int,
@@ -282,6 +472,17 @@ def main():
         "--email",
         help="Email for NCBI API tracking (recommended)"
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=EFETCH_CHUNK_SIZE,
+        help=f"Records per efetch request (default: {EFETCH_CHUNK_SIZE})"
+    )
+    parser.add_argument(
+        "--ndjson",
+        action="store_true",
+        help="Stream one JSON record per line as records arrive"
+    )
     parser.add_argument(
         "--output",
         help="Output JSON file (default: stdout)"
@@ -289,14 +490,28 @@ def main():
 
     args = parser.parse_args()
 
-    # Search
-    results = search_pubmed(args.query, args.max_results, args.email)
+    records = iter_pubmed(args.query, args.max_results, args.email, args.chunk_size)
+
+    if args.ndjson:
+        out = open(args.output, 'w') if args.output else sys.stdout
+        count = 0
+        try:
+            for record in records:
+                out.write(json.dumps(record) + "\n")
+                count += 1
+        finally:
+            if args.output:
+                out.close()
+        print(f"Retrieved {count} complete articles", file=sys.stderr)
+        return 0
+
+    results = list(records)
 
     print(f"Retrieved {len(results)} complete articles", file=sys.stderr)
 
     # Output
     output_data = {
-        "query": args.query,
+        "query": args.query[0] if len(args.query) == 1 else args.query,
         "result_count": len(results),
         "papers": results
     }
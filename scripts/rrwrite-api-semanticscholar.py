@@ -14,6 +14,12 @@ from pathlib import Path
 
 import requests
 
+try:
+    from rrwrite_http_cache import shared_session
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import shared_session
+
 
 def format_authors(authors: List[Dict]) -> str:
     """
@@ -85,7 +91,7 @@ def search_semantic_scholar(
             params["year"] = f"-{year_max}"
 
     try:
-        response = requests.get(url, params=params, timeout=15)
+        response = shared_session().get(url, params=params, timeout=15)
         response.raise_for_status()
         data = response.json()
 
@@ -9,8 +9,10 @@ resolution, conflict detection, and transaction-based safety.
 import argparse
 import json
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, Tuple
 
 SCRIPTS_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPTS_DIR))
@@ -25,18 +27,78 @@ from rrwrite_edit_applicators import (
 )
 
 
+def _apply_recommendation(rec, applicators: Dict) -> Tuple[bool, str]:
+    """Route an edit to its applicator: (success, message)."""
+    try:
+        if rec.edit_type in ["add_content", "remove_content", "revise_content", "citation_fix"]:
+            return applicators["section"].apply_edit(rec)
+
+        elif rec.edit_type == "move_content":
+            if len(rec.target_sections) >= 1:
+                target = rec.target_sections[0]
+                return applicators["cross_section"].move_content(
+                    rec.section,
+                    target,
+                    rec.issue_description
+                )
+            return False, "No target section specified for move"
+
+        elif rec.edit_type == "figure_update":
+            # Extract figure ID from description
+            figure_id = "figure_1"  # Placeholder - should be extracted
+            return applicators["figure"].update_caption(figure_id, rec.replacement_text or "Updated caption")
+
+        elif rec.edit_type == "table_update":
+            table_id = "table_1"  # Placeholder
+            return applicators["table"].update_title(table_id, rec.replacement_text or "Updated title")
+
+        elif rec.edit_type == "formatting":
+            # Consistency applicator
+            return True, "Formatting edit noted (manual application required)"
+
+        return False, f"Unsupported edit type: {rec.edit_type}"
+
+    except Exception as e:
+        return False, f"Exception: {str(e)}"
+
+
+def _record_result(results: dict, edit_id: str, rec, success: bool, message: str) -> None:
+    """Update recommendation status and results for an applied edit."""
+    if success:
+        rec.mark_applied()
+        results["applied"] += 1
+        print(f"  ✓ {message}")
+    else:
+        rec.mark_failed(message)
+        results["failed"] += 1
+        print(f"  ✗ {message}")
+
+    results["details"].append({
+        "id": edit_id,
+        "status": "applied" if success else "failed",
+        "message": message
+    })
+
+
 def apply_edits(
     orchestrator: HolisticEditOrchestrator,
     dry_run: bool = False,
-    backup: bool = True
+    backup: bool = True,
+    workers: int = 1
 ) -> dict:
     """
     Apply all edits in the orchestrator's plan.
 
+    With more than one worker, the plan is applied wave by wave (see
+    ApplicationPlan.waves()): the lanes of a wave, one per section, run
+    concurrently and each lane applies its edits in plan order. Results are
+    printed per wave, in plan order.
+
     Args:
         orchestrator: Initialized orchestrator with plan
         dry_run: If True, don't actually modify files
         backup: If True, create backups before modification
+        workers: Sections edited concurrently (1 = apply in plan order)
 
     Returns:
         Dictionary with application results
@@ -50,11 +112,13 @@ def apply_edits(
     }
 
     # Initialize applicators
-    section_applicator = SectionEditApplicator(orchestrator.manuscript_dir)
-    cross_section_applicator = CrossSectionApplicator(orchestrator.manuscript_dir)
-    figure_applicator = FigureEditApplicator(orchestrator.manuscript_dir)
-    table_applicator = TableEditApplicator(orchestrator.manuscript_dir)
-    consistency_applicator = ConsistencyApplicator(orchestrator.manuscript_dir)
+    applicators = {
+        "section": SectionEditApplicator(orchestrator.manuscript_dir),
+        "cross_section": CrossSectionApplicator(orchestrator.manuscript_dir),
+        "figure": FigureEditApplicator(orchestrator.manuscript_dir),
+        "table": TableEditApplicator(orchestrator.manuscript_dir),
+        "consistency": ConsistencyApplicator(orchestrator.manuscript_dir),
+    }
 
     # Create backup if requested
     if backup and not dry_run:
@@ -68,9 +132,37 @@ def apply_edits(
             shutil.copytree(sections_dir, backup_dir / "sections", dirs_exist_ok=True)
             print(f"✓ Backup created: {backup_dir}")
 
+    recommendations = orchestrator.plan.recommendations
+
+    if workers > 1 and not dry_run:
+        def apply_lane(lane):
+            return [
+                (edit_id, _apply_recommendation(recommendations[edit_id], applicators))
+                for edit_id in lane
+                if recommendations[edit_id].status != "skipped"
+            ]
+
+        position = {edit_id: i for i, edit_id in enumerate(orchestrator.plan.sorted_edits)}
+
+        for wave in orchestrator.plan.waves():
+            lanes = list(wave.values())
+            with ThreadPoolExecutor(max_workers=min(workers, len(lanes)),
+                                    thread_name_prefix="rrwrite-edit") as executor:
+                outcomes = dict(o for lane in executor.map(apply_lane, lanes) for o in lane)
+
+            for edit_id in sorted((e for lane in lanes for e in lane), key=position.get):
+                rec = recommendations[edit_id]
+                if edit_id not in outcomes:
+                    results["skipped"] += 1
+                    continue
+                print(f"\nApplying {edit_id}: {rec.edit_type} in {rec.section}...")
+                _record_result(results, edit_id, rec, *outcomes[edit_id])
+
+        return results
+
     # Apply each edit
     for edit_id in orchestrator.plan.sorted_edits:
-        rec = orchestrator.plan.recommendations[edit_id]
+        rec = recommendations[edit_id]
 
         if rec.status == "skipped":
             results["skipped"] += 1
@@ -90,59 +182,8 @@ def apply_edits(
             continue
 
         # Route to appropriate applicator
-        success = False
-        message = ""
-
-        try:
-            if rec.edit_type in ["add_content", "remove_content", "revise_content", "citation_fix"]:
-                success, message = section_applicator.apply_edit(rec)
-
-            elif rec.edit_type == "move_content":
-                if len(rec.target_sections) >= 1:
-                    target = rec.target_sections[0]
-                    success, message = cross_section_applicator.move_content(
-                        rec.section,
-                        target,
-                        rec.issue_description
-                    )
-                else:
-                    success, message = False, "No target section specified for move"
-
-            elif rec.edit_type == "figure_update":
-                # Extract figure ID from description
-                figure_id = "figure_1"  # Placeholder - should be extracted
-                success, message = figure_applicator.update_caption(figure_id, rec.replacement_text or "Updated caption")
-
-            elif rec.edit_type == "table_update":
-                table_id = "table_1"  # Placeholder
-                success, message = table_applicator.update_title(table_id, rec.replacement_text or "Updated title")
-
-            elif rec.edit_type == "formatting":
-                # Consistency applicator
-                success, message = True, "Formatting edit noted (manual application required)"
-
-            else:
-                success, message = False, f"Unsupported edit type: {rec.edit_type}"
-
-        except Exception as e:
-            success = False
-            message = f"Exception: {str(e)}"
-
-        # Update recommendation status
-        if success:
-            rec.mark_applied()
-            results["applied"] += 1
-            print(f"  ✓ {message}")
-        else:
-            rec.mark_failed(message)
-            results["failed"] += 1
-            print(f"  ✗ {message}")
-
-        results["details"].append({
-            "id": edit_id,
-            "status": "applied" if success else "failed",
-            "message": message
-        })
+        success, message = _apply_recommendation(rec, applicators)
+        _record_result(results, edit_id, rec, success, message)
 
     return results
 
@@ -243,6 +284,13 @@ Examples:
         help="Skip backup creation (not recommended)"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Sections edited concurrently, in dependency waves (default: 1)"
+    )
+
     parser.add_argument(
         "--output-report",
         type=Path,
@@ -298,7 +346,12 @@ Examples:
 
     # Apply edits
     print("\nApplying edits...")
-    results = apply_edits(orchestrator, dry_run=args.dry_run, backup=not args.no_backup)
+    results = apply_edits(
+        orchestrator,
+        dry_run=args.dry_run,
+        backup=not args.no_backup,
+        workers=args.workers
+    )
 
     # Generate report
     if not args.output_report:
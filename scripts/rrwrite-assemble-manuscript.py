@@ -7,6 +7,14 @@ Generates multiple output formats:
 - DOCX (.docx): Microsoft Word format with proper figure/table handling
 - PDF (.pdf): PDF format (if pdflatex/weasyprint/wkhtmltopdf available)
 
+Sections are read once and cached (.assembly_cache.json); only changed
+sections are re-read and full_manuscript.md is rewritten only when its
+content changes (see rrwrite_manuscript_assembler).
+
+DOCX and PDF are converted concurrently, and a format is only regenerated
+when the manuscript, bibliography, CSL style, reference doc or referenced
+images changed (see rrwrite_pandoc_export; --force-export overrides).
+
 Figure and Table Handling:
 - Images: Place image files (PNG, JPG, PDF) in the manuscript directory or subdirectories
 - Reference in markdown: ![Caption text](path/to/image.png)
@@ -23,67 +31,79 @@ Usage:
 """
 
 import argparse
-import re
-import json
 from pathlib import Path
-from datetime import datetime
+from typing import List
 
+# The Paperpile helpers used to live in this script; re-exported for callers
+# that load it as a module.
+try:
+    from rrwrite_manuscript_assembler import (  # noqa: F401
+        ManuscriptAssembler, convert_paperpile_to_bibtex, detect_paperpile_citations
+    )
+    from rrwrite_pandoc_export import ExportResult, PandocExporter, manuscript_export_jobs
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_manuscript_assembler import (  # noqa: F401
+        ManuscriptAssembler, convert_paperpile_to_bibtex, detect_paperpile_citations
+    )
+    from rrwrite_pandoc_export import ExportResult, PandocExporter, manuscript_export_jobs
 
-def detect_paperpile_citations(text: str) -> bool:
-    """Check if text contains Paperpile citations."""
-    pattern = r'\[.*?\]\(https://paperpile\.com/c/[^/]+/[^\)]+\)'
-    return bool(re.search(pattern, text))
 
+def export_formats(output_file: Path, manuscript_dir: Path, force: bool = False) -> List[ExportResult]:
+    """Generate DOCX and PDF versions of the assembled manuscript.
 
-def convert_paperpile_to_bibtex(
-    text: str,
-    mapping_file: Path
-) -> str:
-    """
-    Convert Paperpile citation links to BibTeX keys.
-
-    Transforms: [(Author et al. YEAR)](https://paperpile.com/c/PROJECT/CODE)
-    To: [authorYEAR]
+    Both conversions run concurrently; a format whose inputs are unchanged
+    since its last export is not converted again.
 
     Args:
-        text: Text with Paperpile citations
-        mapping_file: Path to paperpile_mapping.json
+        output_file: Assembled markdown manuscript
+        manuscript_dir: Manuscript directory (figures, tables, bibliography)
+        force: Convert even if inputs are unchanged
 
     Returns:
-        Text with BibTeX citations
+        Export results (DOCX, PDF), or an empty list if pandoc is missing
     """
-    if not mapping_file.exists():
-        print(f"Warning: Paperpile mapping file not found: {mapping_file}")
-        return text
-
-    # Load mapping
-    try:
-        with open(mapping_file, 'r') as f:
-            mapping = json.load(f)
-    except Exception as e:
-        print(f"Warning: Could not load Paperpile mapping: {e}")
-        return text
-
-    # Pattern: [(display text)](https://paperpile.com/c/PROJECT/CODE)
-    pattern = r'\[(.*?)\]\(https://paperpile\.com/c/[^/]+/([^\)]+)\)'
-
-    def replace_citation(match):
-        display_text = match.group(1)
-        paperpile_code = match.group(2)
+    exporter = PandocExporter(force=force)
+    if not exporter.available:
+        print("\n  Note: Pandoc not found. Install to generate DOCX/PDF:")
+        print("    brew install pandoc")
+        return []
+
+    print("\nGenerating alternate formats...")
+    docx_job, pdf_job = manuscript_export_jobs(output_file, manuscript_dir)
+    bib_file = manuscript_dir / "literature_citations.bib"
+    if bib_file.exists():
+        print(f"  📚 Bibliography processing enabled: {bib_file.name}")
+    docx_result, pdf_result = exporter.run([docx_job, pdf_job])
+
+    if docx_result.status == 'unchanged':
+        print(f"  ✓ DOCX unchanged: {docx_result.output}")
+    elif docx_result.ok:
+        docx_size = docx_result.output.stat().st_size / 1024  # KB
+        print(f"  ✓ DOCX generated: {docx_result.output} ({docx_size:.1f} KB)")
+        print(f"    - Images resolved from:")
+        print(f"      • {manuscript_dir / 'figures/from_repo'}/ (Priority 1: Repository)")
+        print(f"      • {manuscript_dir / 'figures/generated'}/ (Priority 2: Generated)")
+        print(f"    - Media extracted to: {manuscript_dir / 'media'}/")
+    else:
+        print(f"  ⚠ DOCX generation failed: {docx_result.error}")
 
-        # Look up BibTeX key
-        if paperpile_code in mapping:
-            bibtex_key = mapping[paperpile_code]
-            return f'[{bibtex_key}]'
-        else:
-            # Keep original if not in mapping
-            print(f"Warning: Paperpile code '{paperpile_code}' not in mapping, keeping original")
-            return match.group(0)
+    if pdf_result.status == 'unchanged':
+        print(f"  ✓ PDF unchanged: {pdf_result.output}")
+    elif pdf_result.ok:
+        pdf_size = pdf_result.output.stat().st_size / 1024  # KB
+        print(f"  ✓ PDF generated: {pdf_result.output} ({pdf_size:.1f} KB) [engine: {pdf_result.engine}]")
+    else:
+        if pdf_result.error and pdf_result.error.startswith('timed out'):
+            print(f"  ⚠ PDF generation {pdf_result.error}")
+        print(f"  ⚠ PDF generation skipped (requires pdflatex, weasyprint, or wkhtmltopdf)")
+        print(f"    Install with: brew install basictex  # for pdflatex")
 
-    return re.sub(pattern, replace_citation, text)
+    return [docx_result, pdf_result]
 
 
-def assemble_manuscript(manuscript_dir="manuscript", output_file=None):
+def assemble_manuscript(manuscript_dir="manuscript", output_file=None, force_export=False):
     """Assemble sections into full manuscript."""
 
     manuscript_dir = Path(manuscript_dir)
@@ -92,39 +112,9 @@ def assemble_manuscript(manuscript_dir="manuscript", output_file=None):
         print(f"Error: {manuscript_dir} directory not found")
         return False
 
-    # Standard section order
-    section_order = [
-        "abstract.md",
-        "introduction.md",
-        "methods.md",
-        "results.md",
-        "discussion.md",
-        "conclusion.md"
-    ]
-
-    # Check for sections in two possible locations:
-    # 1. Direct: manuscript_dir/abstract.md
-    # 2. Subdirectory: manuscript_dir/sections/abstract.md
+    assembler = ManuscriptAssembler(manuscript_dir)
+    found_sections, missing_sections = assembler.locate_sections()
     sections_dir = manuscript_dir / "sections"
-    found_sections = []
-    missing_sections = []
-    section_paths = {}  # Map section name to full path
-
-    for section in section_order:
-        # Try direct path first
-        direct_path = manuscript_dir / section
-        sections_subdir_path = sections_dir / section
-
-        if direct_path.exists():
-            found_sections.append(section)
-            section_paths[section] = direct_path
-        elif sections_subdir_path.exists():
-            found_sections.append(section)
-            section_paths[section] = sections_subdir_path
-        else:
-            # Conclusion is optional
-            if section != "conclusion.md":
-                missing_sections.append(section)
 
     if missing_sections:
         print(f"Warning: Missing sections: {', '.join(missing_sections)}")
@@ -134,184 +124,37 @@ def assemble_manuscript(manuscript_dir="manuscript", output_file=None):
         print(f"Error: No section files found in {manuscript_dir}/ or {sections_dir}/")
         return False
 
-    # Determine output file
-    if output_file is None:
-        output_file = manuscript_dir / "full_manuscript.md"
-    else:
-        output_file = Path(output_file)
-
     print(f"Assembling manuscript from {len(found_sections)} sections:")
     for section in found_sections:
         print(f"  ✓ {section}")
     print()
 
-    # Check for Paperpile citations and mapping
-    paperpile_mapping_file = manuscript_dir / "paperpile_mapping.json"
-    has_paperpile = False
-    convert_citations = False
+    # Sections are read once; unchanged sections come from the assembly cache
+    result = assembler.assemble(output_file)
+    output_file = result.output_file
 
-    # Detect Paperpile citations in sections
-    for section in found_sections:
-        section_path = section_paths[section]
-        with open(section_path, 'r') as f:
-            content = f.read()
-            if detect_paperpile_citations(content):
-                has_paperpile = True
-                break
-
-    if has_paperpile:
+    if result.has_paperpile:
+        paperpile_mapping_file = assembler.mapping_file
         print("📋 Detected Paperpile citations in manuscript")
-        if paperpile_mapping_file.exists():
+        if result.converted_citations:
             print(f"  ✓ Found mapping file: {paperpile_mapping_file.name}")
             print("  Converting Paperpile → BibTeX format...")
-            convert_citations = True
         else:
             print(f"  ⚠️  Warning: No mapping file found at {paperpile_mapping_file}")
             print("  Keeping Paperpile citations as-is")
             print("  To convert citations, create paperpile_mapping.json first")
 
-    # Assemble sections
-    with open(output_file, 'w') as outfile:
-        # Write header
-        outfile.write(f"# Full Manuscript\n\n")
-        outfile.write(f"**Assembled:** {datetime.now().strftime('%Y-%m-%d')}\n\n")
-        outfile.write("---\n\n")
-
-        # Write each section
-        for section in found_sections:
-            section_path = section_paths[section]
-            section_name = section.replace('.md', '').title()
-
-            # Add section header if not already in file
-            with open(section_path, 'r') as infile:
-                content = infile.read().strip()
-
-                # Convert Paperpile citations if needed
-                if convert_citations:
-                    content = convert_paperpile_to_bibtex(content, paperpile_mapping_file)
-
-                # Check if content already starts with a title
-                if not content.startswith('# '):
-                    outfile.write(f"# {section_name}\n\n")
-
-                outfile.write(content)
-                outfile.write("\n\n---\n\n")
-
-    print(f"✓ Manuscript assembled: {output_file}")
+    if result.written:
+        print(f"✓ Manuscript assembled: {output_file}")
+    else:
+        print(f"✓ Manuscript unchanged: {output_file}")
     print(f"  Total size: {output_file.stat().st_size} bytes")
-
-    # Count words
-    with open(output_file, 'r') as f:
-        content = f.read()
-        words = len(content.split())
-        print(f"  Estimated words: {words}")
+    print(f"  Estimated words: {result.words}")
+    if len(result.reread) < len(result.sections):
+        print(f"  Sections re-read: {len(result.reread)} of {len(result.sections)}")
 
     # Generate DOCX and PDF versions
-    import subprocess
-    import shutil
-
-    if shutil.which("pandoc"):
-        print("\nGenerating alternate formats...")
-
-        # Generate DOCX with proper figure and table handling
-        docx_file = output_file.with_suffix('.docx')
-        try:
-            # Set resource paths to include both figure and table directories
-            # Priority 1: from_repo directories (original research outputs)
-            # Priority 2: generated directories (analysis visualizations)
-            resource_paths = [
-                str(manuscript_dir),
-                str(manuscript_dir / "figures/from_repo"),
-                str(manuscript_dir / "figures/generated"),
-                str(manuscript_dir / "tables/from_repo"),
-                str(manuscript_dir / "tables/generated"),
-                str(manuscript_dir / "figures"),  # Fallback for old manuscripts
-                str(manuscript_dir / "tables")    # Fallback for old manuscripts
-            ]
-
-            # Build pandoc command with proper image/table support
-            pandoc_cmd = [
-                "pandoc",
-                str(output_file),
-                "-o", str(docx_file),
-                "--standalone",
-                "--resource-path", ":".join(resource_paths),  # Colon-separated paths
-                "--extract-media", str(manuscript_dir / "media"),
-                "--wrap=preserve",
-                "--metadata", "title=Manuscript"
-            ]
-
-            # Add bibliography processing if .bib file exists
-            bib_file = manuscript_dir / "literature_citations.bib"
-            if bib_file.exists():
-                pandoc_cmd.extend([
-                    "--bibliography", str(bib_file),
-                    "--citeproc"
-                ])
-                # Add CSL style if available
-                csl_file = manuscript_dir / "citation-style.csl"
-                if not csl_file.exists():
-                    # Try common CSL files in templates
-                    templates_dir = Path(__file__).parent.parent / "templates"
-                    for csl_name in ["nature.csl", "apa.csl", "chicago.csl"]:
-                        csl_path = templates_dir / csl_name
-                        if csl_path.exists():
-                            csl_file = csl_path
-                            break
-                if csl_file.exists():
-                    pandoc_cmd.extend(["--csl", str(csl_file)])
-                print(f"  📚 Bibliography processing enabled: {bib_file.name}")
-
-            # Add reference doc if available (for consistent styling)
-            reference_doc = Path(__file__).parent.parent / "templates/reference.docx"
-            if reference_doc.exists():
-                pandoc_cmd.extend(["--reference-doc", str(reference_doc)])
-
-            subprocess.run(pandoc_cmd, check=True, capture_output=True)
-
-            docx_size = docx_file.stat().st_size / 1024  # KB
-            print(f"  ✓ DOCX generated: {docx_file} ({docx_size:.1f} KB)")
-            print(f"    - Images resolved from:")
-            print(f"      • {manuscript_dir / 'figures/from_repo'}/ (Priority 1: Repository)")
-            print(f"      • {manuscript_dir / 'figures/generated'}/ (Priority 2: Generated)")
-            print(f"    - Media extracted to: {manuscript_dir / 'media'}/")
-        except subprocess.CalledProcessError as e:
-            print(f"  ⚠ DOCX generation failed: {e.stderr.decode()}")
-        except Exception as e:
-            print(f"  ⚠ DOCX generation failed: {e}")
-
-        # Generate PDF (try multiple engines)
-        pdf_file = output_file.with_suffix('.pdf')
-        pdf_engines = ['pdflatex', 'weasyprint', 'wkhtmltopdf']
-        pdf_generated = False
-
-        for engine in pdf_engines:
-            try:
-                subprocess.run([
-                    "pandoc",
-                    str(output_file),
-                    "-o", str(pdf_file),
-                    "--pdf-engine=" + engine,
-                    "-V", "geometry:margin=1in"
-                ], check=True, capture_output=True, timeout=60)
-                pdf_size = pdf_file.stat().st_size / 1024  # KB
-                print(f"  ✓ PDF generated: {pdf_file} ({pdf_size:.1f} KB) [engine: {engine}]")
-                pdf_generated = True
-                break
-            except subprocess.CalledProcessError:
-                continue
-            except subprocess.TimeoutExpired:
-                print(f"  ⚠ PDF generation timed out with {engine}")
-                continue
-            except Exception:
-                continue
-
-        if not pdf_generated:
-            print(f"  ⚠ PDF generation skipped (requires pdflatex, weasyprint, or wkhtmltopdf)")
-            print(f"    Install with: brew install basictex  # for pdflatex")
-    else:
-        print("\n  Note: Pandoc not found. Install to generate DOCX/PDF:")
-        print("    brew install pandoc")
+    export_formats(output_file, manuscript_dir, force=force_export)
 
     # Update state
     try:
@@ -356,13 +199,18 @@ def main():
         default=None,
         help='Output file path (default: <output-dir>/full_manuscript.md)'
     )
+    parser.add_argument(
+        '--force-export',
+        action='store_true',
+        help='Regenerate DOCX/PDF even if the manuscript and its inputs are unchanged'
+    )
 
     args = parser.parse_args()
 
     # Prefer --output-dir over --manuscript-dir
     manuscript_dir = args.output_dir if args.output_dir else args.manuscript_dir
 
-    success = assemble_manuscript(manuscript_dir, args.output)
+    success = assemble_manuscript(manuscript_dir, args.output, force_export=args.force_export)
 
     if not success:
         exit(1)
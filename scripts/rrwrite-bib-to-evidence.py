@@ -17,15 +17,20 @@ CSV columns:
 """
 
 import re
+import sys
 import csv
-import time
 import argparse
-import requests
 from pathlib import Path
 from typing import List, Dict, Optional
 import bibtexparser
 from bibtexparser.bparser import BibTexParser
 
+try:
+    from rrwrite_http_cache import shared_session
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import shared_session
+
 
 def parse_bib_file(bib_path: Path) -> List[Dict]:
     """
@@ -211,7 +216,7 @@ def fetch_abstract_from_doi(doi: str) -> Optional[str]:
     """
     try:
         url = f"https://api.crossref.org/works/{doi}"
-        response = requests.get(url, timeout=10)
+        response = shared_session().get(url, timeout=10)
         response.raise_for_status()
 
         data = response.json()
@@ -265,7 +270,6 @@ def write_evidence_csv(
                     print("✓")
                 else:
                     print("✗")
-                time.sleep(0.1)  # Rate limiting
 
     # Write CSV
     with open(output_path, 'w', encoding='utf-8', newline='') as f:
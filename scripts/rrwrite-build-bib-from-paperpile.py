@@ -11,21 +11,25 @@ fetches BibTeX entries via DOI content negotiation, and generates:
 """
 
 import re
+import sys
 import json
-import time
 import argparse
-import requests
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 from collections import defaultdict
 from difflib import SequenceMatcher
 
+try:
+    from rrwrite_http_cache import get_session
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import get_session
+
 
 class CrossRefAPI:
     """CrossRef API client for DOI and BibTeX lookup."""
 
     BASE_URL = "https://api.crossref.org/works"
-    RATE_LIMIT_DELAY = 0.1  # 10 requests/second (polite rate limit)
 
     def __init__(self, email: Optional[str] = None):
         """
@@ -35,7 +39,7 @@ class CrossRefAPI:
             email: Contact email for polite API usage
         """
         self.email = email
-        self.session = requests.Session()
+        self.session = get_session()
         self.session.headers.update({
             'User-Agent': f'RRWrite/1.0 (mailto:{email})' if email else 'RRWrite/1.0'
         })
@@ -72,7 +76,6 @@ class CrossRefAPI:
         }
 
         try:
-            time.sleep(self.RATE_LIMIT_DELAY)
             response = self.session.get(self.BASE_URL, params=params, timeout=10)
             response.raise_for_status()
 
@@ -101,8 +104,7 @@ class CrossRefAPI:
         }
 
         try:
-            time.sleep(self.RATE_LIMIT_DELAY)
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.session.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
             return response.text
@@ -24,6 +24,9 @@ from datetime import datetime
 from typing import List, Dict, Set, Tuple
 from collections import defaultdict
 
+sys.path.insert(0, str(Path(__file__).parent))
+from rrwrite_paper_dedup import deduplicate_papers
+
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
     from sklearn.metrics.pairwise import cosine_similarity
@@ -87,27 +90,14 @@ class CitationGapAnalyzer:
     def load_search_results(self, search_files: List[Path]) -> List[Dict]:
         """Load and merge search results from multiple files"""
         all_papers = []
-        seen_dois = set()
 
         for search_file in search_files:
             with open(search_file) as f:
                 data = json.load(f)
+            all_papers.extend(data.get('papers', []))
 
-            papers = data.get('papers', [])
-
-            # Deduplicate by DOI
-            for paper in papers:
-                doi = paper.get('doi', '').lower()
-                if doi and doi not in seen_dois:
-                    all_papers.append(paper)
-                    seen_dois.add(doi)
-                elif not doi:
-                    # Papers without DOI - deduplicate by title
-                    title = paper.get('title', '').lower()
-                    if title not in [p.get('title', '').lower() for p in all_papers]:
-                        all_papers.append(paper)
-
-        return all_papers
+        # Merge duplicates across tiers by DOI/PMID/arXiv ID/title
+        return deduplicate_papers(all_papers)
 
     def exact_match_gaps(
         self,
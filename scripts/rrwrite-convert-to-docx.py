@@ -19,16 +19,26 @@ Requirements:
 """
 
 import argparse
-import shutil
-import subprocess
 import sys
 from pathlib import Path
 
+try:
+    from rrwrite_pandoc_export import ExportJob, PandocExporter, probe_engines
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_pandoc_export import ExportJob, PandocExporter, probe_engines
+
 
 class DocxConverter:
     """Convert markdown manuscripts to .docx format."""
 
-    def __init__(self, input_file: Path, output_file: Path = None, reference_doc: Path = None):
+    def __init__(
+        self,
+        input_file: Path,
+        output_file: Path = None,
+        reference_doc: Path = None,
+        force: bool = False
+    ):
         """
         Initialize converter.
 
@@ -36,51 +46,52 @@ class DocxConverter:
             input_file: Path to markdown file
             output_file: Path to output .docx file (default: same name as input)
             reference_doc: Optional path to reference .docx template for styling
+            force: Convert even if the markdown and template are unchanged
+                since the last conversion
         """
         self.input_file = Path(input_file)
-        self.output_file = output_file or self.input_file.with_suffix('.docx')
+        self.output_file = Path(output_file) if output_file else self.input_file.with_suffix('.docx')
         self.reference_doc = Path(reference_doc) if reference_doc else None
+        self.force = force
 
         if not self.input_file.exists():
             raise FileNotFoundError(f"Input file not found: {self.input_file}")
 
     def check_pandoc(self) -> bool:
         """Check if pandoc is available."""
-        return shutil.which('pandoc') is not None
+        return probe_engines().pandoc is not None
 
     def convert_with_pandoc(self) -> bool:
         """
         Convert markdown to .docx using system pandoc.
 
+        Skipped when the markdown, reference template and options are
+        unchanged since the last conversion to the same output.
+
         Returns:
             True if conversion succeeded
         """
-        cmd = [
-            'pandoc',
-            str(self.input_file),
-            '-o', str(self.output_file),
-            '-f', 'markdown',
-            '-t', 'docx',
-            '--standalone'
-        ]
+        args = ['-f', 'markdown', '-t', 'docx', '--standalone']
+        inputs = []
 
         # Add reference document if provided
         if self.reference_doc and self.reference_doc.exists():
-            cmd.extend(['--reference-doc', str(self.reference_doc)])
+            args.extend(['--reference-doc', str(self.reference_doc)])
+            inputs.append(self.reference_doc)
             print(f"Using reference template: {self.reference_doc}")
 
-        try:
-            print(f"Converting {self.input_file} to {self.output_file}...")
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            return True
-        except subprocess.CalledProcessError as e:
-            print(f"Pandoc conversion failed: {e.stderr}", file=sys.stderr)
-            return False
+        print(f"Converting {self.input_file} to {self.output_file}...")
+        result = PandocExporter(force=self.force).convert(ExportJob(
+            markdown=self.input_file,
+            output=self.output_file,
+            args=args,
+            inputs=inputs
+        ))
+        if result.status == 'unchanged':
+            print("Inputs unchanged since last conversion, keeping existing output")
+        elif not result.ok:
+            print(f"Pandoc conversion failed: {result.error}", file=sys.stderr)
+        return result.ok
 
     def convert_with_pypandoc(self) -> bool:
         """
@@ -185,6 +196,11 @@ def main():
         help='Reference .docx template for styling',
         default=None
     )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Convert even if the input is unchanged since the last conversion'
+    )
 
     args = parser.parse_args()
 
@@ -208,7 +224,8 @@ def main():
         converter = DocxConverter(
             input_file=input_file,
             output_file=output_file,
-            reference_doc=args.reference_doc
+            reference_doc=args.reference_doc,
+            force=args.force
         )
         success = converter.convert()
         return 0 if success else 1
@@ -23,14 +23,29 @@ Usage:
     python scripts/rrwrite-convert-tsv-to-table.py \
         --input-dir data_tables/ \
         --output-dir tables/
+
+    # Top 20 rows of selected columns of a large table, with column statistics
+    python scripts/rrwrite-convert-tsv-to-table.py \
+        --input results/all_hits.tsv --max-rows 20 \
+        --columns gene,score,pvalue --stats
+
+Large tables are streamed: only the requested columns and rows are parsed,
+and statistics are computed in one chunked pass, so memory use does not grow
+with the number of rows.
 """
 
 import argparse
-import csv
+import sys
 from pathlib import Path
 
+try:
+    from rrwrite_table_reader import summarize_table
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_table_reader import summarize_table
+
 
-def convert_tsv_to_markdown(tsv_file, caption=None, max_rows=None):
+def convert_tsv_to_markdown(tsv_file, caption=None, max_rows=None, columns=None, stats=False):
     """
     Convert a TSV file to markdown table format.
 
@@ -38,6 +53,8 @@ def convert_tsv_to_markdown(tsv_file, caption=None, max_rows=None):
         tsv_file: Path to TSV file
         caption: Optional table caption
         max_rows: Maximum number of data rows to include (None = all)
+        columns: Columns to include (None = all)
+        stats: Append count/mean/min/max of numeric columns over all rows
 
     Returns:
         String containing markdown table
@@ -47,12 +64,10 @@ def convert_tsv_to_markdown(tsv_file, caption=None, max_rows=None):
     if not tsv_file.exists():
         raise FileNotFoundError(f"TSV file not found: {tsv_file}")
 
-    # Read TSV, skipping comment lines
-    with open(tsv_file, 'r', newline='', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter='\t')
-        rows = [row for row in reader if row and not row[0].startswith('#')]
+    # Stream the table, keeping only the rows that are shown
+    summary = summarize_table(tsv_file, usecols=columns, top_n=max_rows, stats=stats, raw=True)
 
-    if not rows:
+    if not summary.header.columns:
         return "<!-- Empty table -->\n"
 
     # Build markdown table
@@ -63,27 +78,36 @@ def convert_tsv_to_markdown(tsv_file, caption=None, max_rows=None):
         lines.append(f"**{caption}**\n")
 
     # Header row
-    header = rows[0]
+    header = [str(col) for col in summary.head.columns]
     lines.append("| " + " | ".join(header) + " |")
 
     # Separator row
     lines.append("| " + " | ".join(["---"] * len(header)) + " |")
 
-    # Data rows
-    data_rows = rows[1:max_rows+1] if max_rows else rows[1:]
-    for row in data_rows:
-        # Pad row if necessary
-        padded_row = row + [""] * (len(header) - len(row))
-        lines.append("| " + " | ".join(padded_row[:len(header)]) + " |")
+    # Data rows (missing trailing cells are empty)
+    for row in summary.head.fillna("").itertuples(index=False, name=None):
+        lines.append("| " + " | ".join(row) + " |")
 
     # Add truncation note if rows were limited
-    if max_rows and len(rows) - 1 > max_rows:
-        lines.append(f"\n*Note: Showing {max_rows} of {len(rows)-1} rows*")
+    if summary.truncated:
+        lines.append(f"\n*Note: Showing {len(summary.head)} of {summary.rows} rows*")
+
+    # Summary statistics over all rows
+    if stats and summary.stats:
+        lines.append("")
+        lines.append("| Column | Count | Mean | Min | Max |")
+        lines.append("| --- | ---: | ---: | ---: | ---: |")
+        for col, col_stats in summary.stats.items():
+            if col_stats.count:
+                lines.append(
+                    f"| {col} | {col_stats.count} | {col_stats.mean:.4g} | "
+                    f"{col_stats.minimum:.4g} | {col_stats.maximum:.4g} |"
+                )
 
     return "\n".join(lines) + "\n"
 
 
-def convert_directory(input_dir, output_dir, max_rows=None):
+def convert_directory(input_dir, output_dir, max_rows=None, stats=False):
     """
     Convert all TSV files in a directory to markdown tables.
 
@@ -91,6 +115,7 @@ def convert_directory(input_dir, output_dir, max_rows=None):
         input_dir: Directory containing TSV files
         output_dir: Directory to write markdown tables
         max_rows: Maximum rows per table
+        stats: Append column statistics to each table
     """
     input_dir = Path(input_dir)
     output_dir = Path(output_dir)
@@ -116,7 +141,8 @@ def convert_directory(input_dir, output_dir, max_rows=None):
         markdown = convert_tsv_to_markdown(
             tsv_file,
             caption=caption,
-            max_rows=max_rows
+            max_rows=max_rows,
+            stats=stats
         )
 
         # Write output file
@@ -163,6 +189,15 @@ def main():
         type=int,
         help='Maximum number of data rows to include (default: all)'
     )
+    parser.add_argument(
+        '--columns',
+        help='Comma-separated columns to include (for --input mode, default: all)'
+    )
+    parser.add_argument(
+        '--stats',
+        action='store_true',
+        help='Append count/mean/min/max of numeric columns over all rows'
+    )
 
     args = parser.parse_args()
 
@@ -171,7 +206,9 @@ def main():
         markdown = convert_tsv_to_markdown(
             args.input,
             caption=args.caption,
-            max_rows=args.max_rows
+            max_rows=args.max_rows,
+            columns=args.columns.split(',') if args.columns else None,
+            stats=args.stats
         )
 
         if args.output:
@@ -193,7 +230,8 @@ def main():
         convert_directory(
             args.input_dir,
             args.output_dir,
-            max_rows=args.max_rows
+            max_rows=args.max_rows,
+            stats=args.stats
         )
 
 
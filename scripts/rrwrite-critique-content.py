@@ -18,9 +18,10 @@ from datetime import datetime
 class ContentReviewer:
     """Review scientific content and arguments."""
 
-    def __init__(self, manuscript_path: Path):
+    def __init__(self, manuscript_path: Path, content: str = None):
         self.manuscript_path = manuscript_path
-        self.content = self._load_manuscript()
+        # Content may be passed in by callers that already hold the manuscript
+        self.content = content if content is not None else self._load_manuscript()
         self.issues = []
         self.strengths = []
 
@@ -40,10 +40,11 @@ class FormatReviewer:
         }
     }
 
-    def __init__(self, manuscript_path: Path, journal: str = None):
+    def __init__(self, manuscript_path: Path, journal: str = None, content: str = None):
         self.manuscript_path = manuscript_path
         self.journal = journal.lower() if journal else None
-        self.content = self._load_manuscript()
+        # Content may be passed in by callers that already hold the manuscript
+        self.content = content if content is not None else self._load_manuscript()
         self.issues = []
         self.warnings = []
 
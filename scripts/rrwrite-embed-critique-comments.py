@@ -27,12 +27,18 @@ try:
     from docx.oxml import parse_xml
     from docx.oxml.ns import qn
     from docx.shared import RGBColor, Pt
-    import subprocess
     from lxml import etree
+    DOCX_AVAILABLE = True
 except ImportError:
-    print("ERROR: Missing required packages. Install with:")
-    print("  pip install python-docx lxml")
-    sys.exit(1)
+    # Checked in main(); the revision loop reports it instead of exiting
+    Document = None
+    DOCX_AVAILABLE = False
+
+try:
+    from rrwrite_pandoc_export import ExportJob, PandocExporter
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_pandoc_export import ExportJob, PandocExporter
 
 
 @dataclass
@@ -127,6 +133,10 @@ class WordCommentHelper:
 class CritiqueCommentEmbedder:
     """Embeds critique comments into Word document."""
 
+    # Pandoc conversion of the manuscript before comments are added; kept so
+    # that re-embedding after a critique-only change skips pandoc
+    BASE_DOCX = ".manuscript_comments_base.docx"
+
     def __init__(self, manuscript_dir: Path, version: int = 1):
         """
         Initialize embedder.
@@ -200,27 +210,59 @@ class CritiqueCommentEmbedder:
         pattern = r'\d+\.\s+\*\*([^:]+):\*\*\s+([^\n]+)(?:\n\s+- \*\*Impact:\*\*\s+([^\n]+))?(?:\n\s+- \*\*Action:\*\*\s+([^\n]+))?'
 
         for match in re.finditer(pattern, section_text):
-            category = match.group(1).strip()
-            description = match.group(2).strip()
-            impact = match.group(3).strip() if match.group(3) else None
-            action = match.group(4).strip() if match.group(4) else "Review and address"
+            issues.append(self._make_issue(
+                severity,
+                match.group(1).strip(),
+                match.group(2).strip(),
+                match.group(4).strip() if match.group(4) else None,
+                match.group(3).strip() if match.group(3) else None,
+                critique_type
+            ))
 
-            # Try to extract text snippet from description
-            text_snippet = self._extract_text_snippet(description)
+        return issues
 
+    def _make_issue(
+        self,
+        severity: str,
+        category: str,
+        description: str,
+        action: Optional[str],
+        impact: Optional[str],
+        critique_type: str
+    ) -> CritiqueIssue:
+        """Build a CritiqueIssue, locating its text snippet and section."""
+        return CritiqueIssue(
+            severity=severity,
+            category=f"{critique_type.title()}: {category}",
+            description=description,
+            action=action or "Review and address",
+            impact=impact,
+            # Try to extract text snippet from description
+            text_snippet=self._extract_text_snippet(description),
             # Infer section from category or description
-            section = self._infer_section(category, description)
-
-            issues.append(CritiqueIssue(
-                severity=severity,
-                category=f"{critique_type.title()}: {category}",
-                description=description,
-                action=action,
-                impact=impact,
-                text_snippet=text_snippet,
-                section=section
-            ))
+            section=self._infer_section(category, description)
+        )
+
+    def add_issues(self, findings: List[Dict[str, str]], critique_type: str) -> List[CritiqueIssue]:
+        """
+        Add issues already produced by a reviewer, without a report round-trip.
+
+        Args:
+            findings: Dicts with severity, category, description and
+                optionally action and impact
+            critique_type: 'content' or 'format'
 
+        Returns:
+            The added issues
+        """
+        issues = [
+            self._make_issue(
+                f['severity'], f['category'], f['description'],
+                f.get('action'), f.get('impact'), critique_type
+            )
+            for f in findings
+        ]
+        self.issues.extend(issues)
         return issues
 
     def _extract_text_snippet(self, description: str) -> Optional[str]:
@@ -259,7 +301,8 @@ class CritiqueCommentEmbedder:
     def generate_docx_with_comments(
         self,
         output_file: Optional[Path] = None,
-        unresolved_only: bool = False
+        unresolved_only: bool = False,
+        markdown_file: Optional[Path] = None
     ) -> Path:
         """
         Generate .docx file with embedded critique comments.
@@ -267,6 +310,8 @@ class CritiqueCommentEmbedder:
         Args:
             output_file: Output path (default: manuscript_with_comments_v{version}.docx)
             unresolved_only: Only include unresolved issues
+            markdown_file: Assembled manuscript (default: full_manuscript.md,
+                or manuscript_full.md if only that exists)
 
         Returns:
             Path to generated .docx file
@@ -275,17 +320,20 @@ class CritiqueCommentEmbedder:
             output_file = self.manuscript_dir / f"manuscript_with_comments_v{self.version}.docx"
 
         # First convert markdown to docx using pandoc
-        markdown_file = self.manuscript_dir / "manuscript_full.md"
+        if markdown_file is None:
+            markdown_file = self.manuscript_dir / "full_manuscript.md"
+            if not markdown_file.exists():
+                markdown_file = self.manuscript_dir / "manuscript_full.md"
         if not markdown_file.exists():
             raise FileNotFoundError(f"Manuscript not found: {markdown_file}")
 
         print(f"Converting markdown to .docx...")
-        temp_docx = self.manuscript_dir / "manuscript_temp.docx"
-        self._convert_markdown_to_docx(markdown_file, temp_docx)
+        base_docx = self.manuscript_dir / self.BASE_DOCX
+        self._convert_markdown_to_docx(markdown_file, base_docx)
 
         # Load the docx
         print(f"Loading document...")
-        doc = Document(str(temp_docx))
+        doc = Document(str(base_docx))
 
         # Filter issues
         issues_to_embed = self.issues
@@ -315,13 +363,9 @@ class CritiqueCommentEmbedder:
         if comments_added == 0 and issues_to_embed:
             self._add_summary_section(doc, issues_to_embed)
 
-        # Save
+        # Save (the uncommented base is kept for the next run)
         doc.save(str(output_file))
 
-        # Clean up temp file
-        if temp_docx.exists():
-            temp_docx.unlink()
-
         print(f"\n✓ Generated: {output_file}")
         print(f"  Comments added: {comments_added}")
         print(f"  Total issues: {len(issues_to_embed)}")
@@ -329,19 +373,14 @@ class CritiqueCommentEmbedder:
         return output_file
 
     def _convert_markdown_to_docx(self, markdown_file: Path, output_file: Path):
-        """Convert markdown to docx using pandoc."""
-        cmd = [
-            'pandoc',
-            str(markdown_file),
-            '-o', str(output_file),
-            '-f', 'markdown',
-            '-t', 'docx',
-            '--standalone'
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise Exception(f"Pandoc conversion failed: {result.stderr}")
+        """Convert markdown to docx using pandoc (skipped if the markdown is unchanged)."""
+        result = PandocExporter().convert(ExportJob(
+            markdown=markdown_file,
+            output=output_file,
+            args=['-f', 'markdown', '-t', 'docx', '--standalone']
+        ))
+        if not result.ok:
+            raise Exception(f"Pandoc conversion failed: {result.error}")
 
     def _add_comment_to_text(self, doc: Document, issue: CritiqueIssue) -> bool:
         """
@@ -480,6 +519,11 @@ Examples:
 
     args = parser.parse_args()
 
+    if not DOCX_AVAILABLE:
+        print("ERROR: Missing required packages. Install with:")
+        print("  pip install python-docx lxml")
+        sys.exit(1)
+
     # Validate manuscript directory
     manuscript_dir = Path(args.manuscript_dir)
     if not manuscript_dir.exists():
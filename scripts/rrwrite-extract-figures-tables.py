@@ -9,6 +9,11 @@ Priority system:
 - Priority 1: Original repository figures/tables (from_repo/)
 - Priority 2: Generated analysis visualizations (generated/)
 
+Repository files are imported through a content-addressed blob store shared
+by all manuscript versions (manuscript/.rrwrite-blobs): each unique file is
+stored once and hardlinked (or reflinked, or copied) into from_repo/, and the
+manifest records its content hash.
+
 Usage:
     python scripts/rrwrite-extract-figures-tables.py \
         --repo-path /path/to/analyzed/repo \
@@ -21,19 +26,26 @@ import argparse
 import json
 import shutil
 import re
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import logging
 
 # Import existing generators
 try:
+    from rrwrite_blob_store import BlobStore
     from rrwrite_figure_generator import FigureGenerator
     from rrwrite_manifest_generator import ManifestGenerator
+    from rrwrite_repo_index import RepoIndex
+    from rrwrite_script_references import SCRIPT_PATTERNS, ScriptReferenceIndex
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_blob_store import BlobStore
     from rrwrite_figure_generator import FigureGenerator
     from rrwrite_manifest_generator import ManifestGenerator
+    from rrwrite_repo_index import RepoIndex
+    from rrwrite_script_references import SCRIPT_PATTERNS, ScriptReferenceIndex
 
 
 class FigureTableExtractor:
@@ -58,19 +70,26 @@ class FigureTableExtractor:
         r'dist/'
     ]
 
+    # Directories whose files EXCLUDE_PATTERNS always rejects; pruned during
+    # the walk (virtualenvs etc. are still scanned, as with rglob)
+    SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.pytest_cache', '.ipynb_checkpoints', 'build', 'dist'}
+
     # Size limits
     MAX_FIGURE_SIZE_MB = 10
     MAX_TABLE_SIZE_MB = 5
 
-    def __init__(self, repo_path: Path, manuscript_dir: Path):
+    def __init__(self, repo_path: Path, manuscript_dir: Path, blob_store: Optional[BlobStore] = None):
         """Initialize extractor.
 
         Args:
             repo_path: Path to analyzed repository
-            repo_path: Path to manuscript output directory
+            manuscript_dir: Path to manuscript output directory
+            blob_store: Store for imported files (default: shared by the
+                manuscript directory's sibling versions)
         """
         self.repo_path = Path(repo_path).resolve()
         self.manuscript_dir = Path(manuscript_dir).resolve()
+        self.blobs = blob_store or BlobStore.for_manuscript(self.manuscript_dir)
 
         # Create output directories
         self.figures_from_repo = self.manuscript_dir / "figures" / "from_repo"
@@ -79,6 +98,24 @@ class FigureTableExtractor:
         self.tables_generated = self.manuscript_dir / "tables" / "generated"
 
         self.logger = logging.getLogger(__name__)
+        self._index: Optional[RepoIndex] = None
+        self._references: Optional[ScriptReferenceIndex] = None
+
+    @property
+    def index(self) -> RepoIndex:
+        """Repository file index, built with a single walk on first use."""
+        if self._index is None:
+            self._index = RepoIndex(self.repo_path, skip_dirs=self.SKIP_DIRS)
+        return self._index
+
+    @property
+    def references(self) -> ScriptReferenceIndex:
+        """Output name → script index, built by tokenizing every script once."""
+        if self._references is None:
+            scripts = self.index.find(SCRIPT_PATTERNS)
+            self._references = ScriptReferenceIndex(self.repo_path, scripts)
+            self.logger.debug(f"Indexed {len(self._references)} output names from {len(scripts)} scripts")
+        return self._references
 
     def extract_repository_figures(self) -> List[Dict[str, any]]:
         """Extract existing figures from repository.
@@ -88,9 +125,7 @@ class FigureTableExtractor:
         """
         self.logger.info(f"Scanning repository for figures: {self.repo_path}")
 
-        figure_files = []
-        for pattern in self.FIGURE_PATTERNS:
-            figure_files.extend(self.repo_path.rglob(pattern))
+        figure_files = self.index.find(self.FIGURE_PATTERNS)
 
         # Filter out excluded patterns and oversized files
         filtered_figures = []
@@ -101,7 +136,7 @@ class FigureTableExtractor:
                 continue
 
             # Check size
-            size_mb = fig_path.stat().st_size / (1024 * 1024)
+            size_mb = self.index.stat(fig_path).size / (1024 * 1024)
             if size_mb > self.MAX_FIGURE_SIZE_MB:
                 self.logger.warning(
                     f"Skipping large figure ({size_mb:.1f}MB): {fig_path.relative_to(self.repo_path)}"
@@ -112,29 +147,12 @@ class FigureTableExtractor:
 
         self.logger.info(f"Found {len(filtered_figures)} figures (filtered from {len(figure_files)})")
 
-        # Copy figures to manuscript directory
-        self.figures_from_repo.mkdir(parents=True, exist_ok=True)
+        # Link figures into manuscript directory
+        imported = self._import_files(filtered_figures, self.figures_from_repo)
 
         extracted_metadata = []
-        for idx, fig_path in enumerate(filtered_figures, start=1):
-            # Generate unique filename while preserving original
+        for idx, (fig_path, dest_path, digest) in enumerate(imported, start=1):
             rel_path = fig_path.relative_to(self.repo_path)
-            dest_name = self._sanitize_filename(fig_path.name)
-            dest_path = self.figures_from_repo / dest_name
-
-            # Handle duplicates
-            if dest_path.exists():
-                stem = dest_path.stem
-                suffix = dest_path.suffix
-                counter = 1
-                while dest_path.exists():
-                    dest_name = f"{stem}_{counter}{suffix}"
-                    dest_path = self.figures_from_repo / dest_name
-                    counter += 1
-
-            # Copy file
-            shutil.copy2(fig_path, dest_path)
-            self.logger.debug(f"Copied: {rel_path} → {dest_path.relative_to(self.manuscript_dir)}")
 
             # Create metadata
             metadata = {
@@ -143,6 +161,7 @@ class FigureTableExtractor:
                 "source": "from_repo",
                 "priority": 1,
                 "original_path": str(rel_path),
+                "content_hash": f"sha256:{digest}",
                 "recommended_sections": self._infer_sections_from_path(fig_path),
                 "default_caption": self._generate_caption_from_filename(fig_path),
                 "generating_script": self._find_generating_script(fig_path)
@@ -162,9 +181,7 @@ class FigureTableExtractor:
         """
         self.logger.info(f"Scanning repository for tables: {self.repo_path}")
 
-        table_files = []
-        for pattern in self.TABLE_PATTERNS:
-            table_files.extend(self.repo_path.rglob(pattern))
+        table_files = self.index.find(self.TABLE_PATTERNS)
 
         # Filter exclusions and oversized files
         filtered_tables = []
@@ -173,7 +190,7 @@ class FigureTableExtractor:
                 self.logger.debug(f"Excluding: {table_path.relative_to(self.repo_path)}")
                 continue
 
-            size_mb = table_path.stat().st_size / (1024 * 1024)
+            size_mb = self.index.stat(table_path).size / (1024 * 1024)
             if size_mb > self.MAX_TABLE_SIZE_MB:
                 self.logger.warning(
                     f"Skipping large table ({size_mb:.1f}MB): {table_path.relative_to(self.repo_path)}"
@@ -184,28 +201,12 @@ class FigureTableExtractor:
 
         self.logger.info(f"Found {len(filtered_tables)} tables (filtered from {len(table_files)})")
 
-        # Copy tables to manuscript directory
-        self.tables_from_repo.mkdir(parents=True, exist_ok=True)
+        # Link tables into manuscript directory
+        imported = self._import_files(filtered_tables, self.tables_from_repo)
 
         extracted_metadata = []
-        for idx, table_path in enumerate(filtered_tables, start=1):
+        for idx, (table_path, dest_path, digest) in enumerate(imported, start=1):
             rel_path = table_path.relative_to(self.repo_path)
-            dest_name = self._sanitize_filename(table_path.name)
-            dest_path = self.tables_from_repo / dest_name
-
-            # Handle duplicates
-            if dest_path.exists():
-                stem = dest_path.stem
-                suffix = dest_path.suffix
-                counter = 1
-                while dest_path.exists():
-                    dest_name = f"{stem}_{counter}{suffix}"
-                    dest_path = self.tables_from_repo / dest_name
-                    counter += 1
-
-            # Copy file
-            shutil.copy2(table_path, dest_path)
-            self.logger.debug(f"Copied: {rel_path} → {dest_path.relative_to(self.manuscript_dir)}")
 
             # Create metadata
             metadata = {
@@ -214,6 +215,7 @@ class FigureTableExtractor:
                 "source": "from_repo",
                 "priority": 1,
                 "original_path": str(rel_path),
+                "content_hash": f"sha256:{digest}",
                 "recommended_sections": self._infer_sections_from_path(table_path),
                 "default_caption": self._generate_caption_from_filename(table_path),
                 "generating_script": self._find_generating_script(table_path)
@@ -301,6 +303,56 @@ class FigureTableExtractor:
 
         return generated_metadata
 
+    def _import_files(self, files: List[Path], dest_dir: Path) -> List[Tuple[Path, Path, str]]:
+        """Store files in the blob store and link them into dest_dir.
+
+        Files keep their sanitized names; a name already taken in this import
+        by different content gets a numeric suffix, while identical content
+        shares one file. Destination files that already hold the right
+        content (e.g., from a previous import) are left untouched.
+
+        Args:
+            files: Repository files to import
+            dest_dir: Manuscript directory to link them into
+
+        Returns:
+            List of (source path, destination path, SHA-256 digest)
+        """
+        dest_dir.mkdir(parents=True, exist_ok=True)
+
+        taken: Dict[str, str] = {}
+        methods = Counter()
+        new_blobs = 0
+        imported = []
+        for src in files:
+            digest, added = self.blobs.put(src)
+            new_blobs += added
+
+            dest_name = self._sanitize_filename(src.name)
+            stem, suffix = Path(dest_name).stem, Path(dest_name).suffix
+            counter = 1
+            while taken.get(dest_name, digest) != digest:
+                dest_name = f"{stem}_{counter}{suffix}"
+                counter += 1
+            dest_path = dest_dir / dest_name
+
+            if dest_name not in taken:
+                taken[dest_name] = digest
+                method = self.blobs.link(digest, dest_path)
+                methods[method] += 1
+                self.logger.debug(
+                    f"Imported ({method}): {src.relative_to(self.repo_path)} → "
+                    f"{dest_path.relative_to(self.manuscript_dir)}"
+                )
+            imported.append((src, dest_path, digest))
+
+        if imported:
+            self.logger.info(
+                f"Imported {len(imported)} files ({len(taken)} unique, {new_blobs} new blobs): "
+                + ", ".join(f"{n} {m}" for m, n in sorted(methods.items()))
+            )
+        return imported
+
     def _should_exclude(self, file_path: Path) -> bool:
         """Check if file matches exclusion patterns."""
         path_str = str(file_path)
@@ -354,23 +406,11 @@ class FigureTableExtractor:
     def _find_generating_script(self, file_path: Path) -> Optional[str]:
         """Try to find the script that generated this figure/table.
 
-        Searches for Python/R scripts in the same directory that reference the file.
+        Looks the file name (or stem) up in the repository-wide reverse index
+        of script string literals; scripts that write the name (savefig,
+        to_csv, write.table, ...) win over scripts that only mention it.
         """
-        parent_dir = file_path.parent
-        filename = file_path.name
-
-        # Search for scripts that might have generated this file
-        for script_ext in ['*.py', '*.R', '*.r', '*.ipynb']:
-            for script in parent_dir.glob(script_ext):
-                try:
-                    content = script.read_text(errors='ignore')
-                    # Look for filename reference (without extension or with)
-                    if filename in content or file_path.stem in content:
-                        return str(script.relative_to(self.repo_path))
-                except Exception:
-                    continue
-
-        return None
+        return self.references.generating_script(file_path)
 
     def _get_generated_figure_sections(self, figure_name: str) -> List[str]:
         """Get recommended sections for generated figures."""
@@ -437,6 +477,10 @@ def main():
         default="figures,tables",
         help="What to generate: 'figures', 'tables', or 'figures,tables' (default: both)"
     )
+    parser.add_argument(
+        "--blob-store",
+        help="Content store for imported files (default: <manuscript parent>/.rrwrite-blobs)"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -459,7 +503,8 @@ def main():
     # Initialize extractor
     extractor = FigureTableExtractor(
         repo_path=args.repo_path,
-        manuscript_dir=args.manuscript_dir
+        manuscript_dir=args.manuscript_dir,
+        blob_store=BlobStore(Path(args.blob_store)) if args.blob_store else None
     )
 
     # Extract repository content
@@ -4,16 +4,24 @@ Extract repository evidence from manuscript.
 
 Scans manuscript for factual claims about the repository and generates
 verification commands in repo_evidence.md.
+
+Counts are read from the shared GitStats engine (one `git ls-files` and one
+`git log --numstat` per repository) rather than one git process per claim.
 """
 
 import argparse
 import re
-import subprocess
 import sys
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Tuple
 
+try:
+    from rrwrite_git_stats import get_git_stats
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_git_stats import get_git_stats
+
 
 class RepositoryEvidenceExtractor:
     """Extract and verify repository claims from manuscript."""
@@ -29,6 +37,7 @@ class RepositoryEvidenceExtractor:
         self.repo_path = Path(repo_path).resolve()
         self.manuscript_path = Path(manuscript_path).resolve()
         self.claims = []
+        self.git = get_git_stats(self.repo_path)
 
     def extract_claims(self) -> List[Dict]:
         """
@@ -109,13 +118,7 @@ class RepositoryEvidenceExtractor:
     def _verify_commits(self, claim: Dict) -> Dict:
         """Verify commit count claim."""
         try:
-            result = subprocess.run(
-                ['git', '-C', str(self.repo_path), 'rev-list', '--all', '--count'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            count = result.stdout.strip()
+            count = str(self.git.history().commits)
 
             return {
                 'claim': claim['text'],
@@ -138,13 +141,7 @@ class RepositoryEvidenceExtractor:
     def _verify_contributors(self, claim: Dict) -> Dict:
         """Verify contributor count claim."""
         try:
-            result = subprocess.run(
-                ['git', '-C', str(self.repo_path), 'log', '--all', '--format=%ae'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            contributors = len(set(result.stdout.strip().split('\n')))
+            contributors = len(self.git.history().contributors)
 
             return {
                 'claim': claim['text'],
@@ -178,15 +175,25 @@ class RepositoryEvidenceExtractor:
         else:
             pattern = '**/*'
 
+        # Tracked files (the index) when in a git repository, else the filesystem
+        use_git = bool(self.git.tracked_files())
+        if use_git:
+            verification = f"git ls-files ':(glob){pattern}' | wc -l"
+        else:
+            verification = f'find . -path "./{pattern}" -type f | wc -l'
+
         try:
-            files = list(self.repo_path.glob(pattern))
-            count = len([f for f in files if f.is_file()])
+            if use_git:
+                count = self.git.count_files(pattern)
+            else:
+                files = list(self.repo_path.glob(pattern))
+                count = len([f for f in files if f.is_file()])
 
             return {
                 'claim': claim['text'],
                 'section': claim['section'],
                 'evidence_source': f'File pattern: {pattern}',
-                'verification': f'find . -path "./{pattern}" -type f | wc -l',
+                'verification': verification,
                 'output': str(count),
                 'status': '✅ Verified' if str(count) in claim['text'] else '⚠ Approximate'
             }
@@ -195,7 +202,7 @@ class RepositoryEvidenceExtractor:
                 'claim': claim['text'],
                 'section': claim['section'],
                 'evidence_source': f'File pattern: {pattern}',
-                'verification': f'find . -path "./{pattern}" -type f | wc -l',
+                'verification': verification,
                 'output': f'Error: {e}',
                 'status': '❌ Unverified'
             }
@@ -207,10 +214,8 @@ class RepositoryEvidenceExtractor:
         if not match:
             return {'claim': claim['text'], 'status': '❌ Unverified'}
 
-        expected = match.group(1).replace(',', '')
-
-        # Try to find likely file
-        # This is heuristic-based - may need manual refinement
+        # The claimed total may span several files, so the source needs
+        # manual identification
         return {
             'claim': claim['text'],
             'section': claim['section'],
@@ -230,27 +235,8 @@ class RepositoryEvidenceExtractor:
         Returns:
             Markdown content
         """
-        # Get git commit hash
-        try:
-            result = subprocess.run(
-                ['git', '-C', str(self.repo_path), 'rev-parse', '--short', 'HEAD'],
-                capture_output=True,
-                text=True
-            )
-            commit_hash = result.stdout.strip()
-        except:
-            commit_hash = 'unknown'
-
-        # Get remote URL
-        try:
-            result = subprocess.run(
-                ['git', '-C', str(self.repo_path), 'config', '--get', 'remote.origin.url'],
-                capture_output=True,
-                text=True
-            )
-            repo_url = result.stdout.strip()
-        except:
-            repo_url = str(self.repo_path)
+        commit_hash = self.git.head() or 'unknown'
+        repo_url = self.git.remote_url() or str(self.repo_path)
 
         md = f"""# Repository Evidence
 
@@ -25,6 +25,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 
+sys.path.insert(0, str(Path(__file__).parent))
+from rrwrite_paper_dedup import deduplicate_papers
+
 
 class CitationGapWorkflow:
     """Orchestrate complete citation gap analysis workflow"""
@@ -188,9 +191,8 @@ class CitationGapWorkflow:
         return 0
 
     def _merge_search_results(self, input_files: List[Path], output_file: Path):
-        """Merge multiple search result files, deduplicating by DOI"""
+        """Merge multiple search result files, deduplicating by DOI/PMID/title"""
         all_papers = []
-        seen_dois = set()
 
         for input_file in input_files:
             if not input_file.exists():
@@ -198,18 +200,9 @@ class CitationGapWorkflow:
 
             with open(input_file) as f:
                 data = json.load(f)
+            all_papers.extend(data.get('papers', []))
 
-            for paper in data.get('papers', []):
-                doi = paper.get('doi', '').lower()
-
-                if doi and doi not in seen_dois:
-                    all_papers.append(paper)
-                    seen_dois.add(doi)
-                elif not doi:
-                    # No DOI - check title
-                    title = paper.get('title', '').lower()
-                    if title not in [p.get('title', '').lower() for p in all_papers]:
-                        all_papers.append(paper)
+        all_papers = deduplicate_papers(all_papers)
 
         # Write merged results
         output_data = {
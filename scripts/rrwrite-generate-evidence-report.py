@@ -15,8 +15,17 @@ import json
 import sys
 from pathlib import Path
 from datetime import datetime
+from typing import List, Optional
 import csv
 
+import pandas as pd
+
+try:
+    from rrwrite_table_reader import load_table, table_rows
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_table_reader import load_table, table_rows
+
 
 class EvidenceReportGenerator:
     """Generate comprehensive evidence reports for manuscripts."""
@@ -53,14 +62,13 @@ class EvidenceReportGenerator:
             except Exception as e:
                 print(f"Warning: Could not load state file: {e}", file=sys.stderr)
 
-    def count_files_in_tsv(self, tsv_path: Path) -> int:
+    def count_table_rows(self, tsv_path: Path) -> int:
         """Count data rows in TSV file (excluding header and comments)."""
         if not tsv_path.exists():
             return 0
 
         try:
-            with open(tsv_path) as f:
-                return sum(1 for line in f if line.strip() and not line.startswith('#'))
+            return table_rows(tsv_path)
         except Exception:
             return 0
 
@@ -93,31 +101,31 @@ class EvidenceReportGenerator:
         except Exception:
             return {'total': 0, 'unique_dois': 0, 'citation_keys': 0}
 
-    def read_tsv_table(self, filename: str) -> list:
-        """Read TSV file and return rows (skip comments)."""
+    def read_tsv_table(self, filename: str) -> Optional[pd.DataFrame]:
+        """Load a data table with typed columns (Arrow sidecar if present)."""
         tsv_path = self.data_tables_dir / filename
 
         if not tsv_path.exists():
-            return []
+            return None
 
-        rows = []
         try:
-            with open(tsv_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        rows.append(line.split('\t'))
+            return load_table(tsv_path)[0]
         except Exception as e:
             print(f"Warning: Could not read {filename}: {e}", file=sys.stderr)
+            return None
 
-        return rows
+    @staticmethod
+    def complete_rows(table: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """Rows that have a value in every column (none if a column is missing)."""
+        if not set(columns).issubset(table.columns):
+            return table.iloc[0:0].reindex(columns=columns)
+        return table[columns].dropna()
 
     def generate_summary_stats(self) -> str:
         """Generate summary statistics table."""
         # Count files from different sources
-        file_inventory_count = self.count_files_in_tsv(self.data_tables_dir / 'file_inventory.tsv') - 1  # Exclude header
-        repo_stats_rows = self.read_tsv_table('repository_statistics.tsv')
-        research_indicators_rows = self.read_tsv_table('research_indicators.tsv')
+        repo_stats = self.read_tsv_table('repository_statistics.tsv')
+        research_topics = self.count_table_rows(self.data_tables_dir / 'research_indicators.tsv')
         citation_stats = self.count_citations()
 
         # Parse repository statistics
@@ -127,28 +135,19 @@ class EvidenceReportGenerator:
         data_files = 0
         config_files = 0
         test_files = 0
-
-        for row in repo_stats_rows[1:]:  # Skip header
-            if len(row) >= 6:
-                category = row[0]
-                count = int(row[1])
-                tests = int(row[4])
-
-                total_files += count
-                test_files += tests
-
-                if category.lower() == 'doc':
-                    doc_files = count
-                elif category.lower() == 'script':
-                    script_files = count
-                elif category.lower() == 'data':
-                    data_files = count
-                elif category.lower() == 'config':
-                    config_files = count
-
-        total_size_mb = sum(float(row[2]) for row in repo_stats_rows[1:] if len(row) >= 3)
-
-        research_topics = len(research_indicators_rows) - 1  # Exclude header
+        total_size_mb = 0.0
+
+        if repo_stats is not None:
+            repo_stats = self.complete_rows(repo_stats, ['category', 'file_count', 'test_files', 'total_size_mb'])
+        if repo_stats is not None and not repo_stats.empty:
+            counts = repo_stats.set_index(repo_stats['category'].astype(str).str.lower())['file_count']
+            total_files = int(counts.sum())
+            test_files = int(repo_stats['test_files'].sum())
+            total_size_mb = float(repo_stats['total_size_mb'].sum())
+            doc_files = int(counts.get('doc', 0))
+            script_files = int(counts.get('script', 0))
+            data_files = int(counts.get('data', 0))
+            config_files = int(counts.get('config', 0))
 
         output = f"""| Metric | Count | Source File |
 |--------|-------|-------------|
@@ -166,14 +165,11 @@ class EvidenceReportGenerator:
 
     def generate_repo_statistics_table(self) -> str:
         """Generate repository statistics table with evidence counts."""
-        rows = self.read_tsv_table('repository_statistics.tsv')
+        stats = self.read_tsv_table('repository_statistics.tsv')
 
-        if len(rows) < 2:
+        if stats is None or stats.empty:
             return "No repository statistics available.\n"
 
-        header = rows[0]
-        data_rows = rows[1:]
-
         output = "| Category | Files | Total Size | Avg Size | Test Files | Doc Files | Evidence Count |\n"
         output += "|----------|-------|------------|----------|------------|-----------|----------------|\n"
 
@@ -182,21 +178,17 @@ class EvidenceReportGenerator:
         total_tests = 0
         total_docs = 0
 
-        for row in data_rows:
-            if len(row) >= 6:
-                category = row[0].title()
-                files = int(row[1])
-                size_mb = float(row[2])
-                avg_kb = float(row[3])
-                tests = int(row[4])
-                docs = int(row[5])
+        columns = ['category', 'file_count', 'total_size_mb', 'avg_size_kb', 'test_files', 'doc_files']
+        for category, files, size_mb, avg_kb, tests, docs in self.complete_rows(stats, columns).itertuples(index=False):
+            category = str(category).title()
+            files, tests, docs = int(files), int(tests), int(docs)
 
-                total_files += files
-                total_size += size_mb
-                total_tests += tests
-                total_docs += docs
+            total_files += files
+            total_size += size_mb
+            total_tests += tests
+            total_docs += docs
 
-                output += f"| {category} | {files} | {size_mb:.2f} MB | {avg_kb:.2f} KB | {tests} | {docs} | {files} |\n"
+            output += f"| {category} | {files} | {size_mb:.2f} MB | {avg_kb:.2f} KB | {tests} | {docs} | {files} |\n"
 
         avg_size = (total_size * 1024 / total_files) if total_files > 0 else 0
         output += f"| **TOTAL** | **{total_files}** | **{total_size:.2f} MB** | **{avg_size:.2f} KB** | **{total_tests}** | **{total_docs}** | **{total_files}** |\n"
@@ -205,9 +197,9 @@ class EvidenceReportGenerator:
 
     def generate_research_topics_table(self) -> str:
         """Generate research topics table with evidence counts."""
-        rows = self.read_tsv_table('research_indicators.tsv')
+        topics = self.read_tsv_table('research_indicators.tsv')
 
-        if len(rows) < 2:
+        if topics is None or topics.empty:
             return "No research topics detected.\n"
 
         output = "| Topic | Confidence | Evidence Count | Evidence Files | Example Files |\n"
@@ -215,16 +207,14 @@ class EvidenceReportGenerator:
 
         total_evidence = 0
 
-        for row in rows[1:]:
-            if len(row) >= 4:
-                topic = row[0]
-                confidence = row[1].title()
-                evidence_count = int(row[2])
-                example_files = row[3]
+        columns = ['topic', 'confidence', 'evidence_count', 'example_files']
+        for topic, confidence, evidence_count, example_files in self.complete_rows(topics, columns).itertuples(index=False):
+            confidence = str(confidence).title()
+            evidence_count = int(evidence_count)
 
-                total_evidence += evidence_count
+            total_evidence += evidence_count
 
-                output += f"| **{topic}** | {confidence} | {evidence_count} | {evidence_count} files | `{example_files}` |\n"
+            output += f"| **{topic}** | {confidence} | {evidence_count} | {evidence_count} files | `{example_files}` |\n"
 
         output += f"| **TOTAL** | - | **{total_evidence}** | **{total_evidence} files** | - |\n"
 
@@ -304,7 +294,7 @@ All evidence data is stored in structured files within this manuscript directory
 
                 # Count records
                 if filename.endswith('.tsv'):
-                    records = self.count_files_in_tsv(file_path) - 1  # Exclude header
+                    records = self.count_table_rows(file_path)
                 elif filename.endswith('.csv'):
                     records = self.count_citations()['total']
                 else:
@@ -348,10 +338,10 @@ All evidence data is stored in structured files within this manuscript directory
 
 | Evidence Type | Count | Quality | Completeness | Source File |
 |---------------|-------|---------|--------------|-------------|
-| **Repository Files** | {self.count_files_in_tsv(self.data_tables_dir / 'file_inventory.tsv') - 1} | ✅ High | 100% | [`data_tables/file_inventory.tsv`](data_tables/file_inventory.tsv) |
+| **Repository Files** | {self.count_table_rows(self.data_tables_dir / 'file_inventory.tsv')} | ✅ High | 100% | [`data_tables/file_inventory.tsv`](data_tables/file_inventory.tsv) |
 | **Data Tables** | 4 | ✅ High | 100% | `data_tables/*.tsv` |
 | **Repository Analysis** | 1 | ✅ High | 100% | [`repository_analysis.md`](repository_analysis.md) |
-| **Research Topics** | {len(self.read_tsv_table('research_indicators.tsv')) - 1} | ✅ Good | 100% | [`data_tables/research_indicators.tsv`](data_tables/research_indicators.tsv) |
+| **Research Topics** | {self.count_table_rows(self.data_tables_dir / 'research_indicators.tsv')} | ✅ Good | 100% | [`data_tables/research_indicators.tsv`](data_tables/research_indicators.tsv) |
 | **Literature Citations** | {citation_stats['total']} | {'⚠️ Poor' if citation_stats['total'] <= 1 else '✅ Good'} | {'0% (placeholder)' if citation_stats['total'] <= 1 else '100%'} | [`literature_evidence.csv`](literature_evidence.csv) |
 
 ---
@@ -8,16 +8,41 @@ Usage:
     python scripts/rrwrite-plot.py data.csv "scatter plot of x vs y"
     python scripts/rrwrite-plot.py data.tsv "bar chart" --x category --y count
     python scripts/rrwrite-plot.py data.json "heatmap" --output figure.pdf
+    python scripts/rrwrite-plot.py data.csv "bar chart" "box plot" "histogram"
+    python scripts/rrwrite-plot.py --manifest plots.json --workers 8
+
+Several descriptions or a plot manifest are rendered in parallel, one
+process per core; each figure is drawn once and saved in every format.
+Plots whose data, parameters and style are unchanged are linked from the
+render cache instead of being redrawn (disable with --no-cache).
+
+Manifest format (paths are relative to the manifest file):
+    {
+      "defaults": {"style": "nature", "formats": ["png", "pdf"], "output_dir": "figures/generated"},
+      "plots": [
+        {"data": "data_tables/results.tsv", "description": "bar chart", "x": "category", "y": "count"},
+        {"data": "data_tables/results.tsv", "type": "box", "output": "figures/generated/fig2"}
+      ]
+    }
 """
 
 import argparse
 import json
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
 
+try:
+    from rrwrite_render_pool import RenderPool, RenderResult, RenderTask
+    from rrwrite_render_cache import render_key, render_with_cache
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_render_pool import RenderPool, RenderResult, RenderTask
+    from rrwrite_render_cache import render_key, render_with_cache
+
 # Try to import plotting libraries
 try:
     import matplotlib
@@ -63,6 +88,17 @@ class PlotGenerator:
         }
     }
 
+    # Publication quality settings applied on top of every preset
+    RC_PARAMS = {
+        'font.size': 10,
+        'axes.labelsize': 11,
+        'axes.titlesize': 12,
+        'xtick.labelsize': 9,
+        'ytick.labelsize': 9,
+        'legend.fontsize': 9,
+        'figure.titlesize': 13
+    }
+
     def __init__(self, style: str = 'nature', dpi: int = 300):
         """Initialize plot generator with style settings"""
         self.dpi = dpi
@@ -74,6 +110,7 @@ class PlotGenerator:
             print(f"⚠️  Unknown style '{style}', using 'nature'")
             style = 'nature'
 
+        self.style = style
         preset = self.STYLE_PRESETS[style]
         sns.set_style(preset['style'])
         sns.set_context(preset['context'], font_scale=preset['font_scale'])
@@ -82,13 +119,13 @@ class PlotGenerator:
         # Publication quality settings
         plt.rcParams['figure.dpi'] = self.dpi
         plt.rcParams['savefig.dpi'] = self.dpi
-        plt.rcParams['font.size'] = 10
-        plt.rcParams['axes.labelsize'] = 11
-        plt.rcParams['axes.titlesize'] = 12
-        plt.rcParams['xtick.labelsize'] = 9
-        plt.rcParams['ytick.labelsize'] = 9
-        plt.rcParams['legend.fontsize'] = 9
-        plt.rcParams['figure.titlesize'] = 13
+        plt.rcParams.update(self.RC_PARAMS)
+
+    @classmethod
+    def style_settings(cls, style: str, dpi: int) -> Dict:
+        """Everything apply_style sets for a preset (used in render cache keys)"""
+        preset = cls.STYLE_PRESETS.get(style, cls.STYLE_PRESETS['nature'])
+        return {'preset': preset, 'rcParams': cls.RC_PARAMS, 'dpi': dpi}
 
     def load_data(self, file_path: Path) -> pd.DataFrame:
         """Load data from CSV, TSV, or JSON"""
@@ -165,6 +202,17 @@ class PlotGenerator:
         **kwargs
     ) -> Path:
         """Generate plot of specified type"""
+        return self.generate_plot_formats(df, plot_type, [output_path], description, **kwargs)[0]
+
+    def generate_plot_formats(
+        self,
+        df: pd.DataFrame,
+        plot_type: str,
+        output_paths: List[Path],
+        description: Optional[str] = None,
+        **kwargs
+    ) -> List[Path]:
+        """Draw a plot once and save it to every output path (format from suffix)"""
 
         # Infer parameters
         params = self.infer_plot_params(df, plot_type, description, **kwargs)
@@ -257,17 +305,20 @@ class PlotGenerator:
 
             plt.tight_layout()
 
-            # Save figure
-            output_path = Path(output_path)
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-            plt.savefig(output_path, bbox_inches='tight', dpi=self.dpi)
-            plt.close()
+            # Save figure in each format
+            saved = []
+            for output_path in output_paths:
+                output_path = Path(output_path)
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                fig.savefig(output_path, bbox_inches='tight', dpi=self.dpi)
+                print(f"✓ Saved: {output_path}")
+                saved.append(output_path)
+            plt.close(fig)
 
-            print(f"✓ Saved: {output_path}")
-            return output_path
+            return saved
 
         except Exception as e:
-            plt.close()
+            plt.close(fig)
             raise ValueError(f"Error generating plot: {e}")
 
 
@@ -306,14 +357,152 @@ def parse_plot_description(description: str) -> Tuple[str, Dict]:
     return plot_type, params
 
 
+@dataclass
+class PlotSpec:
+    """One plot to render: data, plot type, output base path and options"""
+    data: Path
+    plot_type: str
+    output_base: Path
+    formats: List[str] = field(default_factory=lambda: ['png'])
+    description: Optional[str] = None
+    style: str = 'nature'
+    dpi: int = 300
+    params: Dict = field(default_factory=dict)
+
+    def output_paths(self) -> List[Path]:
+        return [self.output_base.parent / f"{self.output_base.name}.{fmt}" for fmt in self.formats]
+
+    def cache_key(self) -> Optional[str]:
+        """Render cache key: data bytes, plot options, style and plotting code"""
+        return render_key(
+            [Path(self.data)],
+            {
+                'plot_type': self.plot_type,
+                'description': self.description,
+                'formats': self.formats,
+                'params': self.params
+            },
+            PlotGenerator.style_settings(self.style, self.dpi),
+            code=[Path(__file__)]
+        )
+
+
+# Per-worker state: one PlotGenerator (styled once) and the tables it has loaded
+_worker_generator: Optional[PlotGenerator] = None
+_worker_data: Dict[Path, pd.DataFrame] = {}
+
+
+def _init_render_worker(style: str, dpi: int):
+    """Pool initializer: import and style matplotlib once per worker"""
+    global _worker_generator
+    _worker_generator = PlotGenerator(style=style, dpi=dpi)
+
+
+def render_spec(spec: PlotSpec) -> List[Path]:
+    """Render one PlotSpec in the current worker"""
+    global _worker_generator
+    if _worker_generator is None or _worker_generator.dpi != spec.dpi:
+        _worker_generator = PlotGenerator(style=spec.style, dpi=spec.dpi)
+    elif _worker_generator.style != spec.style:
+        _worker_generator.apply_style(spec.style)
+
+    data_path = Path(spec.data).resolve()
+    if data_path not in _worker_data:
+        _worker_data[data_path] = _worker_generator.load_data(data_path)
+
+    return _worker_generator.generate_plot_formats(
+        df=_worker_data[data_path],
+        plot_type=spec.plot_type,
+        output_paths=spec.output_paths(),
+        description=spec.description,
+        **spec.params
+    )
+
+
+def render_specs(
+    specs: List[PlotSpec],
+    workers: Optional[int] = None,
+    use_cache: bool = True
+) -> List[RenderResult]:
+    """Render a batch of plots across a process pool (one worker per core by default)
+
+    Plots found in the render cache are linked into place; only the rest are
+    sent to the pool.
+    """
+    if not specs:
+        return []
+    pool = RenderPool(
+        setup=_init_render_worker,
+        setup_args=(specs[0].style, specs[0].dpi),
+        workers=workers
+    )
+    tasks = [RenderTask(str(spec.output_base), render_spec, (spec,)) for spec in specs]
+    keys = [spec.cache_key() if use_cache else None for spec in specs]
+    outputs = [spec.output_paths() for spec in specs]
+    return render_with_cache(pool, tasks, keys, outputs)
+
+
+PLOT_PARAM_KEYS = ('x', 'y', 'hue', 'title', 'xlabel', 'ylabel', 'figsize', 'bins', 'trendline')
+
+
+def load_plot_manifest(manifest_path: Path) -> List[PlotSpec]:
+    """Load plot specs from a JSON manifest (see module docstring)"""
+    manifest_path = Path(manifest_path)
+    manifest = json.loads(manifest_path.read_text())
+    base_dir = manifest_path.parent
+    defaults = manifest.get('defaults', {})
+    output_dir = base_dir / defaults.get('output_dir', 'figures/generated')
+
+    specs = []
+    for entry in manifest.get('plots', []):
+        options = {**defaults, **entry}
+        if 'data' not in options:
+            raise ValueError(f"Plot entry without 'data' in {manifest_path}: {entry}")
+        data = base_dir / options['data']
+
+        description = options.get('description')
+        if options.get('type'):
+            plot_type, params = options['type'], {}
+        elif description:
+            plot_type, params = parse_plot_description(description)
+        else:
+            raise ValueError(f"Plot entry needs 'type' or 'description' in {manifest_path}: {entry}")
+
+        params.update({k: options[k] for k in PLOT_PARAM_KEYS if options.get(k) is not None})
+        if 'figsize' in params:
+            params['figsize'] = tuple(params['figsize'])
+
+        if options.get('output'):
+            output_base = (base_dir / options['output']).with_suffix('')
+        else:
+            output_base = output_dir / f"{Path(data).stem}_{plot_type}"
+
+        formats = options.get('formats', ['png'])
+        if isinstance(formats, str):
+            formats = formats.split(',')
+
+        specs.append(PlotSpec(
+            data=data,
+            plot_type=plot_type,
+            output_base=output_base,
+            formats=formats,
+            description=description,
+            style=options.get('style', 'nature'),
+            dpi=options.get('dpi', 300),
+            params=params
+        ))
+    return specs
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate publication-quality plots from data',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__
     )
-    parser.add_argument('data', type=Path, help='Data file (CSV, TSV, JSON)')
-    parser.add_argument('description', nargs='?', help='Natural language plot description')
+    parser.add_argument('data', type=Path, nargs='?', help='Data file (CSV, TSV, JSON)')
+    parser.add_argument('description', nargs='*',
+                       help='Natural language plot description (several render in parallel)')
     parser.add_argument('--type', choices=[
         'bar', 'barh', 'scatter', 'line', 'box', 'violin',
         'heatmap', 'histogram', 'kde', 'count', 'strip', 'swarm'
@@ -332,16 +521,29 @@ def main():
                        help='Journal style preset')
     parser.add_argument('--dpi', type=int, default=300, help='Resolution (DPI)')
     parser.add_argument('--show-data', action='store_true', help='Show data preview')
+    parser.add_argument('--manifest', type=Path, help='JSON manifest of plots to render')
+    parser.add_argument('--workers', type=int, help='Render processes (default: one per core)')
+    parser.add_argument('--no-cache', action='store_true', help='Always redraw (skip the render cache)')
 
     args = parser.parse_args()
 
-    # Initialize generator
-    generator = PlotGenerator(style=args.style, dpi=args.dpi)
+    if args.manifest:
+        try:
+            specs = load_plot_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"❌ Error: {e}")
+            return 1
+        print(f"📊 Rendering {len(specs)} plot(s) from {args.manifest}...")
+        return _report(render_specs(specs, workers=args.workers, use_cache=not args.no_cache))
+
+    if not args.data:
+        print("❌ Error: Must specify a data file or --manifest")
+        return 1
 
     # Load data
     print(f"📊 Loading data from {args.data}...")
     try:
-        df = generator.load_data(args.data)
+        df = PlotGenerator(style=args.style, dpi=args.dpi).load_data(args.data)
     except Exception as e:
         print(f"❌ Error: {e}")
         return 1
@@ -353,13 +555,13 @@ def main():
         print(df.dtypes)
         return 0
 
-    # Determine plot type
+    # Determine plot types (one per description)
     if args.type:
-        plot_type = args.type
-        params = {}
+        plots = [(args.type, {}, d) for d in (args.description or [None])]
     elif args.description:
-        plot_type, params = parse_plot_description(args.description)
-        print(f"🎨 Detected plot type: {plot_type}")
+        plots = [(*parse_plot_description(d), d) for d in args.description]
+        for plot_type, _, _ in plots:
+            print(f"🎨 Detected plot type: {plot_type}")
     else:
         print(f"❌ Error: Must specify either --type or provide description")
         return 1
@@ -370,7 +572,7 @@ def main():
     else:
         output_dir = Path('figures/generated')
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_base = output_dir / f'plot_{plot_type}'
+        output_base = output_dir / 'plot'
 
     # Parse figsize
     figsize = (10, 6)
@@ -381,36 +583,48 @@ def main():
         except:
             print(f"⚠️  Invalid figsize, using default (10, 6)")
 
-    # Generate plots in requested formats
-    formats = args.formats.split(',')
-    output_paths = []
-
-    for fmt in formats:
-        output_path = output_base.with_suffix(f'.{fmt}')
-        print(f"\n🎨 Generating {plot_type} plot...")
-
-        try:
-            path = generator.generate_plot(
-                df=df,
-                plot_type=plot_type,
-                output_path=output_path,
-                description=args.description,
-                x=args.x,
-                y=args.y,
-                hue=args.hue,
-                title=args.title,
-                xlabel=args.xlabel,
-                ylabel=args.ylabel,
-                figsize=figsize,
-                **params
-            )
-            output_paths.append(path)
-
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return 1
+    specs = []
+    for i, (plot_type, params, description) in enumerate(plots, start=1):
+        if len(plots) > 1:
+            base = output_base.with_name(f"{output_base.name}_{i}_{plot_type}")
+        elif args.output:
+            base = output_base
+        else:
+            base = output_base.with_name(f"plot_{plot_type}")
+
+        params.update(
+            x=args.x, y=args.y, hue=args.hue, title=args.title,
+            xlabel=args.xlabel, ylabel=args.ylabel, figsize=figsize
+        )
+        specs.append(PlotSpec(
+            data=args.data,
+            plot_type=plot_type,
+            output_base=base,
+            formats=args.formats.split(','),
+            description=description,
+            style=args.style,
+            dpi=args.dpi,
+            params=params
+        ))
+
+    print(f"\n🎨 Generating {len(specs)} plot(s)...")
+    return _report(render_specs(specs, workers=args.workers, use_cache=not args.no_cache))
+
+
+def _report(results: List[RenderResult]) -> int:
+    """Print render results; returns the CLI exit code"""
+    output_paths = [path for r in results if not r.error for path in r.value]
+    failed = [r for r in results if r.error]
+    cached = sum(1 for r in results if r.cached)
+
+    for r in failed:
+        print(f"❌ Error ({r.name}): {r.error}")
+    if failed:
+        return 1
 
     print(f"\n✅ Success! Generated {len(output_paths)} file(s)")
+    if cached:
+        print(f"   ♻️  {cached} plot(s) unchanged, reused from render cache")
     for path in output_paths:
         print(f"   📁 {path}")
 
@@ -12,7 +12,6 @@ Usage:
 """
 
 import sys
-import subprocess
 from pathlib import Path
 from typing import List, Dict, Optional
 import logging
@@ -21,14 +20,18 @@ import argparse
 # Import revision components
 try:
     from rrwrite_revision_parser import CritiqueParser, Issue
+    from rrwrite_llm_client import get_llm_client
     from rrwrite_revision_context import RevisionContext
-    from rrwrite_section_reviser import get_reviser
+    from rrwrite_revision_executor import RevisionExecutor, SectionJob
+    from rrwrite_revision_pipeline import PipelineError, RevisionPipeline
     from rrwrite_state_manager import StateManager
 except ImportError:
     sys.path.insert(0, str(Path(__file__).parent))
     from rrwrite_revision_parser import CritiqueParser, Issue
+    from rrwrite_llm_client import get_llm_client
     from rrwrite_revision_context import RevisionContext
-    from rrwrite_section_reviser import get_reviser
+    from rrwrite_revision_executor import RevisionExecutor, SectionJob
+    from rrwrite_revision_pipeline import PipelineError, RevisionPipeline
     from rrwrite_state_manager import StateManager
 
 
@@ -40,7 +43,8 @@ class RevisionOrchestrator:
         manuscript_dir: Path,
         max_revisions: int = 2,
         min_improvement: float = 0.05,
-        dry_run: bool = False
+        dry_run: bool = False,
+        workers: Optional[int] = None
     ):
         """Initialize revision orchestrator.
 
@@ -49,6 +53,7 @@ class RevisionOrchestrator:
             max_revisions: Maximum number of revision iterations
             min_improvement: Minimum improvement rate to continue (default: 5%)
             dry_run: If True, don't save changes or commit
+            workers: Sections revised concurrently (default: RRWRITE_REVISION_WORKERS or 4)
         """
         self.manuscript_dir = Path(manuscript_dir).resolve()
         self.max_revisions = max_revisions
@@ -60,10 +65,17 @@ class RevisionOrchestrator:
         self.state_manager = StateManager(output_dir=self.manuscript_dir, enable_git=not dry_run)
         self.critique_parser = CritiqueParser(self.manuscript_dir)
         self.context = RevisionContext(self.manuscript_dir)
+        self.executor = RevisionExecutor(self.context, workers=workers, dry_run=dry_run)
+        self.llm = get_llm_client()
+        self.pipeline = RevisionPipeline(self.manuscript_dir)
 
         # Track current version
         self.current_version = 1
 
+        # Issues and reports of the latest in-process critique (None: read from disk)
+        self._issues: Optional[List[Issue]] = None
+        self._reports = None
+
     def run_revision_loop(self):
         """Main revision loop: parse → revise → validate → critique → converge."""
 
@@ -87,16 +99,20 @@ class RevisionOrchestrator:
             print(f"REVISION ITERATION {iteration}/{self.max_revisions}")
             print(f"{'='*60}\n")
 
-            # Step 1: Parse critique reports
-            print(f"Parsing critique reports (version {self.current_version})...")
-            issues = self.critique_parser.parse_critique_reports(version=self.current_version)
+            # Step 1: Parse critique reports (after the first iteration, the
+            # issues come straight from the in-process critique)
+            if self._issues is not None:
+                issues = self._issues
+            else:
+                print(f"Parsing critique reports (version {self.current_version})...")
+                issues = self.critique_parser.parse_critique_reports(version=self.current_version)
 
-            if not issues:
-                print("✗ No critique reports found. Run critique first.")
-                return
+                if not issues:
+                    print("✗ No critique reports found. Run critique first.")
+                    return
 
-            # Infer sections
-            issues = self.critique_parser.infer_all_sections(issues)
+                # Infer sections
+                issues = self.critique_parser.infer_all_sections(issues)
 
             # Count issues before
             metrics_before = self.critique_parser.count_issues(issues)
@@ -118,37 +134,39 @@ class RevisionOrchestrator:
                 minor = sum(1 for i in section_issues if i.severity == "minor")
                 print(f"  - {section}: {major} major, {minor} minor")
 
-            # Step 4: Revise sections
+            # Step 4: Revise sections (concurrently; results reported in section order)
             print(f"\nRevising sections...")
             sections_revised = []
 
+            jobs = []
             for section, section_issues in section_issue_map.items():
+                section_file = self.manuscript_dir / f"{section}.md"
+                if section != "manuscript_full" and section_file.exists():
+                    jobs.append(SectionJob(section, section_file, section_issues))
+            llm_before = self.llm.usage.snapshot()
+            outcomes = {outcome.section: outcome for outcome in self.executor.run(jobs)}
+
+            for section in section_issue_map:
                 # Skip manuscript_full (cross-cutting issues)
                 if section == "manuscript_full":
                     print(f"  ⊘ Skipping manuscript_full (cross-cutting issues)")
                     continue
 
-                # Get section file
-                section_file = self.manuscript_dir / f"{section}.md"
-
-                if not section_file.exists():
+                if section not in outcomes:
                     print(f"  ✗ Section file not found: {section}.md")
                     continue
 
-                # Create reviser
-                reviser = get_reviser(section, section_file, section_issues, self.context)
-
-                # Revise
+                outcome = outcomes[section]
+                result = outcome.result
                 print(f"  Revising {section}...", end=" ")
-                result = reviser.revise()
 
-                if result.success:
+                if outcome.error:
+                    print(f"✗ Revision failed: {outcome.error}")
+
+                elif result.success:
                     print(f"✓ ({len(result.changes_made)} changes)")
 
-                    # Save if not dry run
-                    if not self.dry_run and result.validation.passed:
-                        with open(section_file, 'w', encoding='utf-8') as f:
-                            f.write(result.content)
+                    if outcome.saved:
                         sections_revised.append(section)
                     elif self.dry_run:
                         sections_revised.append(section)
@@ -165,43 +183,34 @@ class RevisionOrchestrator:
                     for error in result.validation.errors:
                         print(f"    ERROR: {error}")
 
+            if self.llm.usage.snapshot() != llm_before:
+                print(f"  LLM (total): {self.llm.usage}")
+
             if not sections_revised:
                 print(f"\n⚠ No sections were successfully revised")
                 if not self.dry_run:
                     self.state_manager.complete_revision("stalled", "no_sections_revised")
                 return
 
-            # Step 5: Re-assemble manuscript
-            print(f"\nRe-assembling manuscript...")
-            if not self.dry_run:
-                try:
-                    self._run_assembly()
-                    print(f"  ✓ Manuscript assembled")
-                except Exception as e:
-                    print(f"  ✗ Assembly failed: {e}")
-                    return
-            else:
-                print(f"  (Dry run - skipping assembly)")
-
-            # Step 6: Re-run critique
+            # Step 5-6: Re-assemble manuscript and re-run critique (in-process;
+            # content and format critique run in parallel)
             self.current_version += 1
-            print(f"\nRe-running critique (version {self.current_version})...")
+            print(f"\nRe-assembling manuscript and re-running critique (version {self.current_version})...")
 
             if not self.dry_run:
                 try:
-                    self._run_critique(self.current_version)
+                    self._run_pipeline(self.current_version)
+                    print(f"  ✓ Manuscript assembled")
                     print(f"  ✓ Critique complete")
-                except Exception as e:
-                    print(f"  ✗ Critique failed: {e}")
+                except PipelineError as e:
+                    print(f"  ✗ {e.stage.capitalize()} failed: {e.error}")
                     return
             else:
-                print(f"  (Dry run - skipping critique)")
+                print(f"  (Dry run - skipping assembly and critique)")
 
-            # Step 7: Parse new critique
+            # Step 7: Collect new issues (structured, no report parsing)
             if not self.dry_run:
-                new_issues = self.critique_parser.parse_critique_reports(version=self.current_version)
-                new_issues = self.critique_parser.infer_all_sections(new_issues)
-                metrics_after = self.critique_parser.count_issues(new_issues)
+                metrics_after = self.critique_parser.count_issues(self._issues)
             else:
                 # In dry run, assume improvement
                 metrics_after = {
@@ -265,60 +274,14 @@ class RevisionOrchestrator:
             print("\nGenerating .docx with embedded critique comments...")
             self._embed_critique_comments()
 
-    def _run_assembly(self):
-        """Re-assemble manuscript after revisions."""
-        assembly_script = Path(__file__).parent / "rrwrite-assemble-manuscript.py"
-
-        cmd = [
-            sys.executable,
-            str(assembly_script),
-            "--manuscript-dir", str(self.manuscript_dir)
-        ]
-
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            raise Exception(f"Assembly failed: {result.stderr}")
-
-    def _run_critique(self, version: int):
-        """Re-run critique on updated manuscript."""
-        # Run content critique
-        content_script = Path(__file__).parent / "rrwrite-critique-content.py"
-        content_output = self.manuscript_dir / f"critique_content_v{version}.md"
-
-        cmd_content = [
-            sys.executable,
-            str(content_script),
-            "--file", str(self.manuscript_dir / "manuscript_full.md"),
-            "--output", str(content_output)
-        ]
-
-        result = subprocess.run(cmd_content, capture_output=True, text=True)
-
-        # Note: critique scripts return exit code 1 when issues found (expected behavior)
-        # Only treat as error if output file wasn't created
-        if not content_output.exists():
-            error_msg = result.stderr if result.stderr else result.stdout
-            raise Exception(f"Content critique failed: {error_msg}")
-
-        # Run format critique
-        format_script = Path(__file__).parent / "rrwrite-critique-format.py"
-        format_output = self.manuscript_dir / f"critique_format_v{version}.md"
-
-        cmd_format = [
-            sys.executable,
-            str(format_script),
-            "--file", str(self.manuscript_dir / "manuscript_full.md"),
-            "--output", str(format_output)
-        ]
-
-        result = subprocess.run(cmd_format, capture_output=True, text=True)
-
-        # Note: critique scripts return exit code 1 when issues found (expected behavior)
-        # Only treat as error if output file wasn't created
-        if not format_output.exists():
-            error_msg = result.stderr if result.stderr else result.stdout
-            raise Exception(f"Format critique failed: {error_msg}")
+    def _run_pipeline(self, version: int):
+        """Re-assemble the manuscript and critique it as version `version`."""
+        _, reports = self.pipeline.run_iteration(version)
+        issues = [issue for report in reports for issue in report.issues]
+        self._issues = self.critique_parser.infer_all_sections(
+            issues, manuscript_content=self.pipeline.manuscript_text
+        )
+        self._reports = reports
 
     def _git_commit_iteration(self, iteration: int, metrics_before: Dict, metrics_after: Dict):
         """Commit iteration changes to git."""
@@ -378,26 +341,11 @@ class RevisionOrchestrator:
 
     def _embed_critique_comments(self):
         """Embed critique comments into .docx file."""
-        embed_script = Path(__file__).parent / 'rrwrite-embed-critique-comments.py'
-
-        if not embed_script.exists():
-            print("  Comment embedding script not found")
-            return
-
-        # Use current version (after revisions)
-        cmd = [
-            sys.executable,
-            str(embed_script),
-            '--manuscript-dir', str(self.manuscript_dir),
-            '--version', str(self.current_version),
-            '--unresolved-only'  # Only show remaining issues
-        ]
-
+        # Use current version (after revisions); only show remaining issues
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-            print(result.stdout.strip())
-        except subprocess.CalledProcessError as e:
-            print(f"  Comment embedding failed: {e.stderr}")
+            self.pipeline.embed_comments(self.current_version, self._reports, unresolved_only=True)
+        except PipelineError as e:
+            print(f"  Comment embedding failed: {e.error}")
         except Exception as e:
             print(f"  Error embedding comments: {e}")
 
@@ -445,6 +393,11 @@ Examples:
         action="store_true",
         help="Show planned revisions without saving changes"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Sections revised concurrently (default: 4)"
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -479,7 +432,8 @@ Examples:
         manuscript_dir=manuscript_dir,
         max_revisions=args.max_iterations,
         min_improvement=args.min_improvement,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        workers=args.workers
     )
 
     # Run revision loop
@@ -5,143 +5,56 @@ Combined literature search using Semantic Scholar + PubMed APIs with caching.
 This script combines:
 - Semantic Scholar API (all domains, citation counts)
 - PubMed E-utilities API (biomedical focus, PMID)
-- Request caching (24-hour SQLite cache)
+- OpenAlex and Europe PMC APIs
+- Shared HTTP response cache (SQLite, per-endpoint expiry, see rrwrite_http_cache.py)
+
+All sources are searched concurrently in-process (see rrwrite_literature_engine.py).
+Every result is added to the local paper index (rrwrite_paper_index.py): repeat
+queries are replayed per source from the index, --related merges in related
+papers found earlier, and --offline answers from the index alone.
 """
 
 import argparse
 import json
 import sys
 from pathlib import Path
-from typing import List, Dict, Any
-import subprocess
+from typing import List, Dict, Any, Optional
 
-# Check for requests_cache availability
 try:
-    import requests_cache
-    CACHE_AVAILABLE = True
+    from rrwrite_literature_engine import LiteratureSearchEngine, SOURCE_LABELS
+    from rrwrite_http_cache import cache_enabled, configure_cache_dir, format_stats, get_cache
+    from rrwrite_paper_index import PaperIndex
+    from rrwrite_paper_dedup import deduplicate_papers as merge_duplicate_papers
 except ImportError:
-    CACHE_AVAILABLE = False
-    print("Warning: requests_cache not installed. Install with: pip install requests-cache", file=sys.stderr)
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_literature_engine import LiteratureSearchEngine, SOURCE_LABELS
+    from rrwrite_http_cache import cache_enabled, configure_cache_dir, format_stats, get_cache
+    from rrwrite_paper_index import PaperIndex
+    from rrwrite_paper_dedup import deduplicate_papers as merge_duplicate_papers
 
 
 def setup_cache(cache_dir: Path):
     """
-    Setup request caching if available.
-
-    Args:
-        cache_dir: Directory for cache files
-    """
-    if not CACHE_AVAILABLE:
-        return
-
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    cache_file = cache_dir / "literature_cache"
-
-    requests_cache.install_cache(
-        str(cache_file),
-        backend="sqlite",
-        expire_after=86400  # 24 hours
-    )
-
-    print(f"Cache enabled: {cache_file}.sqlite (24 hour expiry)", file=sys.stderr)
-
-
-def search_semantic_scholar(
-    query: str,
-    max_results: int = 20,
-    script_path: Path = None
-) -> List[Dict]:
-    """
-    Search Semantic Scholar via Python script.
+    Point the shared HTTP cache at a directory.
 
-    Args:
-        query: Search query
-        max_results: Maximum results
-        script_path: Path to rrwrite-api-semanticscholar.py script
-
-    Returns:
-        List of paper dictionaries
-    """
-    if script_path is None:
-        script_path = Path(__file__).parent / "rrwrite-api-semanticscholar.py"
-
-    cmd = [
-        "python3",
-        str(script_path),
-        query,
-        "--max-results", str(max_results),
-        "--prioritize"  # Prioritize highly-cited + recent
-    ]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-
-        if result.returncode != 0:
-            print(f"Semantic Scholar error: {result.stderr}", file=sys.stderr)
-            return []
-
-        data = json.loads(result.stdout)
-        return data.get("papers", [])
-
-    except Exception as e:
-        print(f"Semantic Scholar failed: {e}", file=sys.stderr)
-        return []
-
-
-def search_pubmed(
-    query: str,
-    max_results: int = 20,
-    script_path: Path = None
-) -> List[Dict]:
-    """
-    Search PubMed via Python script.
+    The location is exported via $RRWRITE_CACHE_DIR, so the in-process API
+    clients and any subprocesses started from here use the same cache.
 
     Args:
-        query: Search query
-        max_results: Maximum results
-        script_path: Path to rrwrite-api-pubmed.py script
-
-    Returns:
-        List of paper dictionaries
+        cache_dir: Directory for cache files
     """
-    if script_path is None:
-        script_path = Path(__file__).parent / "rrwrite-api-pubmed.py"
-
-    cmd = [
-        "python3",
-        str(script_path),
-        query,
-        "--max-results", str(max_results)
-    ]
+    configure_cache_dir(cache_dir)
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=45
-        )
-
-        if result.returncode != 0:
-            print(f"PubMed error: {result.stderr}", file=sys.stderr)
-            return []
-
-        data = json.loads(result.stdout)
-        return data.get("papers", [])
-
-    except Exception as e:
-        print(f"PubMed failed: {e}", file=sys.stderr)
-        return []
+    if cache_enabled():
+        print(f"Cache enabled: {Path(cache_dir) / 'http_cache.sqlite'} (per-endpoint expiry)", file=sys.stderr)
 
 
 def deduplicate_papers(papers: List[Dict]) -> List[Dict]:
     """
-    Remove duplicate papers based on DOI or title.
+    Merge duplicate papers returned by different sources.
+
+    Records sharing a DOI, PMID, arXiv ID or normalized title (or with
+    near-identical titles) are merged field by field, see rrwrite_paper_dedup.
 
     Args:
         papers: List of paper dictionaries
@@ -149,31 +62,7 @@ def deduplicate_papers(papers: List[Dict]) -> List[Dict]:
     Returns:
         Deduplicated list
     """
-    seen_dois = set()
-    seen_titles = set()
-    unique_papers = []
-
-    for paper in papers:
-        doi = paper.get("doi", "").strip().lower()
-        title = paper.get("title", "").strip().lower()
-
-        # Skip if we've seen this DOI
-        if doi and doi in seen_dois:
-            continue
-
-        # Skip if we've seen this exact title
-        if title and title in seen_titles:
-            continue
-
-        # Add to unique list
-        unique_papers.append(paper)
-
-        if doi:
-            seen_dois.add(doi)
-        if title:
-            seen_titles.add(title)
-
-    return unique_papers
+    return merge_duplicate_papers(papers)
 
 
 def merge_results(
@@ -220,78 +109,6 @@ def merge_results(
     }
 
 
-def search_openalex(
-    query: str,
-    max_results: int = 20,
-    script_path: Path = None
-) -> List[Dict]:
-    """Search OpenAlex via Python script"""
-    if script_path is None:
-        script_path = Path(__file__).parent / "rrwrite-api-openalex.py"
-
-    cmd = [
-        "python3",
-        str(script_path),
-        query,
-        "--max-results", str(max_results)
-    ]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if result.returncode != 0:
-            print(f"OpenAlex error: {result.stderr}", file=sys.stderr)
-            return []
-
-        data = json.loads(result.stdout)
-        return data.get("papers", [])
-
-    except Exception as e:
-        print(f"OpenAlex failed: {e}", file=sys.stderr)
-        return []
-
-
-def search_europepmc(
-    query: str,
-    max_results: int = 20,
-    script_path: Path = None
-) -> List[Dict]:
-    """Search Europe PMC via Python script"""
-    if script_path is None:
-        script_path = Path(__file__).parent / "rrwrite-api-europepmc.py"
-
-    cmd = [
-        "python3",
-        str(script_path),
-        query,
-        "--max-results", str(max_results)
-    ]
-
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=60
-        )
-
-        if result.returncode != 0:
-            print(f"Europe PMC error: {result.stderr}", file=sys.stderr)
-            return []
-
-        data = json.loads(result.stdout)
-        return data.get("papers", [])
-
-    except Exception as e:
-        print(f"Europe PMC failed: {e}", file=sys.stderr)
-        return []
-
-
 def search_literature(
     query: str,
     max_results: int = 20,
@@ -299,10 +116,15 @@ def search_literature(
     use_semantic_scholar: bool = True,
     use_openalex: bool = True,
     use_europepmc: bool = True,
-    cache_dir: Path = None
+    cache_dir: Path = None,
+    timeouts: Dict[str, float] = None,
+    index: Optional[PaperIndex] = None,
+    offline: bool = False,
+    index_max_age: Optional[float] = None,
+    include_related: bool = False
 ) -> Dict[str, Any]:
     """
-    Search literature using multiple APIs.
+    Search literature using multiple APIs concurrently.
 
     Args:
         query: Search query
@@ -312,6 +134,12 @@ def search_literature(
         use_openalex: Include OpenAlex search
         use_europepmc: Include Europe PMC search
         cache_dir: Directory for request cache
+        timeouts: Optional per-source timeout budgets in seconds
+        index: Local paper index (None disables the index)
+        offline: Answer from the local index only
+        index_max_age: Maximum age in seconds of replayed repeat queries
+        include_related: Merge in related papers from the local index (every
+            query term must match); always on when offline
 
     Returns:
         Dictionary with merged results
@@ -320,35 +148,50 @@ def search_literature(
     if cache_dir:
         setup_cache(cache_dir)
 
-    all_results = []
+    enabled = {
+        "semantic_scholar": use_semantic_scholar,
+        "pubmed": use_pubmed,
+        "openalex": use_openalex,
+        "europepmc": use_europepmc,
+    }
+    sources = [name for name, use in enabled.items() if use]
 
-    # Search Semantic Scholar
-    if use_semantic_scholar:
-        print(f"\n=== Searching Semantic Scholar ===", file=sys.stderr)
-        semantic_results = search_semantic_scholar(query, max_results)
-        all_results.extend(semantic_results)
-        print(f"Found {len(semantic_results)} papers", file=sys.stderr)
-
-    # Search PubMed
-    if use_pubmed:
-        print(f"\n=== Searching PubMed ===", file=sys.stderr)
-        pubmed_results = search_pubmed(query, max_results)
-        all_results.extend(pubmed_results)
-        print(f"Found {len(pubmed_results)} papers", file=sys.stderr)
-
-    # Search OpenAlex
-    if use_openalex:
-        print(f"\n=== Searching OpenAlex ===", file=sys.stderr)
-        openalex_results = search_openalex(query, max_results)
-        all_results.extend(openalex_results)
-        print(f"Found {len(openalex_results)} papers", file=sys.stderr)
-
-    # Search Europe PMC
-    if use_europepmc:
-        print(f"\n=== Searching Europe PMC ===", file=sys.stderr)
-        europepmc_results = search_europepmc(query, max_results)
-        all_results.extend(europepmc_results)
-        print(f"Found {len(europepmc_results)} papers", file=sys.stderr)
+    all_results = []
+    source_counts = {name: 0 for name in enabled}
+
+    # Replay sources that already answered this exact query
+    remaining = []
+    for name in sources:
+        cached = index.cached_results(query, name, max_results, index_max_age) if index else None
+        if cached is None:
+            remaining.append(name)
+            continue
+        print(f"{SOURCE_LABELS[name]}: {len(cached)} papers from local index", file=sys.stderr)
+        source_counts[name] = len(cached)
+        all_results.extend(cached)
+
+    # Related papers from earlier searches (every term must match unless offline)
+    local_results = []
+    if index and (offline or include_related):
+        local_results = index.search(query, limit=max_results, match_all=not offline)
+        print(f"Local index: {len(local_results)} related papers", file=sys.stderr)
+        all_results.extend(local_results)
+
+    if remaining and not offline:
+        print(f"\n=== Searching {', '.join(SOURCE_LABELS[s] for s in remaining)} ===", file=sys.stderr)
+        engine = LiteratureSearchEngine(timeouts=timeouts)
+        source_results = engine.search(query, remaining, max_results)
+
+        for name, result in source_results.items():
+            label = SOURCE_LABELS[name]
+            if result.error:
+                print(f"{label} failed: {result.error}", file=sys.stderr)
+            else:
+                print(f"{label}: found {len(result.papers)} papers ({result.elapsed:.1f}s)", file=sys.stderr)
+                if index and result.papers:
+                    index.record_query(query, name, result.papers, max_results)
+            source_counts[name] = len(result.papers)
+            all_results.extend(result.papers)
 
     # Merge and deduplicate
     print(f"\n=== Merging Results ===", file=sys.stderr)
@@ -363,22 +206,20 @@ def search_literature(
                 year = int(year)
             except (ValueError, TypeError):
                 year = 0
-        return (-citations, -year)
+        return (-citations, -(year or 0))
 
     unique_papers.sort(key=sort_key)
 
     print(f"Total unique papers: {len(unique_papers)}", file=sys.stderr)
 
+    counts = {"total_unique": len(unique_papers)}
+    counts.update(source_counts)
+    counts["local_index"] = len(local_results)
+
     return {
         "query": query,
         "papers": unique_papers,
-        "counts": {
-            "total_unique": len(unique_papers),
-            "semantic_scholar": len(semantic_results) if use_semantic_scholar else 0,
-            "pubmed": len(pubmed_results) if use_pubmed else 0,
-            "openalex": len(openalex_results) if use_openalex else 0,
-            "europepmc": len(europepmc_results) if use_europepmc else 0
-        }
+        "counts": counts
     }
 
 
@@ -417,8 +258,43 @@ def main():
     parser.add_argument(
         "--cache-dir",
         type=Path,
-        default=Path("manuscript/.cache"),
-        help="Cache directory (default: manuscript/.cache)"
+        help="HTTP cache directory (default: $RRWRITE_CACHE_DIR or ~/.cache/rrwrite)"
+    )
+    parser.add_argument(
+        "--cache-stats",
+        action="store_true",
+        help="Print HTTP cache statistics after the search"
+    )
+    parser.add_argument(
+        "--no-index",
+        action="store_true",
+        help="Do not read or update the local paper index"
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help="Answer from the local paper index only (no network)"
+    )
+    parser.add_argument(
+        "--related",
+        action="store_true",
+        help="Also merge related papers from the local index (every query term must match)"
+    )
+    parser.add_argument(
+        "--index-path",
+        type=Path,
+        help="Local paper index file (default: $RRWRITE_CACHE_DIR/paper_index.sqlite)"
+    )
+    parser.add_argument(
+        "--index-max-age-days",
+        type=float,
+        default=7,
+        help="Replay repeat queries from the index if younger than this (default: 7)"
+    )
+    parser.add_argument(
+        "--source-timeout",
+        type=float,
+        help="Timeout budget in seconds applied to every source (default: per-source limits)"
     )
     parser.add_argument(
         "--output",
@@ -441,7 +317,18 @@ def main():
         use_semantic_scholar=not args.no_semantic_scholar,
         use_openalex=not args.no_openalex,
         use_europepmc=not args.no_europepmc,
-        cache_dir=args.cache_dir
+        cache_dir=args.cache_dir,
+        timeouts=(
+            {name: args.source_timeout for name in SOURCE_LABELS}
+            if args.source_timeout else None
+        ),
+        index=None if args.no_index else PaperIndex(
+            args.index_path or (args.cache_dir / "paper_index.sqlite" if args.cache_dir else None)
+        ),
+        offline=args.offline,
+        # Offline, any recorded answer beats none
+        index_max_age=None if args.offline else args.index_max_age_days * 86400,
+        include_related=args.related
     )
 
     # Add metadata
@@ -450,6 +337,9 @@ def main():
         "pubmed_enabled": not args.no_pubmed,
         "openalex_enabled": not args.no_openalex,
         "europepmc_enabled": not args.no_europepmc,
+        "local_index_enabled": not args.no_index,
+        "offline": args.offline,
+        "related_from_index": args.related or args.offline,
         "max_results_per_source": args.max_results
     }
 
@@ -462,6 +352,13 @@ def main():
     else:
         print(json.dumps(results, indent=2))
 
+    if args.cache_stats:
+        cache = get_cache()
+        if cache is not None:
+            print(f"\n{format_stats(cache.stats())}", file=sys.stderr)
+        else:
+            print("\nHTTP cache disabled", file=sys.stderr)
+
     return 0
 
 
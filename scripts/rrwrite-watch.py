@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Watch a manuscript directory and rebuild its artifacts on every edit.
+
+Reassembles full_manuscript.md and reruns the consistency check, validation,
+format review and DOCX/PDF export - but only the stages affected by the
+files that changed.
+
+Usage:
+    python scripts/rrwrite-watch.py --manuscript-dir manuscript/project_v1
+    python scripts/rrwrite-watch.py --manuscript-dir manuscript/project_v1 --journal nature --no-export
+    python scripts/rrwrite-watch.py --manuscript-dir manuscript/project_v1 --once
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+try:
+    from rrwrite_watch import DEBOUNCE, POLL_INTERVAL, ManuscriptWatcher, format_report
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_watch import DEBOUNCE, POLL_INTERVAL, ManuscriptWatcher, format_report
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rebuild manuscript artifacts when section files change"
+    )
+    parser.add_argument(
+        '--manuscript-dir', '--output-dir',
+        dest='manuscript_dir',
+        type=Path,
+        default=Path('manuscript'),
+        help='Manuscript directory (default: manuscript)'
+    )
+    parser.add_argument(
+        '--journal',
+        choices=['nature', 'plos', 'bioinformatics'],
+        help='Target journal for the format review'
+    )
+    parser.add_argument(
+        '--no-export',
+        action='store_true',
+        help='Skip DOCX/PDF export'
+    )
+    parser.add_argument(
+        '--interval',
+        type=float,
+        default=POLL_INTERVAL,
+        help=f'Seconds between checks for changes (default: {POLL_INTERVAL})'
+    )
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=DEBOUNCE,
+        help=f'Seconds without changes before rebuilding (default: {DEBOUNCE})'
+    )
+    parser.add_argument(
+        '--once',
+        action='store_true',
+        help='Build once and exit'
+    )
+
+    args = parser.parse_args()
+
+    if not args.manuscript_dir.is_dir():
+        print(f"Error: Manuscript directory not found: {args.manuscript_dir}")
+        return 1
+
+    watcher = ManuscriptWatcher(
+        args.manuscript_dir,
+        journal=args.journal,
+        export=not args.no_export,
+        interval=args.interval,
+        debounce=args.debounce
+    )
+    if not args.no_export and not watcher.export:
+        print("Note: pandoc not found, DOCX/PDF export disabled")
+
+    if args.once:
+        report = watcher.check()
+        print(format_report(report))
+        return 0 if report.ok else 1
+
+    print(f"Watching {args.manuscript_dir} (Ctrl+C to stop)")
+    try:
+        watcher.watch()
+    except KeyboardInterrupt:
+        print("\nStopped watching")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
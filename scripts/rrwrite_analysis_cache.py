@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+RRWrite Analysis Cache
+
+Incremental repository analysis keyed on git commit and tree hashes.
+
+- Directory listings (file names, sizes, mtimes) are stored per directory
+  together with the directory's git tree hash. On the next run a directory
+  whose tree object and mtime are unchanged, and which has no uncommitted
+  changes, is reused from the cache instead of being read from disk. The
+  tree hash only covers tracked files, so gitignored files in the directory
+  are re-stat'ed and must still have their cached size and mtime.
+- GitHub URLs are kept as a persistent bare mirror plus a worktree. Repeated
+  analyses run `git fetch` into the mirror and check out the new commit, so
+  only changed files are rewritten and unchanged directories stay cached.
+- When every directory is reused, AnalysisCache.tree_key identifies the
+  unchanged tree, so outputs derived from the listing (the repository
+  tables) can be skipped without rebuilding them.
+
+Cache location: $RRWRITE_CACHE_DIR/repo_analysis (default: ~/.cache/rrwrite)
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+try:
+    from rrwrite_repo_index import DirSnapshot
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_repo_index import DirSnapshot
+
+CACHE_DIR_ENV = "RRWRITE_CACHE_DIR"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "rrwrite"
+CACHE_VERSION = 2
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from $RRWRITE_CACHE_DIR or the per-user default."""
+    return Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+
+
+def _git(args, cwd: Optional[Path] = None, timeout: int = 60) -> Optional[str]:
+    """Run a git command and return stdout, or None if it failed."""
+    try:
+        result = subprocess.run(
+            ['git', *args], cwd=cwd, capture_output=True, text=True, timeout=timeout
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def mirror_repo(url: str, cache_dir: Optional[Path] = None) -> Path:
+    """Fetch a remote repository into a persistent mirror and return its worktree.
+
+    The first call clones a bare mirror; later calls `git fetch` into it and
+    move the worktree to the new HEAD, which rewrites only changed files.
+
+    Args:
+        url: Repository URL
+        cache_dir: Cache root (default: $RRWRITE_CACHE_DIR)
+
+    Returns:
+        Path to the up-to-date worktree
+
+    Raises:
+        subprocess.CalledProcessError: If a git command fails or the mirror
+            has no HEAD (e.g. an empty repository)
+    """
+    cache_dir = Path(cache_dir or default_cache_dir())
+    name = re.sub(r'[^\w.-]', '_', url.rstrip('/').split('/')[-1].removesuffix('.git'))
+    key = hashlib.sha1(url.encode('utf-8')).hexdigest()[:12]
+    mirror = cache_dir / 'mirrors' / f"{name}-{key}.git"
+    worktree = cache_dir / 'mirrors' / f"{name}-{key}"
+
+    def run(args, cwd=None):
+        subprocess.run(['git', *args], cwd=cwd, capture_output=True, text=True, check=True)
+
+    if mirror.exists():
+        print(f"Fetching repository: {url}", file=sys.stderr)
+        run(['--git-dir', str(mirror), 'fetch', '--prune', '--quiet'])
+    else:
+        print(f"Mirroring repository: {url}", file=sys.stderr)
+        mirror.parent.mkdir(parents=True, exist_ok=True)
+        run(['clone', '--mirror', '--quiet', url, str(mirror)])
+
+    head = _git(['--git-dir', str(mirror), 'rev-parse', 'HEAD'])
+    if not head:
+        raise subprocess.CalledProcessError(
+            1, ['git', 'rev-parse', 'HEAD'], stderr=f"No HEAD commit in mirror of {url}"
+        )
+    head = head.strip()
+    if (worktree / '.git').exists():
+        run(['checkout', '--force', '--quiet', '--detach', head], cwd=worktree)
+        run(['clean', '-fdq'], cwd=worktree)
+    else:
+        run(['--git-dir', str(mirror), 'worktree', 'prune'])
+        run(['--git-dir', str(mirror), 'worktree', 'add', '--force', '--detach', str(worktree), head])
+    return worktree
+
+
+def git_tree_hashes(repo_path: Path) -> Dict[str, str]:
+    """Map each committed directory ('' for the root) to its git tree hash at HEAD."""
+    root = _git(['rev-parse', 'HEAD^{tree}'], cwd=repo_path)
+    if not root:
+        return {}
+    trees = {'': root.strip()}
+    listing = _git(['ls-tree', '-r', '-d', '-z', 'HEAD'], cwd=repo_path, timeout=300) or ''
+    for record in listing.split('\0'):
+        if not record:
+            continue
+        meta, path = record.split('\t', 1)
+        _, obj_type, obj_hash = meta.split()
+        if obj_type == 'tree':
+            trees[path] = obj_hash
+    return trees
+
+
+def git_tracked_files(repo_path: Path) -> Set[str]:
+    """Paths of all files in the git index."""
+    listing = _git(['ls-files', '-z'], cwd=repo_path, timeout=300) or ''
+    return {path for path in listing.split('\0') if path}
+
+
+def git_dirty_dirs(repo_path: Path) -> Set[str]:
+    """Directories ('' for the root) containing uncommitted or untracked changes."""
+    status = _git(['status', '--porcelain', '-z', '--untracked-files=all'], cwd=repo_path, timeout=300)
+    if status is None:
+        return set()
+    dirty = set()
+    records = status.split('\0')
+    i = 0
+    while i < len(records):
+        record = records[i]
+        i += 1
+        if len(record) < 4:
+            continue
+        if record[0] in 'RC':
+            i += 1   # Rename/copy source follows as its own record
+        parts = record[3:].rstrip('/').split('/')
+        for depth in range(len(parts)):
+            dirty.add('/'.join(parts[:depth]))
+    return dirty
+
+
+class AnalysisCache:
+    """Per-directory listing cache for one repository, keyed on git tree hashes."""
+
+    def __init__(self, repo_path: Path, cache_dir: Optional[Path] = None):
+        """Load cached listings and the current git tree state.
+
+        Args:
+            repo_path: Repository root
+            cache_dir: Cache root (default: $RRWRITE_CACHE_DIR)
+        """
+        self.repo_path = Path(repo_path)
+        cache_dir = Path(cache_dir or default_cache_dir()) / 'repo_analysis'
+        key = hashlib.sha1(str(self.repo_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        self.cache_file = cache_dir / f"{key}.json"
+
+        commit = _git(['rev-parse', 'HEAD'], cwd=self.repo_path)
+        self.commit = commit.strip() if commit else None
+        self.trees = git_tree_hashes(self.repo_path) if self.commit else {}
+        self.dirty = git_dirty_dirs(self.repo_path) if self.commit else set()
+
+        self.dirs: Dict[str, Dict] = {}
+        self.previous_commit: Optional[str] = None
+        try:
+            data = json.loads(self.cache_file.read_text())
+            if data.get('version') == CACHE_VERSION:
+                self.dirs = data.get('dirs', {})
+                self.previous_commit = data.get('commit')
+        except (OSError, json.JSONDecodeError):
+            pass
+
+        self.hits = 0
+        self.misses = 0
+
+    def _rel(self, directory: Path) -> str:
+        rel = Path(directory).relative_to(self.repo_path).as_posix()
+        return '' if rel == '.' else rel
+
+    @property
+    def tree_key(self) -> Optional[str]:
+        """Root tree hash if every directory was reused from the cache, else None.
+
+        The listing is then identical to the one saved by the previous run,
+        so anything built from it only needs rebuilding if this key changed.
+        """
+        if self.commit and self.hits and not self.misses and not self.dirty:
+            return self.trees.get('')
+        return None
+
+    def lookup(self, directory: Path) -> Optional[DirSnapshot]:
+        """Cached listing of a directory if its tree is unchanged, else None.
+
+        Used as the RepoIndex `reuse` callback.
+        """
+        rel = self._rel(directory)
+        tree = self.trees.get(rel)
+        entry = self.dirs.get(rel)
+        if tree and entry and rel not in self.dirty and entry.get('tree') == tree:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            if entry.get('mtime_ns') == mtime and self._untracked_unchanged(Path(directory), entry):
+                self.hits += 1
+                return {'files': entry['files'], 'subdirs': entry['subdirs']}
+        self.misses += 1
+        return None
+
+    @staticmethod
+    def _untracked_unchanged(directory: Path, entry: Dict) -> bool:
+        """Check that the directory's ignored files still have their cached size and mtime."""
+        untracked = set(entry.get('untracked', ()))
+        for name, size, mtime in entry['files']:
+            if name not in untracked:
+                continue
+            try:
+                st = os.stat(directory / name)
+            except OSError:
+                return False
+            if (st.st_size, st.st_mtime) != (size, mtime):
+                return False
+        return True
+
+    def save(self, snapshots: Dict[str, DirSnapshot]) -> None:
+        """Store the listings of all clean, committed directories.
+
+        Args:
+            snapshots: Listings from RepoIndex.snapshots()
+        """
+        tracked = git_tracked_files(self.repo_path) if self.commit else set()
+        dirs = {}
+        for rel, snapshot in snapshots.items():
+            tree = self.trees.get(rel)
+            if not tree or rel in self.dirty:
+                continue
+            try:
+                mtime = os.stat(self.repo_path / rel).st_mtime_ns
+            except OSError:
+                continue
+            prefix = f"{rel}/" if rel else ''
+            untracked = [name for name, _, _ in snapshot['files'] if prefix + name not in tracked]
+            dirs[rel] = {'tree': tree, 'mtime_ns': mtime, 'untracked': untracked, **snapshot}
+
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.cache_file.with_name(self.cache_file.name + '.tmp')
+        tmp.write_text(json.dumps({'version': CACHE_VERSION, 'commit': self.commit, 'dirs': dirs}))
+        os.replace(tmp, self.cache_file)
+        self.dirs = dirs
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+RRWrite Blob Store
+
+Content-addressed store for files imported into manuscript directories.
+
+Every unique file is stored once under its SHA-256 digest and linked into
+each manuscript version that uses it: a hardlink where possible, a reflink
+(copy-on-write clone) where hardlinks are not allowed, and a plain copy as
+the last resort. Blobs keep the permissions of the imported file: a
+hardlinked copy shares the blob's inode, so making blobs read-only would also
+lock the manuscript's own copies. Tools that rewrite a linked file should
+replace it (as link_file does) rather than edit it in place.
+
+By default the store sits next to the manuscript versions
+(manuscript/.rrwrite-blobs), so links stay on one filesystem.
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Linux ioctl for cloning a file's extents (btrfs, XFS, ...)
+FICLONE = 0x40049409
+
+BLOB_STORE_DIRNAME = ".rrwrite-blobs"
+
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's bytes."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _reflink(src: Path, dst: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        return True
+    except OSError:
+        dst.unlink(missing_ok=True)
+        return False
+
+
+def link_file(src: Path, dst: Path) -> str:
+    """Place src at dst without duplicating data when the filesystem allows it.
+
+    Args:
+        src: Existing file
+        dst: Destination path (replaced if present)
+
+    Returns:
+        Method used: 'hardlink', 'reflink' or 'copy'
+    """
+    dst = Path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    dst.unlink(missing_ok=True)
+    try:
+        os.link(src, dst)
+        return "hardlink"
+    except OSError:
+        pass
+    if _reflink(src, dst):
+        return "reflink"
+    shutil.copy2(src, dst)
+    return "copy"
+
+
+class BlobStore:
+    """Store each unique file once and link it wherever it is used."""
+
+    def __init__(self, root: Path):
+        """Initialize store.
+
+        Args:
+            root: Directory holding the blobs
+        """
+        self.root = Path(root)
+
+    @classmethod
+    def for_manuscript(cls, manuscript_dir: Path) -> "BlobStore":
+        """Store shared by all versions in a manuscript directory's parent."""
+        return cls(Path(manuscript_dir).parent / BLOB_STORE_DIRNAME)
+
+    def blob_path(self, digest: str) -> Path:
+        """Path of the blob with the given SHA-256 digest."""
+        return self.root / digest[:2] / digest[2:]
+
+    def put(self, path: Path, digest: Optional[str] = None) -> Tuple[str, bool]:
+        """Add a file to the store.
+
+        Args:
+            path: File to add
+            digest: Precomputed SHA-256 of the file
+
+        Returns:
+            (digest, added) where added is False if the blob was already stored
+        """
+        digest = digest or hash_file(path)
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return digest, False
+
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f"{blob.name}.tmp{os.getpid()}")
+        shutil.copy2(path, tmp)
+        os.replace(tmp, blob)
+        return digest, True
+
+    def contains(self, path: Path, digest: str) -> bool:
+        """Check whether a file already holds the blob's content."""
+        path = Path(path)
+        if not path.is_file():
+            return False
+        blob = self.blob_path(digest)
+        try:
+            if os.path.samefile(path, blob):
+                return True
+        except OSError:
+            return False
+        return path.stat().st_size == blob.stat().st_size and hash_file(path) == digest
+
+    def link(self, digest: str, dest: Path) -> str:
+        """Materialize a stored blob at dest.
+
+        Returns:
+            'existing' if dest already had the content, else the link method
+        """
+        if self.contains(dest, digest):
+            return "existing"
+        return link_file(self.blob_path(digest), dest)
@@ -11,23 +11,29 @@ Checks for:
 
 import re
 from pathlib import Path
-from typing import List, Dict, Set, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from collections import Counter, defaultdict
 
 
 class ConsistencyChecker:
     """Detects consistency issues in manuscript."""
 
-    def __init__(self, manuscript_dir: Path):
+    SECTION_ORDER = ["abstract", "introduction", "methods", "results", "discussion", "availability"]
+
+    def __init__(self, manuscript_dir: Path, section_texts: Optional[Dict[str, str]] = None):
         """
         Initialize checker.
 
         Args:
             manuscript_dir: Path to manuscript directory
+            section_texts: Optional section name → content already in memory
+                (e.g. held by a watch process); other sections are read from
+                sections/ once per checker
         """
         self.manuscript_dir = Path(manuscript_dir)
-        self.sections_dir = manuscript_dir / "sections"
+        self.sections_dir = self.manuscript_dir / "sections"
         self.issues = []
+        self._texts: Dict[str, Optional[str]] = dict(section_texts or {})
 
     def check_terminology(self) -> List[Dict[str, str]]:
         """Check for terminology inconsistencies."""
@@ -95,16 +101,13 @@ class ConsistencyChecker:
         issues = []
 
         # Load sections in order
-        section_order = ["abstract", "introduction", "methods", "results", "discussion", "availability"]
         figure_numbers = []
 
-        for section_name in section_order:
-            section_path = self.sections_dir / f"{section_name}.md"
-            if not section_path.exists():
+        for section_name in self.SECTION_ORDER:
+            content = self._section_text(section_name)
+            if content is None:
                 continue
 
-            content = section_path.read_text(encoding="utf-8")
-
             # Find all "Figure N" references
             matches = re.findall(r'Figure\s+(\d+)', content, re.IGNORECASE)
             for match in matches:
@@ -143,16 +146,13 @@ class ConsistencyChecker:
         """Check for table numbering issues."""
         issues = []
 
-        section_order = ["abstract", "introduction", "methods", "results", "discussion", "availability"]
         table_numbers = []
 
-        for section_name in section_order:
-            section_path = self.sections_dir / f"{section_name}.md"
-            if not section_path.exists():
+        for section_name in self.SECTION_ORDER:
+            content = self._section_text(section_name)
+            if content is None:
                 continue
 
-            content = section_path.read_text(encoding="utf-8")
-
             # Find all "Table N" references
             matches = re.findall(r'Table\s+(\d+)', content, re.IGNORECASE)
             for match in matches:
@@ -257,16 +257,22 @@ class ConsistencyChecker:
 
         output_path.write_text('\n'.join(md_lines), encoding='utf-8')
 
+    def _section_text(self, section_name: str) -> Optional[str]:
+        """Content of a section (None if missing), read at most once."""
+        if section_name not in self._texts:
+            section_path = self.sections_dir / f"{section_name}.md"
+            self._texts[section_name] = (
+                section_path.read_text(encoding="utf-8") if section_path.exists() else None
+            )
+        return self._texts[section_name]
+
     def _load_all_sections(self) -> str:
         """Load and concatenate all section content."""
         all_content = []
 
-        section_order = ["abstract", "introduction", "methods", "results", "discussion", "availability"]
-
-        for section_name in section_order:
-            section_path = self.sections_dir / f"{section_name}.md"
-            if section_path.exists():
-                content = section_path.read_text(encoding="utf-8")
+        for section_name in self.SECTION_ORDER:
+            content = self._section_text(section_name)
+            if content is not None:
                 all_content.append(content)
 
         return "\n\n".join(all_content)
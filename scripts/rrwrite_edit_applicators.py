@@ -12,13 +12,19 @@ This module contains applicators for:
 import re
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
-from difflib import SequenceMatcher
 import sys
 
 SCRIPTS_DIR = Path(__file__).parent
 sys.path.insert(0, str(SCRIPTS_DIR))
 
 from rrwrite_edit_recommendation import EditRecommendation
+from rrwrite_fuzzy_match import best_match
+
+
+def find_paragraph(paragraphs: List[str], text: str, threshold: float) -> int:
+    """Index of the paragraph most similar to `text` (case-insensitive), or -1."""
+    idx, _ = best_match(text, paragraphs, threshold)
+    return -1 if idx is None else idx
 
 
 class SectionEditApplicator:
@@ -101,14 +107,7 @@ class SectionEditApplicator:
             if match_text:
                 # Find matching paragraph
                 paragraphs = content.split('\n\n')
-                best_match_idx = -1
-                best_score = 0.0
-
-                for i, para in enumerate(paragraphs):
-                    score = SequenceMatcher(None, match_text.lower(), para.lower()).ratio()
-                    if score > best_score and score >= 0.7:
-                        best_score = score
-                        best_match_idx = i
+                best_match_idx = find_paragraph(paragraphs, match_text, 0.7)
 
                 if best_match_idx >= 0:
                     # Remove paragraph
@@ -135,14 +134,7 @@ class SectionEditApplicator:
             if match_text:
                 # Find and replace
                 paragraphs = content.split('\n\n')
-                best_match_idx = -1
-                best_score = 0.0
-
-                for i, para in enumerate(paragraphs):
-                    score = SequenceMatcher(None, match_text.lower(), para.lower()).ratio()
-                    if score > best_score and score >= 0.7:
-                        best_score = score
-                        best_match_idx = i
+                best_match_idx = find_paragraph(paragraphs, match_text, 0.7)
 
                 if best_match_idx >= 0:
                     paragraphs[best_match_idx] = rec.replacement_text
@@ -241,19 +233,11 @@ class CrossSectionApplicator:
 
         # Find content in source
         paragraphs = source_content.split('\n\n')
-        best_match_idx = -1
-        best_score = 0.0
-        moved_content = ""
-
-        for i, para in enumerate(paragraphs):
-            score = SequenceMatcher(None, content_identifier.lower(), para.lower()).ratio()
-            if score > best_score and score >= 0.6:
-                best_score = score
-                best_match_idx = i
-                moved_content = para
+        best_match_idx = find_paragraph(paragraphs, content_identifier, 0.6)
 
         if best_match_idx < 0:
             return False, "Could not locate content to move"
+        moved_content = paragraphs[best_match_idx]
 
         # Remove from source
         paragraphs.pop(best_match_idx)
@@ -8,11 +8,23 @@ This module provides tools for:
 3. Selecting appropriate figures for each section
 """
 
+import importlib.util
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import pandas as pd
 
+try:
+    from rrwrite_render_pool import RenderPool, RenderTask
+    from rrwrite_render_cache import render_key, render_with_cache
+    from rrwrite_table_reader import load_table
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_render_pool import RenderPool, RenderTask
+    from rrwrite_render_cache import render_key, render_with_cache
+    from rrwrite_table_reader import load_table
+
 
 class FigureGenerator:
     """Generate figures from repository analysis data."""
@@ -24,11 +36,41 @@ class FigureGenerator:
         'preview': 'png'     # Lower DPI for quick previews (150 DPI)
     }
 
+    # Publication style applied by _setup_style (part of the render cache key)
+    STYLE = {
+        'context': 'paper',
+        'style': 'whitegrid',
+        'rcParams': {
+            'figure.dpi': 300,
+            'savefig.dpi': 300,
+            'font.size': 10,
+            'axes.labelsize': 10,
+            'axes.titlesize': 11,
+            'legend.fontsize': 9,
+        },
+    }
+
+    @staticmethod
+    def _setup_style() -> None:
+        """Import matplotlib/seaborn and set publication-quality defaults.
+
+        Runs once per render worker.
+        """
+        import matplotlib
+        matplotlib.use('Agg')  # Non-interactive backend
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+
+        sns.set_context(FigureGenerator.STYLE['context'])
+        sns.set_style(FigureGenerator.STYLE['style'])
+        plt.rcParams.update(FigureGenerator.STYLE['rcParams'])
+
     @staticmethod
     def generate_repo_figures(
         data_tables_dir: Path,
         output_dir: Path,
-        formats: List[str] = ['png', 'pdf']
+        formats: List[str] = ['png', 'pdf'],
+        workers: Optional[int] = None
     ) -> Dict[str, List[Path]]:
         """
         Generate all standard repository analysis figures.
@@ -39,10 +81,16 @@ class FigureGenerator:
         3. code_complexity_metrics.png/pdf - Scatter plot of code metrics
         4. research_topics_radar.png/pdf - Radar chart of detected research areas
 
+        Figures are rendered in parallel by a RenderPool; each figure is drawn
+        once and saved in every requested format. Figures whose input table,
+        style and plotting code are unchanged are linked from the render cache
+        instead of being redrawn (see rrwrite_render_cache).
+
         Args:
             data_tables_dir: Directory containing TSV data tables
             output_dir: Directory to save generated figures
             formats: List of output formats ('png', 'pdf', 'svg')
+            workers: Render processes (default: one per core, 1 = in-process)
 
         Returns:
             Dict mapping figure names to lists of output paths
@@ -53,47 +101,42 @@ class FigureGenerator:
 
         figure_paths = {}
 
-        try:
-            import matplotlib
-            matplotlib.use('Agg')  # Non-interactive backend
-            import matplotlib.pyplot as plt
-            import seaborn as sns
-
-            # Set publication-quality defaults
-            sns.set_context("paper")
-            sns.set_style("whitegrid")
-            plt.rcParams['figure.dpi'] = 300
-            plt.rcParams['savefig.dpi'] = 300
-            plt.rcParams['font.size'] = 10
-            plt.rcParams['axes.labelsize'] = 10
-            plt.rcParams['axes.titlesize'] = 11
-            plt.rcParams['legend.fontsize'] = 9
-
-        except ImportError:
+        # Plotting libraries are imported by the render workers; only check here
+        if not all(importlib.util.find_spec(name) for name in ('matplotlib', 'seaborn')):
             print("Warning: matplotlib/seaborn not installed. Skipping figure generation.")
             print("Install with: pip install matplotlib seaborn")
             return figure_paths
 
-        # Figure 1: Repository Composition
-        composition_paths = FigureGenerator._generate_composition_figure(
-            data_tables_dir, output_dir, formats
-        )
-        if composition_paths:
-            figure_paths['repository_composition'] = composition_paths
-
-        # Figure 2: File Size Distribution
-        size_dist_paths = FigureGenerator._generate_size_distribution_figure(
-            data_tables_dir, output_dir, formats
-        )
-        if size_dist_paths:
-            figure_paths['file_size_distribution'] = size_dist_paths
-
-        # Figure 3: Research Topics
-        topics_paths = FigureGenerator._generate_research_topics_figure(
-            data_tables_dir, output_dir, formats
-        )
-        if topics_paths:
-            figure_paths['research_topics'] = topics_paths
+        args = (data_tables_dir, output_dir, formats)
+        figures = [
+            # Figure 1: Repository Composition
+            ('repository_composition', FigureGenerator._generate_composition_figure,
+             'repository_statistics.tsv'),
+            # Figure 2: File Size Distribution
+            ('file_size_distribution', FigureGenerator._generate_size_distribution_figure,
+             'file_inventory.tsv'),
+            # Figure 3: Research Topics
+            ('research_topics', FigureGenerator._generate_research_topics_figure,
+             'research_indicators.tsv'),
+        ]
+
+        tasks, keys, outputs = [], [], []
+        for name, func, table in figures:
+            tasks.append(RenderTask(name, func, args))
+            keys.append(render_key(
+                [data_tables_dir / table],
+                {'figure': name, 'formats': list(formats)},
+                FigureGenerator.STYLE,
+                code=[Path(__file__)]
+            ))
+            outputs.append([output_dir / f"{name}.{fmt}" for fmt in formats])
+
+        pool = RenderPool(setup=FigureGenerator._setup_style, workers=workers)
+        for result in render_with_cache(pool, tasks, keys, outputs):
+            if result.error:
+                print(f"Warning: Failed to generate {result.name}: {result.error}")
+            elif result.value:
+                figure_paths[result.name] = result.value
 
         return figure_paths
 
@@ -112,7 +155,7 @@ class FigureGenerator:
             return []
 
         # Load data
-        df = pd.read_csv(stats_file, sep='\t', comment='#')
+        df, _ = load_table(stats_file)
 
         if df.empty or 'category' not in df.columns:
             return []
@@ -163,7 +206,7 @@ class FigureGenerator:
             return []
 
         # Load data
-        df = pd.read_csv(inventory_file, sep='\t', comment='#')
+        df, _ = load_table(inventory_file, columns=['size_bytes', 'type'])
 
         if df.empty or 'size_bytes' not in df.columns:
             return []
@@ -219,7 +262,7 @@ class FigureGenerator:
             return []
 
         # Load data
-        df = pd.read_csv(topics_file, sep='\t', comment='#')
+        df, _ = load_table(topics_file)
 
         if df.empty or 'topic' not in df.columns:
             return []
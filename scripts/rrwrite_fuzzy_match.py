@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+RRWrite Fuzzy Match
+
+Bounded-cost best-match search for SequenceMatcher similarity.
+
+Edit application, citation link matching and issue tracking all pick the
+candidate (paragraph, citation, issue) with the highest
+SequenceMatcher(None, query, candidate).ratio() above a threshold. Computing
+the full ratio against every candidate is quadratic in the text length and
+dominates on long manuscripts, so FuzzyIndex avoids it where it cannot
+change the answer:
+
+- Anchor: a candidate identical to the query scores 1.0 and is returned
+  from a hash lookup.
+- Order: candidates are tried in decreasing number of character n-grams
+  shared with the query (from an inverted n-gram index), so a good match is
+  usually found first and raises the bar for the rest.
+- Bounds: before the full ratio, each candidate is checked against cheap
+  upper bounds (real_quick_ratio: lengths; quick_ratio: character counts;
+  and the rapidfuzz Indel ratio when rapidfuzz is installed, since the
+  longest common subsequence is never shorter than SequenceMatcher's
+  matching blocks). Candidates that cannot beat the current best or reach
+  the threshold are skipped.
+
+The index only changes the order of the work, so results are identical to a
+linear scan: the highest score wins, ties go to the earliest candidate, and
+a score must be above 0 and at least the threshold.
+"""
+
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import Callable, Collection, Dict, List, Optional, Sequence, Tuple
+
+# Optional rapidfuzz import for a tighter upper bound
+try:
+    from rapidfuzz.fuzz import ratio as _indel_ratio
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
+NGRAM_SIZE = 3
+
+# rapidfuzz scores are percentages; allow for rounding when used as a bound
+_BOUND_SLACK = 1e-9
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> set:
+    """Set of character n-grams (the whole text if shorter than n)."""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _ratio(matches: int, total: int) -> float:
+    # Same arithmetic as difflib, so bounds compare exactly with ratio()
+    return 2.0 * matches / total if total else 1.0
+
+
+class FuzzyIndex:
+    """Candidates indexed for repeated best-match queries."""
+
+    def __init__(
+        self,
+        candidates: Sequence[str],
+        normalize: Callable[[str], str] = str.lower,
+        n: int = NGRAM_SIZE
+    ):
+        """Initialize index.
+
+        Args:
+            candidates: Candidate texts; matches are reported by position
+            normalize: Applied to candidates and queries before comparison
+            n: Character n-gram size used to order candidates
+        """
+        self.normalize = normalize
+        self.n = n
+        self.texts = [normalize(c) for c in candidates]
+        self._counts: List[Optional[Counter]] = [None] * len(self.texts)
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+        for i, text in enumerate(self.texts):
+            self._exact.setdefault(text, i)
+            for gram in ngrams(text, n):
+                self._postings[gram].append(i)
+        self.comparisons = 0      # Full ratios computed (for diagnostics)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def _char_counts(self, i: int) -> Counter:
+        counts = self._counts[i]
+        if counts is None:
+            counts = self._counts[i] = Counter(self.texts[i])
+        return counts
+
+    def _ranked(self, query: str) -> List[int]:
+        """Candidate positions, most shared n-grams first."""
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in ngrams(query, self.n):
+            for i in self._postings.get(gram, ()):
+                shared[i] += 1
+        return sorted(range(len(self.texts)), key=lambda i: (-shared.get(i, 0), i))
+
+    def best_match(
+        self,
+        query: str,
+        threshold: float = 0.0,
+        exclude: Collection[int] = (),
+        weight: Optional[Callable[[int], float]] = None
+    ) -> Tuple[Optional[int], float]:
+        """Find the best-scoring candidate.
+
+        Args:
+            query: Text to match
+            threshold: Minimum score
+            exclude: Candidate positions to skip
+            weight: Multiplier applied to candidate i's ratio (e.g. a boost
+                for issues in the same section)
+
+        Returns:
+            (candidate position, score), or (None, 0.0) if no candidate
+            scores above 0 and at least `threshold`
+        """
+        query = self.normalize(query)
+
+        if weight is None:
+            i = self._exact.get(query)
+            if i is not None and i not in exclude and 1.0 >= threshold:
+                return i, 1.0
+
+        best_i: Optional[int] = None
+        best = 0.0
+
+        def can_win(score: float, i: int) -> bool:
+            if score <= 0.0 or score < threshold:
+                return False
+            return best_i is None or score > best or (score == best and i < best_i)
+
+        query_len = len(query)
+        query_counts = None
+        for i in self._ranked(query):
+            if i in exclude:
+                continue
+            w = weight(i) if weight else 1.0
+            text = self.texts[i]
+            total = query_len + len(text)
+
+            # real_quick_ratio: at most the shorter string can match
+            if not can_win(_ratio(min(query_len, len(text)), total) * w, i):
+                continue
+
+            # quick_ratio: at most the shared characters can match
+            if query_counts is None:
+                query_counts = Counter(query)
+            counts = self._char_counts(i)
+            shared = sum(min(c, counts[ch]) for ch, c in query_counts.items())
+            if not can_win(_ratio(shared, total) * w, i):
+                continue
+
+            # Indel ratio (longest common subsequence) bounds the block matches
+            if RAPIDFUZZ_AVAILABLE and total:
+                if not can_win((_indel_ratio(query, text) / 100.0 + _BOUND_SLACK) * w, i):
+                    continue
+
+            self.comparisons += 1
+            score = SequenceMatcher(None, query, text).ratio() * w
+            if can_win(score, i):
+                best_i, best = i, score
+
+        return best_i, best if best_i is not None else 0.0
+
+
+def best_match(
+    query: str,
+    candidates: Sequence[str],
+    threshold: float = 0.0,
+    normalize: Callable[[str], str] = str.lower
+) -> Tuple[Optional[int], float]:
+    """One-off best match of a query against candidates (see FuzzyIndex)."""
+    return FuzzyIndex(candidates, normalize).best_match(query, threshold)
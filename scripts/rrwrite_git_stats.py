@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+RRWrite Git Statistics
+
+Git-native repository statistics shared by the inventory tables, evidence
+extraction and claim verification.
+
+Instead of one subprocess per claim and one stat per file, the engine uses:
+- `git ls-files -s -z` once for the tracked file list and blob hashes (the
+  index, as `git ls-files`: staged files are tracked, and a repository
+  without commits still lists them)
+- one `git log --all --numstat` stream for commit and contributor metrics
+
+Results are computed on first use and cached; get_git_stats() returns a
+shared instance per repository so every consumer in a process reads the same
+data.
+"""
+
+import re
+import subprocess
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+# Separator between commits in the `git log` stream
+_COMMIT_MARK = "\x1ecommit\x1f"
+
+
+@dataclass
+class TreeEntry:
+    """A tracked file in the index."""
+    path: str
+    mode: str
+    blob: str
+
+
+@dataclass
+class HistoryStats:
+    """Commit and contributor metrics from one `git log --numstat` pass."""
+    commits: int = 0
+    contributors: Set[str] = field(default_factory=set)
+    commits_by_author: Counter = field(default_factory=Counter)
+    lines_added: int = 0
+    lines_deleted: int = 0
+    first_commit: Optional[str] = None
+    last_commit: Optional[str] = None
+
+
+def glob_to_regex(pattern: str) -> 're.Pattern':
+    """Compile a Path.glob-style pattern ('**' matches any number of directories)."""
+    segments = pattern.split('/')
+    regex = ''
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == '**':
+            regex += '.*' if last else '(?:[^/]+/)*'
+            continue
+        regex += ''.join(
+            '[^/]*' if c == '*' else '[^/]' if c == '?' else re.escape(c) for c in segment
+        )
+        if not last:
+            regex += '/'
+    return re.compile(regex + r'\Z')
+
+
+class GitStats:
+    """Repository statistics read directly from git objects."""
+
+    def __init__(self, repo_path: Path):
+        """Initialize engine (nothing is run until a statistic is requested).
+
+        Args:
+            repo_path: Path inside a git repository
+        """
+        self.repo_path = Path(repo_path)
+        self._lock = threading.Lock()
+        self._tree: Optional[Dict[str, TreeEntry]] = None
+        self._history: Optional[HistoryStats] = None
+        self._head: Optional[str] = None
+        self._remote: Optional[str] = None
+
+    def _git(self, *args, timeout: int = 300) -> Optional[str]:
+        try:
+            result = subprocess.run(
+                ['git', '-C', str(self.repo_path), *args],
+                capture_output=True, text=True, timeout=timeout
+            )
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    # Metadata
+
+    def head(self, short: bool = True) -> Optional[str]:
+        """Commit hash of HEAD (None outside a git repository)."""
+        if self._head is None:
+            out = self._git('rev-parse', 'HEAD')
+            self._head = out.strip() if out else ''
+        if not self._head:
+            return None
+        return self._head[:7] if short else self._head
+
+    def remote_url(self) -> Optional[str]:
+        """URL of the 'origin' remote, if configured."""
+        if self._remote is None:
+            out = self._git('config', '--get', 'remote.origin.url')
+            self._remote = out.strip() if out else ''
+        return self._remote or None
+
+    # Tracked files (git ls-files)
+
+    def tree(self) -> Dict[str, TreeEntry]:
+        """All tracked files (the index, as `git ls-files`) with blob hashes."""
+        with self._lock:
+            if self._tree is None:
+                self._tree = {}
+                out = self._git('ls-files', '-s', '-z') or ''
+                for record in out.split('\0'):
+                    if not record:
+                        continue
+                    meta, path = record.split('\t', 1)
+                    mode, blob, _stage = meta.split()
+                    if mode == '160000':
+                        continue   # Submodules
+                    # Conflicted paths have several stages; list them once
+                    self._tree.setdefault(path, TreeEntry(path, mode, blob))
+            return self._tree
+
+    def tracked_files(self) -> Set[str]:
+        """Relative paths of all tracked files."""
+        return set(self.tree())
+
+    def count_files(self, pattern: str) -> int:
+        """Number of tracked files matching a Path.glob-style pattern."""
+        regex = glob_to_regex(pattern)
+        return sum(1 for path in self.tree() if regex.match(path))
+
+    # History (git log --numstat)
+
+    def history(self) -> HistoryStats:
+        """Commit and contributor metrics across all refs."""
+        with self._lock:
+            if self._history is not None:
+                return self._history
+            stats = HistoryStats()
+            self._history = stats
+            try:
+                proc = subprocess.Popen(
+                    ['git', '-C', str(self.repo_path), 'log', '--all', '--numstat',
+                     f'--format={_COMMIT_MARK}%H%x1f%ae%x1f%aI'],
+                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    text=True, errors='replace'
+                )
+            except FileNotFoundError:
+                return stats
+
+            for line in proc.stdout:
+                if line.startswith(_COMMIT_MARK):
+                    _, email, date = line[len(_COMMIT_MARK):].rstrip('\n').split('\x1f')
+                    stats.commits += 1
+                    stats.contributors.add(email)
+                    stats.commits_by_author[email] += 1
+                    date = date[:10]
+                    if stats.first_commit is None or date < stats.first_commit:
+                        stats.first_commit = date
+                    if stats.last_commit is None or date > stats.last_commit:
+                        stats.last_commit = date
+                elif line.strip():
+                    added, deleted, _ = line.split('\t', 2)
+                    if added.isdigit():
+                        stats.lines_added += int(added)
+                    if deleted.isdigit():
+                        stats.lines_deleted += int(deleted)
+            proc.wait()
+            return stats
+
+
+_shared_stats: Dict[str, GitStats] = {}
+_shared_lock = threading.Lock()
+
+
+def get_git_stats(repo_path: Path) -> GitStats:
+    """Return the process-wide GitStats for a repository."""
+    key = str(Path(repo_path).resolve())
+    with _shared_lock:
+        if key not in _shared_stats:
+            _shared_stats[key] = GitStats(Path(key))
+        return _shared_stats[key]
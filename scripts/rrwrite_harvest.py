@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+RRWrite Harvest
+
+Resumable NDJSON harvesting for cursor-paginated literature APIs
+(OpenAlex `cursor`, Europe PMC `cursorMark`).
+
+Each page is written to the output as soon as it arrives, one JSON record per
+line. After every page the next cursor and the output byte offset are saved
+to a small state file, so an interrupted harvest resumes from the last
+complete page instead of page 1 (a partially written page is truncated away).
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+START_CURSOR = "*"
+
+# A page iterator takes a start cursor and yields (papers, next_cursor)
+PageIterator = Callable[[str], Iterator[Tuple[List[Dict], Optional[str]]]]
+
+
+def default_state_file(output: Path) -> Path:
+    """State file path used for an output file (output + '.cursor.json')."""
+    return output.with_name(output.name + ".cursor.json")
+
+
+def _load_state(state_file: Optional[Path], source: str, query: str) -> Optional[Dict]:
+    if not state_file or not state_file.exists():
+        return None
+    try:
+        state = json.loads(state_file.read_text())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if state.get("source") != source or state.get("query") != query:
+        print(f"Warning: {state_file} belongs to a different harvest, starting over", file=sys.stderr)
+        return None
+    return state
+
+
+def _save_state(state_file: Path, state: Dict) -> None:
+    tmp = state_file.with_name(state_file.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    os.replace(tmp, state_file)
+
+
+def harvest_ndjson(
+    iter_pages: PageIterator,
+    source: str,
+    query: str,
+    max_results: int,
+    output: Optional[Path] = None,
+    state_file: Optional[Path] = None
+) -> int:
+    """
+    Stream records from a cursor-paginated API to NDJSON.
+
+    Args:
+        iter_pages: Page iterator of the client (see PageIterator)
+        source: Source name stored in the state file (e.g., 'openalex')
+        query: Query string stored in the state file
+        max_results: Stop after this many records in total
+        output: NDJSON output file (default: stdout, not resumable)
+        state_file: Cursor state file (default: output + '.cursor.json')
+
+    Returns:
+        Total number of records harvested (including resumed ones)
+    """
+    if output is not None and state_file is None:
+        state_file = default_state_file(output)
+
+    state = _load_state(state_file, source, query) if output is not None else None
+    cursor = START_CURSOR
+    harvested = 0
+
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        if state and output.exists():
+            cursor = state["cursor"]
+            harvested = state["harvested"]
+            # Drop anything written after the last saved page
+            with open(output, "r+b") as f:
+                f.truncate(state["offset"])
+            print(f"Resuming {source} harvest at {harvested} records", file=sys.stderr)
+            out = open(output, "ab")
+        else:
+            out = open(output, "wb")
+    else:
+        out = sys.stdout.buffer
+
+    try:
+        for papers, next_cursor in iter_pages(cursor):
+            for paper in papers[:max(0, max_results - harvested)]:
+                out.write(json.dumps(paper).encode("utf-8") + b"\n")
+                harvested += 1
+            out.flush()
+
+            done = harvested >= max_results or not next_cursor
+            if state_file is not None and output is not None:
+                if done:
+                    state_file.unlink(missing_ok=True)
+                else:
+                    _save_state(state_file, {
+                        "source": source,
+                        "query": query,
+                        "cursor": next_cursor,
+                        "harvested": harvested,
+                        "offset": out.tell()
+                    })
+
+            print(f"  {source}: {harvested} records", file=sys.stderr)
+            if done:
+                break
+    finally:
+        if output is not None:
+            out.close()
+
+    return harvested
@@ -4,8 +4,19 @@ HolisticEditOrchestrator - Coordinates holistic application of edit recommendati
 
 This module provides the main orchestration for applying edit recommendations
 cohesively across the manuscript with dependency analysis and conflict detection.
+
+Planning is linear in the number of edits and dependencies (plus the number
+of conflicts reported), so large consolidated feedback sets plan instantly:
+- Dependencies are sorted with Kahn's algorithm over a reverse adjacency map,
+  taking ready edits from a heap keyed on calculate_priority_score().
+- Conflicts are found within buckets of edits that share a section and edit
+  type, instead of comparing all pairs.
+- A plan is split into waves of independent edits. Within a wave, each lane
+  (the section, or the files an edit touches) can be applied by its own worker;
+  edits in a lane keep plan order.
 """
 
+import heapq
 import json
 from pathlib import Path
 from typing import List, Dict, Optional, Set, Tuple, Any
@@ -31,57 +42,62 @@ class DependencyGraph:
         """
         self.recommendations = {rec.id: rec for rec in recommendations}
         self.graph = self._build_graph()
+        self.dependents = self._build_dependents()
 
     def _build_graph(self) -> Dict[str, Set[str]]:
-        """Build dependency graph."""
+        """Build dependency graph (edit ID → IDs it depends on)."""
         graph = defaultdict(set)
 
         for rec_id, rec in self.recommendations.items():
             for dep_id in rec.dependencies:
-                graph[rec_id].add(dep_id)
+                # Dependencies outside the set (e.g. filtered out) are ignored
+                if dep_id in self.recommendations:
+                    graph[rec_id].add(dep_id)
 
         return graph
 
+    def _build_dependents(self) -> Dict[str, List[str]]:
+        """Reverse adjacency: edit ID → IDs that depend on it."""
+        dependents = defaultdict(list)
+        for rec_id in self.recommendations:
+            for dep_id in self.graph.get(rec_id, ()):
+                dependents[dep_id].append(rec_id)
+        return dependents
+
     def topological_sort(self) -> List[str]:
         """
         Perform topological sort to determine application order.
 
+        Dependencies come before the edits that depend on them; among edits
+        that are ready, higher priority scores go first (ties keep input order).
+
         Returns:
             List of recommendation IDs in dependency order
 
         Raises:
             ValueError: If circular dependencies detected
         """
-        # Kahn's algorithm
-        in_degree = defaultdict(int)
-
-        # Calculate in-degrees
-        for rec_id in self.recommendations:
-            if rec_id not in in_degree:
-                in_degree[rec_id] = 0
-            for dep_id in self.graph[rec_id]:
-                in_degree[dep_id] += 1
+        # Kahn's algorithm: in-degree = number of unapplied dependencies
+        in_degree = {rec_id: len(self.graph.get(rec_id, ())) for rec_id in self.recommendations}
+        keys = {
+            rec_id: (-rec.calculate_priority_score(), position)
+            for position, (rec_id, rec) in enumerate(self.recommendations.items())
+        }
 
-        # Queue of nodes with no dependencies
-        queue = [rec_id for rec_id in self.recommendations if in_degree[rec_id] == 0]
+        # Heap of edits with no pending dependencies
+        heap = [(keys[rec_id], rec_id) for rec_id, degree in in_degree.items() if degree == 0]
+        heapq.heapify(heap)
         result = []
 
-        while queue:
-            # Sort by priority score for deterministic ordering
-            queue.sort(
-                key=lambda x: self.recommendations[x].calculate_priority_score(),
-                reverse=True
-            )
-
-            rec_id = queue.pop(0)
+        while heap:
+            _, rec_id = heapq.heappop(heap)
             result.append(rec_id)
 
             # Reduce in-degree for dependent nodes
-            for other_id, deps in self.graph.items():
-                if rec_id in deps:
-                    in_degree[other_id] -= 1
-                    if in_degree[other_id] == 0:
-                        queue.append(other_id)
+            for other_id in self.dependents.get(rec_id, ()):
+                in_degree[other_id] -= 1
+                if in_degree[other_id] == 0:
+                    heapq.heappush(heap, (keys[other_id], other_id))
 
         if len(result) != len(self.recommendations):
             raise ValueError("Circular dependency detected")
@@ -92,20 +108,39 @@ class DependencyGraph:
         """
         Detect potential conflicts between edits.
 
+        Only edits that can conflict are compared: explicitly marked pairs,
+        and edits bucketed by section and edit type.
+
         Returns:
-            List of (edit_id1, edit_id2, reason) tuples
+            List of (edit_id1, edit_id2, reason) tuples, in input order
         """
-        conflicts = []
-
-        recs_list = list(self.recommendations.values())
+        ids = list(self.recommendations)
+        position = {rec_id: i for i, rec_id in enumerate(ids)}
+        found: Dict[Tuple[int, int], str] = {}
 
-        for i, rec1 in enumerate(recs_list):
-            for rec2 in recs_list[i+1:]:
-                conflict_reason = self._check_conflict(rec1, rec2)
-                if conflict_reason:
-                    conflicts.append((rec1.id, rec2.id, conflict_reason))
-
-        return conflicts
+        # Same section, incompatible edit types
+        buckets = defaultdict(list)
+        for i, rec in enumerate(self.recommendations.values()):
+            buckets[(rec.section, rec.edit_type)].append(i)
+        for (section, edit_type), indices in buckets.items():
+            if edit_type == "remove_content":
+                for i in indices:
+                    for j in buckets.get((section, "add_content"), ()):
+                        if i < j:
+                            found[(i, j)] = "Conflicting add/remove operations in same section"
+            elif edit_type == "restructure":
+                for a, i in enumerate(indices):
+                    for j in indices[a + 1:]:
+                        found[(i, j)] = "Multiple restructure operations in same section"
+
+        # Explicit conflicts (take precedence)
+        for i, rec in enumerate(self.recommendations.values()):
+            for other_id in rec.conflicts_with:
+                j = position.get(other_id)
+                if j is not None and j != i:
+                    found[(min(i, j), max(i, j))] = "Explicitly marked as conflicting"
+
+        return [(ids[i], ids[j], found[(i, j)]) for i, j in sorted(found)]
 
     def _check_conflict(
         self,
@@ -128,6 +163,18 @@ class DependencyGraph:
         return None
 
 
+def edit_resources(rec: EditRecommendation) -> Tuple[str, ...]:
+    """Files (by section or manifest name) an edit modifies."""
+    resources = [rec.section]
+    if rec.edit_type == "move_content":
+        resources.extend(rec.target_sections[:1])
+    elif rec.edit_type == "figure_update":
+        resources.append("figures_manifest")
+    elif rec.edit_type == "table_update":
+        resources.append("tables_manifest")
+    return tuple(dict.fromkeys(resources))
+
+
 class ApplicationPlan:
     """Represents a plan for applying edits."""
 
@@ -170,6 +217,50 @@ class ApplicationPlan:
 
         return ApplicationPlan(filtered, self.conflicts, self.recommendations)
 
+    def waves(self) -> List[Dict[str, List[str]]]:
+        """
+        Group the plan into waves of edits that can be applied concurrently.
+
+        An edit goes in the first wave after all of its dependencies. Edits that
+        modify the same file share a lane and keep plan order, so applying
+        each wave's lanes in parallel has the same effect on every file as
+        applying the plan sequentially. Edits that modify several files (e.g.
+        move_content) are placed after every earlier edit on those files.
+
+        Returns:
+            Waves in order; each maps a lane (section, or sections joined
+            with '+') to its edit IDs in plan order
+        """
+        wave_of: Dict[str, int] = {}
+        # Resource → (wave of its last edit, whether that edit had it alone)
+        last: Dict[str, Tuple[int, bool]] = {}
+        waves: List[Dict[str, List[str]]] = []
+
+        for edit_id in self.sorted_edits:
+            rec = self.recommendations[edit_id]
+            resources = edit_resources(rec)
+            shared = len(resources) > 1
+
+            wave = 0
+            for dep_id in rec.dependencies:
+                if dep_id in wave_of:
+                    wave = max(wave, wave_of[dep_id] + 1)
+            for resource in resources:
+                if resource in last:
+                    prev_wave, prev_alone = last[resource]
+                    # Sequential in the same lane, otherwise strictly after
+                    wave = max(wave, prev_wave if prev_alone and not shared else prev_wave + 1)
+
+            wave_of[edit_id] = wave
+            for resource in resources:
+                last[resource] = (wave, not shared)
+
+            while len(waves) <= wave:
+                waves.append({})
+            waves[wave].setdefault("+".join(resources), []).append(edit_id)
+
+        return waves
+
     def resolve_conflicts(self, resolution_strategy: str = "priority") -> 'ApplicationPlan':
         """
         Resolve conflicts by removing lower-priority edits.
@@ -184,9 +275,8 @@ class ApplicationPlan:
             # For manual, just return as-is
             return self
 
-        conflicting_pairs = set()
-        for id1, id2, _ in self.conflicts:
-            conflicting_pairs.add((id1, id2))
+        # Ordered and de-duplicated, so resolution does not depend on hashing
+        conflicting_pairs = dict.fromkeys((id1, id2) for id1, id2, _ in self.conflicts)
 
         # Remove lower-priority edit from each conflict
         removed = set()
@@ -0,0 +1,495 @@
+#!/usr/bin/env python3
+"""
+RRWrite HTTP Cache
+
+Persistent, process-shared HTTP response cache for the literature API clients
+(PubMed, OpenAlex, Europe PMC, Semantic Scholar, CrossRef, doi.org).
+
+Responses are stored in a single SQLite database so every script, and every
+subprocess started from the gap-analysis shell pipelines, reads and writes the
+same cache. Entries expire per endpoint (see ENDPOINT_TTLS) and the database
+is kept under a size cap by evicting the least recently used entries.
+
+Requests that miss the cache go through the shared per-host token bucket
+(rrwrite_rate_limiter.py) and are retried with jittered exponential backoff
+on 429/5xx, honouring Retry-After.
+
+Cache location: $RRWRITE_CACHE_DIR/http_cache.sqlite (default: ~/.cache/rrwrite)
+Disable with RRWRITE_HTTP_CACHE=0 (rate limiting stays active).
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:
+    from rrwrite_rate_limiter import (
+        MAX_RETRIES, RETRY_STATUS, backoff_delay, get_limiter, host_of, parse_retry_after
+    )
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_rate_limiter import (
+        MAX_RETRIES, RETRY_STATUS, backoff_delay, get_limiter, host_of, parse_retry_after
+    )
+
+CACHE_DIR_ENV = "RRWRITE_CACHE_DIR"
+CACHE_ENABLED_ENV = "RRWRITE_HTTP_CACHE"
+CACHE_MAX_MB_ENV = "RRWRITE_HTTP_CACHE_MAX_MB"
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "rrwrite"
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+DEFAULT_TTL = 86400  # 24 hours
+
+DAY = 86400
+
+# (URL pattern, TTL in seconds) - first match wins.
+# Search endpoints change as new papers are indexed; record lookups are stable.
+ENDPOINT_TTLS: List[Tuple[str, int]] = [
+    # History-server sessions (WebEnv) expire on NCBI's side after a few hours
+    (r"eutils\.ncbi\.nlm\.nih\.gov/.*(usehistory=y|WebEnv=)", 3600),
+    (r"eutils\.ncbi\.nlm\.nih\.gov/.*/esearch\.fcgi", DAY),
+    (r"eutils\.ncbi\.nlm\.nih\.gov/.*/(esummary|efetch)\.fcgi", 30 * DAY),
+    (r"api\.openalex\.org/works/", 30 * DAY),
+    (r"api\.openalex\.org/", DAY),
+    (r"ebi\.ac\.uk/europepmc/webservices/rest/search", DAY),
+    (r"api\.semanticscholar\.org/graph/v1/paper/search", DAY),
+    (r"api\.semanticscholar\.org/", 7 * DAY),
+    (r"api\.crossref\.org/works/10\.", 30 * DAY),
+    (r"api\.crossref\.org/works", 7 * DAY),
+    (r"doi\.org/", 30 * DAY),
+]
+
+# Only cache responses that are stable answers to the request
+CACHEABLE_STATUS = {200, 404}
+CACHEABLE_METHODS = {"GET", "HEAD", "POST"}
+
+_COMPILED_TTLS = [(re.compile(pattern), ttl) for pattern, ttl in ENDPOINT_TTLS]
+
+
+def ttl_for_url(url: str) -> int:
+    """Return the cache TTL in seconds for a URL.
+
+    Args:
+        url: Full request URL
+
+    Returns:
+        TTL in seconds (DEFAULT_TTL when no endpoint rule matches)
+    """
+    for pattern, ttl in _COMPILED_TTLS:
+        if pattern.search(url):
+            return ttl
+    return DEFAULT_TTL
+
+
+def cache_enabled() -> bool:
+    """Check whether the HTTP cache is enabled via environment."""
+    return os.environ.get(CACHE_ENABLED_ENV, "1").lower() not in ("0", "false", "no", "off")
+
+
+def default_cache_dir() -> Path:
+    """Cache directory from $RRWRITE_CACHE_DIR or the per-user default."""
+    return Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+
+
+def configure_cache_dir(cache_dir: Path) -> None:
+    """Point this process and its subprocesses at a cache directory.
+
+    Args:
+        cache_dir: Directory that holds http_cache.sqlite
+    """
+    global _shared_cache, _shared_session
+    os.environ[CACHE_DIR_ENV] = str(Path(cache_dir).resolve())
+    with _shared_lock:
+        _shared_cache = None
+    with _session_lock:
+        _shared_session = None
+
+
+class HTTPCache:
+    """SQLite-backed response store with per-endpoint TTLs and an LRU size cap."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            method TEXT NOT NULL,
+            url TEXT NOT NULL,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            content BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            expires REAL NOT NULL,
+            last_access REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access);
+        CREATE TABLE IF NOT EXISTS counters (
+            name TEXT PRIMARY KEY,
+            value INTEGER NOT NULL
+        );
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Directory for http_cache.sqlite (default: default_cache_dir())
+            max_bytes: Size cap for stored response bodies
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else default_cache_dir()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / "http_cache.sqlite"
+
+        if max_bytes is None:
+            max_mb = os.environ.get(CACHE_MAX_MB_ENV)
+            max_bytes = int(float(max_mb) * 1024 * 1024) if max_mb else DEFAULT_MAX_BYTES
+        self.max_bytes = max_bytes
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self.SCHEMA)
+
+    @staticmethod
+    def make_key(method: str, url: str, body: Optional[bytes] = None, vary: str = "") -> str:
+        """Build a cache key from the request identity."""
+        digest = hashlib.sha256()
+        for part in (method.upper(), url, vary):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        if body:
+            digest.update(body if isinstance(body, bytes) else str(body).encode("utf-8"))
+        return digest.hexdigest()
+
+    def _bump(self, name: str, amount: int = 1) -> None:
+        self._conn.execute(
+            "INSERT INTO counters(name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a fresh entry, updating its LRU timestamp.
+
+        Returns:
+            Dict with status, url, headers, content - or None on miss/expiry
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, url, headers, content, expires FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+
+            if row is None or row[4] < now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._bump("misses")
+                return None
+
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._bump("hits")
+
+        return {
+            "status": row[0],
+            "url": row[1],
+            "headers": json.loads(row[2]),
+            "content": row[3],
+        }
+
+    def put(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status: int,
+        headers: Dict[str, str],
+        content: bytes,
+        ttl: Optional[int] = None
+    ) -> None:
+        """Store a response and enforce the size cap."""
+        now = time.time()
+        ttl = ttl if ttl is not None else ttl_for_url(url)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, method, url, status, headers, content, size, created, expires, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, method.upper(), url, status, json.dumps(dict(headers)),
+                 sqlite3.Binary(content), len(content), now, now + ttl, now)
+            )
+            self._bump("stores")
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones above the cap."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        removed = self._conn.execute(
+            "DELETE FROM responses WHERE expires < ?", (time.time(),)
+        ).rowcount
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+        # Evict down to 90% of the cap so we don't evict on every insert
+        target = int(self.max_bytes * 0.9)
+        if total > target:
+            rows = self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY last_access ASC"
+            ).fetchall()
+            doomed = []
+            for key, size in rows:
+                if total <= target:
+                    break
+                doomed.append((key,))
+                total -= size
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            removed += len(doomed)
+
+        if removed:
+            self._bump("evictions", removed)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return cache statistics (counters, size, per-host breakdown)."""
+        with self._lock:
+            counters = dict(self._conn.execute("SELECT name, value FROM counters").fetchall())
+            entries, total_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            expired = self._conn.execute(
+                "SELECT COUNT(*) FROM responses WHERE expires < ?", (time.time(),)
+            ).fetchone()[0]
+            urls = self._conn.execute("SELECT url FROM responses").fetchall()
+
+        by_host: Dict[str, int] = {}
+        for (url,) in urls:
+            host = re.sub(r"^https?://", "", url).split("/", 1)[0]
+            by_host[host] = by_host.get(host, 0) + 1
+
+        hits = counters.get("hits", 0)
+        misses = counters.get("misses", 0)
+        lookups = hits + misses
+
+        return {
+            "path": str(self.db_path),
+            "entries": entries,
+            "expired_entries": expired,
+            "size_bytes": total_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+            "stores": counters.get("stores", 0),
+            "evictions": counters.get("evictions", 0),
+            "by_host": dict(sorted(by_host.items(), key=lambda kv: -kv[1])),
+        }
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.execute("DELETE FROM counters")
+            self._conn.execute("VACUUM")
+
+
+_shared_cache: Optional[HTTPCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_cache() -> Optional[HTTPCache]:
+    """Return the process-wide HTTPCache (None when caching is disabled)."""
+    global _shared_cache
+    if not cache_enabled():
+        return None
+    with _shared_lock:
+        if _shared_cache is None:
+            try:
+                _shared_cache = HTTPCache()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: HTTP cache unavailable ({e})", file=sys.stderr)
+                return None
+        return _shared_cache
+
+
+class CachedSession(requests.Session):
+    """requests.Session that serves GET/HEAD/POST responses from HTTPCache.
+
+    Network requests are rate limited per host across processes and retried
+    on throttling or transient server errors.
+    """
+
+    def __init__(self, cache: Optional[HTTPCache] = None, rate_limit: bool = True):
+        """Initialize session.
+
+        Args:
+            cache: Cache to use (default: the shared process-wide cache)
+            rate_limit: Apply the shared per-host token bucket and retry policy
+        """
+        super().__init__()
+        self.cache = cache if cache is not None else get_cache()
+        self.limiter = get_limiter(default_cache_dir()) if rate_limit else None
+
+    def request(self, method, url, **kwargs):
+        method = method.upper()
+        if self.cache is None or method not in CACHEABLE_METHODS or kwargs.get("stream"):
+            return self._send_with_retries(method, url, **kwargs)
+
+        prepared = self.prepare_request(requests.Request(
+            method=method,
+            url=url,
+            params=kwargs.get("params"),
+            data=kwargs.get("data"),
+            json=kwargs.get("json"),
+            headers=kwargs.get("headers"),
+        ))
+        # Content negotiation (e.g., doi.org BibTeX) returns different bodies per Accept
+        vary = prepared.headers.get("Accept", "")
+        key = HTTPCache.make_key(method, prepared.url, prepared.body, vary)
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            return self._build_response(prepared, cached)
+
+        response = self._send_with_retries(method, url, **kwargs)
+        if response.status_code in CACHEABLE_STATUS:
+            body = prepared.body
+            if isinstance(body, bytes):
+                body = body.decode("utf-8", "replace")
+            self.cache.put(
+                key, method, prepared.url, response.status_code,
+                {k: v for k, v in response.headers.items()
+                 if k.lower() in ("content-type", "last-modified", "etag")},
+                response.content,
+                # POSTed form parameters (e.g. WebEnv) also select the TTL rule
+                ttl=ttl_for_url(f"{prepared.url}?{body}" if body else prepared.url)
+            )
+        response.from_cache = False
+        return response
+
+    def _send_with_retries(self, method, url, **kwargs):
+        """Send a request under the host's rate limit, retrying 429/5xx."""
+        if self.limiter is None:
+            return super().request(method, url, **kwargs)
+
+        host = host_of(url)
+        for attempt in range(MAX_RETRIES + 1):
+            self.limiter.acquire(host)
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt == MAX_RETRIES:
+                    raise
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if response.status_code not in RETRY_STATUS or attempt == MAX_RETRIES:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            delay = backoff_delay(attempt, retry_after)
+            if retry_after is not None:
+                # Hold back every process, not just this one
+                self.limiter.block(host, retry_after)
+            print(f"{host} returned {response.status_code}, retrying in {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{MAX_RETRIES})", file=sys.stderr)
+            time.sleep(delay)
+
+        return response
+
+    @staticmethod
+    def _build_response(prepared: requests.PreparedRequest, cached: Dict[str, Any]) -> requests.Response:
+        response = requests.Response()
+        response.status_code = cached["status"]
+        response.url = cached["url"]
+        response.headers = CaseInsensitiveDict(cached["headers"])
+        response._content = bytes(cached["content"])
+        response._content_consumed = True
+        response.request = prepared
+        response.reason = "OK" if response.status_code == 200 else "Cached"
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.from_cache = True
+        return response
+
+
+def get_session() -> requests.Session:
+    """Create a rate-limited session backed by the shared HTTP cache.
+
+    Sessions are cheap; each client keeps its own (for its own headers)
+    while all of them share one cache database.
+    """
+    return CachedSession()
+
+
+_shared_session: Optional[CachedSession] = None
+_session_lock = threading.Lock()
+
+
+def shared_session() -> requests.Session:
+    """Return the process-wide session for module-level helpers.
+
+    Functions called once per DOI or row use it so that their requests
+    reuse one connection pool instead of opening a new one per call.
+    """
+    global _shared_session
+    with _session_lock:
+        if _shared_session is None:
+            _shared_session = CachedSession()
+        return _shared_session
+
+
+def format_stats(stats: Dict[str, Any]) -> str:
+    """Format cache statistics for terminal output."""
+    lines = [
+        f"HTTP cache: {stats['path']}",
+        f"  Entries:   {stats['entries']} ({stats['expired_entries']} expired)",
+        f"  Size:      {stats['size_bytes'] / 1024 / 1024:.1f} MB "
+        f"/ {stats['max_bytes'] / 1024 / 1024:.0f} MB cap",
+        f"  Hits:      {stats['hits']}  Misses: {stats['misses']}  "
+        f"Hit rate: {stats['hit_rate'] * 100:.1f}%",
+        f"  Stores:    {stats['stores']}  Evictions: {stats['evictions']}",
+    ]
+    for host, count in stats["by_host"].items():
+        lines.append(f"    {host}: {count}")
+    return "\n".join(lines)
+
+
+def main():
+    """Command-line interface for cache inspection."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or clear the RRWrite HTTP cache")
+    parser.add_argument("--cache-dir", type=Path, help="Cache directory (default: $RRWRITE_CACHE_DIR or ~/.cache/rrwrite)")
+    parser.add_argument("--cache-stats", action="store_true", help="Print cache statistics")
+    parser.add_argument("--json", action="store_true", help="Print statistics as JSON")
+    parser.add_argument("--clear", action="store_true", help="Remove all cached responses")
+
+    args = parser.parse_args()
+
+    cache = HTTPCache(cache_dir=args.cache_dir)
+
+    if args.clear:
+        cache.clear()
+        print(f"Cleared {cache.db_path}")
+
+    if args.cache_stats or args.json or not args.clear:
+        stats = cache.stats()
+        print(json.dumps(stats, indent=2) if args.json else format_stats(stats))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
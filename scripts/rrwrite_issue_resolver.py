@@ -10,7 +10,13 @@ import re
 import hashlib
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any
-from difflib import SequenceMatcher
+
+try:
+    from rrwrite_fuzzy_match import FuzzyIndex
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_fuzzy_match import FuzzyIndex
 
 
 class Issue:
@@ -210,32 +216,24 @@ class IssueResolver:
         matched_new = set()
         persisting = []
 
-        # Match issues using description similarity
-        for old_issue in old_issues:
-            best_match = None
-            best_score = 0.0
-
-            for i, new_issue in enumerate(new_issues):
-                if i in matched_new:
-                    continue
+        # Match issues using description similarity (new descriptions are
+        # indexed once; see rrwrite_fuzzy_match)
+        index = FuzzyIndex([issue.description for issue in new_issues])
 
-                # Compute similarity
-                score = SequenceMatcher(
-                    None,
-                    old_issue.description.lower(),
-                    new_issue.description.lower()
-                ).ratio()
+        for old_idx, old_issue in enumerate(old_issues):
+            # Boost score if sections match
+            def section_boost(i: int, section: Optional[str] = old_issue.section) -> float:
+                return 1.2 if section and new_issues[i].section == section else 1.0
 
-                # Boost score if sections match
-                if old_issue.section == new_issue.section and old_issue.section:
-                    score *= 1.2
-
-                if score > best_score and score >= threshold:
-                    best_score = score
-                    best_match = i
+            best_match, _ = index.best_match(
+                old_issue.description,
+                threshold=threshold,
+                exclude=matched_new,
+                weight=section_boost
+            )
 
             if best_match is not None:
-                matched_old.add(old_issues.index(old_issue))
+                matched_old.add(old_idx)
                 matched_new.add(best_match)
                 persisting.append(new_issues[best_match])
 
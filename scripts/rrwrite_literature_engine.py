@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+RRWrite Literature Engine
+
+In-process, concurrent literature search across the API clients:
+- Semantic Scholar (rrwrite-api-semanticscholar.py)
+- PubMed (rrwrite-api-pubmed.py)
+- OpenAlex (rrwrite-api-openalex.py)
+- Europe PMC (rrwrite-api-europepmc.py)
+
+The client modules are imported once per process and every enabled source
+runs in its own worker thread with its own timeout budget, so a multi-source
+query takes about as long as the slowest source instead of the sum of all of
+them.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+try:
+    from rrwrite_script_loader import load_script_module
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_script_loader import load_script_module
+
+# Per-source timeout budgets in seconds (same limits the old subprocess calls used)
+DEFAULT_TIMEOUTS = {
+    "semantic_scholar": 30,
+    "pubmed": 45,
+    "openalex": 60,
+    "europepmc": 60,
+}
+
+# Source name -> client script file
+SOURCE_SCRIPTS = {
+    "semantic_scholar": "rrwrite-api-semanticscholar.py",
+    "pubmed": "rrwrite-api-pubmed.py",
+    "openalex": "rrwrite-api-openalex.py",
+    "europepmc": "rrwrite-api-europepmc.py",
+}
+
+SOURCE_LABELS = {
+    "semantic_scholar": "Semantic Scholar",
+    "pubmed": "PubMed",
+    "openalex": "OpenAlex",
+    "europepmc": "Europe PMC",
+}
+
+
+def _search_semantic_scholar(query: str, max_results: int) -> List[Dict]:
+    module = load_script_module(SOURCE_SCRIPTS["semantic_scholar"])
+    papers = module.search_semantic_scholar(query, max_results)
+    # Prioritize highly-cited + recent, as the CLI did with --prioritize
+    return module.prioritize_papers(papers)
+
+
+def _search_pubmed(query: str, max_results: int) -> List[Dict]:
+    module = load_script_module(SOURCE_SCRIPTS["pubmed"])
+    return module.search_pubmed(query, max_results)
+
+
+def _search_openalex(query: str, max_results: int) -> List[Dict]:
+    module = load_script_module(SOURCE_SCRIPTS["openalex"])
+    return module.OpenAlexClient().search(query, max_results)
+
+
+def _search_europepmc(query: str, max_results: int) -> List[Dict]:
+    module = load_script_module(SOURCE_SCRIPTS["europepmc"])
+    return module.EuropePMCClient().search(query, max_results)
+
+
+SOURCE_SEARCHERS: Dict[str, Callable[[str, int], List[Dict]]] = {
+    "semantic_scholar": _search_semantic_scholar,
+    "pubmed": _search_pubmed,
+    "openalex": _search_openalex,
+    "europepmc": _search_europepmc,
+}
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one source search."""
+    source: str
+    papers: List[Dict] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+    timed_out: bool = False
+
+
+class LiteratureSearchEngine:
+    """Runs literature sources concurrently with per-source timeouts."""
+
+    def __init__(
+        self,
+        timeouts: Optional[Dict[str, float]] = None,
+        searchers: Optional[Dict[str, Callable[[str, int], List[Dict]]]] = None
+    ):
+        """Initialize engine.
+
+        Args:
+            timeouts: Per-source timeout budgets in seconds (overrides defaults)
+            searchers: Optional source -> search function mapping (overrides defaults)
+        """
+        self.timeouts = dict(DEFAULT_TIMEOUTS)
+        if timeouts:
+            self.timeouts.update(timeouts)
+        self.searchers = dict(SOURCE_SEARCHERS)
+        if searchers:
+            self.searchers.update(searchers)
+
+    def search(
+        self,
+        query: str,
+        sources: List[str],
+        max_results: int = 20
+    ) -> Dict[str, SourceResult]:
+        """Search all requested sources at the same time.
+
+        Sources that exceed their timeout budget are reported as timed out
+        with no papers; their worker threads are daemonic and are abandoned.
+
+        Args:
+            query: Search query
+            sources: Source names to query (keys of SOURCE_SEARCHERS)
+            max_results: Maximum results per source
+
+        Returns:
+            Dictionary mapping source name -> SourceResult, in request order
+        """
+        results = {name: SourceResult(source=name) for name in sources}
+        done = {name: threading.Event() for name in sources}
+
+        def run(name: str):
+            start = time.monotonic()
+            try:
+                results[name].papers = self.searchers[name](query, max_results) or []
+            except Exception as e:
+                results[name].error = str(e)
+            finally:
+                results[name].elapsed = time.monotonic() - start
+                done[name].set()
+
+        start = time.monotonic()
+        for name in sources:
+            threading.Thread(
+                target=run, args=(name,), name=f"search-{name}", daemon=True
+            ).start()
+
+        collected = {}
+        for name in sources:
+            budget = self.timeouts.get(name, max(DEFAULT_TIMEOUTS.values()))
+            remaining = max(0.0, start + budget - time.monotonic())
+            if done[name].wait(remaining):
+                collected[name] = results[name]
+            else:
+                collected[name] = SourceResult(
+                    source=name,
+                    elapsed=time.monotonic() - start,
+                    error=f"timed out after {budget:g}s",
+                    timed_out=True
+                )
+
+        return collected
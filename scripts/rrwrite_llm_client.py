@@ -0,0 +1,301 @@
+#!/usr/bin/env python3
+"""
+RRWrite LLM Client
+
+Shared call layer for LLM-based revisions.
+
+- One client per process (get_llm_client()) whose HTTP connection pool is
+  reused by every reviser and worker thread. The anthropic SDK is used when
+  installed; otherwise the Messages API is called through a pooled
+  requests.Session.
+- Responses are cached on disk, keyed by a hash of the model, the prompt and
+  the request parameters, so rerunning a revision iteration or repeating a
+  dry run does not send the same request twice.
+- Token counts and latency are accumulated per client (LLMUsage).
+- ANTHROPIC_BASE_URL points the client at another endpoint, e.g. a local
+  stub server for tests.
+
+Cache location: $RRWRITE_CACHE_DIR/llm (default: ~/.cache/rrwrite)
+Disable with RRWRITE_LLM_CACHE=0.
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+import requests
+
+# Optional anthropic import; the HTTP API is used directly without it
+try:
+    import anthropic
+    ANTHROPIC_AVAILABLE = True
+except ImportError:
+    ANTHROPIC_AVAILABLE = False
+
+try:
+    from rrwrite_rate_limiter import MAX_RETRIES, backoff_delay, parse_retry_after
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_rate_limiter import MAX_RETRIES, backoff_delay, parse_retry_after
+
+CACHE_DIR_ENV = "RRWRITE_CACHE_DIR"
+CACHE_ENABLED_ENV = "RRWRITE_LLM_CACHE"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "rrwrite"
+
+DEFAULT_MODEL = "claude-sonnet-4-5-20241022"
+DEFAULT_BASE_URL = "https://api.anthropic.com"
+API_VERSION = "2023-06-01"
+
+# Overloaded (529) and rate limited requests are retried with backoff
+RETRY_STATUS = {429, 500, 502, 503, 504, 529}
+
+
+def llm_cache_enabled() -> bool:
+    """Check whether the LLM response cache is enabled via environment."""
+    return os.environ.get(CACHE_ENABLED_ENV, "1").lower() not in ("0", "false", "no", "off")
+
+
+class LLMError(Exception):
+    """An LLM request failed or no API key is configured."""
+
+
+@dataclass
+class LLMResponse:
+    """Text of a completion and what it cost."""
+    text: str
+    input_tokens: int = 0
+    output_tokens: int = 0
+    seconds: float = 0.0
+    cached: bool = False
+
+
+class LLMUsage:
+    """Thread-safe request, token and latency counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.cache_hits = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.seconds = 0.0
+
+    def record(self, response: LLMResponse) -> None:
+        with self._lock:
+            if response.cached:
+                self.cache_hits += 1
+                return
+            self.requests += 1
+            self.input_tokens += response.input_tokens
+            self.output_tokens += response.output_tokens
+            self.seconds += response.seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current counters as a dict."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "cache_hits": self.cache_hits,
+                "input_tokens": self.input_tokens,
+                "output_tokens": self.output_tokens,
+                "seconds": round(self.seconds, 3),
+            }
+
+    def __str__(self):
+        s = self.snapshot()
+        return (f"{s['requests']} requests ({s['cache_hits']} cached), "
+                f"{s['input_tokens']:,} input / {s['output_tokens']:,} output tokens, "
+                f"{s['seconds']:.1f} s")
+
+
+class LLMCache:
+    """Completions stored as one JSON file per request key."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Cache root (default: $RRWRITE_CACHE_DIR or ~/.cache/rrwrite)
+        """
+        root = Path(cache_dir) if cache_dir else Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR))
+        self.cache_dir = root / "llm"
+
+    @staticmethod
+    def make_key(payload: Dict[str, Any]) -> str:
+        """Key for a request: hash of the model, prompt and parameters."""
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, entry: Dict[str, Any]) -> None:
+        path = self._path(key)
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}.{threading.get_ident()}")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(entry), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+
+class LLMClient:
+    """Cached, pooled client for single-turn completions."""
+
+    def __init__(
+        self,
+        model: str = DEFAULT_MODEL,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache: Optional[LLMCache] = None,
+        timeout: float = 600.0
+    ):
+        """Initialize client.
+
+        Args:
+            model: Model name
+            api_key: API key (default: $ANTHROPIC_API_KEY)
+            base_url: API endpoint (default: $ANTHROPIC_BASE_URL or the public API)
+            cache: Response cache (default: LLMCache() unless RRWRITE_LLM_CACHE=0)
+            timeout: Seconds per request
+        """
+        self.model = model
+        self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
+        self.base_url = (base_url or os.environ.get("ANTHROPIC_BASE_URL") or DEFAULT_BASE_URL).rstrip("/")
+        self.cache = cache if cache is not None else (LLMCache() if llm_cache_enabled() else None)
+        self.timeout = timeout
+        self.usage = LLMUsage()
+        self._lock = threading.Lock()
+        self._client = None
+
+    @property
+    def available(self) -> bool:
+        """Whether requests can be sent (cached responses need no key)."""
+        return bool(self.api_key)
+
+    def _transport(self):
+        with self._lock:
+            if self._client is None:
+                if ANTHROPIC_AVAILABLE:
+                    self._client = anthropic.Anthropic(
+                        api_key=self.api_key, base_url=self.base_url,
+                        timeout=self.timeout, max_retries=MAX_RETRIES
+                    )
+                else:
+                    self._client = requests.Session()
+                    self._client.headers.update({
+                        "x-api-key": self.api_key or "",
+                        "anthropic-version": API_VERSION,
+                        "content-type": "application/json",
+                    })
+            return self._client
+
+    def _send(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a Messages request: {'text', 'input_tokens', 'output_tokens'}."""
+        client = self._transport()
+        if ANTHROPIC_AVAILABLE:
+            try:
+                message = client.messages.create(**payload)
+            except anthropic.APIError as e:
+                raise LLMError(str(e)) from e
+            return {
+                "text": "".join(b.text for b in message.content if getattr(b, "type", "") == "text"),
+                "input_tokens": message.usage.input_tokens,
+                "output_tokens": message.usage.output_tokens,
+            }
+
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = client.post(f"{self.base_url}/v1/messages", json=payload, timeout=self.timeout)
+            except requests.RequestException as e:
+                if attempt == MAX_RETRIES:
+                    raise LLMError(str(e)) from e
+                time.sleep(backoff_delay(attempt))
+                continue
+            if response.status_code in RETRY_STATUS and attempt < MAX_RETRIES:
+                time.sleep(backoff_delay(attempt, parse_retry_after(response.headers.get("Retry-After"))))
+                continue
+            if response.status_code != 200:
+                raise LLMError(f"HTTP {response.status_code}: {response.text[:200]}")
+            data = response.json()
+            usage = data.get("usage", {})
+            return {
+                "text": "".join(b.get("text", "") for b in data.get("content", []) if b.get("type") == "text"),
+                "input_tokens": usage.get("input_tokens", 0),
+                "output_tokens": usage.get("output_tokens", 0),
+            }
+
+    def complete(
+        self,
+        prompt: str,
+        max_tokens: int = 4096,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None
+    ) -> LLMResponse:
+        """Complete a single user prompt.
+
+        Args:
+            prompt: User message
+            max_tokens: Output token limit
+            system: Optional system prompt
+            temperature: Optional sampling temperature
+
+        Returns:
+            LLMResponse (cached=True when served from the cache)
+
+        Raises:
+            LLMError: If the request fails or no API key is configured
+        """
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+        }
+        if system is not None:
+            payload["system"] = system
+        if temperature is not None:
+            payload["temperature"] = temperature
+
+        key = LLMCache.make_key(payload) if self.cache else None
+        entry = self.cache.get(key) if key else None
+        if entry is not None:
+            response = LLMResponse(entry["text"], entry["input_tokens"], entry["output_tokens"], cached=True)
+            self.usage.record(response)
+            return response
+
+        if not self.available:
+            raise LLMError("ANTHROPIC_API_KEY not set")
+
+        start = time.perf_counter()
+        entry = self._send(payload)
+        response = LLMResponse(entry["text"], entry["input_tokens"], entry["output_tokens"],
+                               seconds=time.perf_counter() - start)
+        self.usage.record(response)
+        if key:
+            self.cache.put(key, entry)
+        return response
+
+
+_shared_client: Optional[LLMClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_llm_client() -> LLMClient:
+    """Return the process-wide LLMClient."""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = LLMClient()
+        return _shared_client
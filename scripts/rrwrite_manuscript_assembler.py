@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+RRWrite Manuscript Assembler
+
+Incremental assembly of section files into full_manuscript.md.
+
+- Each section is read once; its Paperpile detection, citation conversion and
+  word count are cached per section, keyed by the file's mtime and size (and
+  the mapping file's for converted sections).
+- paperpile_mapping.json is loaded once per change, not once per section.
+- The cache is kept in memory (an assembler object can be reused across
+  revisions) and in .assembly_cache.json in the manuscript directory, so a
+  fresh process only reads the sections that changed.
+- full_manuscript.md is rewritten only when its content changes.
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# Standard section order
+SECTION_ORDER = [
+    "abstract.md",
+    "introduction.md",
+    "methods.md",
+    "results.md",
+    "discussion.md",
+    "conclusion.md"
+]
+
+# Sections that may be missing without a warning
+OPTIONAL_SECTIONS = {"conclusion.md"}
+
+ASSEMBLY_CACHE_FILE = ".assembly_cache.json"
+PAPERPILE_MAPPING_FILE = "paperpile_mapping.json"
+
+# Bump when the cached section format changes
+_CACHE_VERSION = 1
+
+# [(display text)](https://paperpile.com/c/PROJECT/CODE)
+_PAPERPILE_LINK = re.compile(r'\[(.*?)\]\(https://paperpile\.com/c/[^/]+/([^\)]+)\)')
+
+_mapping_cache: Dict[str, Tuple[Tuple[int, int], Optional[Dict[str, str]]]] = {}
+
+
+def _signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def detect_paperpile_citations(text: str) -> bool:
+    """Check if text contains Paperpile citations."""
+    return bool(_PAPERPILE_LINK.search(text))
+
+
+def load_paperpile_mapping(mapping_file: Path) -> Optional[Dict[str, str]]:
+    """Load paperpile_mapping.json, reusing the last load while the file is unchanged.
+
+    Returns:
+        Paperpile code → BibTeX key, or None if the file is missing or invalid
+    """
+    mapping_file = Path(mapping_file)
+    signature = _signature(mapping_file)
+    if signature is None:
+        print(f"Warning: Paperpile mapping file not found: {mapping_file}")
+        return None
+    cached = _mapping_cache.get(str(mapping_file))
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    try:
+        with open(mapping_file, 'r') as f:
+            mapping = json.load(f)
+    except Exception as e:
+        print(f"Warning: Could not load Paperpile mapping: {e}")
+        mapping = None
+    _mapping_cache[str(mapping_file)] = (signature, mapping)
+    return mapping
+
+
+def convert_paperpile_to_bibtex(
+    text: str,
+    mapping_file: Optional[Path] = None,
+    mapping: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Convert Paperpile citation links to BibTeX keys.
+
+    Transforms: [(Author et al. YEAR)](https://paperpile.com/c/PROJECT/CODE)
+    To: [authorYEAR]
+
+    Args:
+        text: Text with Paperpile citations
+        mapping_file: Path to paperpile_mapping.json
+        mapping: Already loaded mapping (takes precedence over mapping_file)
+
+    Returns:
+        Text with BibTeX citations
+    """
+    if mapping is None:
+        mapping = load_paperpile_mapping(mapping_file) if mapping_file is not None else None
+        if mapping is None:
+            return text
+
+    def replace_citation(match):
+        paperpile_code = match.group(2)
+
+        # Look up BibTeX key
+        if paperpile_code in mapping:
+            return f'[{mapping[paperpile_code]}]'
+        # Keep original if not in mapping
+        print(f"Warning: Paperpile code '{paperpile_code}' not in mapping, keeping original")
+        return match.group(0)
+
+    return _PAPERPILE_LINK.sub(replace_citation, text)
+
+
+@dataclass
+class AssembledSection:
+    """A section as written into the full manuscript."""
+    name: str
+    path: Path
+    block: str            # Heading (if added), converted content and separator
+    words: int
+    has_paperpile: bool
+
+
+@dataclass
+class AssemblyResult:
+    """Outcome of ManuscriptAssembler.assemble()."""
+    output_file: Path
+    sections: List[AssembledSection]
+    missing: List[str]
+    words: int = 0
+    written: bool = False         # False if the output already had this content
+    has_paperpile: bool = False
+    converted_citations: bool = False
+    reread: List[str] = field(default_factory=list)   # Sections read from disk this run
+    text: str = ''                # Assembled manuscript
+
+
+class ManuscriptAssembler:
+    """Assemble section files, re-reading only sections that changed."""
+
+    def __init__(self, manuscript_dir: Path, persist: bool = True):
+        """Initialize assembler.
+
+        Args:
+            manuscript_dir: Directory containing the section files
+                (directly or in a sections/ subdirectory)
+            persist: Keep the section cache in .assembly_cache.json
+        """
+        self.manuscript_dir = Path(manuscript_dir)
+        self.persist = persist
+        self.cache_path = self.manuscript_dir / ASSEMBLY_CACHE_FILE
+        self.mapping_file = self.manuscript_dir / PAPERPILE_MAPPING_FILE
+        self._entries: Dict[str, dict] = self._load_cache() if persist else {}
+
+    def _load_cache(self) -> Dict[str, dict]:
+        try:
+            data = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        if data.get('version') != _CACHE_VERSION:
+            return {}
+        return data.get('sections', {})
+
+    def _save_cache(self) -> None:
+        tmp = self.cache_path.with_name(f"{self.cache_path.name}.tmp{os.getpid()}")
+        try:
+            tmp.write_text(json.dumps({'version': _CACHE_VERSION, 'sections': self._entries}),
+                           encoding='utf-8')
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def locate_sections(self) -> Tuple[Dict[str, Path], List[str]]:
+        """Find section files in standard order.
+
+        Sections are looked up directly in the manuscript directory first,
+        then in its sections/ subdirectory.
+
+        Returns:
+            (section name → path, missing required section names)
+        """
+        found: Dict[str, Path] = {}
+        missing = []
+        sections_dir = self.manuscript_dir / "sections"
+        for section in SECTION_ORDER:
+            for path in (self.manuscript_dir / section, sections_dir / section):
+                if path.exists():
+                    found[section] = path
+                    break
+            else:
+                if section not in OPTIONAL_SECTIONS:
+                    missing.append(section)
+        return found, missing
+
+    def _read_section(self, section: str, path: Path) -> Tuple[dict, bool]:
+        """Cached raw entry for a section: (entry, read from disk)."""
+        signature = _signature(path)
+        entry = self._entries.get(section)
+        if (entry is not None and signature is not None and entry['path'] == str(path)
+                and entry.get('signature') and tuple(entry['signature']) == signature):
+            return entry, False
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
+        entry = {
+            'path': str(path),
+            'signature': list(signature) if signature else None,
+            'content': content,
+            'has_paperpile': detect_paperpile_citations(content),
+        }
+        self._entries[section] = entry
+        return entry, True
+
+    @staticmethod
+    def _block(section: str, content: str) -> str:
+        # Add section header if not already in file
+        heading = '' if content.startswith('# ') else f"# {section.replace('.md', '').title()}\n\n"
+        return f"{heading}{content}\n\n---\n\n"
+
+    def assemble(self, output_file: Optional[Path] = None) -> AssemblyResult:
+        """Assemble the manuscript.
+
+        Args:
+            output_file: Output path (default: <manuscript_dir>/full_manuscript.md)
+
+        Returns:
+            AssemblyResult (no sections found: empty sections, nothing written)
+        """
+        output_file = Path(output_file) if output_file else self.manuscript_dir / "full_manuscript.md"
+        found, missing = self.locate_sections()
+        result = AssemblyResult(output_file, [], missing)
+        if not found:
+            return result
+
+        entries = {}
+        for section, path in found.items():
+            entries[section], reread = self._read_section(section, path)
+            if reread:
+                result.reread.append(section)
+        result.has_paperpile = any(e['has_paperpile'] for e in entries.values())
+
+        # Citations are converted only if some section has them and a mapping exists
+        mapping_signature = _signature(self.mapping_file) if result.has_paperpile else None
+        result.converted_citations = mapping_signature is not None
+        dirty = bool(result.reread)
+        mapping, mapping_loaded = None, False
+
+        for section, entry in entries.items():
+            convert = result.converted_citations and entry['has_paperpile']
+            key = list(mapping_signature) if convert else None
+            if 'block' not in entry or entry.get('mapping') != key:
+                content = entry['content']
+                if convert:
+                    if not mapping_loaded:
+                        mapping, mapping_loaded = load_paperpile_mapping(self.mapping_file), True
+                    if mapping is not None:
+                        content = convert_paperpile_to_bibtex(content, mapping=mapping)
+                entry['block'] = self._block(section, content)
+                entry['words'] = len(entry['block'].split())
+                entry['mapping'] = key
+                dirty = True
+            result.sections.append(AssembledSection(
+                section, found[section], entry['block'], entry['words'], entry['has_paperpile']
+            ))
+
+        header = (
+            f"# Full Manuscript\n\n"
+            f"**Assembled:** {datetime.now().strftime('%Y-%m-%d')}\n\n"
+            "---\n\n"
+        )
+        text = header + ''.join(s.block for s in result.sections)
+        result.text = text
+        result.words = len(header.split()) + sum(s.words for s in result.sections)
+        result.written = self._write_if_changed(output_file, text)
+
+        if self.persist and (dirty or not self.cache_path.exists()):
+            self._save_cache()
+        return result
+
+    @staticmethod
+    def _write_if_changed(output_file: Path, text: str) -> bool:
+        data = text.encode('utf-8')
+        try:
+            if output_file.stat().st_size == len(data) and output_file.read_bytes() == data:
+                return False
+        except OSError:
+            pass
+        tmp = output_file.with_name(f"{output_file.name}.tmp{os.getpid()}")
+        tmp.write_bytes(data)
+        os.replace(tmp, output_file)
+        return True
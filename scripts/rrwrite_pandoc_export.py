@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+RRWrite Pandoc Export
+
+Export service for converting the assembled manuscript with pandoc.
+
+- The pandoc binary and the PDF engines (pdflatex, weasyprint, wkhtmltopdf)
+  are looked up on PATH once per process; engines that are not installed are
+  never tried.
+- DOCX and PDF conversions of one manuscript run concurrently (each is a
+  separate pandoc process).
+- A conversion is skipped when its output exists and its inputs are
+  unchanged: the markdown, bibliography, CSL style, reference doc, images
+  referenced from the markdown, the pandoc options and the pandoc binary.
+  Input digests are kept in .export_inputs.json next to the outputs.
+
+Set RRWRITE_EXPORT_CACHE=0 (or pass force=True) to always convert.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    from rrwrite_blob_store import hash_file
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_blob_store import hash_file
+
+# PDF engines in order of preference
+PDF_ENGINES = ('pdflatex', 'weasyprint', 'wkhtmltopdf')
+
+# Digests of the inputs of the last successful conversions, per output directory
+EXPORT_INPUTS_FILE = '.export_inputs.json'
+
+EXPORT_CACHE_ENV = 'RRWRITE_EXPORT_CACHE'
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+
+_IMAGE_REF = re.compile(r'!\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+
+
+@dataclass(frozen=True)
+class PandocEngines:
+    """Installed pandoc binary and PDF engines."""
+    pandoc: Optional[str]
+    pdf_engines: Tuple[str, ...]
+
+
+@lru_cache(maxsize=None)
+def probe_engines() -> PandocEngines:
+    """Find pandoc and the available PDF engines (once per process)."""
+    return PandocEngines(
+        pandoc=shutil.which('pandoc'),
+        pdf_engines=tuple(engine for engine in PDF_ENGINES if shutil.which(engine))
+    )
+
+
+def export_cache_enabled() -> bool:
+    """Check whether unchanged conversions may be skipped."""
+    return os.environ.get(EXPORT_CACHE_ENV, '1') != '0'
+
+
+@dataclass
+class ExportJob:
+    """One pandoc conversion of a markdown file."""
+    markdown: Path
+    output: Path
+    args: List[str] = field(default_factory=list)      # pandoc options besides input/output
+    inputs: List[Path] = field(default_factory=list)   # Bibliography, CSL, reference doc, ...
+    resource_paths: List[Path] = field(default_factory=list)
+    pdf_engines: Optional[Sequence[str]] = None        # PDF output: engines to try, in order
+    timeout: Optional[float] = None
+
+    @property
+    def is_pdf(self) -> bool:
+        return self.pdf_engines is not None
+
+
+@dataclass
+class ExportResult:
+    """Outcome of an ExportJob."""
+    output: Path
+    status: str                  # 'generated', 'unchanged' or 'failed'
+    engine: Optional[str] = None
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status in ('generated', 'unchanged')
+
+
+def referenced_images(markdown_text: str, resource_paths: Sequence[Path]) -> List[Path]:
+    """Image files referenced from markdown, resolved like pandoc --resource-path."""
+    images = []
+    for ref in _IMAGE_REF.findall(markdown_text):
+        if '://' in ref:
+            continue
+        for base in resource_paths:
+            candidate = Path(base) / ref
+            if candidate.is_file():
+                images.append(candidate)
+                break
+    return images
+
+
+class PandocExporter:
+    """Run pandoc conversions concurrently, skipping unchanged ones."""
+
+    def __init__(self, engines: Optional[PandocEngines] = None, force: bool = False):
+        """Initialize exporter.
+
+        Args:
+            engines: Installed tools (default: probe_engines())
+            force: Convert even if inputs are unchanged
+        """
+        self.engines = engines or probe_engines()
+        self.force = force or not export_cache_enabled()
+
+    @property
+    def available(self) -> bool:
+        return self.engines.pandoc is not None
+
+    def _pandoc_identity(self) -> str:
+        try:
+            st = os.stat(self.engines.pandoc)
+            return f"{self.engines.pandoc}:{st.st_size}:{st.st_mtime_ns}"
+        except (OSError, TypeError):
+            return str(self.engines.pandoc)
+
+    def input_key(self, job: ExportJob) -> Optional[str]:
+        """Digest of everything a conversion depends on (None if the markdown is unreadable)."""
+        try:
+            text = Path(job.markdown).read_text(encoding='utf-8', errors='replace')
+        except OSError:
+            return None
+        h = hashlib.sha256()
+        h.update(json.dumps({
+            'args': list(job.args),
+            'pdf_engines': list(job.pdf_engines) if job.is_pdf else None,
+            'pandoc': self._pandoc_identity(),
+        }, sort_keys=True).encode())
+        h.update(hashlib.sha256(text.encode('utf-8')).digest())
+        resources = job.resource_paths or [Path(job.markdown).parent]
+        for path in list(job.inputs) + referenced_images(text, resources):
+            try:
+                digest = hash_file(path)
+            except OSError:
+                digest = 'missing'
+            h.update(f"{path}\0{digest}\0".encode())
+        return h.hexdigest()
+
+    def _command(self, job: ExportJob, engine: Optional[str] = None) -> List[str]:
+        cmd = [self.engines.pandoc, str(job.markdown), '-o', str(job.output)]
+        if job.resource_paths:
+            cmd.extend(['--resource-path', os.pathsep.join(str(p) for p in job.resource_paths)])
+        if engine:
+            cmd.append(f'--pdf-engine={engine}')
+        return cmd + list(job.args)
+
+    def _convert(self, job: ExportJob) -> ExportResult:
+        start = time.perf_counter()
+        if job.is_pdf:
+            engines = [e for e in job.pdf_engines if e in self.engines.pdf_engines]
+            if not engines:
+                return ExportResult(job.output, 'failed', error='no PDF engine installed')
+        else:
+            engines = [None]
+
+        error = None
+        for engine in engines:
+            try:
+                subprocess.run(self._command(job, engine), check=True,
+                               capture_output=True, text=True, timeout=job.timeout)
+                return ExportResult(job.output, 'generated', engine,
+                                    seconds=time.perf_counter() - start)
+            except subprocess.CalledProcessError as e:
+                error = e.stderr.strip() or str(e)
+            except subprocess.TimeoutExpired:
+                error = f"timed out with {engine or 'pandoc'}"
+            except OSError as e:
+                error = str(e)
+        return ExportResult(job.output, 'failed', engines[-1], error,
+                            time.perf_counter() - start)
+
+    def run(self, jobs: Sequence[ExportJob]) -> List[ExportResult]:
+        """Convert all jobs concurrently.
+
+        A failing conversion is reported in its ExportResult and does not
+        stop the others.
+
+        Args:
+            jobs: Conversions to run
+
+        Returns:
+            Results in job order
+        """
+        jobs = list(jobs)
+        if not self.available:
+            return [ExportResult(job.output, 'failed', error='pandoc not found') for job in jobs]
+
+        keys = [self.input_key(job) for job in jobs]
+        stamps: Dict[Path, Dict[str, str]] = {}
+        for job in jobs:
+            directory = Path(job.output).parent
+            if directory not in stamps:
+                stamps[directory] = self._read_stamps(directory)
+
+        results: List[Optional[ExportResult]] = [None] * len(jobs)
+        pending = []
+        for i, (job, key) in enumerate(zip(jobs, keys)):
+            output = Path(job.output)
+            if (not self.force and key is not None and output.exists()
+                    and stamps[output.parent].get(output.name) == key):
+                results[i] = ExportResult(output, 'unchanged')
+            else:
+                pending.append(i)
+
+        if len(pending) == 1:
+            results[pending[0]] = self._convert(jobs[pending[0]])
+        elif pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                for i, result in zip(pending, executor.map(self._convert, [jobs[i] for i in pending])):
+                    results[i] = result
+
+        changed = set()
+        for i in pending:
+            output = Path(jobs[i].output)
+            entries = stamps[output.parent]
+            if results[i].status == 'generated' and keys[i] is not None:
+                entries[output.name] = keys[i]
+            else:
+                entries.pop(output.name, None)
+            changed.add(output.parent)
+        for directory in changed:
+            self._write_stamps(directory, stamps[directory])
+        return results
+
+    def convert(self, job: ExportJob) -> ExportResult:
+        """Run a single conversion."""
+        return self.run([job])[0]
+
+    @staticmethod
+    def _read_stamps(directory: Path) -> Dict[str, str]:
+        try:
+            return json.loads((Path(directory) / EXPORT_INPUTS_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_stamps(directory: Path, entries: Dict[str, str]) -> None:
+        path = Path(directory) / EXPORT_INPUTS_FILE
+        tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+        try:
+            tmp.write_text(json.dumps(entries, indent=2, sort_keys=True))
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+
+def manuscript_export_jobs(output_file: Path, manuscript_dir: Path) -> Tuple[ExportJob, ExportJob]:
+    """DOCX and PDF conversions of an assembled manuscript.
+
+    Args:
+        output_file: Assembled markdown (full_manuscript.md)
+        manuscript_dir: Manuscript directory (figures, tables, bibliography)
+
+    Returns:
+        (DOCX job, PDF job)
+    """
+    # Set resource paths to include both figure and table directories
+    # Priority 1: from_repo directories (original research outputs)
+    # Priority 2: generated directories (analysis visualizations)
+    resource_paths = [
+        manuscript_dir,
+        manuscript_dir / "figures/from_repo",
+        manuscript_dir / "figures/generated",
+        manuscript_dir / "tables/from_repo",
+        manuscript_dir / "tables/generated",
+        manuscript_dir / "figures",  # Fallback for old manuscripts
+        manuscript_dir / "tables"    # Fallback for old manuscripts
+    ]
+
+    # DOCX with proper figure and table handling
+    docx_args = [
+        "--standalone",
+        "--extract-media", str(manuscript_dir / "media"),
+        "--wrap=preserve",
+        "--metadata", "title=Manuscript"
+    ]
+    inputs = []
+
+    # Add bibliography processing if .bib file exists
+    bib_file = manuscript_dir / "literature_citations.bib"
+    if bib_file.exists():
+        docx_args.extend(["--bibliography", str(bib_file), "--citeproc"])
+        inputs.append(bib_file)
+        # Add CSL style if available
+        csl_file = manuscript_dir / "citation-style.csl"
+        if not csl_file.exists():
+            # Try common CSL files in templates
+            for csl_name in ["nature.csl", "apa.csl", "chicago.csl"]:
+                csl_path = TEMPLATES_DIR / csl_name
+                if csl_path.exists():
+                    csl_file = csl_path
+                    break
+        if csl_file.exists():
+            docx_args.extend(["--csl", str(csl_file)])
+            inputs.append(csl_file)
+
+    # Add reference doc if available (for consistent styling)
+    reference_doc = TEMPLATES_DIR / "reference.docx"
+    if reference_doc.exists():
+        docx_args.extend(["--reference-doc", str(reference_doc)])
+        inputs.append(reference_doc)
+
+    docx_job = ExportJob(
+        markdown=output_file,
+        output=output_file.with_suffix('.docx'),
+        args=docx_args,
+        inputs=inputs,
+        resource_paths=resource_paths
+    )
+    pdf_job = ExportJob(
+        markdown=output_file,
+        output=output_file.with_suffix('.pdf'),
+        args=["-V", "geometry:margin=1in"],
+        pdf_engines=PDF_ENGINES,
+        timeout=60
+    )
+    return docx_job, pdf_job
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+RRWrite Paper Deduplication
+
+Linear-time deduplication and field-level merging of paper records from
+Semantic Scholar, PubMed, OpenAlex, Europe PMC and evidence files.
+
+Records are clustered when they share any identity key:
+- Normalized DOI
+- PMID
+- arXiv ID
+- Normalized title hash
+
+Near-duplicate titles (punctuation, word order, a changed word) are found with
+MinHash signatures and LSH banding, so candidates are only compared within a
+bucket instead of across all pairs. Each cluster is merged field by field,
+keeping the richest value from each source (longest abstract, highest
+citation count, any PMID/DOI that one source has and another lacks).
+"""
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Set
+
+# MinHash / LSH parameters: 16 hashes in 4 bands of 4 rows puts the
+# candidate threshold near Jaccard 0.7; candidates are then verified exactly.
+NUM_HASHES = 16
+BANDS = 4
+ROWS = NUM_HASHES // BANDS
+NEAR_DUPLICATE_THRESHOLD = 0.8
+MIN_TITLE_TOKENS = 4      # Short titles ("Introduction") are never fuzzy-matched
+MAX_BUCKET_COMPARISONS = 50
+
+TITLE_STOPWORDS = {"a", "an", "the", "of", "and", "for", "in", "on", "to", "with", "by", "from", "at"}
+
+# Numeric fields take the maximum; text fields take the longest value
+MAX_FIELDS = {"citations", "citationCount", "influentialCitationCount"}
+ID_FIELDS = ("doi", "pmid", "pmcid", "arxiv", "openalex_id")
+
+_MASKS = [
+    int.from_bytes(hashlib.blake2b(str(i).encode(), digest_size=8).digest(), "big")
+    for i in range(NUM_HASHES)
+]
+
+
+def normalize_doi(doi: Any) -> str:
+    """Lowercase a DOI and strip resolver prefixes."""
+    doi = str(doi or "").strip().lower()
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:\s*)", "", doi)
+    return doi.rstrip(".")
+
+
+def normalize_pmid(pmid: Any) -> str:
+    """Return a PMID as a digit string ('' if not numeric)."""
+    pmid = str(pmid or "").strip()
+    return pmid if pmid.isdigit() else ""
+
+
+def normalize_arxiv(arxiv: Any) -> str:
+    """Strip 'arXiv:' prefixes and version suffixes from an arXiv ID."""
+    arxiv = str(arxiv or "").strip().lower()
+    arxiv = re.sub(r"^(arxiv:|https?://arxiv\.org/abs/)", "", arxiv)
+    return re.sub(r"v\d+$", "", arxiv)
+
+
+def normalize_title(title: Any) -> str:
+    """Lowercase a title and drop punctuation/whitespace differences."""
+    return " ".join(re.findall(r"\w+", str(title or "").lower()))
+
+
+def identity_keys(paper: Dict[str, Any]) -> List[str]:
+    """All exact identity keys of a paper record."""
+    keys = []
+    doi = normalize_doi(paper.get("doi"))
+    if doi:
+        keys.append(f"doi:{doi}")
+    pmid = normalize_pmid(paper.get("pmid"))
+    if pmid:
+        keys.append(f"pmid:{pmid}")
+    arxiv = normalize_arxiv(paper.get("arxiv"))
+    if arxiv:
+        keys.append(f"arxiv:{arxiv}")
+    title = normalize_title(paper.get("title"))
+    if title:
+        keys.append("title:" + hashlib.sha1(title.encode("utf-8")).hexdigest())
+    return keys
+
+
+def title_tokens(title: Any) -> Set[str]:
+    """Content tokens of a title used for near-duplicate detection."""
+    return {t for t in normalize_title(title).split() if t not in TITLE_STOPWORDS}
+
+
+def minhash(tokens: Set[str]) -> List[int]:
+    """MinHash signature of a token set."""
+    hashes = [int.from_bytes(hashlib.blake2b(t.encode("utf-8"), digest_size=8).digest(), "big")
+              for t in tokens]
+    return [min(h ^ mask for h in hashes) for mask in _MASKS]
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Jaccard similarity of two sets."""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# Identifiers a cluster may hold at most one value of
+CONFLICT_FIELDS = (("doi", normalize_doi), ("pmid", normalize_pmid), ("arxiv", normalize_arxiv))
+
+
+def _record_ids(paper: Dict[str, Any]) -> Dict[str, str]:
+    """Normalized DOI/PMID/arXiv ID of a record (present fields only)."""
+    ids = {}
+    for field, normalize in CONFLICT_FIELDS:
+        value = normalize(paper.get(field))
+        if value:
+            ids[field] = value
+    return ids
+
+
+class _UnionFind:
+    """Union-find over records that refuses to join clusters with conflicting IDs."""
+
+    def __init__(self, papers: List[Dict[str, Any]]):
+        self.parent = list(range(len(papers)))
+        # Identifiers of each cluster, kept on its root
+        self.ids = [_record_ids(paper) for paper in papers]
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, a: int, b: int) -> bool:
+        """Join the clusters of a and b unless they carry different DOIs, PMIDs or arXiv IDs."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return True
+        ids_a, ids_b = self.ids[ra], self.ids[rb]
+        if any(ids_a[f] != ids_b[f] for f in ids_a.keys() & ids_b.keys()):
+            return False
+        # Keep the earlier record as root so output order is stable
+        if rb < ra:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        self.ids[ra] = {**self.ids[rb], **self.ids[ra]}
+        return True
+
+
+def _years_compatible(a: Dict[str, Any], b: Dict[str, Any]) -> bool:
+    """Preprint and journal versions may differ by a year, not more."""
+    ya = re.search(r"\d{4}", str(a.get("year") or ""))
+    yb = re.search(r"\d{4}", str(b.get("year") or ""))
+    if not ya or not yb:
+        return True
+    return abs(int(ya.group(0)) - int(yb.group(0))) <= 1
+
+
+def merge_records(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Merge duplicate records field by field.
+
+    Text fields keep the longest non-empty value, count fields keep the
+    maximum, and 'sources' lists every source that returned the paper.
+
+    Args:
+        records: Duplicate records, first one wins ties
+
+    Returns:
+        Merged record
+    """
+    merged: Dict[str, Any] = {}
+    sources: List[str] = []
+
+    for record in records:
+        source = record.get("source")
+        if source and source not in sources:
+            sources.append(source)
+        for extra in record.get("sources", []):
+            if extra not in sources:
+                sources.append(extra)
+
+        for field, value in record.items():
+            if field == "sources" or value in (None, "", [], {}):
+                continue
+            current = merged.get(field)
+            if current in (None, "", [], {}):
+                merged[field] = value
+            elif field in MAX_FIELDS:
+                try:
+                    merged[field] = max(current, value)
+                except TypeError:
+                    pass
+            elif field not in ID_FIELDS and field != "source" and isinstance(value, str) \
+                    and isinstance(current, str) and len(value) > len(current):
+                merged[field] = value
+
+    # Restore fields that were empty in every record (keeps the schema stable)
+    for record in records:
+        for field, value in record.items():
+            merged.setdefault(field, value)
+
+    if sources:
+        merged["sources"] = sources
+    return merged
+
+
+def cluster_papers(
+    papers: List[Dict[str, Any]],
+    near_duplicates: bool = True,
+    threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> List[List[int]]:
+    """Group indices of duplicate records.
+
+    Args:
+        papers: Paper records
+        near_duplicates: Also match near-identical titles (MinHash/LSH)
+        threshold: Token Jaccard needed for a near-duplicate title match
+
+    Returns:
+        Clusters of record indices, ordered by first occurrence
+    """
+    # Clusters never hold two different DOIs, PMIDs or arXiv IDs, even when
+    # linked through a chain of records
+    uf = _UnionFind(papers)
+
+    # Exact identity keys: one dict lookup per key
+    owner: Dict[str, int] = {}
+    for i, paper in enumerate(papers):
+        for key in identity_keys(paper):
+            if key in owner:
+                j = owner[key]
+                if key.startswith("title:") and not _years_compatible(papers[i], papers[j]):
+                    continue
+                uf.union(i, j)
+            else:
+                owner[key] = i
+
+    if near_duplicates:
+        buckets: Dict[tuple, List[int]] = defaultdict(list)
+        tokens_cache: Dict[int, Set[str]] = {}
+        for i, paper in enumerate(papers):
+            tokens = title_tokens(paper.get("title"))
+            if len(tokens) < MIN_TITLE_TOKENS:
+                continue
+            tokens_cache[i] = tokens
+            signature = minhash(tokens)
+            for band in range(BANDS):
+                bucket = buckets[(band, *signature[band * ROWS:(band + 1) * ROWS])]
+                for j in bucket[:MAX_BUCKET_COMPARISONS]:
+                    if uf.find(i) == uf.find(j):
+                        continue
+                    if (jaccard(tokens, tokens_cache[j]) >= threshold
+                            and _years_compatible(paper, papers[j])):
+                        uf.union(i, j)
+                bucket.append(i)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(papers)):
+        clusters.setdefault(uf.find(i), []).append(i)
+    return sorted(clusters.values(), key=lambda c: c[0])
+
+
+def deduplicate_papers(
+    papers: Iterable[Dict[str, Any]],
+    near_duplicates: bool = True,
+    threshold: float = NEAR_DUPLICATE_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Deduplicate paper records and merge each group of duplicates.
+
+    Args:
+        papers: Paper records from any mix of sources
+        near_duplicates: Also merge near-identical titles
+        threshold: Token Jaccard needed for a near-duplicate title match
+
+    Returns:
+        One merged record per paper, in order of first occurrence
+    """
+    papers = list(papers)
+    return [
+        merge_records([papers[i] for i in cluster]) if len(cluster) > 1 else papers[cluster[0]]
+        for cluster in cluster_papers(papers, near_duplicates, threshold)
+    ]
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+RRWrite Paper Index
+
+Local full-text index of every paper the literature clients have returned
+(plus literature_evidence.csv files), stored in SQLite FTS5 and ranked with BM25.
+
+Used by rrwrite-search-literature.py to:
+- Replay repeat queries per source without touching the network (the
+  records each source returned are stored verbatim and replayed as-is)
+- Answer related queries offline (air-gapped nodes) with BM25 ranking
+
+Index location: $RRWRITE_CACHE_DIR/paper_index.sqlite (default: ~/.cache/rrwrite)
+
+Usage:
+    python scripts/rrwrite_paper_index.py --ingest manuscript/literature_evidence.csv
+    python scripts/rrwrite_paper_index.py --ingest results.json harvest.ndjson
+    python scripts/rrwrite_paper_index.py --search "metagenome assembly" --limit 10
+    python scripts/rrwrite_paper_index.py --stats
+"""
+
+import csv
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+CACHE_DIR_ENV = "RRWRITE_CACHE_DIR"
+DEFAULT_INDEX_PATH = Path.home() / ".cache" / "rrwrite" / "paper_index.sqlite"
+
+# Fields stored per paper (text columns are merged field by field)
+PAPER_FIELDS = ["doi", "pmid", "title", "abstract", "authors", "journal", "year",
+                "citations", "source", "url", "citation_key"]
+
+
+def default_index_path() -> Path:
+    """Index path from $RRWRITE_CACHE_DIR or the per-user default."""
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    return Path(cache_dir) / "paper_index.sqlite" if cache_dir else DEFAULT_INDEX_PATH
+
+
+def normalize_query(query: str) -> str:
+    """Normalize a query for repeat-query lookups."""
+    return " ".join(query.lower().split())
+
+
+def normalize_title(title: str) -> str:
+    """Lowercase a title and strip punctuation/whitespace differences."""
+    return " ".join(re.findall(r"\w+", (title or "").lower()))
+
+
+def paper_key(paper: Dict[str, Any]) -> Optional[str]:
+    """Stable identity for a paper: DOI, then PMID, then normalized title hash."""
+    doi = (paper.get("doi") or "").strip().lower()
+    doi = re.sub(r"^(https?://(dx\.)?doi\.org/|doi:\s*)", "", doi)
+    if doi:
+        return f"doi:{doi}"
+    pmid = str(paper.get("pmid") or "").strip()
+    if pmid:
+        return f"pmid:{pmid}"
+    title = normalize_title(paper.get("title", ""))
+    if title:
+        return "title:" + hashlib.sha1(title.encode("utf-8")).hexdigest()
+    return None
+
+
+def fts_query(query: str, match_all: bool = False) -> str:
+    """Turn free text into an FTS5 query of quoted terms.
+
+    By default terms are OR-ed (BM25 ranks by overlap); match_all requires every term.
+    """
+    terms = [t for t in re.findall(r"\w+", query.lower()) if len(t) > 1]
+    operator = " AND " if match_all else " OR "
+    return operator.join(f'"{t}"' for t in dict.fromkeys(terms))
+
+
+def _to_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_year(value: Any) -> Optional[int]:
+    match = re.search(r"\b(1[89]|20)\d{2}\b", str(value or ""))
+    return int(match.group(0)) if match else None
+
+
+class PaperIndex:
+    """SQLite FTS5 index of papers with per-source query bookkeeping."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS papers (
+            id INTEGER PRIMARY KEY,
+            key TEXT UNIQUE NOT NULL,
+            doi TEXT, pmid TEXT, title TEXT, abstract TEXT, authors TEXT,
+            journal TEXT, year INTEGER, citations INTEGER, source TEXT,
+            url TEXT, citation_key TEXT, added REAL NOT NULL
+        );
+        CREATE VIRTUAL TABLE IF NOT EXISTS papers_fts USING fts5(
+            title, abstract, content='papers', content_rowid='id',
+            tokenize='porter unicode61'
+        );
+        CREATE TRIGGER IF NOT EXISTS papers_ai AFTER INSERT ON papers BEGIN
+            INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.id, new.title, new.abstract);
+        END;
+        CREATE TRIGGER IF NOT EXISTS papers_au AFTER UPDATE OF title, abstract ON papers BEGIN
+            INSERT INTO papers_fts(papers_fts, rowid, title, abstract)
+                VALUES ('delete', old.id, old.title, old.abstract);
+            INSERT INTO papers_fts(rowid, title, abstract) VALUES (new.id, new.title, new.abstract);
+        END;
+        CREATE TABLE IF NOT EXISTS queries (
+            query TEXT NOT NULL,
+            source TEXT NOT NULL,
+            max_results INTEGER NOT NULL,
+            result_count INTEGER NOT NULL,
+            fetched REAL NOT NULL,
+            PRIMARY KEY (query, source)
+        );
+        CREATE TABLE IF NOT EXISTS query_results (
+            query TEXT NOT NULL,
+            source TEXT NOT NULL,
+            rank INTEGER NOT NULL,
+            paper_id INTEGER NOT NULL,
+            record TEXT,
+            PRIMARY KEY (query, source, rank)
+        );
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        """Initialize index.
+
+        Args:
+            db_path: SQLite file (default: default_index_path())
+        """
+        self.db_path = Path(db_path) if db_path else default_index_path()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+        # Indexes created before records were stored verbatim
+        columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(query_results)")}
+        if "record" not in columns:
+            self._conn.execute("ALTER TABLE query_results ADD COLUMN record TEXT")
+
+    # ------------------------------------------------------------------
+    # Ingestion
+    # ------------------------------------------------------------------
+
+    def _upsert(self, paper: Dict[str, Any], source: Optional[str]) -> Optional[int]:
+        key = paper_key(paper)
+        if key is None:
+            return None
+
+        values = {
+            "doi": (paper.get("doi") or "").strip(),
+            "pmid": str(paper.get("pmid") or "").strip(),
+            "title": (paper.get("title") or "").strip(),
+            "abstract": (paper.get("abstract") or "").strip(),
+            "authors": paper.get("authors") or "",
+            "journal": paper.get("journal") or paper.get("venue") or "",
+            "year": _to_year(paper.get("year")),
+            "citations": _to_int(paper.get("citations") or paper.get("citationCount")),
+            "source": source or paper.get("source") or "",
+            "url": paper.get("url") or "",
+            "citation_key": paper.get("citation_key") or "",
+        }
+        if isinstance(values["authors"], list):
+            values["authors"] = ", ".join(str(a) for a in values["authors"])
+
+        # Keep existing non-empty values unless the new record has a richer one
+        self._conn.execute(
+            f"""
+            INSERT INTO papers (key, {", ".join(PAPER_FIELDS)}, added)
+            VALUES (?, {", ".join("?" for _ in PAPER_FIELDS)}, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                doi = COALESCE(NULLIF(papers.doi, ''), excluded.doi),
+                pmid = COALESCE(NULLIF(papers.pmid, ''), excluded.pmid),
+                title = CASE WHEN length(excluded.title) > length(COALESCE(papers.title, ''))
+                             THEN excluded.title ELSE papers.title END,
+                abstract = CASE WHEN length(excluded.abstract) > length(COALESCE(papers.abstract, ''))
+                                THEN excluded.abstract ELSE papers.abstract END,
+                authors = COALESCE(NULLIF(papers.authors, ''), excluded.authors),
+                journal = COALESCE(NULLIF(papers.journal, ''), excluded.journal),
+                year = COALESCE(papers.year, excluded.year),
+                citations = MAX(COALESCE(papers.citations, 0), COALESCE(excluded.citations, 0)),
+                source = COALESCE(NULLIF(excluded.source, ''), papers.source),
+                url = COALESCE(NULLIF(papers.url, ''), excluded.url),
+                citation_key = COALESCE(NULLIF(papers.citation_key, ''), excluded.citation_key)
+            """,
+            [key] + [values[f] for f in PAPER_FIELDS] + [time.time()]
+        )
+        return self._conn.execute("SELECT id FROM papers WHERE key = ?", (key,)).fetchone()[0]
+
+    def add_papers(self, papers: Iterable[Dict[str, Any]], source: Optional[str] = None) -> List[int]:
+        """Insert or merge papers.
+
+        Args:
+            papers: Paper dictionaries as returned by the API clients
+            source: Source name to store (default: each paper's 'source' field)
+
+        Returns:
+            Row ids of the papers, in input order (skipping unidentifiable ones)
+        """
+        with self._lock, self._conn:
+            ids = [self._upsert(p, source) for p in papers]
+        return [i for i in ids if i is not None]
+
+    def record_query(
+        self,
+        query: str,
+        source: str,
+        papers: List[Dict[str, Any]],
+        max_results: int
+    ) -> None:
+        """Index a source's results and remember them for repeat-query replay.
+
+        The records are stored as returned, so a replay has every field the
+        source provided (e.g. openalex_id, citationCount, pub_date).
+        """
+        norm = normalize_query(query)
+        with self._lock, self._conn:
+            ranked = [
+                (paper_id, json.dumps(paper))
+                for paper in papers
+                if (paper_id := self._upsert(paper, source)) is not None
+            ]
+            self._conn.execute("DELETE FROM query_results WHERE query = ? AND source = ?", (norm, source))
+            self._conn.executemany(
+                "INSERT INTO query_results (query, source, rank, paper_id, record) VALUES (?, ?, ?, ?, ?)",
+                [(norm, source, rank, paper_id, record) for rank, (paper_id, record) in enumerate(ranked)]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO queries (query, source, max_results, result_count, fetched) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (norm, source, max_results, len(ranked), time.time())
+            )
+
+    def ingest_file(self, path: Path) -> int:
+        """Ingest a literature_evidence.csv, search results JSON or NDJSON harvest.
+
+        Returns:
+            Number of papers ingested
+        """
+        path = Path(path)
+        if path.suffix == ".csv":
+            with open(path, newline="", encoding="utf-8") as f:
+                rows = list(csv.DictReader(f))
+            papers = []
+            for row in rows:
+                evidence = row.get("abstract") or row.get("evidence") or row.get("evidence_quote") or ""
+                papers.append({
+                    "doi": row.get("doi", ""),
+                    "title": row.get("title") or row.get("citation") or "",
+                    "abstract": evidence,
+                    "authors": row.get("authors", ""),
+                    "journal": row.get("journal", ""),
+                    "year": row.get("year", ""),
+                    "citation_key": row.get("citation_key", ""),
+                })
+            return len(self.add_papers(papers, "evidence"))
+
+        if path.suffix in (".ndjson", ".jsonl"):
+            with open(path, encoding="utf-8") as f:
+                papers = [json.loads(line) for line in f if line.strip()]
+            return len(self.add_papers(papers))
+
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        papers = data.get("papers", []) if isinstance(data, dict) else data
+        return len(self.add_papers(papers))
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _row_to_paper(row: sqlite3.Row) -> Dict[str, Any]:
+        paper = {f: row[f] for f in PAPER_FIELDS if row[f] not in (None, "")}
+        paper.setdefault("citations", 0)
+        return paper
+
+    def cached_results(
+        self,
+        query: str,
+        source: str,
+        max_results: int,
+        max_age: Optional[float] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Replay a previous (query, source) search if it covers max_results.
+
+        Args:
+            query: Search query
+            source: Source name
+            max_results: Requested results
+            max_age: Maximum age in seconds (None: any age)
+
+        Returns:
+            Papers as the source returned them, in original rank order, or
+            None if the network is needed
+        """
+        norm = normalize_query(query)
+        with self._lock:
+            meta = self._conn.execute(
+                "SELECT max_results, result_count, fetched FROM queries WHERE query = ? AND source = ?",
+                (norm, source)
+            ).fetchone()
+            # Clients report failures as an empty list, so no results is never replayed
+            if meta is None or meta["result_count"] == 0:
+                return None
+            if max_age is not None and time.time() - meta["fetched"] > max_age:
+                return None
+            # A smaller earlier request only covers us if it was exhaustive
+            if meta["max_results"] < max_results and meta["result_count"] >= meta["max_results"]:
+                return None
+
+            rows = self._conn.execute(
+                "SELECT p.*, q.record FROM query_results q JOIN papers p ON p.id = q.paper_id "
+                "WHERE q.query = ? AND q.source = ? ORDER BY q.rank LIMIT ?",
+                (norm, source, max_results)
+            ).fetchall()
+        # Rows recorded before records were stored fall back to the merged paper
+        return [json.loads(r["record"]) if r["record"] else self._row_to_paper(r) for r in rows]
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        year_min: Optional[int] = None,
+        match_all: bool = False
+    ) -> List[Dict[str, Any]]:
+        """BM25-ranked full-text search over titles and abstracts.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results
+            year_min: Optional minimum publication year
+            match_all: Require every query term (default: any term)
+
+        Returns:
+            Papers, best match first, with an 'index_score' field
+        """
+        match = fts_query(query, match_all)
+        if not match:
+            return []
+
+        sql = (
+            "SELECT p.*, bm25(papers_fts, 2.0, 1.0) AS score FROM papers_fts "
+            "JOIN papers p ON p.id = papers_fts.rowid WHERE papers_fts MATCH ?"
+        )
+        params: List[Any] = [match]
+        if year_min:
+            sql += " AND p.year >= ?"
+            params.append(year_min)
+        sql += " ORDER BY score LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+
+        papers = []
+        for row in rows:
+            paper = self._row_to_paper(row)
+            paper["index_score"] = round(-row["score"], 4)  # bm25() is lower-is-better
+            papers.append(paper)
+        return papers
+
+    def stats(self) -> Dict[str, Any]:
+        """Return paper and query counts."""
+        with self._lock:
+            papers = self._conn.execute("SELECT COUNT(*) FROM papers").fetchone()[0]
+            by_source = dict(self._conn.execute(
+                "SELECT source, COUNT(*) FROM papers GROUP BY source ORDER BY COUNT(*) DESC"
+            ).fetchall())
+            queries = self._conn.execute("SELECT COUNT(*) FROM queries").fetchone()[0]
+        return {"path": str(self.db_path), "papers": papers, "by_source": by_source, "queries": queries}
+
+
+def main():
+    """Command-line interface for the paper index."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Local full-text paper index (SQLite FTS5, BM25)")
+    parser.add_argument("--index", type=Path, help="Index file (default: $RRWRITE_CACHE_DIR/paper_index.sqlite)")
+    parser.add_argument("--ingest", type=Path, nargs="+", help="literature_evidence.csv, results JSON or NDJSON files")
+    parser.add_argument("--search", help="Full-text query")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum search results (default: 20)")
+    parser.add_argument("--stats", action="store_true", help="Print index statistics")
+
+    args = parser.parse_args()
+
+    index = PaperIndex(args.index)
+
+    for path in args.ingest or []:
+        count = index.ingest_file(path)
+        print(f"Ingested {count} papers from {path}", file=sys.stderr)
+
+    if args.search:
+        results = index.search(args.search, args.limit)
+        print(json.dumps({"query": args.search, "papers": results}, indent=2))
+
+    if args.stats:
+        print(json.dumps(index.stats(), indent=2))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+RRWrite Rate Limiter
+
+Per-host token-bucket rate limiting shared by every process on the machine.
+
+Bucket state lives in a small SQLite database next to the HTTP cache, and each
+token is taken inside an IMMEDIATE transaction, so parallel searches started by
+the gap-analysis shell scripts draw from the same bucket instead of each
+throttling on its own. A host that answers 429/503 with Retry-After is blocked
+for every process until that time has passed.
+
+Allowed rates are listed in HOST_RATES (requests/second, burst size).
+"""
+
+import random
+import sqlite3
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# host -> (requests per second, burst capacity)
+HOST_RATES: Dict[str, Tuple[float, float]] = {
+    "eutils.ncbi.nlm.nih.gov": (3.0, 1.0),     # NCBI: 3 req/s without API key
+    "api.crossref.org": (10.0, 1.0),           # CrossRef polite pool
+    "doi.org": (10.0, 1.0),
+    "api.openalex.org": (10.0, 1.0),           # OpenAlex polite pool
+    "www.ebi.ac.uk": (3.0, 1.0),               # Europe PMC
+    "api.semanticscholar.org": (1.0, 1.0),     # Shared unauthenticated pool
+}
+DEFAULT_RATE = (5.0, 1.0)
+
+# Retry policy for throttled or transient failures
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_RETRIES = 4
+BACKOFF_BASE = 1.0   # seconds
+BACKOFF_CAP = 60.0   # seconds
+
+
+def host_of(url: str) -> str:
+    """Return the host name of a URL (lowercase, no port)."""
+    return (urlparse(url).hostname or "").lower()
+
+
+def rate_for_host(host: str) -> Tuple[float, float]:
+    """Return (rate, capacity) for a host, matching parent domains too."""
+    parts = host.split(".")
+    for i in range(len(parts) - 1):
+        candidate = ".".join(parts[i:])
+        if candidate in HOST_RATES:
+            return HOST_RATES[candidate]
+    return DEFAULT_RATE
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Jittered exponential backoff ("full jitter"), never shorter than Retry-After.
+
+    Args:
+        attempt: Zero-based retry attempt
+        retry_after: Server-requested delay in seconds, if any
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
+
+
+class RateLimiter:
+    """Cross-process token bucket per host, backed by SQLite."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS buckets (
+            host TEXT PRIMARY KEY,
+            tokens REAL NOT NULL,
+            updated REAL NOT NULL,
+            blocked_until REAL NOT NULL DEFAULT 0
+        );
+    """
+
+    def __init__(self, state_dir: Path, rates: Optional[Dict[str, Tuple[float, float]]] = None):
+        """Initialize limiter.
+
+        Args:
+            state_dir: Directory for rate_limits.sqlite
+            rates: Optional host -> (rate, capacity) overrides
+        """
+        self.state_dir = Path(state_dir)
+        self.state_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.state_dir / "rate_limits.sqlite"
+        self.rates = dict(HOST_RATES)
+        if rates:
+            self.rates.update(rates)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path), timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(self.SCHEMA)
+
+    def _rate(self, host: str) -> Tuple[float, float]:
+        if host in self.rates:
+            return self.rates[host]
+        return rate_for_host(host)
+
+    def _try_acquire(self, host: str) -> float:
+        """Take a token if available.
+
+        Returns:
+            0.0 if a token was taken, otherwise seconds to wait before retrying
+        """
+        rate, capacity = self._rate(host)
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = self._conn.execute(
+                    "SELECT tokens, updated, blocked_until FROM buckets WHERE host = ?", (host,)
+                ).fetchone()
+                tokens, updated, blocked_until = row if row else (capacity, now, 0.0)
+
+                if blocked_until > now:
+                    self._conn.execute("COMMIT")
+                    return blocked_until - now
+
+                tokens = min(capacity, tokens + (now - updated) * rate)
+                if tokens >= 1.0:
+                    tokens -= 1.0
+                    wait = 0.0
+                else:
+                    wait = (1.0 - tokens) / rate
+
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO buckets (host, tokens, updated, blocked_until) "
+                    "VALUES (?, ?, ?, ?)",
+                    (host, tokens, now, blocked_until)
+                )
+                self._conn.execute("COMMIT")
+                return wait
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def acquire(self, host: str) -> float:
+        """Block until a request to host is allowed.
+
+        Args:
+            host: Host name (see host_of)
+
+        Returns:
+            Total seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            wait = self._try_acquire(host)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def block(self, host: str, seconds: float) -> None:
+        """Stop all processes from calling host for the given number of seconds.
+
+        Used when a server answers 429/503 with Retry-After.
+        """
+        until = time.time() + seconds
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO buckets (host, tokens, updated, blocked_until) VALUES (?, 0, ?, ?) "
+                "ON CONFLICT(host) DO UPDATE SET blocked_until = MAX(blocked_until, excluded.blocked_until)",
+                (host, time.time(), until)
+            )
+
+
+_shared_limiters: Dict[str, RateLimiter] = {}
+_shared_lock = threading.Lock()
+
+
+def get_limiter(state_dir: Path) -> RateLimiter:
+    """Return the process-wide RateLimiter for a state directory."""
+    key = str(Path(state_dir).resolve())
+    with _shared_lock:
+        if key not in _shared_limiters:
+            _shared_limiters[key] = RateLimiter(state_dir)
+        return _shared_limiters[key]
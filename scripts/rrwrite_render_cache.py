@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+RRWrite Render Cache
+
+Content-addressed cache of rendered figures.
+
+A figure's key is a hash of everything that determines its pixels: the bytes
+of the input table(s), the plot type and parameters, the style settings, the
+plotting code and the matplotlib/seaborn/pandas/numpy versions. On a hit the
+cached files are hardlinked (reflinked or copied across filesystems) into
+the output directory and nothing is rendered. The cache is bounded by size
+and evicts least recently used figures.
+
+Cache location: $RRWRITE_CACHE_DIR/renders (default: ~/.cache/rrwrite)
+Disable with RRWRITE_RENDER_CACHE=0; size limit RRWRITE_RENDER_CACHE_MAX_MB.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+try:
+    from rrwrite_blob_store import hash_file, link_file
+    from rrwrite_render_pool import RenderPool, RenderResult, RenderTask
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_blob_store import hash_file, link_file
+    from rrwrite_render_pool import RenderPool, RenderResult, RenderTask
+
+CACHE_DIR_ENV = "RRWRITE_CACHE_DIR"
+CACHE_ENABLED_ENV = "RRWRITE_RENDER_CACHE"
+CACHE_MAX_MB_ENV = "RRWRITE_RENDER_CACHE_MAX_MB"
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "rrwrite"
+DEFAULT_MAX_MB = 500
+
+VERSIONED_LIBRARIES = ("matplotlib", "seaborn", "pandas", "numpy")
+
+
+def render_cache_enabled() -> bool:
+    """Check whether the render cache is enabled via environment."""
+    return os.environ.get(CACHE_ENABLED_ENV, "1").lower() not in ("0", "false", "no", "off")
+
+
+def library_versions() -> Dict[str, Optional[str]]:
+    """Installed versions of the plotting libraries."""
+    versions = {}
+    for name in VERSIONED_LIBRARIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+    return versions
+
+
+def render_key(inputs: Iterable[Path], plot: Dict[str, Any], style: Dict[str, Any],
+               code: Iterable[Path] = ()) -> Optional[str]:
+    """Cache key for one figure.
+
+    Args:
+        inputs: Data files the figure is drawn from
+        plot: Plot type and parameters (JSON-serializable)
+        style: Style settings applied before drawing
+        code: Source files of the drawing code
+
+    Returns:
+        Hex key, or None if an input file is missing
+    """
+    try:
+        payload = {
+            "inputs": [hash_file(p) for p in inputs],
+            "code": [hash_file(p) for p in code],
+            "plot": plot,
+            "style": style,
+            "versions": library_versions(),
+        }
+    except OSError:
+        return None
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class RenderCache:
+    """Size-bounded, content-addressed store of rendered figure files."""
+
+    def __init__(self, cache_dir: Optional[Path] = None, max_bytes: Optional[int] = None):
+        """Initialize cache.
+
+        Args:
+            cache_dir: Cache root (default: $RRWRITE_CACHE_DIR/renders)
+            max_bytes: Size limit (default: $RRWRITE_RENDER_CACHE_MAX_MB or 500 MB)
+        """
+        if cache_dir is None:
+            cache_dir = Path(os.environ.get(CACHE_DIR_ENV, DEFAULT_CACHE_DIR)) / "renders"
+        self.cache_dir = Path(cache_dir)
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get(CACHE_MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.max_bytes = max_bytes
+
+    def _entry(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / key
+
+    def get(self, key: str, outputs: Sequence[Path]) -> bool:
+        """Link cached files for every output path.
+
+        Args:
+            key: Render key
+            outputs: Output paths (one per format, format taken from the suffix)
+
+        Returns:
+            True if all formats were cached and linked
+        """
+        entry = self._entry(key)
+        cached = [entry / f"figure{Path(out).suffix}" for out in outputs]
+        if not all(c.exists() for c in cached):
+            return False
+        for src, dst in zip(cached, outputs):
+            link_file(src, Path(dst))
+        os.utime(entry)   # Mark as recently used
+        return True
+
+    def put(self, key: str, outputs: Sequence[Path]) -> None:
+        """Store the rendered files of one figure under its key.
+
+        The files are hardlinked into the cache (reflinked or copied across
+        filesystems). Sharing is safe because outputs are unlinked before
+        they are redrawn (see render_with_cache).
+        """
+        entry = self._entry(key)
+        tmp = entry.with_name(f"{key}.tmp{os.getpid()}")
+        tmp.mkdir(parents=True, exist_ok=True)
+        for out in outputs:
+            link_file(Path(out), tmp / f"figure{Path(out).suffix}")
+        if entry.exists():
+            shutil.rmtree(tmp)
+        else:
+            try:
+                os.replace(tmp, entry)
+            except OSError:
+                shutil.rmtree(tmp, ignore_errors=True)   # Another process stored it first
+        self.evict()
+
+    def _entries(self) -> List[Path]:
+        if not self.cache_dir.exists():
+            return []
+        return [e for shard in self.cache_dir.iterdir() if shard.is_dir()
+                for e in shard.iterdir() if e.is_dir() and ".tmp" not in e.name]
+
+    def size(self) -> int:
+        """Total bytes stored."""
+        return sum(f.stat().st_size for e in self._entries() for f in e.iterdir())
+
+    def evict(self) -> int:
+        """Remove least recently used figures until the cache is below 90% of its limit.
+
+        Returns:
+            Number of figures removed
+        """
+        entries = []
+        total = 0
+        for entry in self._entries():
+            size = sum(f.stat().st_size for f in entry.iterdir())
+            entries.append((entry.stat().st_mtime, size, entry))
+            total += size
+        if total <= self.max_bytes:
+            return 0
+
+        removed = 0
+        target = self.max_bytes * 0.9
+        for _, size, entry in sorted(entries, key=lambda e: e[0]):
+            if total <= target:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+
+def render_with_cache(
+    pool: RenderPool,
+    tasks: Sequence[RenderTask],
+    keys: Sequence[Optional[str]],
+    outputs: Sequence[Sequence[Path]],
+    cache: Optional[RenderCache] = None
+) -> List[RenderResult]:
+    """Render only the tasks whose figures are not cached.
+
+    Args:
+        pool: Pool used for cache misses
+        tasks: Render tasks; each must return the list of paths it wrote
+        keys: Render key per task (None = do not cache)
+        outputs: Expected output paths per task
+        cache: Render cache (default: shared cache unless disabled by environment)
+
+    Returns:
+        Results in task order; hits have cached=True and the linked paths as value
+    """
+    if cache is None and render_cache_enabled():
+        cache = RenderCache()
+
+    results: List[Optional[RenderResult]] = [None] * len(tasks)
+    misses = []
+    for i, (task, key, paths) in enumerate(zip(tasks, keys, outputs)):
+        if cache is not None and key and cache.get(key, paths):
+            results[i] = RenderResult(task.name, list(paths), cached=True)
+        else:
+            # Never draw into a file that may be hardlinked to a cache entry
+            for path in paths:
+                Path(path).unlink(missing_ok=True)
+            misses.append(i)
+
+    rendered = pool.map([tasks[i] for i in misses]) if misses else []
+    for i, result in zip(misses, rendered):
+        results[i] = result
+        if cache is not None and keys[i] and not result.error and result.value:
+            written = [Path(p) for p in result.value]
+            if all(p.exists() for p in written):
+                cache.put(keys[i], written)
+    return results
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+RRWrite Render Pool
+
+Process pool for rendering many figures at once.
+
+matplotlib keeps global pyplot state and its renderers hold the GIL, so
+figures are rendered in separate processes. Each worker imports and styles
+matplotlib/seaborn once (the `setup` callable runs as the pool initializer)
+and then renders any number of tasks. Small batches are rendered in-process
+to avoid paying for process start-up.
+
+Tasks are (name, callable, args) triples; the callable and its arguments
+must be picklable (module-level functions or static methods).
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+# Below this many tasks, rendering in-process is faster than starting workers
+MIN_PARALLEL_TASKS = 2
+
+
+@dataclass
+class RenderTask:
+    """One figure to render."""
+    name: str
+    func: Callable[..., Any]
+    args: tuple = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class RenderResult:
+    """Outcome of a RenderTask."""
+    name: str
+    value: Any = None
+    error: Optional[str] = None
+    cached: bool = False
+
+
+def default_workers(n_tasks: int) -> int:
+    """Number of worker processes for a batch (one per core, at most one per task)."""
+    return max(1, min(n_tasks, os.cpu_count() or 1))
+
+
+def _init_worker(setup: Optional[Callable], setup_args: tuple) -> None:
+    if setup is not None:
+        setup(*setup_args)
+
+
+def _run_task(task: RenderTask) -> RenderResult:
+    try:
+        return RenderResult(task.name, task.func(*task.args, **task.kwargs))
+    except Exception as e:
+        return RenderResult(task.name, error=f"{type(e).__name__}: {e}")
+
+
+class RenderPool:
+    """Render a batch of figures across worker processes."""
+
+    def __init__(
+        self,
+        setup: Optional[Callable] = None,
+        setup_args: tuple = (),
+        workers: Optional[int] = None
+    ):
+        """Initialize pool.
+
+        Args:
+            setup: Called once per worker before rendering (imports, styles)
+            setup_args: Arguments for setup
+            workers: Worker processes (default: one per core)
+        """
+        self.setup = setup
+        self.setup_args = setup_args
+        self.workers = workers
+
+    def map(self, tasks: Sequence[RenderTask]) -> List[RenderResult]:
+        """Render all tasks.
+
+        A failing task is reported in its RenderResult and does not stop the
+        rest of the batch.
+
+        Args:
+            tasks: Tasks to render
+
+        Returns:
+            Results in task order
+        """
+        tasks = list(tasks)
+        workers = self.workers or default_workers(len(tasks))
+
+        if workers <= 1 or len(tasks) < MIN_PARALLEL_TASKS:
+            _init_worker(self.setup, self.setup_args)
+            return [_run_task(task) for task in tasks]
+
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.setup, self.setup_args)
+            ) as executor:
+                return list(executor.map(_run_task, tasks))
+        except (OSError, RuntimeError) as e:
+            # No process support (e.g., restricted sandbox): render serially
+            print(f"Warning: render pool unavailable ({e}), rendering serially", file=sys.stderr)
+            _init_worker(self.setup, self.setup_args)
+            return [_run_task(task) for task in tasks]
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+RRWrite Repository Index
+
+Single-pass, in-memory index of a repository's files.
+
+The tree is walked once with os.scandir. Skipped directories (.git,
+node_modules, virtualenvs, ...) are pruned during the walk, so their contents
+are never read. Each file gets its stat result and category, and the glob
+pattern queries used by the repo analyzers are answered from memory instead of
+one rglob per pattern.
+
+A directory listing can be supplied by a `reuse` callback (see
+rrwrite_analysis_cache), in which case that directory is not read at all.
+"""
+
+import fnmatch
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional
+
+# Directories never descended into
+SKIP_DIRS = {'.git', '__pycache__', '.ipynb_checkpoints', 'node_modules', '.venv', 'venv',
+             'env', '.env', 'dist', 'build', '.pytest_cache', '.mypy_cache', '.tox'}
+
+# File patterns for each category (first match wins, in this order)
+CATEGORY_PATTERNS = {
+    'config': ['requirements.txt', 'environment.yml', 'setup.py', 'pyproject.toml', 'Pipfile', 'package.json'],
+    'data': ['*.csv', '*.tsv', '*.xlsx', '*.xls', '*.json', '*.xml', '*.h5', '*.hdf5', '*.parquet'],
+    'script': ['*.py', '*.ipynb', '*.r', '*.R', '*.jl', '*.m', '*.sh'],
+    'figure': ['*.png', '*.jpg', '*.jpeg', '*.pdf', '*.svg', '*.eps'],
+    'doc': ['*.md', '*.rst', '*.txt'],
+}
+
+
+@dataclass
+class IndexedFile:
+    """A file recorded by RepoIndex."""
+    path: Path
+    rel_path: str
+    size: int
+    mtime: float
+    category: str
+
+
+class DirChild(NamedTuple):
+    """An entry directly inside an indexed directory."""
+    name: str
+    path: Path
+    is_dir: bool
+
+
+# Per-directory listing: {'files': [[name, size, mtime], ...], 'subdirs': [name, ...]}
+DirSnapshot = Dict[str, List[Any]]
+
+
+def _compile_patterns(patterns: Iterable[str]) -> 're.Pattern':
+    """Compile glob patterns into one case-sensitive regex (like Path.rglob on POSIX)."""
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+class RepoIndex:
+    """In-memory index of all files in a repository, built with one walk."""
+
+    def __init__(
+        self,
+        root: Path,
+        skip_dirs: Optional[Iterable[str]] = None,
+        reuse: Optional[Callable[[Path], Optional[DirSnapshot]]] = None
+    ):
+        """Walk the repository and index it.
+
+        Args:
+            root: Repository root (indexed paths are built on it as given)
+            skip_dirs: Directory names to prune (default: SKIP_DIRS)
+            reuse: Optional callback returning a cached listing of a directory
+                (or None to read it from disk)
+        """
+        self.root = Path(root)
+        self.skip_dirs = set(SKIP_DIRS if skip_dirs is None else skip_dirs)
+        self.files: List[IndexedFile] = []
+        self.dirs: List[Path] = []
+        self._by_path: Dict[Path, IndexedFile] = {}
+        self._by_dir: Dict[Path, List[IndexedFile]] = {}
+        self._children: Dict[Path, List[DirChild]] = {}
+        self._snapshots: Dict[str, DirSnapshot] = {}
+        self._reuse = reuse
+        self.reused_dirs = 0
+        self._pattern_cache: Dict[tuple, List[Path]] = {}
+        self._category_res = {
+            category: _compile_patterns(patterns)
+            for category, patterns in CATEGORY_PATTERNS.items()
+        }
+        self._walk()
+
+    def _categorize(self, name: str) -> str:
+        for category, regex in self._category_res.items():
+            if regex.match(name):
+                return category
+        return 'other'
+
+    def _scan(self, directory: Path) -> Optional[DirSnapshot]:
+        """Read one directory from disk into a snapshot."""
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return None
+
+        snapshot: DirSnapshot = {'files': [], 'subdirs': []}
+        for entry in entries:
+            if entry.name in self.skip_dirs:
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    snapshot['subdirs'].append(entry.name)
+                elif entry.is_file():
+                    st = entry.stat()
+                    snapshot['files'].append([entry.name, st.st_size, st.st_mtime])
+            except OSError:
+                continue
+        return snapshot
+
+    def _walk(self) -> None:
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            rel_dir = directory.relative_to(self.root).as_posix()
+            if rel_dir == '.':
+                rel_dir = ''
+
+            snapshot = self._reuse(directory) if self._reuse else None
+            if snapshot is not None:
+                self.reused_dirs += 1
+            else:
+                snapshot = self._scan(directory)
+                if snapshot is None:
+                    continue
+            self._snapshots[rel_dir] = snapshot
+
+            children = []
+            for name in snapshot['subdirs']:
+                path = directory / name
+                self.dirs.append(path)
+                stack.append(path)
+                children.append(DirChild(name, path, True))
+
+            for name, size, mtime in snapshot['files']:
+                path = directory / name
+                indexed = IndexedFile(
+                    path=path,
+                    rel_path=f"{rel_dir}/{name}" if rel_dir else name,
+                    size=size,
+                    mtime=mtime,
+                    category=self._categorize(name)
+                )
+                self.files.append(indexed)
+                self._by_path[path] = indexed
+                self._by_dir.setdefault(directory, []).append(indexed)
+                children.append(DirChild(name, path, False))
+            self._children[directory] = children
+
+        self.files.sort(key=lambda f: f.path)
+        self.dirs.sort()
+
+    def __len__(self) -> int:
+        return len(self.files)
+
+    def find(self, patterns: Iterable[str]) -> List[Path]:
+        """Return sorted paths of files whose name matches any glob pattern.
+
+        Args:
+            patterns: Glob patterns on the file name (e.g. '*.py', 'README.md')
+
+        Returns:
+            Matching file paths
+        """
+        key = tuple(patterns)
+        if key not in self._pattern_cache:
+            regex = _compile_patterns(key)
+            self._pattern_cache[key] = [f.path for f in self.files if regex.match(f.path.name)]
+        return list(self._pattern_cache[key])
+
+    def in_category(self, category: str) -> List[Path]:
+        """Return sorted paths of files in a category (see CATEGORY_PATTERNS)."""
+        return [f.path for f in self.files if f.category == category]
+
+    def stat(self, path: Path) -> Optional[IndexedFile]:
+        """Return the recorded entry for a file, or None if not indexed."""
+        return self._by_path.get(path if isinstance(path, Path) else Path(path))
+
+    def stat_many(self, paths: Iterable[Path]) -> List[Optional[IndexedFile]]:
+        """Return the entries for many files at once (None where not indexed).
+
+        Lookups are by Path; pass the Path objects returned by find() or
+        in_category(). Strings are not converted and come back as None.
+        """
+        return list(map(self._by_path.get, paths))
+
+    def files_in_dir(self, directory: Path) -> List[IndexedFile]:
+        """Return the files directly inside a directory."""
+        return list(self._by_dir.get(Path(directory), []))
+
+    def children(self, directory: Path) -> List[DirChild]:
+        """Return the non-skipped entries directly inside a directory."""
+        return list(self._children.get(Path(directory), []))
+
+    def snapshots(self) -> Dict[str, DirSnapshot]:
+        """Per-directory listings keyed by relative directory ('' for the root)."""
+        return dict(self._snapshots)
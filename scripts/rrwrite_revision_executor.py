@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+RRWrite Revision Executor
+
+Runs the section revisers of one revision iteration concurrently.
+
+Sections are independent files and revisers spend most of their time
+waiting on LLM calls, so each section is revised in its own worker thread
+(bounded by `workers`). An iteration takes about as long as its slowest
+section instead of the sum of all sections.
+
+- Each passing revision is written atomically (temporary file + rename), so
+  an interrupted run never leaves a half-written section.
+- Outcomes are returned in job order, regardless of completion order, so
+  callers can print deterministic logs.
+- A reviser that raises is reported in its outcome and does not stop the
+  other sections.
+
+Set RRWRITE_REVISION_WORKERS to change the default number of workers.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+try:
+    from rrwrite_revision_context import RevisionContext
+    from rrwrite_revision_parser import Issue
+    from rrwrite_section_reviser import RevisionResult, get_reviser
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_revision_context import RevisionContext
+    from rrwrite_revision_parser import Issue
+    from rrwrite_section_reviser import RevisionResult, get_reviser
+
+WORKERS_ENV = 'RRWRITE_REVISION_WORKERS'
+
+# Revisions are I/O bound (LLM calls), so this is not tied to the core count
+DEFAULT_WORKERS = 4
+
+
+@dataclass
+class SectionJob:
+    """One section to revise."""
+    section: str
+    section_file: Path
+    issues: List[Issue] = field(default_factory=list)
+
+
+@dataclass
+class SectionOutcome:
+    """Outcome of a SectionJob."""
+    section: str
+    section_file: Path
+    result: Optional[RevisionResult] = None
+    error: Optional[str] = None      # Exception raised by the reviser
+    saved: bool = False
+    seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return self.result is not None and self.result.success
+
+
+def default_workers(n_jobs: int) -> int:
+    """Number of worker threads for an iteration (at most one per section)."""
+    try:
+        workers = int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS))
+    except ValueError:
+        workers = DEFAULT_WORKERS
+    return max(1, min(n_jobs, workers))
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Replace a file's content without exposing a partial write."""
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.tmp{os.getpid()}")
+    try:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class RevisionExecutor:
+    """Revise sections concurrently with a bounded thread pool."""
+
+    def __init__(
+        self,
+        context: RevisionContext,
+        workers: Optional[int] = None,
+        dry_run: bool = False
+    ):
+        """Initialize executor.
+
+        Args:
+            context: Shared revision context (read-only during revision)
+            workers: Maximum concurrent sections (default: RRWRITE_REVISION_WORKERS or 4)
+            dry_run: If True, revise but don't save
+        """
+        self.context = context
+        self.workers = workers
+        self.dry_run = dry_run
+
+    def _revise(self, job: SectionJob) -> SectionOutcome:
+        start = time.perf_counter()
+        outcome = SectionOutcome(job.section, job.section_file)
+        try:
+            reviser = get_reviser(job.section, job.section_file, job.issues, self.context)
+            outcome.result = reviser.revise()
+            if not self.dry_run and outcome.result.success:
+                write_atomic(job.section_file, outcome.result.content)
+                outcome.saved = True
+        except Exception as e:
+            outcome.error = f"{type(e).__name__}: {e}"
+        outcome.seconds = time.perf_counter() - start
+        return outcome
+
+    def run(self, jobs: Sequence[SectionJob]) -> List[SectionOutcome]:
+        """Revise all sections.
+
+        Args:
+            jobs: Sections to revise
+
+        Returns:
+            Outcomes in job order
+        """
+        jobs = list(jobs)
+        workers = self.workers or default_workers(len(jobs))
+        if workers <= 1 or len(jobs) < 2:
+            return [self._revise(job) for job in jobs]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rrwrite-revise') as executor:
+            return list(executor.map(self._revise, jobs))
@@ -404,26 +404,28 @@ class CritiqueParser:
 
         return None
 
-    def infer_all_sections(self, issues: List[Issue]) -> List[Issue]:
+    def infer_all_sections(self, issues: List[Issue], manuscript_content: Optional[str] = None) -> List[Issue]:
         """Infer section for all issues using manuscript context.
 
         Args:
             issues: List of Issue objects
+            manuscript_content: Assembled manuscript, if already in memory
+                (default: read full_manuscript.md or manuscript_full.md)
 
         Returns:
             Updated list with section field populated
         """
-        # Load manuscript content (try both naming conventions)
-        manuscript_file = self.manuscript_dir / "full_manuscript.md"
-        if not manuscript_file.exists():
-            manuscript_file = self.manuscript_dir / "manuscript_full.md"
-
-        manuscript_content = None
-        if manuscript_file.exists():
-            with open(manuscript_file, 'r') as f:
-                manuscript_content = f.read()
-        else:
-            self.logger.warning(f"Manuscript not found: {manuscript_file}")
+        if manuscript_content is None:
+            # Load manuscript content (try both naming conventions)
+            manuscript_file = self.manuscript_dir / "full_manuscript.md"
+            if not manuscript_file.exists():
+                manuscript_file = self.manuscript_dir / "manuscript_full.md"
+
+            if manuscript_file.exists():
+                with open(manuscript_file, 'r') as f:
+                    manuscript_content = f.read()
+            else:
+                self.logger.warning(f"Manuscript not found: {manuscript_file}")
 
         # Infer section for each issue
         for issue in issues:
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+RRWrite Revision Pipeline
+
+In-process assembly, critique and comment embedding for the revision loop.
+
+Each revision iteration used to start one Python process per stage
+(assemble, content critique, format critique) and then parse the markdown
+reports back into issues. Here the stages are library calls on a shared
+in-memory manuscript:
+
+      assembly ──┬─→ content critique
+                 └─→ format critique
+
+- The ManuscriptAssembler is kept between iterations, so only revised
+  sections are re-read.
+- The assembled text is handed to both reviewers, which run in parallel.
+- Reviewers return structured issues directly. The markdown reports are
+  still written for authors and for later runs, but are not parsed again.
+
+Stages are run by run_stages(), a small DAG runner that starts each stage
+as soon as its dependencies have finished.
+"""
+
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+try:
+    from rrwrite_manuscript_assembler import AssemblyResult, ManuscriptAssembler
+    from rrwrite_revision_parser import Issue
+    from rrwrite_script_loader import load_script_module
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_manuscript_assembler import AssemblyResult, ManuscriptAssembler
+    from rrwrite_revision_parser import Issue
+    from rrwrite_script_loader import load_script_module
+
+CONTENT_SCRIPT = 'rrwrite-critique-content.py'
+FORMAT_SCRIPT = 'rrwrite-critique-format.py'
+EMBED_SCRIPT = 'rrwrite-embed-critique-comments.py'
+
+
+class PipelineError(Exception):
+    """A pipeline stage failed."""
+
+    def __init__(self, stage: str, error: Any):
+        super().__init__(f"{stage}: {error}")
+        self.stage = stage
+        self.error = error
+
+
+@dataclass
+class Stage:
+    """A named unit of work and the stages it depends on."""
+    name: str
+    func: Callable[[Dict[str, Any]], Any]   # Called with the results of its dependencies
+    deps: Tuple[str, ...] = ()
+
+
+def run_stages(stages: Sequence[Stage], workers: Optional[int] = None) -> Dict[str, Any]:
+    """Run stages in dependency order, independent stages in parallel.
+
+    Args:
+        stages: Stages to run (dependencies must be in the list)
+        workers: Maximum concurrent stages (default: number of stages)
+
+    Returns:
+        Stage name → return value
+
+    Raises:
+        PipelineError: For the first stage that fails; no new stages are
+            started after a failure
+    """
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        unknown = [dep for dep in stage.deps if dep not in by_name]
+        if unknown:
+            raise ValueError(f"Stage {stage.name} depends on unknown stage(s): {', '.join(unknown)}")
+
+    results: Dict[str, Any] = {}
+    pending = list(stages)
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers or max(1, len(stages)),
+                            thread_name_prefix='rrwrite-pipeline') as executor:
+        while pending or running:
+            for stage in [s for s in pending if all(dep in results for dep in s.deps)]:
+                pending.remove(stage)
+                inputs = {dep: results[dep] for dep in stage.deps}
+                running[executor.submit(stage.func, inputs)] = stage
+            if not running:
+                raise ValueError(f"Dependency cycle between stages: {', '.join(s.name for s in pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                error = future.exception()
+                if error is not None:
+                    # Let running stages finish, but start nothing new
+                    pending.clear()
+                    wait(running)
+                    if isinstance(error, PipelineError):
+                        raise error
+                    raise PipelineError(stage.name, error) from error
+                results[stage.name] = future.result()
+    return results
+
+
+@dataclass
+class CritiqueReport:
+    """Issues found by one reviewer, and the report written for them."""
+    kind: str                    # 'content' or 'format'
+    path: Path
+    issues: List[Issue]
+    findings: List[Dict[str, str]] = field(default_factory=list)   # Reviewer dicts, with severity
+
+
+def _content_findings(reviewer) -> List[Dict[str, str]]:
+    # Report order: major issues first, then minor
+    return ([i for i in reviewer.issues if i['severity'] == 'major']
+            + [i for i in reviewer.issues if i['severity'] == 'minor'])
+
+
+def _format_findings(reviewer) -> List[Dict[str, str]]:
+    # Formatting issues are reported as major, warnings as minor
+    return ([dict(i, severity='major') for i in reviewer.issues]
+            + [dict(w, severity='minor') for w in reviewer.warnings])
+
+
+def _issues(findings: List[Dict[str, str]], source_file: Path) -> List[Issue]:
+    """Issues as CritiqueParser would read them from the written report."""
+    return [
+        Issue(
+            severity=f['severity'],
+            category=f['category'],
+            description=f['description'],
+            action=f['action'],
+            source_file=str(source_file)
+        )
+        for f in findings
+    ]
+
+
+class RevisionPipeline:
+    """Assembly and critique stages over a shared in-memory manuscript."""
+
+    def __init__(self, manuscript_dir: Path, journal: Optional[str] = None):
+        """Initialize pipeline.
+
+        Args:
+            manuscript_dir: Manuscript directory (sections directly or in sections/)
+            journal: Target journal for the format review
+        """
+        self.manuscript_dir = Path(manuscript_dir)
+        self.journal = journal
+        self.assembler = ManuscriptAssembler(self.manuscript_dir)
+        self.assembly: Optional[AssemblyResult] = None
+        self._lock = threading.Lock()
+
+    @property
+    def manuscript_text(self) -> Optional[str]:
+        """Text of the last assembly."""
+        return self.assembly.text if self.assembly else None
+
+    @property
+    def manuscript_file(self) -> Path:
+        return self.assembly.output_file if self.assembly else self.manuscript_dir / 'full_manuscript.md'
+
+    # Stages
+
+    def assemble(self) -> AssemblyResult:
+        """Assemble the manuscript (re-reading only changed sections)."""
+        with self._lock:
+            result = self.assembler.assemble()
+            if not result.sections:
+                raise FileNotFoundError(f"No section files found in {self.manuscript_dir}")
+            self.assembly = result
+            return result
+
+    def critique_content(self, version: int) -> CritiqueReport:
+        """Review content and write critique_content_v{version}.md."""
+        module = load_script_module(CONTENT_SCRIPT)
+        reviewer = module.ContentReviewer(self.manuscript_file, content=self.manuscript_text)
+        reviewer.run_review()
+        path = self.manuscript_dir / f"critique_content_v{version}.md"
+        reviewer.generate_report(path)
+        findings = _content_findings(reviewer)
+        return CritiqueReport('content', path, _issues(findings, path), findings)
+
+    def critique_format(self, version: int) -> CritiqueReport:
+        """Review formatting and write critique_format_v{version}.md."""
+        module = load_script_module(FORMAT_SCRIPT)
+        reviewer = module.FormatReviewer(self.manuscript_file, self.journal, content=self.manuscript_text)
+        reviewer.run_review()
+        path = self.manuscript_dir / f"critique_format_v{version}.md"
+        reviewer.generate_report(path)
+        findings = _format_findings(reviewer)
+        return CritiqueReport('format', path, _issues(findings, path), findings)
+
+    def run_iteration(self, version: int) -> Tuple[AssemblyResult, List[CritiqueReport]]:
+        """Re-assemble the manuscript and critique it as version `version`.
+
+        Returns:
+            (assembly result, [content report, format report])
+
+        Raises:
+            PipelineError: If a stage fails ('assembly', 'content critique'
+                or 'format critique')
+        """
+        results = run_stages([
+            Stage('assembly', lambda _: self.assemble()),
+            Stage('content critique', lambda _: self.critique_content(version), ('assembly',)),
+            Stage('format critique', lambda _: self.critique_format(version), ('assembly',)),
+        ])
+        return results['assembly'], [results['content critique'], results['format critique']]
+
+    def embed_comments(
+        self,
+        version: int,
+        reports: Optional[List[CritiqueReport]] = None,
+        unresolved_only: bool = True
+    ) -> Path:
+        """Write manuscript_with_comments_v{version}.docx.
+
+        Args:
+            version: Critique version
+            reports: Reports from run_iteration() (default: parse the
+                critique files of this version)
+            unresolved_only: Only include unresolved issues
+
+        Returns:
+            Path to the generated .docx
+
+        Raises:
+            PipelineError: If python-docx is missing or generation fails
+        """
+        module = load_script_module(EMBED_SCRIPT)
+        if not module.DOCX_AVAILABLE:
+            raise PipelineError('comment embedding', "python-docx not installed (pip install python-docx lxml)")
+
+        embedder = module.CritiqueCommentEmbedder(self.manuscript_dir, version)
+        if reports is None:
+            embedder.parse_critique_reports()
+        else:
+            for report in reports:
+                embedder.add_issues(report.findings, report.kind)
+        try:
+            return embedder.generate_docx_with_comments(
+                unresolved_only=unresolved_only,
+                markdown_file=self.manuscript_file if self.assembly else None
+            )
+        except Exception as e:
+            raise PipelineError('comment embedding', e) from e
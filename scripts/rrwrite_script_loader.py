@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+RRWrite Script Loader
+
+Import hyphenated CLI scripts (e.g. rrwrite-validate-manuscript.py) as
+modules, so long-running processes can call their classes and functions
+in-process instead of starting a new Python interpreter per stage.
+"""
+
+import importlib.util
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+SCRIPTS_DIR = Path(__file__).parent
+
+_module_cache: Dict[str, Any] = {}
+_module_lock = threading.Lock()
+
+
+def load_script_module(script_name: str):
+    """Import a hyphenated script from the scripts directory as a module.
+
+    Modules are cached, so each script is imported at most once per process.
+
+    Args:
+        script_name: File name of the script (e.g., 'rrwrite-api-pubmed.py')
+
+    Returns:
+        Loaded module object
+    """
+    with _module_lock:
+        if script_name in _module_cache:
+            return _module_cache[script_name]
+
+        script_path = SCRIPTS_DIR / script_name
+        module_name = script_path.stem.replace("-", "_")
+        spec = importlib.util.spec_from_file_location(module_name, script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        _module_cache[script_name] = module
+        return module
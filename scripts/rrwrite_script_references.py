@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+RRWrite Script Reference Index
+
+Reverse index from output file names to the scripts that produce them.
+
+All Python/R scripts and Jupyter notebooks in a repository are tokenized
+once. Every string literal that looks like a file name is indexed under its
+base name and stem, and literals passed to writer calls (savefig, to_csv,
+ggsave, write.table, ...) are marked as outputs. Looking up the script that
+generated a figure or table is then a dictionary hit, regardless of which
+directory the script lives in.
+"""
+
+import io
+import json
+import re
+import tokenize
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+SCRIPT_PATTERNS = ['*.py', '*.R', '*.r', '*.ipynb']
+
+# Calls whose string arguments name files being written
+WRITER_CALLS = {
+    # Python
+    'savefig', 'to_csv', 'to_excel', 'to_parquet', 'to_json', 'to_html',
+    'write_image', 'write_html', 'imsave', 'save', 'savetxt', 'dump',
+    # R
+    'ggsave', 'write.table', 'write.csv', 'write.csv2', 'write.delim',
+    'write_tsv', 'write_csv', 'write.xlsx', 'write_xlsx', 'png', 'pdf',
+    'svg', 'jpeg', 'tiff', 'saveRDS', 'fwrite',
+}
+
+# Literals longer than this are prose or code, not file names
+MAX_NAME_LENGTH = 255
+
+_R_STRING = re.compile(r'"((?:[^"\\\n]|\\.)*)"|\'((?:[^\'\\\n]|\\.)*)\'')
+_R_CALL = re.compile(r'([A-Za-z_.][\w.]*)\s*\(')
+_PLACEHOLDER = re.compile(r'\{[^}]*\}|%[-+ #0-9.]*[sdifgr]')
+
+
+@dataclass(frozen=True)
+class ScriptReference:
+    """A script that mentions an output file."""
+    script: str
+    writes: bool
+
+
+def _split_literal(literal: str, fragment: bool = False) -> Tuple[Optional[str], Optional[str]]:
+    """Interpret a string literal as an output file name.
+
+    Args:
+        literal: String literal contents
+        fragment: Literal is the text part of an f-string (Python 3.12+ tokens)
+
+    Returns:
+        (name, tail): the base name of a plain literal, or for a formatted
+        name (f-string, str.format, %-format) its literal tail such as
+        "_heatmap.png"; either may be None
+    """
+    if not literal or len(literal) > MAX_NAME_LENGTH or any(c.isspace() for c in literal):
+        return None, None
+    name = re.split(r'[/\\]', literal)[-1]
+    pieces = _PLACEHOLDER.split(name)
+    if len(pieces) == 1 and not fragment:
+        return name or None, None
+    tail = pieces[-1]
+    stem = tail.rsplit('.', 1)[0].strip('_-.') if '.' in tail else ''
+    # "_heatmap.png" identifies a figure family; ".png" alone does not
+    return None, tail if len(stem) >= 3 else None
+
+
+def _python_literals(source: str) -> List[Tuple[str, bool, bool]]:
+    """(string literal, inside a writer call, f-string fragment) from Python source."""
+    literals = []
+    call_stack: List[bool] = []
+    previous = None
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            if tok.type == tokenize.OP and tok.string == '(':
+                call_stack.append(previous is not None and previous.type == tokenize.NAME
+                                  and previous.string in WRITER_CALLS)
+            elif tok.type == tokenize.OP and tok.string == ')' and call_stack:
+                call_stack.pop()
+            elif tok.type == tokenize.STRING:
+                value = re.sub(r'^[rRbBuUfF]*', '', tok.string)
+                quote = value[:3] if value[:3] in ('"""', "'''") else value[:1]
+                literals.append((value[len(quote):len(value) - len(quote)], any(call_stack), False))
+            elif getattr(tokenize, 'FSTRING_MIDDLE', None) == tok.type:
+                literals.append((tok.string, any(call_stack), True))
+            if tok.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.COMMENT):
+                previous = tok
+    except (tokenize.TokenError, SyntaxError, IndentationError):
+        pass   # Keep what was read before the error
+    return literals
+
+
+def _r_literals(source: str) -> List[Tuple[str, bool, bool]]:
+    """(string literal, inside a writer call, False) from R source."""
+    writer_spans = []
+    for call in _R_CALL.finditer(source):
+        if call.group(1) in WRITER_CALLS:
+            depth, end = 1, call.end()
+            while end < len(source) and depth:
+                depth += {'(': 1, ')': -1}.get(source[end], 0)
+                end += 1
+            writer_spans.append((call.end(), end))
+
+    literals = []
+    for match in _R_STRING.finditer(source):
+        value = match.group(1) if match.group(1) is not None else match.group(2)
+        writes = any(start <= match.start() < end for start, end in writer_spans)
+        literals.append((value, writes, False))
+    return literals
+
+
+def _notebook_literals(text: str) -> List[Tuple[str, bool, bool]]:
+    """String literals from the code cells of a Jupyter notebook."""
+    try:
+        notebook = json.loads(text)
+    except ValueError:
+        return []
+    language = notebook.get('metadata', {}).get('kernelspec', {}).get('language', 'python')
+    extract = _r_literals if str(language).lower() == 'r' else _python_literals
+    literals = []
+    for cell in notebook.get('cells', []):
+        if cell.get('cell_type') != 'code':
+            continue
+        source = cell.get('source', '')
+        if isinstance(source, list):
+            source = ''.join(source)
+        # IPython magics and shell escapes are not Python
+        source = '\n'.join('' if line.lstrip().startswith(('%', '!')) else line
+                           for line in source.splitlines())
+        literals.extend(extract(source))
+    return literals
+
+
+def script_literals(path: Path) -> List[Tuple[str, bool, bool]]:
+    """(string literal, inside a writer call, f-string fragment) from a script or notebook."""
+    try:
+        text = Path(path).read_text(errors='ignore')
+    except OSError:
+        return []
+    suffix = Path(path).suffix.lower()
+    if suffix == '.ipynb':
+        return _notebook_literals(text)
+    if suffix == '.r':
+        return _r_literals(text)
+    return _python_literals(text)
+
+
+class ScriptReferenceIndex:
+    """Reverse index: output file name or stem → scripts referencing it."""
+
+    def __init__(self, root: Path, scripts: Iterable[Path]):
+        """Tokenize every script once and build the index.
+
+        Args:
+            root: Repository root (script paths are stored relative to it)
+            scripts: Script and notebook files to scan
+        """
+        self.root = Path(root)
+        self._refs: Dict[str, Set[ScriptReference]] = defaultdict(set)
+        # Literal tails of formatted names, e.g. "_heatmap.png" from f"{name}_heatmap.png"
+        self._suffixes: Dict[str, Set[ScriptReference]] = defaultdict(set)
+
+        for script in scripts:
+            rel = str(Path(script).relative_to(self.root))
+            for literal, writes, fragment in script_literals(script):
+                name, tail = _split_literal(literal, fragment)
+                ref = ScriptReference(rel, writes)
+                if name:
+                    self._refs[name].add(ref)
+                    stem = name.rsplit('.', 1)[0] if '.' in name[1:] else None
+                    if stem:
+                        self._refs[stem].add(ref)
+                if tail:
+                    self._suffixes[tail].add(ref)
+
+        # A name ends with a known tail iff its last len(tail) characters are
+        # one: one dict probe per distinct tail length instead of a scan
+        self._suffix_lengths = sorted({len(tail) for tail in self._suffixes})
+
+    def __len__(self) -> int:
+        return len(self._refs)
+
+    def lookup(self, file_path: Path) -> List[str]:
+        """Scripts referencing a file, most likely generator first.
+
+        Scripts that pass the name to a writer call rank before scripts that
+        only mention it; ties prefer scripts in the file's own directory.
+
+        Args:
+            file_path: Output file (absolute or relative to the root)
+
+        Returns:
+            Script paths relative to the root
+        """
+        file_path = Path(file_path)
+        refs = self._refs.get(file_path.name) or self._refs.get(file_path.stem)
+        if not refs:
+            name = file_path.name
+            refs = set()
+            for length in self._suffix_lengths:
+                if length > len(name):
+                    break
+                refs |= self._suffixes.get(name[-length:], set())
+        if not refs:
+            return []
+
+        try:
+            rel_dir = str(file_path.relative_to(self.root).parent)
+        except ValueError:
+            rel_dir = str(file_path.parent)
+
+        best: Dict[str, Tuple[bool, bool, str]] = {}
+        for ref in refs:
+            rank = (not ref.writes, str(Path(ref.script).parent) != rel_dir, ref.script)
+            if ref.script not in best or rank < best[ref.script]:
+                best[ref.script] = rank
+        return [script for script, _ in sorted(best.items(), key=lambda item: item[1])]
+
+    def generating_script(self, file_path: Path) -> Optional[str]:
+        """Most likely script to have produced a file, if any."""
+        scripts = self.lookup(file_path)
+        return scripts[0] if scripts else None
@@ -14,26 +14,20 @@ Revision strategies:
 """
 
 import re
-import os
 from pathlib import Path
-
-# Optional anthropic import for LLM-based revisions
-try:
-    import anthropic
-    ANTHROPIC_AVAILABLE = True
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from dataclasses import dataclass
 import logging
 
-# Import revision context and parser
+# Import revision context, parser and LLM client
 try:
+    from rrwrite_llm_client import LLMClient, LLMError, get_llm_client
     from rrwrite_revision_context import RevisionContext, Citation
     from rrwrite_revision_parser import Issue
 except ImportError:
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_llm_client import LLMClient, LLMError, get_llm_client
     from rrwrite_revision_context import RevisionContext, Citation
     from rrwrite_revision_parser import Issue
 
@@ -73,7 +67,8 @@ class SectionReviser:
         section_name: str,
         section_file: Path,
         issues: List[Issue],
-        context: RevisionContext
+        context: RevisionContext,
+        llm: Optional[LLMClient] = None
     ):
         """Initialize section reviser.
 
@@ -82,13 +77,19 @@ class SectionReviser:
             section_file: Path to section markdown file
             issues: List of issues to address in this section
             context: Revision context with citations, guidelines, etc.
+            llm: LLM client (default: the shared, cached client)
         """
         self.section_name = section_name
         self.section_file = section_file
         self.issues = issues
         self.context = context
+        self.llm = llm or get_llm_client()
         self.logger = logging.getLogger(__name__)
 
+        # Evidence issues whose claims need an LLM to place citations;
+        # sent together in one request per section (see revise())
+        self._pending_citations: List[Tuple[Issue, str, List[Citation]]] = []
+
         # Load section content
         self.original_content = self._load_content()
 
@@ -104,11 +105,17 @@ class SectionReviser:
     def revise(self) -> RevisionResult:
         """Apply revisions to the section.
 
+        Rule-based fixes are applied first, in issue order. Citations that
+        need the LLM are then added in one request for all claims, and the
+        section is condensed last, once, to the strictest word target.
+
         Returns:
             RevisionResult with updated content and validation
         """
         changes_made = []
         content = self.original_content
+        self._pending_citations = []
+        word_count_issues = []
 
         # Apply revisions based on issue categories
         for issue in self.issues:
@@ -118,9 +125,7 @@ class SectionReviser:
                     changes_made.append(f"Fixed citation format: {issue.description[:50]}")
 
             elif issue.category == "Word Count":
-                content, changed = self._reduce_word_count(content, issue)
-                if changed:
-                    changes_made.append(f"Reduced word count: {issue.description[:50]}")
+                word_count_issues.append(issue)
 
             elif issue.category == "Evidence":
                 content, changed = self._add_evidence_citations(content, issue)
@@ -132,6 +137,29 @@ class SectionReviser:
                 if changed:
                     changes_made.append(f"Added reproducibility: {issue.description[:50]}")
 
+        if self._pending_citations:
+            pending = self._pending_citations
+            try:
+                updated = self._llm_add_citations(content, [(claim, cites) for _, claim, cites in pending])
+            except Exception as e:
+                self.logger.error(f"Failed to add citations: {e}")
+                updated = content
+            if updated != content:
+                content = updated
+                changes_made.extend(f"Added evidence: {issue.description[:50]}" for issue, _, _ in pending)
+
+        if word_count_issues:
+            targets = [(self._target_word_count(issue), i) for i, issue in enumerate(word_count_issues)]
+            targets = [(target, i) for target, i in targets if target is not None]
+            if targets:
+                issue = word_count_issues[min(targets)[1]]
+                content, changed = self._reduce_word_count(content, issue)
+                if changed:
+                    changes_made.extend(f"Reduced word count: {i.description[:50]}" for i in word_count_issues)
+            else:
+                for issue in word_count_issues:
+                    self.logger.warning(f"Cannot extract target word count from: {issue.description}")
+
         # Validate revisions
         validation = self._validate_revisions(content)
 
@@ -169,6 +197,12 @@ class SectionReviser:
 
         return content, False
 
+    @staticmethod
+    def _target_word_count(issue: Issue) -> Optional[int]:
+        """Target word count from an issue description (None if not stated)."""
+        target_match = re.search(r'(\d+)\s+words?', issue.description)
+        return int(target_match.group(1)) if target_match else None
+
     def _reduce_word_count(self, content: str, issue: Issue) -> tuple[str, bool]:
         """Reduce word count using LLM.
 
@@ -179,18 +213,15 @@ class SectionReviser:
         Returns:
             Tuple of (updated_content, changed)
         """
-        # Extract target word count from issue description
-        target_match = re.search(r'(\d+)\s+words?', issue.description)
-        if not target_match:
+        target_count = self._target_word_count(issue)
+        if target_count is None:
             self.logger.warning(f"Cannot extract target word count from: {issue.description}")
             return content, False
 
-        target_count = int(target_match.group(1))
-
         # Use LLM to condense
         try:
             condensed = self._llm_condense(content, target_count)
-            return condensed, True
+            return condensed, condensed != content
         except Exception as e:
             self.logger.error(f"Failed to condense content: {e}")
             return content, False
@@ -227,13 +258,10 @@ class SectionReviser:
             updated_content = content.replace(claim, f"{claim} [{citation_str}]")
             return updated_content, True
 
-        # If exact match not found, use LLM to insert citation appropriately
-        try:
-            updated_content = self._llm_add_citation(content, claim, citations)
-            return updated_content, True
-        except Exception as e:
-            self.logger.error(f"Failed to add citations: {e}")
-            return content, False
+        # If exact match not found, the LLM inserts the citation; claims are
+        # batched into one request per section by revise()
+        self._pending_citations.append((issue, claim, citations))
+        return content, False
 
     def _add_reproducibility_elements(self, content: str, issue: Issue) -> tuple[str, bool]:
         """Add reproducibility elements (versions, parameters, data sources).
@@ -304,6 +332,16 @@ class SectionReviser:
             warnings=warnings
         )
 
+    def _llm_complete(self, prompt: str, purpose: str) -> Optional[str]:
+        """Run a prompt through the shared client (None if no API key and not cached)."""
+        try:
+            return self.llm.complete(prompt).text
+        except LLMError:
+            if self.llm.available:
+                raise
+            self.logger.warning(f"ANTHROPIC_API_KEY not set, skipping LLM {purpose}")
+            return None
+
     def _llm_condense(self, content: str, target_words: int) -> str:
         """Use LLM to condense content to target word count.
 
@@ -314,12 +352,6 @@ class SectionReviser:
         Returns:
             Condensed content
         """
-        if not ANTHROPIC_AVAILABLE:
-            self.logger.warning("Anthropic SDK not available, skipping LLM condensation")
-            return content
-
-        client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-
         prompt = f"""Condense the following text to approximately {target_words} words while preserving all key points, citations, and technical details.
 
 Original text:
@@ -333,61 +365,42 @@ Requirements:
 
 Condensed version:"""
 
-        message = client.messages.create(
-            model="claude-sonnet-4-5-20241022",
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        return message.content[0].text
+        condensed = self._llm_complete(prompt, "condensation")
+        return content if condensed is None else condensed
 
-    def _llm_add_citation(self, content: str, claim: str, citations: List[Citation]) -> str:
-        """Use LLM to add citations to content.
+    def _llm_add_citations(self, content: str, claims: List[Tuple[str, List[Citation]]]) -> str:
+        """Use LLM to add citations for several claims in one request.
 
         Args:
             content: Original content
-            claim: Claim needing citation
-            citations: List of relevant citations
+            claims: (claim, relevant citations) pairs
 
         Returns:
             Updated content with citations
         """
-        if not ANTHROPIC_AVAILABLE:
-            self.logger.warning("Anthropic SDK not available, skipping LLM citation addition")
-            return content
-
-        client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-
-        citation_info = "\n".join([
-            f"- [{c.citation_key}]: {c.evidence}"
-            for c in citations
-        ])
+        claim_info = "\n\n".join(
+            f"{i}. \"{claim}\"\n" + "\n".join(f"   - [{c.citation_key}]: {c.evidence}" for c in citations)
+            for i, (claim, citations) in enumerate(claims, 1)
+        )
 
-        prompt = f"""Add appropriate citations to support the following claim in the text.
+        prompt = f"""Add appropriate citations to support each of the following claims in the text.
 
 Text:
 {content}
 
-Claim needing citation: "{claim}"
-
-Available citations:
-{citation_info}
+Claims needing citation, each with its available citations:
+{claim_info}
 
 Instructions:
-- Insert citation(s) at the most appropriate location to support the claim
+- For each claim, insert citation(s) at the most appropriate location to support it
 - Use [author2024] format
 - Maintain the original text structure and meaning
 - Only add citations, do not modify other content
 
 Updated text:"""
 
-        message = client.messages.create(
-            model="claude-sonnet-4-5-20241022",
-            max_tokens=4096,
-            messages=[{"role": "user", "content": prompt}]
-        )
-
-        return message.content[0].text
+        updated = self._llm_complete(prompt, "citation addition")
+        return content if updated is None else updated
 
 
 class AbstractReviser(SectionReviser):
@@ -482,7 +495,8 @@ def get_reviser(
     section_name: str,
     section_file: Path,
     issues: List[Issue],
-    context: RevisionContext
+    context: RevisionContext,
+    llm: Optional[LLMClient] = None
 ) -> SectionReviser:
     """Factory function to get appropriate reviser for section.
 
@@ -491,6 +505,7 @@ def get_reviser(
         section_file: Path to section file
         issues: List of issues for this section
         context: Revision context
+        llm: LLM client (default: the shared, cached client)
 
     Returns:
         Appropriate SectionReviser subclass
@@ -503,7 +518,7 @@ def get_reviser(
     }
 
     reviser_class = revisers.get(section_name, SectionReviser)
-    return reviser_class(section_name, section_file, issues, context)
+    return reviser_class(section_name, section_file, issues, context, llm)
 
 
 def main():
@@ -8,11 +8,31 @@ This module provides tools for:
 3. Selecting appropriate tables for manuscript sections
 """
 
+import hashlib
+import json
+import os
 import re
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
+import numpy as np
 import pandas as pd
 
+try:
+    from rrwrite_git_stats import get_git_stats
+    from rrwrite_table_reader import (
+        ARROW_AVAILABLE, has_sidecar, load_table, read_header, read_table,
+        summarize_table, write_sidecar
+    )
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_git_stats import get_git_stats
+    from rrwrite_table_reader import (
+        ARROW_AVAILABLE, has_sidecar, load_table, read_header, read_table,
+        summarize_table, write_sidecar
+    )
+
 
 class TableGenerator:
     """Generate and format tables for manuscript sections."""
@@ -21,7 +41,8 @@ class TableGenerator:
     def save_tsv(
         df: pd.DataFrame,
         output_path: Path,
-        metadata: Optional[Dict[str, str]] = None
+        metadata: Optional[Dict[str, str]] = None,
+        sidecar: bool = False
     ) -> None:
         """
         Save DataFrame to TSV file with optional metadata header.
@@ -30,6 +51,8 @@ class TableGenerator:
             df: DataFrame to save
             output_path: Path to output TSV file
             metadata: Optional dict of metadata to include as comments
+            sidecar: Also write a typed Arrow sidecar (name.arrow) for fast
+                loading with load_table (requires pyarrow)
         """
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -44,45 +67,77 @@ class TableGenerator:
             # Write DataFrame as TSV
             df.to_csv(f, sep='\t', index=False)
 
+        if sidecar:
+            write_sidecar(df, output_path, metadata)
+
     @staticmethod
-    def load_tsv_with_metadata(tsv_path: Path) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    def load_tsv_with_metadata(
+        tsv_path: Path,
+        usecols: Optional[List[str]] = None,
+        nrows: Optional[int] = None
+    ) -> Tuple[pd.DataFrame, Dict[str, str]]:
         """
         Load TSV file and extract metadata from comment lines.
 
+        Only the comment block is scanned for metadata; the data is then
+        parsed once, limited to the requested columns and rows. Full loads
+        use the table's Arrow sidecar when it is up to date.
+
         Args:
             tsv_path: Path to TSV file
+            usecols: Columns to load (default: all)
+            nrows: Number of data rows to load (default: all)
 
         Returns:
             Tuple of (DataFrame, metadata_dict)
         """
-        metadata = {}
-
-        with open(tsv_path, 'r') as f:
-            lines = f.readlines()
-
-        # Extract metadata from comment lines
-        data_start = 0
-        for i, line in enumerate(lines):
-            if line.startswith('#'):
-                # Parse metadata: # key: value
-                match = re.match(r'#\s*(\w+):\s*(.+)', line)
-                if match:
-                    metadata[match.group(1)] = match.group(2).strip()
-                data_start = i + 1
-            else:
-                break
+        if nrows is None:
+            return load_table(tsv_path, columns=usecols)
+        header = read_header(tsv_path)
+        df = read_table(tsv_path, usecols=usecols, nrows=nrows, header=header)
+        return df, header.metadata
 
-        # Load DataFrame from remaining lines
-        df = pd.read_csv(tsv_path, sep='\t', skiprows=data_start)
+    @staticmethod
+    def format_tsv_table(
+        tsv_path: Path,
+        max_rows: Optional[int] = None,
+        usecols: Optional[List[str]] = None,
+        alignment: Optional[Dict[str, str]] = None,
+        max_col_width: int = 50,
+        caption: Optional[str] = None
+    ) -> str:
+        """
+        Format the top rows of a (possibly very large) TSV file as markdown.
 
-        return df, metadata
+        Only the first max_rows rows of the selected columns are parsed; the
+        rest of the file is counted, not loaded.
+
+        Args:
+            tsv_path: Path to TSV file
+            max_rows: Rows to include (default: all)
+            usecols: Columns to include (default: all)
+            alignment: Dict mapping column names to alignment
+            max_col_width: Maximum column width in characters
+            caption: Optional caption to add before table
+
+        Returns:
+            Markdown formatted table string
+        """
+        summary = summarize_table(tsv_path, usecols=usecols, top_n=max_rows, stats=False)
+        table = TableGenerator.format_markdown_table(
+            summary.head, alignment=alignment, max_col_width=max_col_width, caption=caption
+        )
+        if table and summary.truncated:
+            table += f"\n\n*Note: Showing {len(summary.head)} of {summary.rows} rows*"
+        return table
 
     @staticmethod
     def format_markdown_table(
         df: pd.DataFrame,
         alignment: Optional[Dict[str, str]] = None,
         max_col_width: int = 50,
-        caption: Optional[str] = None
+        caption: Optional[str] = None,
+        max_rows: Optional[int] = None
     ) -> str:
         """
         Convert DataFrame to markdown table with pipe format.
@@ -92,6 +147,7 @@ class TableGenerator:
             alignment: Dict mapping column names to alignment ('left', 'right', 'center')
             max_col_width: Maximum column width in characters (truncate longer values)
             caption: Optional caption to add before table
+            max_rows: Only format the first rows (default: all)
 
         Returns:
             Markdown formatted table string
@@ -99,6 +155,9 @@ class TableGenerator:
         if df.empty:
             return ""
 
+        if max_rows is not None:
+            df = df.head(max_rows)
+
         # Default alignment: left for text, right for numbers
         if alignment is None:
             alignment = {}
@@ -147,17 +206,34 @@ class TableGenerator:
         lines.append(alignment_row)
 
         # Data rows
-        for _, row in df_display.iterrows():
+        for row in df_display.itertuples(index=False, name=None):
             row_str = "| " + " | ".join(str(val) for val in row) + " |"
             lines.append(row_str)
 
         return "\n".join(lines)
 
+    # Input digests of the last generated tables, kept next to the TSVs
+    TABLE_INPUTS_FILE = ".table_inputs.json"
+    REPO_TABLES = ("file_inventory", "repository_statistics", "size_distribution", "research_indicators")
+
+    @staticmethod
+    def _digest(*parts) -> str:
+        """Stable digest of table inputs."""
+        h = hashlib.sha1()
+        for part in parts:
+            if isinstance(part, pd.DataFrame):
+                part = part.to_csv(index=False)
+            h.update(str(part).encode('utf-8'))
+            h.update(b'\0')
+        return h.hexdigest()
+
     @staticmethod
     def generate_repo_tables(
         repo_path: Path,
         categorized_files: Dict[str, List[Path]],
-        output_dir: Path
+        output_dir: Path,
+        repo_index=None,
+        tree_key: Optional[str] = None
     ) -> Dict[str, Path]:
         """
         Generate all repository analysis tables and save as TSV files.
@@ -168,10 +244,21 @@ class TableGenerator:
         3. size_distribution.tsv - File size distribution quartiles
         4. research_indicators.tsv - Detected research topics
 
+        Tables whose inputs are unchanged since the last run (recorded in
+        .table_inputs.json) are neither recomputed nor rewritten. Each TSV
+        gets a typed Arrow sidecar (name.arrow) when pyarrow is installed;
+        downstream stages load it with rrwrite_table_reader.load_table.
+
         Args:
             repo_path: Path to repository root
             categorized_files: Dict mapping category names to file lists
             output_dir: Directory to save TSV files
+            repo_index: Optional RepoIndex; file sizes and mtimes are taken
+                from it instead of stat-ing every file again
+            tree_key: Optional key of an unchanged repository listing (see
+                AnalysisCache.tree_key); if it matches the previous run and
+                all tables exist, they are returned without building the
+                inventory
 
         Returns:
             Dict mapping table names to their file paths
@@ -180,111 +267,185 @@ class TableGenerator:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
+        inputs_path = output_dir / TableGenerator.TABLE_INPUTS_FILE
+        try:
+            previous_inputs = json.loads(inputs_path.read_text())
+        except (OSError, json.JSONDecodeError):
+            previous_inputs = {}
+        current_inputs = {}
+
+        def table_ready(name: str) -> bool:
+            tsv_path = output_dir / f"{name}.tsv"
+            return tsv_path.exists() and (not ARROW_AVAILABLE or has_sidecar(tsv_path))
+
+        if tree_key and previous_inputs.get('tree') == tree_key \
+                and all(table_ready(name) for name in TableGenerator.REPO_TABLES):
+            return {name: output_dir / f"{name}.tsv" for name in TableGenerator.REPO_TABLES}
+
+        def unchanged(name: str, digest: str) -> bool:
+            current_inputs[name] = digest
+            return previous_inputs.get(name) == digest and table_ready(name)
+
         table_paths = {}
 
         # Table 1: File Inventory
         file_inventory = TableGenerator._generate_file_inventory(
-            repo_path, categorized_files
+            repo_path, categorized_files, repo_index
         )
+        inventory_digest = TableGenerator._digest(file_inventory)
         inventory_path = output_dir / "file_inventory.tsv"
-        TableGenerator.save_tsv(
-            file_inventory,
-            inventory_path,
-            metadata={
-                'generated_by': 'rrwrite-analyze-repo',
-                'description': 'Complete file listing with metadata',
-                'total_files': str(len(file_inventory))
-            }
-        )
+        if not unchanged('file_inventory', inventory_digest):
+            TableGenerator.save_tsv(
+                file_inventory,
+                inventory_path,
+                metadata={
+                    'generated_by': 'rrwrite-analyze-repo',
+                    'description': 'Complete file listing with metadata',
+                    'total_files': str(len(file_inventory))
+                },
+                sidecar=True
+            )
         table_paths['file_inventory'] = inventory_path
 
         # Table 2: Repository Statistics
-        repo_stats = TableGenerator._generate_repository_statistics(
-            categorized_files, file_inventory
-        )
         stats_path = output_dir / "repository_statistics.tsv"
-        TableGenerator.save_tsv(
-            repo_stats,
-            stats_path,
-            metadata={
-                'generated_by': 'rrwrite-analyze-repo',
-                'description': 'Summary metrics by file category'
-            }
-        )
+        if not unchanged('repository_statistics', inventory_digest):
+            repo_stats = TableGenerator._generate_repository_statistics(
+                categorized_files, file_inventory
+            )
+            TableGenerator.save_tsv(
+                repo_stats,
+                stats_path,
+                metadata={
+                    'generated_by': 'rrwrite-analyze-repo',
+                    'description': 'Summary metrics by file category'
+                },
+                sidecar=True
+            )
         table_paths['repository_statistics'] = stats_path
 
         # Table 3: Size Distribution
-        size_dist = TableGenerator._generate_size_distribution(
-            categorized_files, file_inventory
-        )
         size_path = output_dir / "size_distribution.tsv"
-        TableGenerator.save_tsv(
-            size_dist,
-            size_path,
-            metadata={
-                'generated_by': 'rrwrite-analyze-repo',
-                'description': 'File size distribution quartiles by category'
-            }
-        )
+        if not unchanged('size_distribution', inventory_digest):
+            size_dist = TableGenerator._generate_size_distribution(
+                categorized_files, file_inventory
+            )
+            TableGenerator.save_tsv(
+                size_dist,
+                size_path,
+                metadata={
+                    'generated_by': 'rrwrite-analyze-repo',
+                    'description': 'File size distribution quartiles by category'
+                },
+                sidecar=True
+            )
         table_paths['size_distribution'] = size_path
 
-        # Table 4: Research Indicators
-        research_ind = TableGenerator._generate_research_indicators(
-            categorized_files
-        )
+        # Table 4: Research Indicators (depends on file paths only)
         research_path = output_dir / "research_indicators.tsv"
-        TableGenerator.save_tsv(
-            research_ind,
-            research_path,
-            metadata={
-                'generated_by': 'rrwrite-analyze-repo',
-                'description': 'Detected research topics with evidence'
-            }
-        )
+        paths_digest = TableGenerator._digest(*(
+            f"{category}:{path}" for category, files in categorized_files.items() for path in files
+        ))
+        if not unchanged('research_indicators', paths_digest):
+            research_ind = TableGenerator._generate_research_indicators(
+                categorized_files
+            )
+            TableGenerator.save_tsv(
+                research_ind,
+                research_path,
+                metadata={
+                    'generated_by': 'rrwrite-analyze-repo',
+                    'description': 'Detected research topics with evidence'
+                },
+                sidecar=True
+            )
         table_paths['research_indicators'] = research_path
 
+        if tree_key:
+            current_inputs['tree'] = tree_key
+        inputs_path.write_text(json.dumps(current_inputs, indent=2))
+
         return table_paths
 
     @staticmethod
     def _generate_file_inventory(
         repo_path: Path,
-        categorized_files: Dict[str, List[Path]]
+        categorized_files: Dict[str, List[Path]],
+        repo_index=None
     ) -> pd.DataFrame:
-        """Generate file inventory table with metadata."""
-        # Get git tracked files (single call for efficiency)
-        git_tracked = TableGenerator._get_git_tracked_files(repo_path)
+        """Generate file inventory table with metadata.
 
-        inventory_data = []
+        Paths, categories, sizes and mtimes are collected into flat lists;
+        the 1000 largest files are selected on the size column alone before
+        the table is built, timestamps are formatted and git status is
+        looked up.
+        """
+        repo_path = Path(repo_path)
+        root = os.path.join(str(repo_path), '')
+        # Indexed entries already carry their path relative to the index root
+        index_rel = repo_index is not None and Path(repo_index.root) == repo_path
+        paths, types, sizes, mtimes = [], [], [], []
 
         for category, files in categorized_files.items():
-            for file_path in files:
-                file_path = Path(file_path)
-
-                # Skip if file doesn't exist
-                if not file_path.exists():
+            if repo_index is not None:
+                entries = repo_index.stat_many(files)
+                if index_rel and all(entries):
+                    # Every file is indexed: take the columns straight from the entries
+                    paths.extend(map(attrgetter('rel_path'), entries))
+                    types.extend([category] * len(entries))
+                    sizes.extend(map(attrgetter('size'), entries))
+                    mtimes.extend(map(attrgetter('mtime'), entries))
                     continue
+            else:
+                entries = [None] * len(files)
 
-                try:
-                    stat = file_path.stat()
-                    rel_path = file_path.relative_to(repo_path)
-
-                    inventory_data.append({
-                        'path': str(rel_path),
-                        'type': category,
-                        'size_bytes': stat.st_size,
-                        'last_modified': pd.Timestamp(stat.st_mtime, unit='s').isoformat(),
-                        'git_tracked': str(rel_path) in git_tracked
-                    })
-                except (OSError, ValueError):
-                    # Skip files that can't be accessed or aren't in repo
-                    continue
+            for file_path, entry in zip(files, entries):
+                if not isinstance(file_path, Path):
+                    file_path = Path(file_path)
+                if entry is not None:
+                    size, mtime = entry.size, entry.mtime
+                else:
+                    try:
+                        stat = os.stat(file_path)
+                    except OSError:
+                        continue   # Skip files that can't be accessed
+                    size, mtime = stat.st_size, stat.st_mtime
+
+                if entry is not None and index_rel:
+                    path = entry.rel_path
+                else:
+                    path = str(file_path)
+                    if path.startswith(root):
+                        path = path[len(root):]
+                    else:
+                        try:
+                            path = str(file_path.relative_to(repo_path))
+                        except ValueError:
+                            continue   # Not in repo
+
+                paths.append(path)
+                types.append(category)
+                sizes.append(size)
+                mtimes.append(mtime)
 
         # Sort by size descending and limit to 1000 largest files if needed
-        df = pd.DataFrame(inventory_data)
-        if len(df) > 1000:
-            df = df.nlargest(1000, 'size_bytes')
+        largest = pd.Series(np.asarray(sizes, dtype=np.int64), dtype=np.int64)
+        if len(largest) > 1000:
+            largest = largest.nlargest(1000)
+        largest = largest.sort_values(ascending=False)
+        rows = largest.index.tolist()
 
-        return df.sort_values('size_bytes', ascending=False).reset_index(drop=True)
+        git_tracked = TableGenerator._get_git_tracked_files(repo_path)
+        df = pd.DataFrame({
+            'path': pd.Series([paths[i] for i in rows], dtype=str),
+            'type': pd.Series([types[i] for i in rows], dtype=str),
+            'size_bytes': largest.to_numpy(),
+            'last_modified': pd.Series(
+                [pd.Timestamp(mtimes[i], unit='s').isoformat() for i in rows], dtype=str
+            ),
+        })
+        df['git_tracked'] = df['path'].isin(git_tracked)
+        return df
 
     @staticmethod
     def _generate_repository_statistics(
@@ -292,33 +453,26 @@ class TableGenerator:
         file_inventory: pd.DataFrame
     ) -> pd.DataFrame:
         """Generate repository statistics table."""
-        stats_data = []
-
-        for category in file_inventory['type'].unique():
-            category_files = file_inventory[file_inventory['type'] == category]
-
+        paths = file_inventory['path']
+        flags = pd.DataFrame({
+            'category': file_inventory['type'],
+            'size_bytes': file_inventory['size_bytes'],
             # Count test and doc files
-            test_count = category_files['path'].str.contains(
-                'test', case=False, na=False
-            ).sum()
-            doc_count = category_files['path'].str.contains(
-                r'readme|doc|documentation', case=False, na=False
-            ).sum()
-
-            stats_data.append({
-                'category': category,
-                'file_count': len(category_files),
-                'total_size_mb': category_files['size_bytes'].sum() / (1024 * 1024),
-                'avg_size_kb': category_files['size_bytes'].mean() / 1024,
-                'test_files': test_count,
-                'doc_files': doc_count
-            })
-
-        df = pd.DataFrame(stats_data)
+            'test': paths.str.contains('test', case=False, na=False),
+            'doc': paths.str.contains(r'readme|doc|documentation', case=False, na=False),
+        })
+
+        df = flags.groupby('category', sort=False).agg(
+            file_count=('size_bytes', 'size'),
+            total_size_mb=('size_bytes', 'sum'),
+            avg_size_kb=('size_bytes', 'mean'),
+            test_files=('test', 'sum'),
+            doc_files=('doc', 'sum'),
+        ).reset_index()
 
         # Round numeric columns
-        df['total_size_mb'] = df['total_size_mb'].round(2)
-        df['avg_size_kb'] = df['avg_size_kb'].round(2)
+        df['total_size_mb'] = (df['total_size_mb'] / (1024 * 1024)).round(2)
+        df['avg_size_kb'] = (df['avg_size_kb'] / 1024).round(2)
 
         return df.sort_values('file_count', ascending=False).reset_index(drop=True)
 
@@ -328,22 +482,15 @@ class TableGenerator:
         file_inventory: pd.DataFrame
     ) -> pd.DataFrame:
         """Generate size distribution table with quartiles."""
-        dist_data = []
-
-        for category in file_inventory['type'].unique():
-            category_files = file_inventory[file_inventory['type'] == category]
-            sizes_kb = category_files['size_bytes'] / 1024
-
-            dist_data.append({
-                'category': category,
-                'percentile_25_kb': sizes_kb.quantile(0.25),
-                'percentile_50_kb': sizes_kb.quantile(0.50),
-                'percentile_75_kb': sizes_kb.quantile(0.75),
-                'min_kb': sizes_kb.min(),
-                'max_kb': sizes_kb.max()
-            })
+        sizes_kb = file_inventory['size_bytes'] / 1024
 
-        df = pd.DataFrame(dist_data)
+        df = sizes_kb.groupby(file_inventory['type'].rename('category'), sort=False).agg(
+            percentile_25_kb=lambda s: s.quantile(0.25),
+            percentile_50_kb=lambda s: s.quantile(0.50),
+            percentile_75_kb=lambda s: s.quantile(0.75),
+            min_kb='min',
+            max_kb='max',
+        ).reset_index()
 
         # Round all numeric columns
         numeric_cols = df.select_dtypes(include=['float64']).columns
@@ -351,38 +498,51 @@ class TableGenerator:
 
         return df
 
+    # Common research keywords to detect in file paths
+    RESEARCH_KEYWORDS = {
+        'machine_learning': ['ml', 'model', 'train', 'predict', 'neural', 'learning'],
+        'data_analysis': ['analysis', 'statistics', 'statistical', 'analyze'],
+        'visualization': ['plot', 'chart', 'graph', 'visual', 'figure'],
+        'bioinformatics': ['sequence', 'genome', 'protein', 'gene', 'bio'],
+        'pipeline': ['pipeline', 'workflow', 'snakemake', 'nextflow'],
+        'database': ['database', 'db', 'sql', 'schema', 'query'],
+        'api': ['api', 'rest', 'endpoint', 'service'],
+        'testing': ['test', 'spec', 'mock', 'fixture']
+    }
+
     @staticmethod
     def _generate_research_indicators(
         categorized_files: Dict[str, List[Path]]
     ) -> pd.DataFrame:
-        """Generate research indicators table by detecting topics from filenames."""
-        # Common research keywords to detect
-        research_keywords = {
-            'machine_learning': ['ml', 'model', 'train', 'predict', 'neural', 'learning'],
-            'data_analysis': ['analysis', 'statistics', 'statistical', 'analyze'],
-            'visualization': ['plot', 'chart', 'graph', 'visual', 'figure'],
-            'bioinformatics': ['sequence', 'genome', 'protein', 'gene', 'bio'],
-            'pipeline': ['pipeline', 'workflow', 'snakemake', 'nextflow'],
-            'database': ['database', 'db', 'sql', 'schema', 'query'],
-            'api': ['api', 'rest', 'endpoint', 'service'],
-            'testing': ['test', 'spec', 'mock', 'fixture']
-        }
+        """Generate research indicators table by detecting topics from filenames.
 
-        indicators = []
+        All topics' keywords form one regex with a named group per topic,
+        inside a lookahead so that overlapping keywords of different topics
+        are all found; extractall runs it over the lowercased path column in
+        a single pass.
+        """
+        files = [file_path for files in categorized_files.values() for file_path in files]
+        paths = pd.Series([str(file_path) for file_path in files], dtype=str).str.lower()
+
+        topics = TableGenerator.RESEARCH_KEYWORDS
+        pattern = '(?=' + '|'.join(
+            f"(?P<{topic}>{'|'.join(re.escape(kw) for kw in keywords)})"
+            for topic, keywords in topics.items()
+        ) + ')'
+        hits = (
+            paths.str.extractall(pattern).notna()
+            .groupby(level=0).any()
+            .reindex(index=range(len(paths)), columns=list(topics), fill_value=False)
+        )
 
-        for topic, keywords in research_keywords.items():
-            matching_files = []
+        indicators = []
 
-            # Search through all categorized files
-            for category, files in categorized_files.items():
-                for file_path in files:
-                    file_str = str(file_path).lower()
-                    if any(kw in file_str for kw in keywords):
-                        matching_files.append(file_path)
+        for topic in topics:
+            matching = np.flatnonzero(hits[topic].to_numpy(dtype=bool))
 
-            if matching_files:
+            if len(matching):
                 # Determine confidence based on evidence count
-                count = len(matching_files)
+                count = len(matching)
                 if count >= 5:
                     confidence = 'high'
                 elif count >= 2:
@@ -391,7 +551,7 @@ class TableGenerator:
                     confidence = 'low'
 
                 # Get example files (max 3)
-                examples = [str(Path(f).name) for f in matching_files[:3]]
+                examples = [str(Path(files[i]).name) for i in matching[:3]]
 
                 indicators.append({
                     'topic': topic.replace('_', ' ').title(),
@@ -400,7 +560,7 @@ class TableGenerator:
                     'example_files': ', '.join(examples)
                 })
 
-        df = pd.DataFrame(indicators)
+        df = pd.DataFrame(indicators, columns=['topic', 'confidence', 'evidence_count', 'example_files'])
         return df.sort_values('evidence_count', ascending=False).reset_index(drop=True)
 
     @staticmethod
@@ -408,29 +568,15 @@ class TableGenerator:
         """
         Get set of git-tracked files efficiently.
 
+        Read from the shared GitStats engine (one `git ls-files` per repository).
+
         Args:
             repo_path: Path to repository root
 
         Returns:
             Set of relative paths for git-tracked files
         """
-        import subprocess
-
-        try:
-            result = subprocess.run(
-                ['git', 'ls-files'],
-                cwd=repo_path,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-
-            if result.returncode == 0:
-                return set(result.stdout.strip().split('\n'))
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            pass
-
-        return set()
+        return get_git_stats(repo_path).tracked_files()
 
 
 class TableSelector:
@@ -505,3 +651,25 @@ class TableSelector:
             return []
 
         return sorted(data_tables_dir.glob("*.tsv"))
+
+    @staticmethod
+    def load_table(
+        data_tables_dir: Path,
+        table_name: str,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Load a data table with typed columns (from its Arrow sidecar if present).
+
+        Args:
+            data_tables_dir: Directory containing TSV files
+            table_name: Table file name (e.g., 'repository_statistics.tsv')
+            columns: Columns to load (default: all)
+
+        Returns:
+            DataFrame, or None if the table does not exist
+        """
+        table_path = Path(data_tables_dir) / table_name
+        if not table_path.exists():
+            return None
+        return load_table(table_path, columns=columns)[0]
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+RRWrite Table Reader
+
+Streaming reader for large TSV data tables.
+
+Research tables can have millions of rows while a manuscript shows the top
+few. The reader:
+- reads only the leading comment block (`# key: value` metadata) and the
+  header line to learn the layout
+- pulls just the requested columns (`usecols`) and top-N rows
+- computes per-column summary statistics over the full file in one chunked
+  pass, keeping a constant amount of data in memory
+
+Tables written by TableGenerator also get a columnar Arrow IPC sidecar
+(`name.arrow` next to `name.tsv`). load_table() memory-maps the sidecar and
+returns typed columns without parsing any text; the TSV stays the human-
+readable copy and is used whenever the sidecar is missing, stale (the TSV
+was edited after it was written) or pyarrow is not installed.
+"""
+
+import io
+import json
+import math
+import os
+import re
+import warnings
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    ARROW_AVAILABLE = True
+except ImportError:
+    ARROW_AVAILABLE = False
+
+# Rows per chunk for full-file passes
+CHUNK_ROWS = 100_000
+
+SIDECAR_SUFFIX = '.arrow'
+
+# Schema metadata keys tying a sidecar to the TSV it was written with
+_SIGNATURE_KEYS = (b'rrwrite.tsv_size', b'rrwrite.tsv_mtime_ns')
+_METADATA_KEY = b'rrwrite.metadata'
+
+_METADATA_LINE = re.compile(r'#\s*(\w+):\s*(.+)')
+
+
+@dataclass
+class TableHeader:
+    """Layout of a TSV table: metadata comments, column names and data offset."""
+    metadata: Dict[str, str]
+    columns: List[str]
+    skiprows: int   # Comment lines before the header row
+
+
+@dataclass
+class ColumnStats:
+    """Running statistics of one numeric column."""
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def update(self, values: pd.Series) -> None:
+        values = values.dropna()
+        if values.empty:
+            return
+        self.count += int(values.size)
+        self.total += float(values.sum())
+        self.minimum = min(self.minimum, float(values.min()))
+        self.maximum = max(self.maximum, float(values.max()))
+
+
+@dataclass
+class TableSummary:
+    """Top rows, row count and column statistics of a table."""
+    header: TableHeader
+    head: pd.DataFrame
+    rows: int
+    stats: Dict[str, ColumnStats] = field(default_factory=dict)
+
+    @property
+    def truncated(self) -> bool:
+        return self.rows > len(self.head)
+
+
+def read_header(tsv_path: Path) -> TableHeader:
+    """Read the comment block and header row only.
+
+    Args:
+        tsv_path: Path to TSV file
+
+    Returns:
+        TableHeader
+    """
+    metadata = {}
+    skiprows = 0
+    columns: List[str] = []
+    with open(tsv_path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('#'):
+                match = _METADATA_LINE.match(line)
+                if match:
+                    metadata[match.group(1)] = match.group(2).strip()
+                skiprows += 1
+                continue
+            columns = line.rstrip('\r\n').split('\t') if line.strip() else []
+            break
+    return TableHeader(metadata, columns, skiprows)
+
+
+def count_rows(tsv_path: Path, header: Optional[TableHeader] = None) -> int:
+    """Number of data rows, counted from raw lines without parsing.
+
+    Blank and comment lines are not rows (the parser skips them too).
+    """
+    header = header or read_header(tsv_path)
+    if not header.columns:
+        return 0
+    with open(tsv_path, 'rb') as f:
+        for _ in range(header.skiprows + 1):
+            next(f, None)
+        return sum(1 for line in f if line.strip(b'\r\n') and not line.startswith(b'#'))
+
+
+class _DataLines(io.TextIOBase):
+    """Text stream over a TSV file without its `#` comment lines.
+
+    Comment lines can appear anywhere in a table (not just in the leading
+    metadata block); a `#` inside a cell is kept.
+    """
+
+    def __init__(self, f):
+        self._f = f
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int = -1) -> str:
+        for line in self._f:
+            if not line.startswith('#'):
+                return line
+        return ''
+
+    def read(self, size: int = -1) -> str:
+        return ''.join(iter(self.readline, ''))
+
+
+@contextmanager
+def _parse(tsv_path: Path, header: TableHeader, usecols: Optional[Sequence[str]], raw: bool, **kwargs):
+    """pd.read_csv over the data lines of a table.
+
+    Rows are read as leniently as csv.reader: comment lines are skipped,
+    missing trailing cells are empty and extra trailing cells are dropped
+    (index_col=False keeps a long first row from becoming an index, and
+    on_bad_lines truncates any later one).
+    """
+    width = len(header.columns)
+    options = {'dtype': str, 'keep_default_na': False} if raw else {}
+    with open(tsv_path, 'r', encoding='utf-8', errors='replace', newline='') as f, \
+            warnings.catch_warnings():
+        warnings.simplefilter('ignore', pd.errors.ParserWarning)   # Extra cells dropped
+        yield pd.read_csv(
+            _DataLines(f), sep='\t', engine='python', index_col=False,
+            on_bad_lines=lambda cells: cells[:width],
+            usecols=list(usecols) if usecols is not None else None, **options, **kwargs
+        )
+
+
+def _in_order(df: pd.DataFrame, usecols: Optional[Sequence[str]]) -> pd.DataFrame:
+    """Columns in the requested order (the parser keeps file order)."""
+    return df[list(usecols)] if usecols is not None else df
+
+
+def read_table(
+    tsv_path: Path,
+    usecols: Optional[Sequence[str]] = None,
+    nrows: Optional[int] = None,
+    raw: bool = False,
+    header: Optional[TableHeader] = None
+) -> pd.DataFrame:
+    """Read selected columns and the first rows of a table.
+
+    Args:
+        tsv_path: Path to TSV file
+        usecols: Columns to read (default: all)
+        nrows: Rows to read (default: all)
+        raw: Keep cell text exactly as written (no type or NA conversion)
+        header: Previously read header (avoids re-reading the comment block)
+
+    Returns:
+        DataFrame
+    """
+    header = header or read_header(tsv_path)
+    if not header.columns:
+        return pd.DataFrame(columns=list(usecols or []))
+    with _parse(tsv_path, header, usecols, raw, nrows=nrows) as df:
+        return _in_order(df, usecols)
+
+
+def summarize_table(
+    tsv_path: Path,
+    usecols: Optional[Sequence[str]] = None,
+    top_n: Optional[int] = None,
+    stats: bool = True,
+    raw: bool = False,
+    chunksize: int = CHUNK_ROWS
+) -> TableSummary:
+    """Top rows, row count and numeric column statistics in one pass.
+
+    Without stats only the top rows are parsed and the remaining rows are
+    counted from raw bytes.
+
+    Args:
+        tsv_path: Path to TSV file
+        usecols: Columns to read (default: all)
+        top_n: Rows to keep in the summary head (default: all rows)
+        stats: Compute count/mean/min/max for numeric columns
+        raw: Keep head cells exactly as written
+        chunksize: Rows per chunk
+
+    Returns:
+        TableSummary
+    """
+    header = read_header(tsv_path)
+    if not header.columns:
+        return TableSummary(header, pd.DataFrame(columns=list(usecols or [])), 0)
+
+    if not stats and top_n is not None:
+        head = read_table(tsv_path, usecols, nrows=top_n, raw=raw, header=header)
+        return TableSummary(header, head, count_rows(tsv_path, header))
+
+    head_parts = []
+    kept = 0
+    rows = 0
+    column_stats: Dict[str, ColumnStats] = {}
+    with _parse(tsv_path, header, usecols, raw, chunksize=chunksize) as reader:
+        for chunk in reader:
+            rows += len(chunk)
+            if top_n is None or kept < top_n:
+                part = chunk if top_n is None else chunk.iloc[:top_n - kept]
+                head_parts.append(part)
+                kept += len(part)
+            if stats:
+                for col in chunk.columns:
+                    values = chunk[col]
+                    if raw or not pd.api.types.is_numeric_dtype(values):
+                        values = pd.to_numeric(values, errors='coerce')
+                    if values.notna().any() or col in column_stats:
+                        column_stats.setdefault(col, ColumnStats()).update(values)
+
+    if head_parts:
+        head = _in_order(pd.concat(head_parts, ignore_index=True), usecols)
+    else:
+        head = pd.DataFrame(columns=list(usecols or header.columns))
+    return TableSummary(header, head, rows, column_stats)
+
+
+# Columnar sidecars
+
+def sidecar_path(tsv_path: Path) -> Path:
+    """Path of the Arrow sidecar for a TSV file."""
+    return Path(tsv_path).with_suffix(SIDECAR_SUFFIX)
+
+
+def _tsv_signature(tsv_path: Path) -> Tuple[bytes, bytes]:
+    st = os.stat(tsv_path)
+    return str(st.st_size).encode(), str(st.st_mtime_ns).encode()
+
+
+def write_sidecar(
+    df: pd.DataFrame,
+    tsv_path: Path,
+    metadata: Optional[Dict[str, str]] = None
+) -> Optional[Path]:
+    """Write an Arrow IPC sidecar for a freshly written TSV.
+
+    Args:
+        df: DataFrame that was written to tsv_path
+        tsv_path: The TSV file (must already exist)
+        metadata: Comment metadata of the TSV
+
+    Returns:
+        Sidecar path, or None if pyarrow is unavailable or the frame cannot
+        be converted
+    """
+    if not ARROW_AVAILABLE:
+        return None
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+
+    schema_metadata = dict(table.schema.metadata or {})
+    schema_metadata.update(zip(_SIGNATURE_KEYS, _tsv_signature(tsv_path)))
+    schema_metadata[_METADATA_KEY] = json.dumps(metadata or {}).encode()
+    table = table.replace_schema_metadata(schema_metadata)
+
+    path = sidecar_path(tsv_path)
+    tmp = path.with_name(f"{path.name}.tmp{os.getpid()}")
+    try:
+        with pa.OSFile(str(tmp), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp, path)
+    except (OSError, pa.ArrowException):
+        tmp.unlink(missing_ok=True)
+        return None
+    return path
+
+
+def _open_sidecar(tsv_path: Path):
+    """Memory-mapped reader for an up-to-date sidecar, or None."""
+    if not ARROW_AVAILABLE:
+        return None
+    try:
+        signature = _tsv_signature(tsv_path)
+        reader = pa.ipc.open_file(pa.memory_map(str(sidecar_path(tsv_path)), 'r'))
+    except (OSError, pa.ArrowException):
+        return None
+    schema_metadata = reader.schema.metadata or {}
+    if tuple(schema_metadata.get(key) for key in _SIGNATURE_KEYS) != signature:
+        return None   # TSV changed since the sidecar was written
+    return reader
+
+
+def has_sidecar(tsv_path: Path) -> bool:
+    """Check whether a TSV has an up-to-date sidecar."""
+    return _open_sidecar(tsv_path) is not None
+
+
+def load_table(
+    tsv_path: Path,
+    columns: Optional[Sequence[str]] = None
+) -> Tuple[pd.DataFrame, Dict[str, str]]:
+    """Load a data table with typed columns, preferring its Arrow sidecar.
+
+    Args:
+        tsv_path: Path to TSV file
+        columns: Columns to load (default: all; unknown names are ignored)
+
+    Returns:
+        Tuple of (DataFrame, metadata_dict)
+    """
+    reader = _open_sidecar(tsv_path)
+    if reader is not None:
+        table = reader.read_all()
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        metadata = json.loads(reader.schema.metadata.get(_METADATA_KEY, b'{}'))
+        return table.to_pandas(), metadata
+
+    header = read_header(tsv_path)
+    usecols = [c for c in columns if c in header.columns] if columns is not None else None
+    return read_table(tsv_path, usecols=usecols, header=header), header.metadata
+
+
+def table_rows(tsv_path: Path) -> int:
+    """Number of data rows, from the sidecar when available."""
+    reader = _open_sidecar(tsv_path)
+    if reader is not None:
+        return sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+    return count_rows(tsv_path)
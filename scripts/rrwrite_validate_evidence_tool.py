@@ -15,6 +15,12 @@ import requests
 from datetime import datetime
 import json
 
+try:
+    from rrwrite_http_cache import shared_session
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_http_cache import shared_session
+
 
 def validate_doi(doi: str, timeout: int = 5) -> str:
     """
@@ -35,7 +41,7 @@ def validate_doi(doi: str, timeout: int = 5) -> str:
     # Try to resolve DOI
     url = f"https://doi.org/{doi_clean}"
     try:
-        response = requests.head(url, timeout=timeout, allow_redirects=True)
+        response = shared_session().head(url, timeout=timeout, allow_redirects=True)
         if response.status_code == 200:
             return "valid"
         elif response.status_code == 404:
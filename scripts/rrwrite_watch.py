@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+RRWrite Watch
+
+Long-running rebuild of manuscript artifacts while sections are edited.
+
+- Manuscript inputs (section files, paperpile_mapping.json, bibliography and
+  CSL style) are polled by mtime and size; a burst of saves is collected
+  until the files have been quiet for the debounce interval.
+- Only the stages that depend on the changed files are rerun:
+
+      section file        → assembly (+ consistency for sections/*.md)
+      paperpile mapping   → assembly
+      bibliography / CSL  → export
+      new full_manuscript → validation, format review, export
+
+- Everything is kept in memory between rebuilds: the section cache of the
+  ManuscriptAssembler, the section texts used by the ConsistencyChecker and
+  the validator/format reviewer modules, so an edit does not start new
+  Python processes or re-read unchanged files.
+"""
+
+import io
+import os
+import threading
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    from rrwrite_consistency_checker import ConsistencyChecker
+    from rrwrite_manuscript_assembler import PAPERPILE_MAPPING_FILE, SECTION_ORDER, ManuscriptAssembler
+    from rrwrite_pandoc_export import PandocExporter, manuscript_export_jobs
+    from rrwrite_script_loader import load_script_module
+except ImportError:
+    import sys
+    sys.path.insert(0, str(Path(__file__).parent))
+    from rrwrite_consistency_checker import ConsistencyChecker
+    from rrwrite_manuscript_assembler import PAPERPILE_MAPPING_FILE, SECTION_ORDER, ManuscriptAssembler
+    from rrwrite_pandoc_export import PandocExporter, manuscript_export_jobs
+    from rrwrite_script_loader import load_script_module
+
+# Stages in execution order
+STAGES = ('assembly', 'consistency', 'validation', 'format', 'export')
+
+# Rerun after the assembled manuscript changes
+MANUSCRIPT_STAGES = ('validation', 'format', 'export')
+
+# Seconds between polls, and quiet time before a rebuild starts
+POLL_INTERVAL = 0.25
+DEBOUNCE = 0.3
+
+EXPORT_INPUT_FILES = ('literature_citations.bib', 'citation-style.csl')
+
+SCHEMA_PATH = Path(__file__).parent.parent / 'schemas' / 'manuscript.yaml'
+
+Snapshot = Dict[Path, Tuple[int, int]]
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage of a rebuild."""
+    name: str
+    seconds: float
+    summary: str
+    ok: bool = True
+
+
+@dataclass
+class RebuildReport:
+    """Stages rerun for a set of changed files."""
+    changed: List[str]
+    stages: List[StageResult] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(stage.ok for stage in self.stages)
+
+    def stage(self, name: str) -> Optional[StageResult]:
+        return next((stage for stage in self.stages if stage.name == name), None)
+
+
+class ManuscriptWatcher:
+    """Rebuild manuscript artifacts when their inputs change."""
+
+    def __init__(
+        self,
+        manuscript_dir: Path,
+        journal: Optional[str] = None,
+        export: bool = True,
+        interval: float = POLL_INTERVAL,
+        debounce: float = DEBOUNCE,
+        exporter: Optional[PandocExporter] = None
+    ):
+        """Initialize watcher.
+
+        Args:
+            manuscript_dir: Manuscript directory (sections directly or in sections/)
+            journal: Target journal for the format review
+            export: Convert to DOCX/PDF after the manuscript changes
+            interval: Seconds between polls
+            debounce: Seconds without changes before rebuilding
+            exporter: Pandoc exporter (default: installed pandoc)
+        """
+        self.manuscript_dir = Path(manuscript_dir)
+        self.sections_dir = self.manuscript_dir / 'sections'
+        self.journal = journal
+        self.interval = interval
+        self.debounce = debounce
+        self.output_file = self.manuscript_dir / 'full_manuscript.md'
+
+        self.exporter = exporter or (PandocExporter() if export else None)
+        self.export = export and self.exporter.available
+
+        self.assembler = ManuscriptAssembler(self.manuscript_dir)
+        self._snapshot: Snapshot = {}
+        self._section_texts: Dict[str, str] = {}
+        self._manuscript_text: Optional[str] = None
+        self._validator = None
+        self._format_module = None
+        self._built = False
+
+    # Change detection
+
+    def snapshot(self) -> Snapshot:
+        """mtime and size of every watched input file."""
+        names = set(SECTION_ORDER) | {PAPERPILE_MAPPING_FILE, *EXPORT_INPUT_FILES}
+        files: Snapshot = {}
+        for directory, wanted in ((self.manuscript_dir, names), (self.sections_dir, None)):
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if wanted is None and not entry.name.endswith('.md'):
+                        continue
+                    if wanted is not None and entry.name not in wanted:
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    if entry.is_file():
+                        files[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+        return files
+
+    def poll(self) -> Set[Path]:
+        """Files added, removed or modified since the last poll."""
+        current = self.snapshot()
+        previous = self._snapshot
+        changed = {path for path, sig in current.items() if previous.get(path) != sig}
+        changed.update(path for path in previous if path not in current)
+        self._snapshot = current
+        return changed
+
+    def stages_for(self, changed: Set[Path]) -> Set[str]:
+        """Stages that depend directly on the changed files."""
+        stages = set()
+        for path in changed:
+            if path.name == PAPERPILE_MAPPING_FILE:
+                stages.add('assembly')
+            elif path.name in EXPORT_INPUT_FILES:
+                stages.add('export')
+            elif path.parent == self.sections_dir:
+                stages.add('consistency')
+                if path.name in SECTION_ORDER:
+                    stages.add('assembly')
+            else:
+                stages.add('assembly')
+        if not self.export:
+            stages.discard('export')
+        return stages
+
+    # Stages
+
+    def _assembly(self, stages: Set[str]) -> str:
+        result = self.assembler.assemble(self.output_file)
+        if not result.sections:
+            return 'no section files found'
+        if result.text != self._manuscript_text:
+            self._manuscript_text = result.text
+            stages.update(MANUSCRIPT_STAGES)
+            if not self.export:
+                stages.discard('export')
+        reread = f", re-read {', '.join(result.reread)}" if result.reread else ''
+        written = 'written' if result.written else 'unchanged'
+        return f"{written}, {result.words} words{reread}"
+
+    def _consistency(self, changed: Set[Path]) -> str:
+        for path in changed:
+            if path.parent != self.sections_dir:
+                continue
+            try:
+                self._section_texts[path.stem] = path.read_text(encoding='utf-8')
+            except OSError:
+                self._section_texts.pop(path.stem, None)
+        texts = {name: self._section_texts.get(name) for name in ConsistencyChecker.SECTION_ORDER}
+        issues = ConsistencyChecker(self.manuscript_dir, section_texts=texts).check_all()
+        return f"{len(issues)} issues"
+
+    def _validation(self) -> Tuple[bool, str]:
+        if self._validator is None:
+            module = load_script_module('rrwrite-validate-manuscript.py')
+            with redirect_stdout(io.StringIO()):
+                self._validator = module.ManuscriptValidator(SCHEMA_PATH)
+        with redirect_stdout(io.StringIO()):
+            errors, warnings, _ = self._validator.validate_manuscript(self.output_file)
+        summary = f"{len(errors)} errors, {len(warnings)} warnings"
+        if errors:
+            summary += f" ({errors[0]})"
+        return not errors, summary
+
+    def _format(self) -> str:
+        if self._format_module is None:
+            self._format_module = load_script_module('rrwrite-critique-format.py')
+        reviewer = self._format_module.FormatReviewer(
+            self.output_file, self.journal, content=self._manuscript_text
+        )
+        reviewer.run_review()
+        return f"{len(reviewer.issues)} issues, {len(reviewer.warnings)} warnings"
+
+    def _export(self) -> Tuple[bool, str]:
+        results = self.exporter.run(manuscript_export_jobs(self.output_file, self.manuscript_dir))
+        parts = [f"{r.output.suffix.lstrip('.')} {r.status}" for r in results]
+        return all(r.ok for r in results), ', '.join(parts)
+
+    def rebuild(self, stages: Set[str], changed: Set[Path] = frozenset()) -> RebuildReport:
+        """Run the given stages and the stages that depend on their output.
+
+        Args:
+            stages: Stage names to run (see STAGES)
+            changed: Changed input files (shown in the report)
+
+        Returns:
+            RebuildReport with per-stage timings and summaries
+        """
+        start = time.perf_counter()
+        report = RebuildReport(sorted(self._relative(path) for path in changed))
+        stages = set(stages)
+        for name in STAGES:
+            if name not in stages:
+                continue
+            stage_start = time.perf_counter()
+            ok = True
+            try:
+                if name == 'assembly':
+                    summary = self._assembly(stages)
+                elif name == 'consistency':
+                    summary = self._consistency(changed)
+                elif name == 'validation':
+                    ok, summary = self._validation()
+                elif name == 'format':
+                    summary = self._format()
+                else:
+                    ok, summary = self._export()
+            except Exception as e:
+                ok, summary = False, f"failed: {e}"
+            report.stages.append(StageResult(name, time.perf_counter() - stage_start, summary, ok))
+        report.seconds = time.perf_counter() - start
+        return report
+
+    def check(self) -> Optional[RebuildReport]:
+        """Poll once and rebuild what changed (None if nothing did).
+
+        The first call builds everything (its report lists no changed files).
+        """
+        changed = self.poll()
+        if not self._built:
+            self._built = True
+            report = self.rebuild(self.stages_for(changed) | {'assembly', 'consistency'}, changed)
+            report.changed = []
+            return report
+        if not changed:
+            return None
+        return self.rebuild(self.stages_for(changed), changed)
+
+    def watch(
+        self,
+        on_report: Optional[Callable[[RebuildReport], None]] = None,
+        stop: Optional[threading.Event] = None
+    ) -> None:
+        """Build once, then rebuild after each debounced burst of changes.
+
+        Args:
+            on_report: Called with each RebuildReport (default: print it)
+            stop: Event that ends the loop (default: run until interrupted)
+        """
+        on_report = on_report or (lambda report: print(format_report(report), flush=True))
+        stop = stop or threading.Event()
+
+        report = self.check()
+        if report is not None:
+            on_report(report)
+
+        pending: Set[Path] = set()
+        last_change = 0.0
+        while not stop.wait(self.interval):
+            changed = self.poll()
+            if changed:
+                pending |= changed
+                last_change = time.monotonic()
+            elif pending and time.monotonic() - last_change >= self.debounce:
+                stages = self.stages_for(pending)
+                if stages:
+                    on_report(self.rebuild(stages, pending))
+                pending = set()
+
+    def _relative(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.manuscript_dir))
+        except ValueError:
+            return str(path)
+
+
+def format_report(report: RebuildReport) -> str:
+    """One line per stage, headed by the changed files."""
+    changed = ', '.join(report.changed) if report.changed else 'initial build'
+    lines = [f"[{datetime.now().strftime('%H:%M:%S')}] {changed} "
+             f"→ rebuilt in {report.seconds * 1000:.0f} ms"]
+    for stage in report.stages:
+        mark = '✓' if stage.ok else '✗'
+        lines.append(f"  {mark} {stage.name:<12} {stage.seconds * 1000:6.0f} ms  {stage.summary}")
+    return '\n'.join(lines)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental repository analysis keyed on git tree hashes.
+"""
+
+import unittest
+import tempfile
+import shutil
+import subprocess
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_analysis_cache import AnalysisCache, mirror_repo
+from rrwrite_repo_index import RepoIndex
+
+
+def git(repo: Path, *args):
+    subprocess.run(
+        ['git', '-c', 'user.email=test@example.com', '-c', 'user.name=Test', *args],
+        cwd=repo, check=True, capture_output=True
+    )
+
+
+@unittest.skipIf(shutil.which('git') is None, "git not installed")
+class TestAnalysisCache(unittest.TestCase):
+    """Test per-directory reuse and mirrored URL analyses."""
+
+    def setUp(self):
+        """Create a committed repository with a few directories."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.repo = self.test_dir / "repo"
+        self.cache_dir = self.test_dir / "cache"
+        for d in ("analysis", "data", "figures"):
+            (self.repo / d).mkdir(parents=True)
+            (self.repo / d / "file.py").write_text(d)
+        git(self.repo, "init", "-q")
+        git(self.repo, "add", "-A")
+        git(self.repo, "commit", "-qm", "init")
+
+    def tearDown(self):
+        """Clean up repository and cache."""
+        shutil.rmtree(self.test_dir)
+
+    def _index(self, root: Path):
+        cache = AnalysisCache(root, self.cache_dir)
+        index = RepoIndex(root, reuse=cache.lookup)
+        cache.save(index.snapshots())
+        return cache, index
+
+    def test_unchanged_directories_reused(self):
+        """Only directories whose tree changed are rescanned."""
+        cache, _ = self._index(self.repo)
+        self.assertEqual(cache.hits, 0)
+
+        cache, index = self._index(self.repo)
+        self.assertEqual((cache.hits, cache.misses), (4, 0))
+        self.assertEqual(len(index), 3)
+
+        (self.repo / "data" / "new.csv").write_text("a,b")
+        git(self.repo, "add", "-A")
+        git(self.repo, "commit", "-qm", "add data")
+        cache, index = self._index(self.repo)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertIsNotNone(index.stat(self.repo / "data" / "new.csv"))
+        self.assertIsNone(cache.tree_key)
+
+    def test_tree_key_needs_full_reuse(self):
+        """The tree key is only given when every directory came from the cache."""
+        cache, _ = self._index(self.repo)
+        self.assertIsNone(cache.tree_key)
+        cache, _ = self._index(self.repo)
+        self.assertEqual(cache.tree_key, cache.trees[''])
+
+        (self.repo / "figures" / "plot.png").write_text("png")
+        cache, _ = self._index(self.repo)
+        self.assertIsNone(cache.tree_key)
+
+    def test_uncommitted_changes_rescanned(self):
+        """Untracked files mark their directories dirty."""
+        self._index(self.repo)
+        (self.repo / "figures" / "plot.png").write_text("png")
+        cache, index = self._index(self.repo)
+        self.assertIn("figures", cache.dirty)
+        self.assertIsNotNone(index.stat(self.repo / "figures" / "plot.png"))
+
+    def test_ignored_files_edited_in_place_rescanned(self):
+        """Gitignored files are not covered by the tree hash, so their stats are checked."""
+        (self.repo / ".gitignore").write_text("*.log\n")
+        git(self.repo, "add", "-A")
+        git(self.repo, "commit", "-qm", "ignore logs")
+        log = self.repo / "data" / "run.log"
+        log.write_text("short")
+        self._index(self.repo)
+        cache, _ = self._index(self.repo)
+        self.assertEqual(cache.misses, 0)
+
+        log.write_text("a longer log line")
+        cache, index = self._index(self.repo)
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(index.stat(log).size, len("a longer log line"))
+        self.assertIsNone(cache.tree_key)
+
+    def test_mirror_fetches_new_commits(self):
+        """A mirrored URL is fetched and its worktree moved to the new HEAD."""
+        url = self.repo.as_uri()
+        worktree = mirror_repo(url, self.cache_dir)
+        self.assertTrue((worktree / "analysis" / "file.py").exists())
+
+        (self.repo / "README.md").write_text("# Repo")
+        git(self.repo, "add", "-A")
+        git(self.repo, "commit", "-qm", "readme")
+        self.assertEqual(mirror_repo(url, self.cache_dir), worktree)
+        self.assertEqual((worktree / "README.md").read_text(), "# Repo")
+
+    def test_mirror_without_head_raises(self):
+        """An empty remote raises CalledProcessError instead of AttributeError."""
+        empty = self.test_dir / "empty"
+        empty.mkdir()
+        git(empty, "init", "-q")
+        with self.assertRaises(subprocess.CalledProcessError):
+            mirror_repo(empty.as_uri(), self.cache_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed blob store and deduplicating figure import.
+"""
+
+import importlib.util
+import stat
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_blob_store import BlobStore, hash_file, link_file
+
+
+def load_extractor_module():
+    script = Path(__file__).parent.parent / "scripts" / "rrwrite-extract-figures-tables.py"
+    spec = importlib.util.spec_from_file_location("rrwrite_extract_figures_tables", script)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBlobStore(unittest.TestCase):
+    """Test storing, linking and re-importing blobs."""
+
+    def setUp(self):
+        """Create a store and a source file."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.store = BlobStore(self.temp_dir / "blobs")
+        self.src = self.temp_dir / "plot.png"
+        self.src.write_bytes(b"png-bytes")
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_put_stores_each_blob_once(self):
+        """Identical content is stored once and reported as already present."""
+        digest, added = self.store.put(self.src)
+        self.assertTrue(added)
+        self.assertEqual(digest, hash_file(self.src))
+
+        copy = self.temp_dir / "copy.png"
+        copy.write_bytes(b"png-bytes")
+        self.assertEqual(self.store.put(copy), (digest, False))
+
+    def test_link_shares_data_and_skips_existing(self):
+        """Linked files share the blob's inode; relinking is a no-op."""
+        digest, _ = self.store.put(self.src)
+        dest = self.temp_dir / "v1" / "plot.png"
+        self.assertEqual(self.store.link(digest, dest), "hardlink")
+        self.assertTrue(dest.samefile(self.store.blob_path(digest)))
+        self.assertEqual(self.store.link(digest, dest), "existing")
+        # The manuscript's copy stays writable
+        self.assertTrue(dest.stat().st_mode & stat.S_IWUSR)
+
+    def test_link_file_replaces_destination(self):
+        """link_file overwrites a stale destination."""
+        dest = self.temp_dir / "stale.png"
+        dest.write_bytes(b"old")
+        link_file(self.src, dest)
+        self.assertEqual(dest.read_bytes(), b"png-bytes")
+
+
+class TestDeduplicatingImport(unittest.TestCase):
+    """Test repository figure import through the blob store."""
+
+    def setUp(self):
+        """Create a repository with duplicate and colliding figures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.repo = self.temp_dir / "repo"
+        (self.repo / "a").mkdir(parents=True)
+        (self.repo / "b").mkdir()
+        (self.repo / "a" / "results.png").write_bytes(b"same")
+        (self.repo / "b" / "results.png").write_bytes(b"same")
+        (self.repo / "b" / "other.png").write_bytes(b"different")
+        (self.repo / "a" / "other.png").write_bytes(b"different-too")
+        self.module = load_extractor_module()
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def extract(self, version: str):
+        extractor = self.module.FigureTableExtractor(self.repo, self.temp_dir / "manuscript" / version)
+        return extractor.extract_repository_figures()
+
+    def test_versions_share_blobs(self):
+        """Duplicates share a file, collisions get suffixes, versions share blobs."""
+        figures = self.extract("v1")
+        paths = {f["original_path"]: f["path"] for f in figures}
+        self.assertEqual(paths["a/results.png"], paths["b/results.png"])
+        self.assertNotEqual(paths["a/other.png"], paths["b/other.png"])
+        for fig in figures:
+            self.assertTrue(fig["content_hash"].startswith("sha256:"))
+
+        self.extract("v2")
+        self.extract("v2")   # Re-import leaves no numbered copies behind
+        v1 = self.temp_dir / "manuscript" / "v1" / "figures" / "from_repo" / "results.png"
+        v2 = self.temp_dir / "manuscript" / "v2" / "figures" / "from_repo" / "results.png"
+        self.assertTrue(v1.samefile(v2))
+        v2_files = sorted(p.name for p in v2.parent.glob("*.png"))
+        self.assertEqual(v2_files, ["other.png", "other_1.png", "results.png"])
+        blobs = [p for p in (self.temp_dir / "manuscript" / ".rrwrite-blobs").rglob("*") if p.is_file()]
+        self.assertEqual(len(blobs), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for evidence report tables built from repository analysis TSVs.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_script_loader import load_script_module
+
+report = load_script_module("rrwrite-generate-evidence-report.py")
+
+
+class TestEvidenceReport(unittest.TestCase):
+    """Test that incomplete statistics tables are skipped, not fatal."""
+
+    def setUp(self):
+        """Create a manuscript with a data_tables directory."""
+        self.manuscript_dir = Path(tempfile.mkdtemp())
+        self.tables = self.manuscript_dir / "data_tables"
+        self.tables.mkdir()
+        self.generator = report.EvidenceReportGenerator(self.manuscript_dir)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.manuscript_dir)
+
+    def test_short_rows_are_skipped(self):
+        """Rows missing cells are left out of the totals."""
+        (self.tables / "repository_statistics.tsv").write_text(
+            "category\tfile_count\ttotal_size_mb\tavg_size_kb\ttest_files\tdoc_files\n"
+            "script\t4\t1.0\t256.0\t2\t0\n"
+            "doc\t3\n"
+        )
+        summary = self.generator.generate_summary_stats()
+        self.assertIn("| **Total Files Analyzed** | 4 |", summary)
+        self.assertIn("| **Documentation Files** | 0 |", summary)
+        self.assertIn("| **TOTAL** | **4** |", self.generator.generate_repo_statistics_table())
+
+    def test_missing_columns(self):
+        """A table without the expected columns yields zero counts."""
+        (self.tables / "repository_statistics.tsv").write_text("name\tcount\nscript\t4\n")
+        self.assertIn("| **Total Files Analyzed** | 0 |", self.generator.generate_summary_stats())
+        self.assertIn("| **TOTAL** | **0** |", self.generator.generate_repo_statistics_table())
+
+
+if __name__ == "__main__":
+    unittest.main()
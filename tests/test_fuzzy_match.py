@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared fuzzy-match engine and its callers.
+"""
+
+import random
+import unittest
+import tempfile
+import shutil
+from difflib import SequenceMatcher
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from citation_matcher import CitationMatcher
+from rrwrite_edit_applicators import SectionEditApplicator
+from rrwrite_edit_recommendation import EditRecommendation
+from rrwrite_fuzzy_match import FuzzyIndex
+from rrwrite_issue_resolver import Issue, IssueResolver
+
+WORDS = "graph protein annotation model sequence accuracy data method results improves".split()
+
+
+def linear_scan(query, candidates, threshold=0.0, exclude=(), weight=None):
+    """The loop FuzzyIndex replaces."""
+    best_i, best = None, 0.0
+    for i, candidate in enumerate(candidates):
+        if i in exclude:
+            continue
+        score = SequenceMatcher(None, query.lower(), candidate.lower()).ratio()
+        if weight:
+            score *= weight(i)
+        if score > best and score >= threshold:
+            best_i, best = i, score
+    return best_i, best
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    """Test that pruning never changes the result and skips work."""
+
+    def test_matches_linear_scan(self):
+        """Random queries, thresholds, exclusions and weights give identical results."""
+        rng = random.Random(7)
+
+        def text():
+            return " ".join(rng.choice(WORDS) for _ in range(rng.randint(0, 25)))
+
+        for _ in range(300):
+            candidates = [text() for _ in range(rng.randint(0, 20))]
+            candidates += rng.sample(candidates, min(2, len(candidates)))   # Duplicates
+            query = rng.choice(candidates + [text()])
+            threshold = rng.choice([0.0, 0.5, 0.7, 0.9])
+            exclude = set(rng.sample(range(len(candidates)), min(3, len(candidates))))
+            weight = rng.choice([None, lambda i: 1.2 if i % 3 == 0 else 1.0])
+            with self.subTest(query=query, threshold=threshold):
+                self.assertEqual(
+                    FuzzyIndex(candidates).best_match(query, threshold, exclude, weight),
+                    linear_scan(query, candidates, threshold, exclude, weight)
+                )
+
+    def test_bounds_skip_most_ratios(self):
+        """A near-duplicate is found with few full comparisons."""
+        rng = random.Random(1)
+        paragraphs = [" ".join(rng.choice(WORDS) for _ in range(80)) for _ in range(200)]
+        index = FuzzyIndex(paragraphs)
+        self.assertEqual(index.best_match(paragraphs[150][:-15] + " revised", 0.7)[0], 150)
+        self.assertLess(index.comparisons, 10)
+
+        index.comparisons = 0
+        self.assertEqual(index.best_match("Installation via conda and Docker", 0.7), (None, 0.0))
+        self.assertEqual(index.comparisons, 0)
+
+
+class TestFuzzyMatchCallers(unittest.TestCase):
+    """Test edit application, citation and issue matching through the engine."""
+
+    def setUp(self):
+        """Create a manuscript with a sections directory."""
+        self.manuscript_dir = Path(tempfile.mkdtemp())
+        (self.manuscript_dir / "sections").mkdir()
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.manuscript_dir)
+
+    def test_remove_content_finds_paragraph(self):
+        """The most similar paragraph above 0.7 is removed."""
+        section = self.manuscript_dir / "sections" / "methods.md"
+        section.write_text("# Methods\n\nWe used graph models.\n\nWe ran tools with default settings.\n\nEnd.")
+        rec = EditRecommendation(
+            id="e1", source="critique_content", category="clarity", priority="optional",
+            edit_type="remove_content", section="methods",
+            issue_description="Verbose", recommended_action="Remove",
+            target_location={"context_before": "We ran the tools with default settings."}
+        )
+        ok, _ = SectionEditApplicator(self.manuscript_dir).apply_edit(rec)
+        self.assertTrue(ok)
+        self.assertEqual(section.read_text(), "# Methods\n\nWe used graph models.\n\nEnd.")
+
+    def test_citation_and_issue_matching(self):
+        """Citation links and persisting issues match as before."""
+        matcher = CitationMatcher()
+        candidates = {"(Smith et al. 2020)": "url-smith", "(Jones and Brown 2021)": "url-jones"}
+        url, score = matcher.find_best_match("(Smith et al 2020)", candidates)
+        self.assertEqual(url, "url-smith")
+        self.assertEqual(score, 1.0)
+        self.assertEqual(matcher.find_best_match("(Smith 2020)", {}), (None, 0.0))
+
+        old = [Issue("Missing citation for graph claim", "introduction"),
+               Issue("Abstract exceeds word limit", "abstract"),
+               Issue("Missing citation for graph claim", "results")]
+        new = [Issue("Missing citations for graph claim", "results"),
+               Issue("Missing citation for graph claim", "introduction")]
+        resolved, persisting, added = IssueResolver(self.manuscript_dir).match_issues(old, new)
+        self.assertEqual(resolved, [old[1]])
+        self.assertEqual(persisting, [new[1], new[0]])
+        self.assertEqual(added, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Tests for the git-native repository statistics engine.
+"""
+
+import unittest
+import tempfile
+import shutil
+import subprocess
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_git_stats import GitStats, glob_to_regex
+
+
+def commit(repo: Path, email: str, message: str):
+    subprocess.run(['git', 'add', '-A'], cwd=repo, check=True)
+    subprocess.run(
+        ['git', '-c', f'user.email={email}', '-c', 'user.name=Test', 'commit', '-qm', message],
+        cwd=repo, check=True
+    )
+
+
+@unittest.skipIf(shutil.which('git') is None, "git not installed")
+class TestGitStats(unittest.TestCase):
+    """Test tree listing, file counts and history metrics."""
+
+    def setUp(self):
+        """Create a repository with two authors."""
+        self.repo = Path(tempfile.mkdtemp())
+        subprocess.run(['git', 'init', '-q'], cwd=self.repo, check=True)
+        (self.repo / "src" / "schema").mkdir(parents=True)
+        (self.repo / "src" / "schema" / "a.yaml").write_text("a: 1\nb: 2\n")
+        (self.repo / "run.py").write_text("print(1)\n")
+        commit(self.repo, "alice@example.com", "first")
+        (self.repo / "tests").mkdir()
+        (self.repo / "tests" / "test_run.py").write_text("x = 1\ny = 2\nz = 3\n")
+        (self.repo / "untracked.py").write_text("")
+        subprocess.run(['git', 'add', 'tests'], cwd=self.repo, check=True)
+        subprocess.run(
+            ['git', '-c', 'user.email=bob@example.com', '-c', 'user.name=Bob', 'commit', '-qm', 'tests'],
+            cwd=self.repo, check=True
+        )
+        self.stats = GitStats(self.repo)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.repo)
+
+    def test_tree_lists_tracked_files(self):
+        """ls-files gives tracked paths; untracked files are excluded."""
+        self.assertEqual(set(self.stats.tree()), {"src/schema/a.yaml", "run.py", "tests/test_run.py"})
+        self.assertEqual(self.stats.count_files("**/*.py"), 2)
+        self.assertEqual(self.stats.count_files("src/**/*.yaml"), 1)
+
+    def test_staged_files_are_tracked(self):
+        """Staged files count as tracked, also in a repository without commits."""
+        subprocess.run(['git', 'add', 'untracked.py'], cwd=self.repo, check=True)
+        self.assertIn("untracked.py", GitStats(self.repo).tracked_files())
+
+        fresh = self.repo / "fresh"
+        fresh.mkdir()
+        subprocess.run(['git', 'init', '-q'], cwd=fresh, check=True)
+        (fresh / "a.py").write_text("a = 1\n")
+        subprocess.run(['git', 'add', 'a.py'], cwd=fresh, check=True)
+        stats = GitStats(fresh)
+        self.assertIsNone(stats.head())
+        self.assertEqual(stats.tracked_files(), {"a.py"})
+
+    def test_history(self):
+        """One log stream yields commit, contributor and line metrics."""
+        history = self.stats.history()
+        self.assertEqual(history.commits, 2)
+        self.assertEqual(history.contributors, {"alice@example.com", "bob@example.com"})
+        self.assertEqual(history.lines_added, 6)
+
+    def test_glob_to_regex(self):
+        """'**' matches zero or more directories and '*' stays within one."""
+        regex = glob_to_regex("**/*.py")
+        self.assertTrue(regex.match("run.py"))
+        self.assertTrue(regex.match("a/b/run.py"))
+        self.assertFalse(glob_to_regex("*.py").match("a/run.py"))
+
+
+if __name__ == "__main__":
+    unittest.main()
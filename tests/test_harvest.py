@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Tests for resumable NDJSON harvesting.
+"""
+
+import unittest
+import tempfile
+import shutil
+import json
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+import sys
+
+import requests
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_harvest import harvest_ndjson, default_state_file
+from rrwrite_script_loader import load_script_module
+
+
+def make_pages(total_pages, page_size=3, fail_at=None, seen=None):
+    """Fake cursor API: cursor '*' -> page 0, cursor 'cN' -> page N."""
+    def iter_pages(cursor):
+        page = 0 if cursor == "*" else int(cursor[1:])
+        while page < total_pages:
+            if seen is not None:
+                seen.append(page)
+            if page == fail_at:
+                raise ConnectionError("network down")
+            papers = [{"id": f"p{page}-{i}"} for i in range(page_size)]
+            page += 1
+            yield papers, (f"c{page}" if page < total_pages else None)
+    return iter_pages
+
+
+class TestHarvest(unittest.TestCase):
+    """Test streaming and resume behaviour."""
+
+    def setUp(self):
+        """Create temporary output directory."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.output = self.test_dir / "works.ndjson"
+
+    def tearDown(self):
+        """Clean up output directory."""
+        shutil.rmtree(self.test_dir)
+
+    def read_ids(self):
+        return [json.loads(line)["id"] for line in self.output.read_text().splitlines()]
+
+    def test_complete_harvest(self):
+        """All pages are written and the state file is removed."""
+        count = harvest_ndjson(make_pages(3), "openalex", "q", 100, self.output)
+        self.assertEqual(count, 9)
+        self.assertEqual(len(self.read_ids()), 9)
+        self.assertFalse(default_state_file(self.output).exists())
+
+    def test_max_results_truncates(self):
+        """Harvest stops at max_results."""
+        count = harvest_ndjson(make_pages(5), "openalex", "q", 4, self.output)
+        self.assertEqual(count, 4)
+        self.assertEqual(self.read_ids(), ["p0-0", "p0-1", "p0-2", "p1-0"])
+
+    def test_resume_after_interruption(self):
+        """A rerun continues from the saved cursor without duplicates."""
+        with self.assertRaises(ConnectionError):
+            harvest_ndjson(make_pages(4, fail_at=2), "openalex", "q", 100, self.output)
+        self.assertTrue(default_state_file(self.output).exists())
+
+        seen = []
+        count = harvest_ndjson(make_pages(4, seen=seen), "openalex", "q", 100, self.output)
+
+        self.assertEqual(seen, [2, 3])  # Did not restart from page 0
+        self.assertEqual(count, 12)
+        ids = self.read_ids()
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(ids), 12)
+
+    def test_different_query_starts_over(self):
+        """State from another query is not reused."""
+        with self.assertRaises(ConnectionError):
+            harvest_ndjson(make_pages(4, fail_at=2), "openalex", "q1", 100, self.output)
+        count = harvest_ndjson(make_pages(2), "openalex", "q2", 100, self.output)
+        self.assertEqual(count, 6)
+        self.assertEqual(len(self.read_ids()), 6)
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FailingSession:
+    """Serves `pages` OpenAlex/Europe PMC pages, then fails."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.headers = {}
+
+    def get(self, url, params=None, timeout=None):
+        if not self.pages:
+            raise requests.exceptions.ConnectionError("network down")
+        page = self.pages.pop(0)
+        return FakeResponse({
+            "results": [{"id": f"W{page}"}], "meta": {"next_cursor": f"c{page + 1}"},
+            "resultList": {"result": [{"id": f"E{page}"}]}, "nextCursorMark": f"c{page + 1}",
+        })
+
+
+class TestHarvestCLI(unittest.TestCase):
+    """Test that API errors fail the --harvest CLIs and keep the cursor."""
+
+    def setUp(self):
+        """Create temporary output directory."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.output = self.test_dir / "works.ndjson"
+
+    def tearDown(self):
+        """Clean up output directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_api_error_exits_nonzero(self):
+        """A failed page request exits 1 and leaves a resumable state file."""
+        for script in ("rrwrite-api-openalex.py", "rrwrite-api-europepmc.py"):
+            with self.subTest(script=script):
+                module = load_script_module(script)
+                argv = [script, "q", "--harvest", "--max-results", "10", "--output", str(self.output)]
+                with mock.patch.object(module, "get_session", return_value=FailingSession([0, 1])), \
+                        mock.patch.object(sys, "argv", argv), redirect_stderr(StringIO()) as err:
+                    self.assertEqual(module.main(), 1)
+                self.assertIn("network down", err.getvalue())
+                self.assertEqual(len(self.output.read_text().splitlines()), 2)
+                state = json.loads(default_state_file(self.output).read_text())
+                self.assertEqual(state["cursor"], "c2")
+                default_state_file(self.output).unlink()
+
+    def test_search_keeps_partial_results(self):
+        """search() still returns the pages fetched before an error."""
+        module = load_script_module("rrwrite-api-openalex.py")
+        with mock.patch.object(module, "get_session", return_value=FailingSession([0])), \
+                redirect_stderr(StringIO()):
+            papers = module.OpenAlexClient().search("q", max_results=5)
+        self.assertEqual(len(papers), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for dependency scheduling, conflict detection and waves in the holistic editor.
+"""
+
+import random
+import unittest
+import tempfile
+import shutil
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_edit_recommendation import EditRecommendation
+from rrwrite_holistic_editor import ApplicationPlan, DependencyGraph, HolisticEditOrchestrator
+from rrwrite_script_loader import load_script_module
+
+SECTIONS = ["introduction", "methods", "results", "discussion"]
+
+
+def rec(rec_id, section="methods", edit_type="revise_content", priority="important", **kwargs):
+    return EditRecommendation(
+        id=rec_id, source="critique_content", category="clarity", priority=priority,
+        edit_type=edit_type, section=section, issue_description=f"Issue {rec_id}",
+        recommended_action=f"Fix {rec_id}", **kwargs
+    )
+
+
+class TestDependencyGraph(unittest.TestCase):
+    """Test ordering, conflicts and waves."""
+
+    def test_dependencies_come_first_then_priority(self):
+        """Dependencies are applied before dependents; ready edits go by priority."""
+        recs = [
+            rec("a", priority="optional"),
+            rec("b", priority="critical", dependencies=["a"]),
+            rec("c", priority="important"),
+            rec("d", priority="important", dependencies=["missing"]),
+        ]
+        self.assertEqual(DependencyGraph(recs).topological_sort(), ["c", "d", "a", "b"])
+
+        with self.assertRaises(ValueError):
+            DependencyGraph([rec("x", dependencies=["y"]), rec("y", dependencies=["x"])]).topological_sort()
+
+    def test_conflicts_match_pairwise_check(self):
+        """Bucketed detection reports the same pairs, in the same order, as all pairs."""
+        rng = random.Random(3)
+        types = ["add_content", "remove_content", "restructure", "revise_content"]
+        recs = [
+            rec(f"e{i}", rng.choice(SECTIONS), rng.choice(types),
+                conflicts_with=[f"e{rng.randrange(80)}"] if rng.random() < 0.1 else [])
+            for i in range(80)
+        ]
+        graph = DependencyGraph(recs)
+        expected = [
+            (r1.id, r2.id, reason)
+            for i, r1 in enumerate(recs) for r2 in recs[i + 1:]
+            if (reason := graph._check_conflict(r1, r2))
+        ]
+        self.assertTrue(expected)
+        self.assertEqual(graph.detect_conflicts(), expected)
+
+    def test_waves_keep_lanes_independent(self):
+        """Sections run side by side; dependents and cross-section moves wait."""
+        recs = [
+            rec("m1", "methods"),
+            rec("r1", "results"),
+            rec("m2", "methods"),
+            rec("d1", "discussion", dependencies=["r1"]),
+            rec("mv", "results", "move_content", target_sections=["discussion"]),
+            rec("r2", "results"),
+        ]
+        order = [r.id for r in recs]
+        plan = ApplicationPlan(order, [], {r.id: r for r in recs})
+        self.assertEqual(plan.waves(), [
+            {"methods": ["m1", "m2"], "results": ["r1"]},
+            {"discussion": ["d1"]},
+            {"results+discussion": ["mv"]},
+            {"results": ["r2"]},
+        ])
+
+
+class TestConcurrentApplication(unittest.TestCase):
+    """Test that applying waves concurrently matches sequential application."""
+
+    def setUp(self):
+        """Create two identical manuscripts and a recommendations list."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.recs = []
+        for name in ("serial", "parallel"):
+            sections = self.temp_dir / name / "sections"
+            sections.mkdir(parents=True)
+            for section in SECTIONS:
+                paragraphs = [f"# {section.title()}"] + [
+                    f"Paragraph {i} of the {section} section describes step {i}." for i in range(6)
+                ]
+                (sections / f"{section}.md").write_text("\n\n".join(paragraphs))
+        for i, section in enumerate(SECTIONS * 3):
+            target = {"context_before": f"Paragraph {i % 6} of the {section} section describes step {i % 6}."}
+            self.recs.append(rec(f"e{i}", section, ["remove_content", "revise_content", "add_content"][i % 3],
+                                 target_location=target, replacement_text=f"Revised text {i}."))
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def apply(self, name, workers):
+        orchestrator = HolisticEditOrchestrator(self.temp_dir / name)
+        orchestrator.recommendations = [EditRecommendation.from_dict(r.to_dict()) for r in self.recs]
+        orchestrator.plan_application(resolve_conflicts=False)
+        with redirect_stdout(StringIO()):
+            results = load_script_module("rrwrite-apply-edits.py").apply_edits(
+                orchestrator, backup=False, workers=workers
+            )
+        files = {p.name: p.read_text() for p in sorted((self.temp_dir / name / "sections").iterdir())}
+        return results, files
+
+    def test_parallel_matches_serial(self):
+        """Section files and counts are identical with four workers."""
+        serial, serial_files = self.apply("serial", 1)
+        parallel, parallel_files = self.apply("parallel", 4)
+        self.assertEqual(parallel_files, serial_files)
+        self.assertEqual(parallel["applied"], serial["applied"])
+        self.assertEqual(sorted(d["id"] for d in parallel["details"]),
+                         sorted(d["id"] for d in serial["details"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared HTTP response cache.
+"""
+
+import unittest
+import tempfile
+import shutil
+import os
+import time
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import rrwrite_http_cache
+from rrwrite_http_cache import HTTPCache, ttl_for_url, DAY
+from rrwrite_validate_evidence_tool import validate_doi
+
+
+class TestHTTPCache(unittest.TestCase):
+    """Test cache storage, expiry and eviction."""
+
+    def setUp(self):
+        """Create temporary cache directory."""
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up cache directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip_and_stats(self):
+        """Stored responses are returned and counted as hits."""
+        cache = HTTPCache(cache_dir=self.test_dir)
+        key = HTTPCache.make_key("GET", "https://api.openalex.org/works?search=x")
+
+        self.assertIsNone(cache.get(key))
+        cache.put(key, "GET", "https://api.openalex.org/works?search=x", 200,
+                  {"Content-Type": "application/json"}, b'{"results": []}')
+        entry = cache.get(key)
+
+        self.assertEqual(entry["status"], 200)
+        self.assertEqual(entry["content"], b'{"results": []}')
+        stats = cache.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["by_host"], {"api.openalex.org": 1})
+
+    def test_shared_between_instances(self):
+        """A second cache instance (another process) sees stored entries."""
+        HTTPCache(cache_dir=self.test_dir).put("k", "GET", "https://doi.org/10.1/x", 200, {}, b"ok")
+        self.assertIsNotNone(HTTPCache(cache_dir=self.test_dir).get("k"))
+
+    def test_expired_entries_miss(self):
+        """Entries past their TTL are not served."""
+        cache = HTTPCache(cache_dir=self.test_dir)
+        cache.put("k", "GET", "https://example.org", 200, {}, b"ok", ttl=-1)
+        self.assertIsNone(cache.get("k"))
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted above the size cap."""
+        cache = HTTPCache(cache_dir=self.test_dir, max_bytes=100)
+        cache.put("a", "GET", "https://example.org/a", 200, {}, b"x" * 40)
+        time.sleep(0.01)
+        cache.put("b", "GET", "https://example.org/b", 200, {}, b"x" * 40)
+        time.sleep(0.01)
+        cache.get("a")  # 'a' is now more recent than 'b'
+        cache.put("c", "GET", "https://example.org/c", 200, {}, b"x" * 40)
+
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_endpoint_ttls(self):
+        """Search endpoints expire sooner than record lookups."""
+        self.assertEqual(ttl_for_url("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi?term=x"), DAY)
+        self.assertEqual(ttl_for_url("https://eutils.ncbi.nlm.nih.gov/entrez/eutils/efetch.fcgi?id=1"), 30 * DAY)
+        self.assertEqual(ttl_for_url("https://api.crossref.org/works/10.1038/x"), 30 * DAY)
+
+    def test_helpers_share_one_session(self):
+        """Per-DOI helpers reuse one session; a new cache directory starts a new one."""
+        session_class = mock.MagicMock()
+        session_class.return_value.head.return_value.status_code = 200
+        with mock.patch.dict(os.environ), mock.patch.object(rrwrite_http_cache, "CachedSession", session_class):
+            try:
+                rrwrite_http_cache.configure_cache_dir(self.test_dir)
+                self.assertEqual([validate_doi("10.1/a"), validate_doi("10.1/b")], ["valid", "valid"])
+                self.assertEqual(session_class.call_count, 1)
+                self.assertEqual(session_class.return_value.head.call_count, 2)
+
+                rrwrite_http_cache.configure_cache_dir(self.test_dir)
+                rrwrite_http_cache.shared_session()
+                self.assertEqual(session_class.call_count, 2)
+            finally:
+                rrwrite_http_cache.configure_cache_dir(self.test_dir)   # Drop the mock session
+
+if __name__ == "__main__":
+    unittest.main()
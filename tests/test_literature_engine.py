@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent literature search engine.
+"""
+
+import unittest
+import time
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_literature_engine import LiteratureSearchEngine
+
+
+def slow_source(query, max_results):
+    time.sleep(0.3)
+    return [{"title": f"{query} paper", "doi": "10.1/x"}]
+
+
+def hanging_source(query, max_results):
+    time.sleep(5)
+    return []
+
+
+def failing_source(query, max_results):
+    raise RuntimeError("API down")
+
+
+class TestLiteratureSearchEngine(unittest.TestCase):
+    """Test concurrent source execution."""
+
+    def test_sources_run_concurrently(self):
+        """Total time is bounded by the slowest source, not the sum."""
+        engine = LiteratureSearchEngine(searchers={
+            "pubmed": slow_source,
+            "semantic_scholar": slow_source,
+            "openalex": slow_source,
+            "europepmc": slow_source,
+        })
+        start = time.monotonic()
+        sources = ["pubmed", "semantic_scholar", "openalex", "europepmc"]
+        results = engine.search("ontology", sources, max_results=5)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(list(results), sources)
+        for result in results.values():
+            self.assertEqual(len(result.papers), 1)
+            self.assertIsNone(result.error)
+
+    def test_timeout_and_errors_are_isolated(self):
+        """A hanging or failing source does not affect the others."""
+        engine = LiteratureSearchEngine(
+            timeouts={"openalex": 0.2},
+            searchers={"pubmed": slow_source, "openalex": hanging_source, "europepmc": failing_source}
+        )
+        results = engine.search("query", ["pubmed", "openalex", "europepmc"])
+
+        self.assertEqual(len(results["pubmed"].papers), 1)
+        self.assertTrue(results["openalex"].timed_out)
+        self.assertEqual(results["openalex"].papers, [])
+        self.assertEqual(results["europepmc"].error, "API down")
+
+
+if __name__ == "__main__":
+    unittest.main()
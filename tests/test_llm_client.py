@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Tests for the cached LLM call layer, against a local stub API server.
+"""
+
+import json
+import os
+import threading
+import unittest
+import tempfile
+import shutil
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_llm_client import LLMCache, LLMClient, LLMError
+from rrwrite_revision_context import RevisionContext
+from rrwrite_revision_parser import Issue
+from rrwrite_section_reviser import SectionReviser
+
+
+class StubMessagesAPI(BaseHTTPRequestHandler):
+    """Answers /v1/messages with a numbered reply; queued statuses are returned first."""
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["content-length"])))
+        server.requests.append(body)
+        status = server.statuses.pop(0) if server.statuses else 200
+        if status == 200:
+            reply = {
+                "content": [{"type": "text", "text": f"Reply {len(server.requests)}."}],
+                "usage": {"input_tokens": 100, "output_tokens": 10},
+            }
+        else:
+            reply = {"type": "error", "error": {"type": "overloaded_error"}}
+        data = json.dumps(reply).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        if status != 200:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLLMClient(unittest.TestCase):
+    """Test response caching, retries, accounting and per-section batching."""
+
+    def setUp(self):
+        """Start the stub server and create a cache directory."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StubMessagesAPI)
+        self.server.requests, self.server.statuses = [], []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        """Stop the server and clean up."""
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.temp_dir)
+
+    def client(self, **kwargs):
+        kwargs.setdefault("api_key", "test-key")
+        return LLMClient(base_url=self.base_url, cache=LLMCache(self.temp_dir), **kwargs)
+
+    def test_repeated_requests_are_served_from_disk(self):
+        """Identical requests hit the API once, also from a new client."""
+        first = self.client().complete("Condense this.")
+        self.assertEqual(first.text, "Reply 1.")
+        self.assertFalse(first.cached)
+
+        with mock.patch.dict(os.environ):
+            os.environ.pop("ANTHROPIC_API_KEY", None)
+            client = self.client(api_key=None)
+        again = client.complete("Condense this.")
+        self.assertTrue(again.cached)
+        self.assertEqual(again.text, "Reply 1.")
+        self.assertEqual(len(self.server.requests), 1)
+
+        # Other parameters are a different request (and need a key)
+        with self.assertRaises(LLMError):
+            client.complete("Condense this.", max_tokens=100)
+        self.assertEqual(client.usage.snapshot()["cache_hits"], 1)
+
+    def test_overloaded_requests_are_retried(self):
+        """Overloaded responses are retried and usage counts the successful call."""
+        self.server.statuses = [529]
+        client = self.client()
+        self.assertEqual(client.complete("Hello").text, "Reply 2.")
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(client.usage.snapshot()["input_tokens"], 100)
+
+        self.server.statuses = [400]
+        with self.assertRaises(LLMError):
+            client.complete("Bad request")
+
+    def test_reviser_batches_llm_work_per_section(self):
+        """One request adds all citations, one condenses; a rerun is free."""
+        manuscript_dir = self.temp_dir / "manuscript"
+        manuscript_dir.mkdir()
+        (manuscript_dir / "literature_evidence.csv").write_text(
+            "doi,citation_key,evidence\n"
+            "10.1/a,smith2020,Graph models improve protein annotation\n"
+            "10.1/b,lee2021,Sequencing costs dropped sharply\n"
+        )
+        section = manuscript_dir / "introduction.md"
+        section.write_text("# Introduction\n\nProteins are annotated with graphs. Sequencing is cheap.\n")
+        context = RevisionContext(manuscript_dir)
+        issues = [
+            Issue("major", "Evidence", 'Unsupported: "graph models improve annotation"', "Cite"),
+            Issue("major", "Word Count", "Section exceeds 300 words", "Condense"),
+            Issue("major", "Evidence", 'Unsupported: "sequencing costs dropped"', "Cite"),
+            Issue("major", "Word Count", "Target is 200 words", "Condense"),
+        ]
+
+        llm = self.client()
+        result = SectionReviser("introduction", section, issues, context, llm).revise()
+        citations, condense = self.server.requests
+        prompt = citations["messages"][0]["content"]
+        self.assertIn("graph models improve annotation", prompt)
+        self.assertIn("sequencing costs dropped", prompt)
+        self.assertIn("[lee2021]", prompt)
+        self.assertIn("approximately 200 words", condense["messages"][0]["content"])
+        self.assertIn("Reply 1.", condense["messages"][0]["content"])
+        self.assertEqual(result.content, "Reply 2.")
+        self.assertEqual(len(result.changes_made), 4)
+
+        SectionReviser("introduction", section, issues, context, self.client()).revise()
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(llm.usage.snapshot()["requests"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
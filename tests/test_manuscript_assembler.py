@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental manuscript assembly.
+"""
+
+import json
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_manuscript_assembler import ManuscriptAssembler, SECTION_ORDER
+
+
+class TestManuscriptAssembler(unittest.TestCase):
+    """Test section caching, Paperpile conversion and unchanged-output skips."""
+
+    def setUp(self):
+        """Create a manuscript with Paperpile citations."""
+        self.manuscript_dir = Path(tempfile.mkdtemp())
+        (self.manuscript_dir / "sections").mkdir()
+        for section in SECTION_ORDER[:-1]:
+            (self.manuscript_dir / section).write_text(
+                f"Text of {section} [(Lee 2019)](https://paperpile.com/c/ABC/x2)\n"
+            )
+        (self.manuscript_dir / "introduction.md").unlink()
+        (self.manuscript_dir / "sections" / "introduction.md").write_text("# Introduction\n\nPlain.\n")
+        self.mapping = self.manuscript_dir / "paperpile_mapping.json"
+        self.mapping.write_text(json.dumps({"x2": "lee2019"}))
+        self.output = self.manuscript_dir / "full_manuscript.md"
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.manuscript_dir)
+
+    def touch(self, path: Path, text: str):
+        path.write_text(text)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def test_assembled_text_and_word_count(self):
+        """Sections are converted, titled and counted like the full document."""
+        result = ManuscriptAssembler(self.manuscript_dir).assemble()
+        text = self.output.read_text()
+        self.assertTrue(result.written)
+        self.assertTrue(result.converted_citations)
+        self.assertEqual(text.count("[lee2019]"), 4)
+        self.assertIn("# Abstract\n\nText of abstract.md", text)
+        self.assertEqual(text.count("# Introduction"), 1)
+        self.assertEqual(result.words, len(text.split()))
+        self.assertEqual([s.name for s in result.sections], SECTION_ORDER[:-1])
+
+    def test_only_changed_sections_are_reread(self):
+        """Unchanged sections come from the cache, also in a new process."""
+        assembler = ManuscriptAssembler(self.manuscript_dir)
+        assembler.assemble()
+        mtime = self.output.stat().st_mtime_ns
+
+        result = assembler.assemble()
+        self.assertEqual(result.reread, [])
+        self.assertFalse(result.written)
+        self.assertEqual(self.output.stat().st_mtime_ns, mtime)
+
+        self.touch(self.manuscript_dir / "results.md", "New results.\n")
+        result = ManuscriptAssembler(self.manuscript_dir).assemble()
+        self.assertEqual(result.reread, ["results.md"])
+        self.assertTrue(result.written)
+        self.assertIn("New results.", self.output.read_text())
+
+    def test_mapping_change_reconverts(self):
+        """Editing paperpile_mapping.json updates converted sections without re-reading them."""
+        assembler = ManuscriptAssembler(self.manuscript_dir)
+        assembler.assemble()
+        self.touch(self.mapping, json.dumps({"x2": "lee2019b"}))
+        result = assembler.assemble()
+        self.assertEqual(result.reread, [])
+        self.assertEqual(self.output.read_text().count("[lee2019b]"), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
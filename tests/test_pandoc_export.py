@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Tests for the pandoc export service.
+"""
+
+import os
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_pandoc_export import ExportJob, PandocEngines, PandocExporter, probe_engines
+
+# Records its arguments and writes the output file; fails on "FAIL" in the input
+FAKE_PANDOC = """#!{python}
+import sys
+args = sys.argv[1:]
+with open({log!r}, 'a') as log:
+    log.write(' '.join(args) + '\\n')
+if 'FAIL' in open(args[0]).read():
+    sys.stderr.write('conversion error')
+    sys.exit(1)
+open(args[args.index('-o') + 1], 'w').write('converted')
+"""
+
+
+@unittest.skipIf(os.name != "posix", "fake pandoc is a POSIX script")
+class TestPandocExporter(unittest.TestCase):
+    """Test engine probing, concurrent conversion and unchanged-input skips."""
+
+    def setUp(self):
+        """Create a manuscript and a fake pandoc executable."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.bin = self.temp_dir / "bin"
+        self.bin.mkdir()
+        self.log = self.temp_dir / "pandoc.log"
+        for name, body in (("pandoc", FAKE_PANDOC.format(python=sys.executable, log=str(self.log))),
+                           ("weasyprint", "#!/bin/sh\n")):
+            (self.bin / name).write_text(body)
+            (self.bin / name).chmod(0o755)
+
+        self.markdown = self.temp_dir / "full_manuscript.md"
+        self.markdown.write_text("# Results\n\n![Accuracy](figures/accuracy.png)\n")
+        (self.temp_dir / "figures").mkdir()
+        self.figure = self.temp_dir / "figures" / "accuracy.png"
+        self.figure.write_bytes(b"png-1")
+        self.bib = self.temp_dir / "literature_citations.bib"
+        self.bib.write_text("@article{a2020,}\n")
+
+        self.engines = PandocEngines(str(self.bin / "pandoc"), ("weasyprint",))
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def jobs(self):
+        docx = ExportJob(self.markdown, self.temp_dir / "full_manuscript.docx",
+                         args=["--citeproc"], inputs=[self.bib])
+        pdf = ExportJob(self.markdown, self.temp_dir / "full_manuscript.pdf",
+                        pdf_engines=("pdflatex", "weasyprint"))
+        return [docx, pdf]
+
+    def calls(self):
+        return self.log.read_text().splitlines() if self.log.exists() else []
+
+    def test_probe_finds_installed_engines_only(self):
+        """Engines missing from PATH are never tried."""
+        probe_engines.cache_clear()
+        path = os.environ.get("PATH", "")
+        os.environ["PATH"] = str(self.bin)
+        try:
+            engines = probe_engines()
+        finally:
+            os.environ["PATH"] = path
+            probe_engines.cache_clear()
+        self.assertEqual(engines, self.engines)
+
+        docx, pdf = PandocExporter(engines).run(self.jobs())
+        self.assertEqual((docx.status, pdf.status), ("generated", "generated"))
+        self.assertEqual(pdf.engine, "weasyprint")
+        self.assertEqual(len(self.calls()), 2)
+
+    def test_unchanged_inputs_are_skipped(self):
+        """A second export converts only the outputs whose inputs changed."""
+        exporter = PandocExporter(self.engines)
+        exporter.run(self.jobs())
+        results = exporter.run(self.jobs())
+        self.assertEqual([r.status for r in results], ["unchanged", "unchanged"])
+        self.assertEqual(len(self.calls()), 2)
+
+        self.bib.write_text("@article{b2021,}\n")
+        results = exporter.run(self.jobs())
+        self.assertEqual([r.status for r in results], ["generated", "unchanged"])
+
+        self.figure.write_bytes(b"png-2")
+        results = exporter.run(self.jobs())
+        self.assertEqual([r.status for r in results], ["generated", "generated"])
+
+        results = PandocExporter(self.engines, force=True).run(self.jobs())
+        self.assertEqual([r.status for r in results], ["generated", "generated"])
+        self.assertEqual(len(self.calls()), 7)
+
+    def test_failure_is_reported_and_retried(self):
+        """A failed conversion reports pandoc's error and is not recorded as done."""
+        exporter = PandocExporter(self.engines)
+        self.markdown.write_text("FAIL\n")
+        result = exporter.convert(self.jobs()[0])
+        self.assertFalse(result.ok)
+        self.assertIn("conversion error", result.error)
+
+        self.assertEqual(exporter.convert(self.jobs()[0]).status, "failed")
+        self.assertEqual(len(self.calls()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
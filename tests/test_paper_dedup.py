@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for multi-key paper deduplication and record merging.
+"""
+
+import unittest
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_paper_dedup import deduplicate_papers, normalize_doi, normalize_arxiv
+
+
+class TestPaperDedup(unittest.TestCase):
+    """Test identity keys, near-duplicate titles and field-level merging."""
+
+    def test_normalizers(self):
+        """DOI and arXiv IDs are normalized before comparison."""
+        self.assertEqual(normalize_doi("https://doi.org/10.1038/ABC"), "10.1038/abc")
+        self.assertEqual(normalize_doi("doi: 10.1/x."), "10.1/x")
+        self.assertEqual(normalize_arxiv("arXiv:2101.00001v3"), "2101.00001")
+
+    def test_merge_by_doi_keeps_richest_fields(self):
+        """Records sharing a DOI merge, keeping the longest abstract and max citations."""
+        papers = [
+            {"title": "Protein folding", "doi": "10.1/PF", "abstract": "Short.",
+             "citations": 10, "pmid": "", "source": "OpenAlex"},
+            {"title": "Protein Folding.", "doi": "https://doi.org/10.1/pf",
+             "abstract": "A much longer abstract text.", "citations": 3,
+             "pmid": "555", "source": "PubMed"},
+        ]
+        result = deduplicate_papers(papers)
+
+        self.assertEqual(len(result), 1)
+        merged = result[0]
+        self.assertEqual(merged["abstract"], "A much longer abstract text.")
+        self.assertEqual(merged["citations"], 10)
+        self.assertEqual(merged["pmid"], "555")
+        self.assertEqual(merged["source"], "OpenAlex")
+        self.assertEqual(merged["sources"], ["OpenAlex", "PubMed"])
+
+    def test_transitive_keys(self):
+        """A record linked by PMID to one and DOI to another joins both."""
+        papers = [
+            {"title": "A", "doi": "10.1/a"},
+            {"title": "B", "pmid": "42"},
+            {"title": "C", "doi": "10.1/A", "pmid": "42"},
+        ]
+        self.assertEqual(len(deduplicate_papers(papers)), 1)
+
+    def test_near_duplicate_titles(self):
+        """Titles differing in punctuation or a stopword merge; distant years do not."""
+        papers = [
+            {"title": "Deep learning for metagenomic binning of soil microbial communities",
+             "year": 2020},
+            {"title": "Deep-learning for metagenomic binning in soil microbial communities",
+             "year": 2021},
+            {"title": "Deep learning for metagenomic binning of soil microbial communities",
+             "year": 2015},
+        ]
+        result = deduplicate_papers(papers)
+        self.assertEqual(len(result), 2)
+        self.assertEqual(len(deduplicate_papers(papers, near_duplicates=False)), 3)
+
+    def test_conflicting_dois_not_merged(self):
+        """Same title with different DOIs stays separate (e.g., errata)."""
+        papers = [
+            {"title": "Introduction", "doi": "10.1/x"},
+            {"title": "Introduction", "doi": "10.1/y"},
+            {"title": "Introduction"},
+        ]
+        self.assertEqual(len(deduplicate_papers(papers)), 2)
+
+    def test_conflicting_ids_not_chained(self):
+        """Records linked through a shared arXiv ID and PMID keep their distinct DOIs apart."""
+        papers = [
+            {"doi": "10.1/a", "arxiv": "2101.00001"},
+            {"pmid": "1", "arxiv": "2101.00001"},
+            {"doi": "10.1/b", "pmid": "1"},
+        ]
+        result = deduplicate_papers(papers)
+        self.assertEqual(len(result), 2)
+        self.assertEqual({p.get("doi") for p in result}, {"10.1/a", "10.1/b"})
+
+    def test_order_preserved(self):
+        """Output keeps first-seen order."""
+        papers = [{"title": f"Paper number {i} on genomes", "doi": f"10.1/{i}"} for i in range(5)]
+        result = deduplicate_papers(papers + papers[:2])
+        self.assertEqual([p["doi"] for p in result], [f"10.1/{i}" for i in range(5)])
+
+
+if __name__ == "__main__":
+    unittest.main()
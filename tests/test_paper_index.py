@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Tests for the local full-text paper index.
+"""
+
+import unittest
+import tempfile
+import shutil
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_literature_engine import SourceResult
+from rrwrite_paper_index import PaperIndex, paper_key
+from rrwrite_script_loader import load_script_module
+
+
+PAPERS = [
+    {"title": "Highly accurate protein structure prediction with AlphaFold",
+     "doi": "10.1038/s41586-021-03819-2", "year": 2021, "citations": 20000, "source": "openalex"},
+    {"title": "Metagenome assembly of soil microbial communities",
+     "abstract": "We assemble metagenomes from soil samples.", "pmid": "123", "source": "PubMed"},
+]
+
+
+class TestPaperIndex(unittest.TestCase):
+    """Test ingestion, merging, replay and BM25 search."""
+
+    def setUp(self):
+        """Create temporary index."""
+        self.test_dir = Path(tempfile.mkdtemp())
+        self.index = PaperIndex(self.test_dir / "index.sqlite")
+
+    def tearDown(self):
+        """Clean up index directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_search_ranks_matches(self):
+        """Full-text search finds papers by title and abstract terms."""
+        self.index.add_papers(PAPERS)
+        results = self.index.search("protein structure", limit=5)
+        self.assertEqual(results[0]["doi"], "10.1038/s41586-021-03819-2")
+        self.assertEqual(self.index.search("soil metagenomes", match_all=True)[0]["pmid"], "123")
+
+    def test_merge_keeps_richest_fields(self):
+        """A later record fills in missing fields without losing existing ones."""
+        self.index.add_papers([PAPERS[0]])
+        self.index.add_papers([{"doi": "https://doi.org/10.1038/S41586-021-03819-2",
+                                "abstract": "AlphaFold predicts structures.", "citations": 5}])
+        paper = self.index.search("alphafold")[0]
+        self.assertEqual(paper["abstract"], "AlphaFold predicts structures.")
+        self.assertEqual(paper["citations"], 20000)
+        self.assertEqual(self.index.stats()["papers"], 1)
+
+    def test_repeat_query_replay(self):
+        """Recorded queries replay in rank order and respect max_results coverage."""
+        self.index.record_query("Protein  Structure", "openalex", PAPERS, max_results=2)
+        replay = self.index.cached_results("protein structure", "openalex", 2)
+        self.assertEqual([p.get("doi") for p in replay], ["10.1038/s41586-021-03819-2", None])
+        self.assertIsNone(self.index.cached_results("protein structure", "openalex", 10))
+        self.assertIsNone(self.index.cached_results("protein structure", "pubmed", 2))
+
+    def test_replay_returns_source_records(self):
+        """Replay returns every field the source gave, and the latest source is kept."""
+        work = {"title": "Graph neural networks for proteins", "doi": "10.1/gnn",
+                "openalex_id": "W123", "citationCount": 7, "pub_date": "2023-05-01", "source": "OpenAlex"}
+        self.index.record_query("gnn", "openalex", [work], max_results=5)
+        self.assertEqual(self.index.cached_results("gnn", "openalex", 5), [work])
+
+        self.index.record_query("gnn", "pubmed", [dict(work, source="PubMed")], max_results=5)
+        self.assertEqual(self.index.search("graph")[0]["source"], "pubmed")
+        self.assertEqual(self.index.cached_results("gnn", "openalex", 5)[0]["source"], "OpenAlex")
+
+    def test_related_hits_need_flag(self):
+        """Index hits for other queries are only merged with include_related or offline."""
+        self.index.record_query("protein structure", "openalex", [PAPERS[0]], max_results=5)
+        search_literature = load_script_module("rrwrite-search-literature.py").search_literature
+        sources = dict(use_pubmed=False, use_semantic_scholar=False, use_europepmc=False)
+        with redirect_stderr(StringIO()):
+            offline = search_literature("structure prediction", index=self.index, offline=True,
+                                        use_openalex=False, **sources)
+            online = search_literature("protein structure", index=self.index, **sources)
+            merged = search_literature("protein structure", index=self.index, include_related=True, **sources)
+        self.assertEqual(offline["counts"]["local_index"], 1)
+        self.assertEqual(online["counts"]["local_index"], 0)
+        self.assertEqual(online["counts"]["openalex"], 1)
+        self.assertEqual(merged["counts"]["local_index"], 1)
+        self.assertEqual(len(merged["papers"]), 1)
+
+    def test_empty_answers_are_not_replayed(self):
+        """A source that returned nothing (e.g. a swallowed network error) is asked again."""
+        self.index.record_query("protein structure", "openalex", [], max_results=5)
+        self.assertIsNone(self.index.cached_results("protein structure", "openalex", 5))
+
+        answers = [[], [PAPERS[0]]]
+
+        class FakeEngine:
+            def __init__(self, timeouts=None):
+                pass
+
+            def search(self, query, sources, max_results):
+                return {name: SourceResult(name, answers.pop(0)) for name in sources}
+
+        module = load_script_module("rrwrite-search-literature.py")
+        sources = dict(use_pubmed=False, use_semantic_scholar=False, use_europepmc=False)
+        with mock.patch.object(module, "LiteratureSearchEngine", FakeEngine), redirect_stderr(StringIO()):
+            first = module.search_literature("graph models", index=self.index, **sources)
+            second = module.search_literature("graph models", index=self.index, **sources)
+        self.assertEqual(first["counts"]["openalex"], 0)
+        self.assertEqual(second["counts"]["openalex"], 1)
+        self.assertEqual(answers, [])
+        self.assertEqual(self.index.cached_results("graph models", "openalex", 20), [PAPERS[0]])
+
+    def test_paper_key(self):
+        """Keys prefer DOI, then PMID, then title."""
+        self.assertEqual(paper_key({"doi": "doi: 10.1/ABC"}), "doi:10.1/abc")
+        self.assertEqual(paper_key({"pmid": 42}), "pmid:42")
+        self.assertEqual(paper_key({"title": "A  Title!"}), paper_key({"title": "a title"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for PubMed history-server paging with mocked E-utilities.
+"""
+
+import unittest
+from contextlib import redirect_stderr
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_script_loader import load_script_module
+
+pubmed = load_script_module("rrwrite-api-pubmed.py")
+
+
+class FakeResponse:
+    def __init__(self, json_data=None, content=b""):
+        self._json = json_data
+        self.content = content
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._json
+
+
+def article_xml(pmids):
+    articles = "".join(
+        f"<PubmedArticle><MedlineCitation><PMID>{pmid}</PMID><Article>"
+        f"<ArticleTitle>Paper {pmid}</ArticleTitle><Journal><Title>J</Title></Journal>"
+        f"</Article></MedlineCitation></PubmedArticle>"
+        for pmid in pmids
+    )
+    return f"<PubmedArticleSet>{articles}</PubmedArticleSet>".encode()
+
+
+class FakeEutils:
+    """esearch/efetch over `total` numbered PMIDs; history fetches fail from `fail_at`."""
+
+    def __init__(self, total, fail_at=None, partial=0):
+        self.pmids = [str(1000 + i) for i in range(total)]
+        self.fail_at = fail_at
+        self.partial = partial      # Records returned by the failing request before the error
+        self.searches = []
+        self.fetches = []
+
+    def get(self, url, params=None, timeout=None):
+        self.searches.append(params)
+        return FakeResponse({"esearchresult": {
+            "count": str(len(self.pmids)),
+            "idlist": self.pmids[:params["retmax"]],
+            "webenv": "ENV",
+            "querykey": "1",
+        }})
+
+    def post(self, url, data=None, timeout=None):
+        self.fetches.append(data)
+        if "id" in data:
+            return FakeResponse(content=article_xml(data["id"].split(",")))
+        start, size = data["retstart"], data["retmax"]
+        if self.fail_at is not None and start >= self.fail_at:
+            body = article_xml(self.pmids[start:start + self.partial])
+            return FakeResponse(content=body.replace(b"</PubmedArticleSet>", b"<ERROR>expired</ERROR>"))
+        return FakeResponse(content=article_xml(self.pmids[start:start + size]))
+
+
+class TestPubMedHistory(unittest.TestCase):
+    """Test chunked history fetches, the PMID fallback and result caps."""
+
+    def run_api(self, eutils, max_results, chunk_size=4):
+        api = pubmed.PubMedAPI()
+        api.session = eutils
+        with redirect_stderr(StringIO()) as err:
+            history = api.search_history("q", max_results)
+            pmids = [a["pmid"] for a in api.iter_history(history, chunk_size)]
+        return history, pmids, err.getvalue()
+
+    def test_pages_through_history(self):
+        """Records are fetched in retstart/retmax chunks up to max_results."""
+        eutils = FakeEutils(10)
+        history, pmids, _ = self.run_api(eutils, 9)
+        self.assertEqual(history.count, 9)
+        self.assertEqual(pmids, eutils.pmids[:9])
+        self.assertEqual([(f["retstart"], f["retmax"]) for f in eutils.fetches], [(0, 4), (4, 4), (8, 1)])
+
+    def test_fallback_resumes_after_last_yielded(self):
+        """A chunk that fails part-way is finished by PMID without duplicates."""
+        eutils = FakeEutils(10, fail_at=4, partial=2)
+        _, pmids, err = self.run_api(eutils, 10)
+        self.assertIn("fetching by PMID", err)
+        self.assertEqual(pmids, eutils.pmids)
+        self.assertEqual(eutils.fetches[-1]["id"].split(","), eutils.pmids[6:10])
+
+    def test_caps_at_esearch_limit(self):
+        """Requests above the E-utilities limit are capped with a warning."""
+        eutils = FakeEutils(0)
+        eutils.pmids = [str(i) for i in range(pubmed.ESEARCH_MAX_IDS + 5)]
+        api = pubmed.PubMedAPI()
+        api.session = eutils
+        with redirect_stderr(StringIO()) as err:
+            history = api.search_history("q", 20000)
+        self.assertEqual(eutils.searches[0]["retmax"], pubmed.ESEARCH_MAX_IDS)
+        self.assertEqual(history.count, pubmed.ESEARCH_MAX_IDS)
+        self.assertEqual(len(history.ids), history.count)
+        self.assertIn("at most", err.getvalue())
+
+        with redirect_stderr(StringIO()) as err:
+            self.assertEqual(api.search_history("q", 50).count, 50)
+        self.assertEqual(err.getvalue(), "")
+
+    def test_iter_pubmed_shares_webenv(self):
+        """Later queries join the first query's history session."""
+        eutils = FakeEutils(3)
+        with mock.patch.object(pubmed, "get_session", return_value=eutils), redirect_stderr(StringIO()):
+            records = list(pubmed.iter_pubmed(["a", "b"], max_results=3))
+        self.assertNotIn("WebEnv", eutils.searches[0])
+        self.assertEqual(eutils.searches[1]["WebEnv"], "ENV")
+        self.assertEqual([r["query"] for r in records], ["a", "a", "a"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the cross-process token-bucket rate limiter.
+"""
+
+import unittest
+import tempfile
+import shutil
+import time
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_rate_limiter import (
+    RateLimiter,
+    backoff_delay,
+    host_of,
+    parse_retry_after,
+    rate_for_host,
+)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Test token bucket behaviour."""
+
+    def setUp(self):
+        """Create temporary state directory."""
+        self.test_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up state directory."""
+        shutil.rmtree(self.test_dir)
+
+    def test_rate_is_enforced(self):
+        """Requests are spaced at the configured rate."""
+        limiter = RateLimiter(self.test_dir, rates={"example.org": (20.0, 1.0)})
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.acquire("example.org")
+        # First token is free, then 4 more at 20/s
+        self.assertGreaterEqual(time.monotonic() - start, 0.18)
+
+    def test_bucket_shared_between_instances(self):
+        """A second limiter (another process) draws from the same bucket."""
+        rates = {"example.org": (2.0, 1.0)}
+        RateLimiter(self.test_dir, rates=rates).acquire("example.org")
+        start = time.monotonic()
+        RateLimiter(self.test_dir, rates=rates).acquire("example.org")
+        self.assertGreaterEqual(time.monotonic() - start, 0.4)
+
+    def test_block_honours_retry_after(self):
+        """A Retry-After block delays every caller."""
+        limiter = RateLimiter(self.test_dir, rates={"example.org": (100.0, 1.0)})
+        limiter.block("example.org", 0.3)
+        start = time.monotonic()
+        limiter.acquire("example.org")
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+
+    def test_helpers(self):
+        """Host parsing, rate lookup, Retry-After parsing and backoff bounds."""
+        self.assertEqual(host_of("https://EUTILS.ncbi.nlm.nih.gov/entrez/x"), "eutils.ncbi.nlm.nih.gov")
+        self.assertEqual(rate_for_host("eutils.ncbi.nlm.nih.gov")[0], 3.0)
+        self.assertEqual(parse_retry_after("7"), 7.0)
+        self.assertIsNone(parse_retry_after("soon"))
+        self.assertGreaterEqual(backoff_delay(0, retry_after=5), 5)
+        self.assertLessEqual(backoff_delay(3), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
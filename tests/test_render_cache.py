@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed figure render cache.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_render_cache import RenderCache, render_key, render_with_cache
+from rrwrite_render_pool import RenderPool, RenderTask
+
+
+def draw(output: str, marker: str) -> list:
+    """Stand-in renderer that records each call in a marker file."""
+    Path(output).write_text("figure")
+    with open(marker, "a") as f:
+        f.write("x")
+    return [Path(output)]
+
+
+class TestRenderCache(unittest.TestCase):
+    """Test keys, hit/miss rendering and eviction."""
+
+    def setUp(self):
+        """Create data, output and cache directories."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.table = self.temp_dir / "data.tsv"
+        self.table.write_text("a\tb\n1\t2\n")
+        self.output = self.temp_dir / "out" / "fig.png"
+        self.output.parent.mkdir()
+        self.marker = self.temp_dir / "calls"
+        self.cache = RenderCache(self.temp_dir / "cache", max_bytes=10 ** 6)
+        self.pool = RenderPool(workers=1)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def render(self, key):
+        task = RenderTask("fig", draw, (str(self.output), str(self.marker)))
+        return render_with_cache(self.pool, [task], [key], [[self.output]], self.cache)[0]
+
+    def calls(self) -> int:
+        return len(self.marker.read_text()) if self.marker.exists() else 0
+
+    def test_key_depends_on_table_bytes_and_params(self):
+        """Changing the data, plot parameters or style changes the key."""
+        key = render_key([self.table], {"type": "bar"}, {"dpi": 300})
+        self.assertEqual(key, render_key([self.table], {"type": "bar"}, {"dpi": 300}))
+        self.assertNotEqual(key, render_key([self.table], {"type": "box"}, {"dpi": 300}))
+        self.assertNotEqual(key, render_key([self.table], {"type": "bar"}, {"dpi": 150}))
+        self.table.write_text("a\tb\n1\t3\n")
+        self.assertNotEqual(key, render_key([self.table], {"type": "bar"}, {"dpi": 300}))
+        self.assertIsNone(render_key([self.temp_dir / "missing.tsv"], {}, {}))
+
+    def test_unchanged_figure_is_linked_not_redrawn(self):
+        """The second render of the same key is a hardlinked cache hit."""
+        key = render_key([self.table], {"type": "bar"}, {})
+        first = self.render(key)
+        self.assertFalse(first.cached)
+        # The rendered file is stored by link, not copied
+        self.assertEqual(self.output.stat().st_nlink, 2)
+
+        self.output.unlink()
+        second = self.render(key)
+        self.assertTrue(second.cached)
+        self.assertEqual(self.calls(), 1)
+        self.assertEqual(self.output.read_text(), "figure")
+        self.assertGreater(self.output.stat().st_nlink, 1)
+
+    def test_uncached_task_always_renders(self):
+        """Tasks without a key bypass the cache."""
+        self.render(None)
+        self.render(None)
+        self.assertEqual(self.calls(), 2)
+        self.assertEqual(self.cache.size(), 0)
+
+    def test_eviction_removes_least_recently_used(self):
+        """Going over the size limit evicts the oldest entries first."""
+        cache = RenderCache(self.temp_dir / "small", max_bytes=10)
+        for i, key in enumerate(["aa" + "0" * 62, "bb" + "0" * 62, "cc" + "0" * 62]):
+            figure = self.temp_dir / f"f{i}.png"
+            figure.write_text("12345")
+            cache.put(key, [figure])
+        self.assertLessEqual(cache.size(), 10)
+        self.assertFalse(cache.get("aa" + "0" * 62, [self.output]))
+        self.assertTrue(cache.get("cc" + "0" * 62, [self.output]))
+
+
+if __name__ == "__main__":
+    unittest.main()
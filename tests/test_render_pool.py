@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Tests for the parallel figure render pool.
+"""
+
+import os
+import unittest
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_render_pool import RenderPool, RenderTask
+
+_setup_calls = []
+
+
+def _setup(tag):
+    _setup_calls.append(tag)
+
+
+def _render(n):
+    if n < 0:
+        raise ValueError("negative")
+    return (n * n, os.getpid(), list(_setup_calls))
+
+
+class TestRenderPool(unittest.TestCase):
+    """Test ordering, per-worker setup and error isolation."""
+
+    def test_results_in_task_order(self):
+        """Results come back in task order from several workers."""
+        pool = RenderPool(setup=_setup, setup_args=("styled",), workers=2)
+        results = pool.map([RenderTask(f"t{i}", _render, (i,)) for i in range(8)])
+
+        self.assertEqual([r.name for r in results], [f"t{i}" for i in range(8)])
+        self.assertEqual([r.value[0] for r in results], [i * i for i in range(8)])
+        # Setup ran once in each worker before any task
+        for r in results:
+            self.assertEqual(r.value[2], ["styled"])
+
+    def test_failure_isolated(self):
+        """A failing task does not stop the rest of the batch."""
+        results = RenderPool(workers=2).map([
+            RenderTask("ok", _render, (3,)),
+            RenderTask("bad", _render, (-1,)),
+        ])
+        self.assertEqual(results[0].value[0], 9)
+        self.assertIsNone(results[1].value)
+        self.assertIn("negative", results[1].error)
+
+    def test_single_task_in_process(self):
+        """Small batches render in the calling process."""
+        results = RenderPool(workers=4).map([RenderTask("one", _render, (2,))])
+        self.assertEqual(results[0].value[1], os.getpid())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Tests for the single-pass repository file index.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_repo_index import RepoIndex
+from rrwrite_script_loader import load_script_module
+
+
+class TestRepoIndex(unittest.TestCase):
+    """Test pruning, pattern queries and recorded metadata."""
+
+    def setUp(self):
+        """Create a small repository tree."""
+        self.repo = Path(tempfile.mkdtemp())
+        files = {
+            "README.md": "# Project",
+            "analysis/run.py": "print('hi')",
+            "analysis/plot.R": "plot(1)",
+            "data/results.tsv": "a\tb\n1\t2\n",
+            "figures/fig1.png": "png",
+            "requirements.txt": "pandas",
+            "node_modules/pkg/index.py": "skip",
+            ".git/config": "skip",
+            "build/out.csv": "skip",
+        }
+        for rel, content in files.items():
+            path = self.repo / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        self.index = RepoIndex(self.repo)
+
+    def tearDown(self):
+        """Clean up repository."""
+        shutil.rmtree(self.repo)
+
+    def test_skip_dirs_pruned(self):
+        """Files under skipped directories are never indexed."""
+        rel_paths = {f.rel_path for f in self.index.files}
+        self.assertEqual(len(self.index), 6)
+        self.assertNotIn("node_modules/pkg/index.py", rel_paths)
+        self.assertNotIn("build/out.csv", rel_paths)
+        self.assertNotIn(self.repo / "node_modules", self.index.dirs)
+
+    def test_find_matches_like_rglob(self):
+        """Pattern queries match file names case-sensitively and return sorted paths."""
+        found = self.index.find(["*.py", "*.R"])
+        self.assertEqual(found, [self.repo / "analysis/plot.R", self.repo / "analysis/run.py"])
+        self.assertEqual(self.index.find(["README.md"]), [self.repo / "README.md"])
+        self.assertEqual(self.index.find(["*.PY"]), [])
+
+    def test_categories_and_stat(self):
+        """Each file records its category, size and mtime."""
+        entry = self.index.stat(self.repo / "data/results.tsv")
+        self.assertEqual(entry.category, "data")
+        self.assertEqual(entry.size, len("a\tb\n1\t2\n"))
+        self.assertEqual(self.index.stat(self.repo / "requirements.txt").category, "config")
+        self.assertEqual(self.index.in_category("figure"), [self.repo / "figures/fig1.png"])
+
+    def test_directory_listing(self):
+        """Children and per-directory files come from the same walk."""
+        names = sorted(e.name for e in self.index.children(self.repo))
+        self.assertEqual(names, ["README.md", "analysis", "data", "figures", "requirements.txt"])
+        self.assertEqual(
+            sorted(f.path.name for f in self.index.files_in_dir(self.repo / "analysis")),
+            ["plot.R", "run.py"]
+        )
+
+    def test_extractor_skips_only_excluded_dirs(self):
+        """The figure/table extractor still scans virtualenv-named directories, as rglob did."""
+        (self.repo / "env").mkdir()
+        (self.repo / "env/summary.csv").write_text("a,b\n1,2\n")
+        module = load_script_module("rrwrite-extract-figures-tables.py")
+        extractor = module.FigureTableExtractor(self.repo, self.repo / "manuscript")
+        found = extractor.index.find(extractor.TABLE_PATTERNS)
+        self.assertIn(self.repo.resolve() / "env/summary.csv", found)
+        self.assertNotIn(self.repo.resolve() / "build/out.csv", found)
+
+
+if __name__ == "__main__":
+    unittest.main()
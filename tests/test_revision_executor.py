@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent section revision executor.
+"""
+
+import threading
+import time
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_revision_context import RevisionContext
+from rrwrite_revision_executor import RevisionExecutor, SectionJob
+from rrwrite_revision_parser import Issue
+from rrwrite_section_reviser import RevisionResult, ValidationResult
+
+
+class FakeReviser:
+    """Reviser that waits like an LLM call and appends a marker."""
+
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, section, section_file, issues, context):
+        self.section = section
+        self.section_file = section_file
+
+    def revise(self):
+        with FakeReviser.lock:
+            FakeReviser.active += 1
+            FakeReviser.peak = max(FakeReviser.peak, FakeReviser.active)
+        try:
+            time.sleep(0.2)
+            if self.section == "broken":
+                raise RuntimeError("API error")
+            passed = self.section != "invalid"
+            return RevisionResult(
+                content=self.section_file.read_text() + "Revised.\n",
+                changes_made=["Revised"],
+                validation=ValidationResult(passed, [] if passed else ["bad citation"], []),
+                success=passed
+            )
+        finally:
+            with FakeReviser.lock:
+                FakeReviser.active -= 1
+
+
+class TestRevisionExecutor(unittest.TestCase):
+    """Test concurrency, ordering, atomic saves and error isolation."""
+
+    def setUp(self):
+        """Create a manuscript directory with section files."""
+        self.manuscript_dir = Path(tempfile.mkdtemp())
+        self.context = RevisionContext(self.manuscript_dir)
+        FakeReviser.active = FakeReviser.peak = 0
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.manuscript_dir)
+
+    def jobs(self, *sections):
+        jobs = []
+        for section in sections:
+            path = self.manuscript_dir / f"{section}.md"
+            path.write_text(f"# {section}\n")
+            jobs.append(SectionJob(section, path, []))
+        return jobs
+
+    @mock.patch("rrwrite_revision_executor.get_reviser", FakeReviser)
+    def test_sections_run_concurrently_in_order(self):
+        """An iteration takes about as long as one section; outcomes keep job order."""
+        sections = ["abstract", "introduction", "methods", "results"]
+        start = time.perf_counter()
+        outcomes = RevisionExecutor(self.context, workers=4).run(self.jobs(*sections))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(FakeReviser.peak, 4)
+        self.assertLess(elapsed, 0.6)
+        self.assertEqual([o.section for o in outcomes], sections)
+        self.assertTrue(all(o.saved for o in outcomes))
+        self.assertEqual((self.manuscript_dir / "methods.md").read_text(), "# methods\nRevised.\n")
+        self.assertEqual(sorted(p.name for p in self.manuscript_dir.iterdir()),
+                         sorted(f"{s}.md" for s in sections))
+
+    @mock.patch("rrwrite_revision_executor.get_reviser", FakeReviser)
+    def test_failures_do_not_stop_other_sections(self):
+        """Errors and failed validation leave their files untouched."""
+        outcomes = RevisionExecutor(self.context, workers=2).run(
+            self.jobs("broken", "invalid", "discussion")
+        )
+        broken, invalid, discussion = outcomes
+        self.assertEqual(FakeReviser.peak, 2)
+        self.assertIn("API error", broken.error)
+        self.assertFalse(invalid.success or invalid.saved)
+        self.assertEqual((self.manuscript_dir / "invalid.md").read_text(), "# invalid\n")
+        self.assertTrue(discussion.saved)
+
+    def test_dry_run_with_real_reviser(self):
+        """Real revisers run in the pool; dry runs save nothing."""
+        jobs = self.jobs("methods")
+        jobs[0].issues = [Issue("minor", "Citation Format", "Use [author2024]", "Fix", "methods")]
+        outcome, = RevisionExecutor(self.context, dry_run=True).run(jobs)
+        self.assertTrue(outcome.success)
+        self.assertFalse(outcome.saved)
+        self.assertEqual(outcome.result.changes_made, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Tests for the in-process revision pipeline.
+"""
+
+import threading
+import time
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_revision_parser import CritiqueParser
+from rrwrite_revision_pipeline import PipelineError, RevisionPipeline, Stage, run_stages
+
+
+class TestRunStages(unittest.TestCase):
+    """Test dependency ordering, parallelism and failure handling."""
+
+    def test_independent_stages_run_in_parallel(self):
+        """Dependents see their inputs; siblings overlap."""
+        active, peak, lock = [0], [0], threading.Lock()
+
+        def sibling(inputs):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.1)
+            with lock:
+                active[0] -= 1
+            return inputs['root'] + 1
+
+        results = run_stages([
+            Stage('root', lambda _: 1),
+            Stage('left', sibling, ('root',)),
+            Stage('right', sibling, ('root',)),
+            Stage('join', lambda inputs: inputs['left'] + inputs['right'], ('left', 'right')),
+        ])
+        self.assertEqual(results, {'root': 1, 'left': 2, 'right': 2, 'join': 4})
+        self.assertEqual(peak[0], 2)
+
+    def test_failure_stops_dependents(self):
+        """A failing stage is reported by name and its dependents never run."""
+        ran = []
+
+        def fail(_):
+            raise RuntimeError("boom")
+
+        with self.assertRaises(PipelineError) as cm:
+            run_stages([
+                Stage('assembly', fail),
+                Stage('critique', lambda _: ran.append('critique'), ('assembly',)),
+            ])
+        self.assertEqual(cm.exception.stage, 'assembly')
+        self.assertIn("boom", str(cm.exception.error))
+        self.assertEqual(ran, [])
+
+        with self.assertRaises(ValueError):
+            run_stages([Stage('a', lambda _: 1, ('b',)), Stage('b', lambda _: 1, ('a',))])
+
+
+class TestRevisionPipeline(unittest.TestCase):
+    """Test assembly and critique on an in-memory manuscript."""
+
+    def setUp(self):
+        """Create a manuscript with section files."""
+        self.manuscript_dir = Path(tempfile.mkdtemp())
+        sections = {
+            "abstract": "This tool improves annotation. " * 5,
+            "introduction": "Graph methods significantly outperform prior work. See Table 1.",
+            "methods": "We ran the analysis with default parameters.",
+            "results": "Figure 2 shows accuracy. Figure 1 shows the pipeline [smith2020].",
+            "discussion": "This proves the approach is always better.",
+        }
+        for name, text in sections.items():
+            (self.manuscript_dir / f"{name}.md").write_text(f"# {name.title()}\n\n{text}\n")
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.manuscript_dir)
+
+    def test_issues_match_parsed_reports(self):
+        """Structured issues equal what CritiqueParser reads from the written reports."""
+        pipeline = RevisionPipeline(self.manuscript_dir)
+        assembly, reports = pipeline.run_iteration(2)
+
+        self.assertTrue((self.manuscript_dir / "full_manuscript.md").exists())
+        self.assertEqual(pipeline.manuscript_text, assembly.text)
+        self.assertEqual([r.kind for r in reports], ["content", "format"])
+
+        issues = [issue for report in reports for issue in report.issues]
+        self.assertTrue(issues)
+        self.assertEqual(issues, CritiqueParser(self.manuscript_dir).parse_critique_reports(version=2))
+
+        # A second iteration re-reads only the revised section
+        (self.manuscript_dir / "methods.md").write_text("# Methods\n\nWe used version 2.1.\n")
+        assembly, _ = pipeline.run_iteration(3)
+        self.assertEqual(assembly.reread, ["methods.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tests for the output name → generating script reverse index.
+"""
+
+import json
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_script_references import ScriptReferenceIndex, script_literals
+
+
+class TestScriptReferenceIndex(unittest.TestCase):
+    """Test tokenizing scripts and looking up generators."""
+
+    def setUp(self):
+        """Create a repository with scripts, a notebook and outputs."""
+        self.repo = Path(tempfile.mkdtemp())
+        (self.repo / "analysis").mkdir()
+        (self.repo / "figures").mkdir()
+        (self.repo / "analysis" / "plot.py").write_text(
+            "import matplotlib.pyplot as plt\n"
+            "plt.savefig('../figures/accuracy.png')\n"
+            "plt.savefig(f'{out}/{name}_heatmap.pdf')\n"
+        )
+        (self.repo / "analysis" / "summarize.py").write_text(
+            "import pandas as pd\n"
+            "df = pd.read_csv('figures/results.tsv')\n"
+            "display('figures/accuracy.png')\n"
+        )
+        (self.repo / "stats.R").write_text(
+            'write.table(df, file = "figures/results.tsv", sep = "\\t")\n'
+        )
+        notebook = {
+            "metadata": {"kernelspec": {"language": "python"}},
+            "cells": [
+                {"cell_type": "markdown", "source": ["'ignored.png'"]},
+                {"cell_type": "code", "source": ["%matplotlib inline\n", "fig.savefig('roc_curve.svg')\n"]},
+            ],
+        }
+        (self.repo / "explore.ipynb").write_text(json.dumps(notebook))
+        scripts = [p for p in self.repo.rglob("*") if p.suffix in (".py", ".R", ".ipynb")]
+        self.index = ScriptReferenceIndex(self.repo, scripts)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.repo)
+
+    def test_lookup_crosses_directories(self):
+        """Outputs are found from scripts in other directories."""
+        self.assertEqual(
+            self.index.generating_script(self.repo / "figures" / "accuracy.png"),
+            "analysis/plot.py"
+        )
+        self.assertEqual(
+            self.index.generating_script(self.repo / "figures" / "roc_curve.svg"),
+            "explore.ipynb"
+        )
+
+    def test_writers_rank_before_readers(self):
+        """A script writing the file beats one that only reads or mentions it."""
+        lookup = self.index.lookup(self.repo / "figures" / "results.tsv")
+        self.assertEqual(lookup, ["stats.R", "analysis/summarize.py"])
+        self.assertEqual(self.index.lookup(self.repo / "figures" / "accuracy.png")[-1],
+                         "analysis/summarize.py")
+
+    def test_formatted_names_match_by_tail(self):
+        """f-string outputs match on their literal tail."""
+        self.assertEqual(
+            self.index.generating_script(self.repo / "figures" / "sample1_heatmap.pdf"),
+            "analysis/plot.py"
+        )
+        self.assertIsNone(self.index.generating_script(self.repo / "figures" / "unrelated.pdf"))
+
+    def test_markdown_cells_and_magics_are_skipped(self):
+        """Only code cells are tokenized; IPython magics do not break parsing."""
+        literals = [lit for lit, _, _ in script_literals(self.repo / "explore.ipynb")]
+        self.assertEqual(literals, ["roc_curve.svg"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Tests for the repository analysis tables built by TableGenerator.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from unittest import mock
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_repo_index import RepoIndex
+from rrwrite_table_generator import TableGenerator
+
+
+class TestRepositoryTables(unittest.TestCase):
+    """Test the inventory, statistics, size and research indicator tables."""
+
+    def setUp(self):
+        """Create a small repository with files of known sizes."""
+        self.repo = Path(tempfile.mkdtemp())
+        files = {
+            "src/train_model.py": 4096,
+            "src/plot_results.py": 1024,
+            "tests/test_model.py": 2048,
+            "README.md": 512,
+            "docs/usage.md": 256,
+            "data/genome_counts.tsv": 8192,
+        }
+        for rel, size in files.items():
+            path = self.repo / rel
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"x" * size)
+        self.index = RepoIndex(self.repo)
+        self.categorized = {}
+        for category in ("script", "doc", "data"):
+            self.categorized[category] = self.index.in_category(category)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.repo)
+
+    def test_inventory_from_index_matches_stat(self):
+        """The indexed fast path gives the same table as stat-ing each file."""
+        indexed = TableGenerator._generate_file_inventory(self.repo, self.categorized, self.index)
+        stat = TableGenerator._generate_file_inventory(self.repo, self.categorized)
+        self.assertTrue(indexed.equals(stat))
+        self.assertEqual(list(indexed.columns),
+                         ["path", "type", "size_bytes", "last_modified", "git_tracked"])
+        self.assertEqual(indexed["path"].iloc[0], "data/genome_counts.tsv")
+        self.assertEqual(list(indexed["size_bytes"]), sorted(indexed["size_bytes"], reverse=True))
+
+    def test_statistics_and_quartiles(self):
+        """Per-category counts, flags and quartiles come from one groupby each."""
+        inventory = TableGenerator._generate_file_inventory(self.repo, self.categorized, self.index)
+        stats = TableGenerator._generate_repository_statistics(self.categorized, inventory)
+        script = stats.set_index("category").loc["script"]
+        self.assertEqual(stats["category"].iloc[0], "script")
+        self.assertEqual((script["file_count"], script["test_files"]), (3, 1))
+        self.assertEqual(script["avg_size_kb"], 2.33)
+        self.assertEqual(stats.set_index("category").loc["doc", "doc_files"], 2)
+
+        sizes = TableGenerator._generate_size_distribution(self.categorized, inventory)
+        script = sizes.set_index("category").loc["script"]
+        self.assertEqual((script["min_kb"], script["percentile_50_kb"], script["max_kb"]),
+                         (1.0, 2.0, 4.0))
+        self.assertEqual(script["percentile_25_kb"], 1.5)
+
+    def test_research_indicators(self):
+        """Topics count matching paths and keep the first examples in order."""
+        relative = {
+            "script": [Path("src/train_model.py"), Path("tests/test_model.py")],
+            "data": [Path("data/genome_counts.tsv")],
+        }
+        table = TableGenerator._generate_research_indicators(relative).set_index("topic")
+        self.assertEqual(table.loc["Machine Learning", "evidence_count"], 2)
+        self.assertEqual(table.loc["Machine Learning", "example_files"],
+                         "train_model.py, test_model.py")
+        self.assertEqual(table.loc["Bioinformatics", "confidence"], "low")
+        self.assertNotIn("Visualization", table.index)
+
+        # Keywords of different topics overlapping in one name are all found
+        table = TableGenerator._generate_research_indicators({"script": [Path("dbio_restats.py")]})
+        self.assertEqual(set(table["topic"]), {"Database", "Bioinformatics", "Api"})
+
+    def test_empty_repository(self):
+        """An empty inventory still yields tables with their columns."""
+        inventory = TableGenerator._generate_file_inventory(self.repo, {"script": []})
+        self.assertEqual(len(inventory), 0)
+        stats = TableGenerator._generate_repository_statistics({}, inventory)
+        self.assertIn("file_count", stats.columns)
+        sizes = TableGenerator._generate_size_distribution({}, inventory)
+        self.assertIn("percentile_50_kb", sizes.columns)
+
+    def test_unchanged_tree_key_skips_inventory(self):
+        """A repeated tree key returns the existing tables without building the inventory."""
+        output_dir = self.repo / "tables"
+        first = TableGenerator.generate_repo_tables(self.repo, self.categorized, output_dir,
+                                                    self.index, tree_key="t1")
+        with mock.patch.object(TableGenerator, "_generate_file_inventory",
+                               side_effect=AssertionError("inventory rebuilt")):
+            again = TableGenerator.generate_repo_tables(self.repo, self.categorized, output_dir,
+                                                        self.index, tree_key="t1")
+            self.assertEqual(again, first)
+            with self.assertRaises(AssertionError):
+                TableGenerator.generate_repo_tables(self.repo, self.categorized, output_dir,
+                                                    self.index, tree_key="t2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests for the streaming TSV table reader.
+"""
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import pandas as pd
+
+from rrwrite_table_reader import (
+    ARROW_AVAILABLE, count_rows, has_sidecar, load_table, read_header,
+    sidecar_path, summarize_table, table_rows
+)
+from rrwrite_table_generator import TableGenerator
+from rrwrite_script_loader import load_script_module
+
+convert = load_script_module("rrwrite-convert-tsv-to-table.py")
+
+
+class TestTableReader(unittest.TestCase):
+    """Test header parsing, top-N reads and one-pass statistics."""
+
+    def setUp(self):
+        """Write a TSV with a metadata block."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.tsv = self.temp_dir / "results.tsv"
+        df = pd.DataFrame({
+            "gene": [f"g{i}" for i in range(250)],
+            "score": [float(i) for i in range(250)],
+            "label": ["x"] * 250,
+        })
+        TableGenerator.save_tsv(df, self.tsv, metadata={"source": "test", "version": "2"})
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_header_reads_comment_block_only(self):
+        """Metadata, columns and data offset come from the first lines."""
+        header = read_header(self.tsv)
+        self.assertEqual(header.metadata, {"source": "test", "version": "2"})
+        self.assertEqual(header.columns, ["gene", "score", "label"])
+        self.assertEqual(header.skiprows, 3)
+        self.assertEqual(count_rows(self.tsv, header), 250)
+
+    def test_top_rows_and_columns(self):
+        """Only requested columns and rows are kept; the total is still known."""
+        summary = summarize_table(self.tsv, usecols=["gene", "score"], top_n=5, stats=False)
+        self.assertEqual(list(summary.head.columns), ["gene", "score"])
+        self.assertEqual(len(summary.head), 5)
+        self.assertEqual(summary.rows, 250)
+        self.assertTrue(summary.truncated)
+
+    def test_stats_in_chunks_match_full_load(self):
+        """Chunked statistics equal those of the fully loaded column."""
+        summary = summarize_table(self.tsv, top_n=3, chunksize=40)
+        score = summary.stats["score"]
+        self.assertEqual(score.count, 250)
+        self.assertAlmostEqual(score.mean, 124.5)
+        self.assertEqual((score.minimum, score.maximum), (0.0, 249.0))
+        self.assertNotIn("label", summary.stats)
+        self.assertEqual(len(summary.head), 3)
+
+    def test_load_tsv_with_metadata_limits(self):
+        """load_tsv_with_metadata honours usecols and nrows."""
+        df, metadata = TableGenerator.load_tsv_with_metadata(self.tsv, usecols=["score"], nrows=10)
+        self.assertEqual(df.shape, (10, 1))
+        self.assertEqual(metadata["source"], "test")
+
+        table = TableGenerator.format_tsv_table(self.tsv, max_rows=2)
+        self.assertIn("| g1 | 1.0 | x |", table)
+        self.assertIn("Showing 2 of 250 rows", table)
+
+    def test_blank_lines_ragged_rows_and_column_order(self):
+        """Blank lines are not rows, extra cells don't shift others, usecols order is kept."""
+        tsv = self.temp_dir / "ragged.tsv"
+        tsv.write_text("a\tb\n1\t2\t9\n3\t4\n\n")
+        self.assertEqual(count_rows(tsv), 2)
+        self.assertFalse(summarize_table(tsv, top_n=2, stats=False).truncated)
+
+        summary = summarize_table(tsv, raw=True)
+        self.assertEqual(summary.rows, 2)
+        self.assertEqual(summary.head.values.tolist(), [["1", "2"], ["3", "4"]])
+
+        for stats in (True, False):
+            head = summarize_table(tsv, usecols=["b", "a"], top_n=1, stats=stats, raw=True).head
+            self.assertEqual(list(head.columns), ["b", "a"])
+            self.assertEqual(head.values.tolist(), [["2", "1"]])
+
+        table = convert.convert_tsv_to_markdown(tsv, columns=["b", "a"])
+        self.assertEqual(table, "| b | a |\n| --- | --- |\n| 2 | 1 |\n| 4 | 3 |\n")
+
+    def test_later_ragged_rows_and_comment_lines(self):
+        """Extra cells on any row are dropped; mid-file comments are skipped, `#` in cells kept."""
+        tsv = self.temp_dir / "notes.tsv"
+        tsv.write_text("col1\tcol2\n1\t2\n# note\n4\t5\t6\nC#\t7\n")
+        self.assertEqual(count_rows(tsv), 3)
+        for chunksize in (1, 100):
+            summary = summarize_table(tsv, raw=True, chunksize=chunksize)
+            self.assertEqual(summary.head.values.tolist(), [["1", "2"], ["4", "5"], ["C#", "7"]])
+            self.assertEqual(summary.stats["col2"].count, 3)
+
+        table = convert.convert_tsv_to_markdown(tsv, max_rows=2)
+        self.assertEqual(table, "| col1 | col2 |\n| --- | --- |\n| 1 | 2 |\n| 4 | 5 |\n\n"
+                                "*Note: Showing 2 of 3 rows*\n")
+
+
+@unittest.skipUnless(ARROW_AVAILABLE, "pyarrow not installed")
+class TestArrowSidecar(unittest.TestCase):
+    """Test typed sidecar writes, memory-mapped loads and staleness."""
+
+    def setUp(self):
+        """Write a TSV with a sidecar."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.tsv = self.temp_dir / "file_inventory.tsv"
+        self.df = pd.DataFrame({
+            "file_path": ["a.py", "b.csv", "c.md"],
+            "size_bytes": [10, 2000, 5],
+            "is_test": [True, False, False],
+        })
+        TableGenerator.save_tsv(self.df, self.tsv, metadata={"total_files": "3"}, sidecar=True)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_sidecar_round_trip(self):
+        """The sidecar returns typed columns, selected columns and metadata."""
+        self.assertTrue(sidecar_path(self.tsv).exists())
+        self.assertTrue(has_sidecar(self.tsv))
+        df, metadata = load_table(self.tsv, columns=["size_bytes", "is_test", "missing"])
+        self.assertEqual(list(df.columns), ["size_bytes", "is_test"])
+        self.assertEqual(df["is_test"].dtype, bool)
+        self.assertEqual(metadata, {"total_files": "3"})
+        self.assertEqual(table_rows(self.tsv), 3)
+
+    def test_edited_tsv_wins_over_stale_sidecar(self):
+        """Hand edits to the TSV invalidate the sidecar."""
+        self.tsv.write_text(self.tsv.read_text().replace("a.py", "edited.py"))
+        self.assertFalse(has_sidecar(self.tsv))
+        df, metadata = load_table(self.tsv)
+        self.assertEqual(df["file_path"].iloc[0], "edited.py")
+        self.assertEqual(metadata, {"total_files": "3"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Tests for the manuscript watch mode.
+"""
+
+import os
+import threading
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from rrwrite_watch import ManuscriptWatcher
+
+
+class TestManuscriptWatcher(unittest.TestCase):
+    """Test change detection and dependent-stage rebuilds."""
+
+    def setUp(self):
+        """Create a manuscript with sections in sections/."""
+        self.manuscript_dir = Path(tempfile.mkdtemp())
+        self.sections = self.manuscript_dir / "sections"
+        self.sections.mkdir()
+        for name in ("abstract", "introduction", "methods", "results", "discussion"):
+            (self.sections / f"{name}.md").write_text(f"# {name.title()}\n\nText of {name}.\n")
+        self.watcher = ManuscriptWatcher(self.manuscript_dir, export=False)
+
+    def tearDown(self):
+        """Clean up."""
+        shutil.rmtree(self.manuscript_dir)
+
+    def touch(self, path: Path, text: str):
+        path.write_text(text)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    def stages(self, report):
+        return [stage.name for stage in report.stages]
+
+    def test_first_check_builds_everything(self):
+        """The first check runs every stage; without changes nothing reruns."""
+        report = self.watcher.check()
+        self.assertEqual(self.stages(report), ["assembly", "consistency", "validation", "format"])
+        self.assertTrue((self.manuscript_dir / "full_manuscript.md").exists())
+        self.assertIn("too short", report.stage("validation").summary)
+        self.assertIsNone(self.watcher.check())
+
+    def test_section_edit_reruns_dependent_stages(self):
+        """Editing a section reassembles it alone and rechecks the manuscript."""
+        self.watcher.check()
+        self.touch(self.sections / "results.md", "# Results\n\nSee Figure 2 before Figure 1.\n")
+        report = self.watcher.check()
+        self.assertEqual(report.changed, ["sections/results.md"])
+        self.assertEqual(self.stages(report), ["assembly", "consistency", "validation", "format"])
+        self.assertIn("re-read results.md", report.stage("assembly").summary)
+        self.assertIn("See Figure 2", (self.manuscript_dir / "full_manuscript.md").read_text())
+
+    def test_unchanged_output_stops_downstream(self):
+        """Inputs that do not change the assembled text do not rerun the checks."""
+        self.watcher.check()
+        self.touch(self.manuscript_dir / "paperpile_mapping.json", "{}")
+        self.assertEqual(self.stages(self.watcher.check()), ["assembly"])
+
+        self.touch(self.sections / "notes.md", "Draft notes\n")
+        self.assertEqual(self.stages(self.watcher.check()), ["consistency"])
+
+        self.touch(self.manuscript_dir / "literature_citations.bib", "@article{a2020,}\n")
+        self.assertEqual(self.watcher.check().stages, [])
+
+    def test_watch_debounces_bursts(self):
+        """A burst of saves is rebuilt once, after the files are quiet."""
+        watcher = ManuscriptWatcher(self.manuscript_dir, export=False, interval=0.01, debounce=0.1)
+        reports, stop = [], threading.Event()
+
+        def on_report(report):
+            reports.append(report)
+            if len(reports) == 1:
+                for name in ("methods", "discussion"):
+                    self.touch(self.sections / f"{name}.md", f"# {name.title()}\n\nEdited.\n")
+            else:
+                stop.set()
+
+        thread = threading.Thread(target=watcher.watch, args=(on_report, stop))
+        thread.start()
+        thread.join(timeout=30)
+        stop.set()
+        self.assertEqual(len(reports), 2)
+        self.assertEqual(reports[1].changed, ["sections/discussion.md", "sections/methods.md"])
+
+
+if __name__ == "__main__":
+    unittest.main()